@@ -0,0 +1,357 @@
+"""
+블로그 글 생성 REST API (FastAPI, 비동기)
+- 이벤트 루프 하나에서 여러 사용자의 요청을 동시에 처리
+  (LLM 호출은 비동기 경로 LLMClient.achat - 서로의 LLM 응답을 기다리며 막히지 않음)
+- 생성 진행은 SSE(text/event-stream)로 구조 → 섹션 순서로 전송
+- 연결이 끊겨도 생성은 끝까지 진행, 결과는 /posts/{post_id}로 조회
+- 블로그 설정/렌더러는 기동 시 한 번 로드해 재사용, 계획/톤 가이드는 블로그별로 계획 저장소(utils.plan_store)에서 조회
+
+엔드포인트:
+- POST /plans/{blog}/days/{n}/generate   SEO 글 생성 (SSE: accepted / start / structure / section / done / error)
+                                         ?stream=false면 202 + post_id만 반환
+- GET  /posts/{post_id}                   생성 상태 / 진행 이벤트 수 / 결과
+- POST /render/{platform}                 {"post_id": ...} 또는 {"content": {...}} (+ "tags") → 플랫폼 HTML
+- GET  /health
+
+실행:
+    uvicorn api_server:app --port 8000
+    python api_server.py --port 8000
+
+    curl -N -X POST localhost:8000/plans/woncamp/days/3/generate
+    curl localhost:8000/posts/<post_id>
+    curl -X POST localhost:8000/render/naver -H 'content-type: application/json' -d '{"post_id": "<post_id>"}'
+
+환경 변수:
+- BLOG_API_MAX_POSTS: 메모리에 보관할 글 수 (기본 500, 넘으면 오래된 완료 글부터 제외 - 저장 파일은 남음)
+- BLOG_API_OUTPUT_DIR: 결과 저장 위치 (기본 outputs/content → <블로그>/dayXX_content.json)
+- BLOG_API_PING_S: SSE 연결 유지용 ping 간격(초, 기본 15)
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple
+
+from fastapi import Body, FastAPI, HTTPException
+from fastapi.responses import HTMLResponse, JSONResponse, PlainTextResponse, Response, StreamingResponse
+
+import worker
+from html_renderers import (
+    BaseRenderer, BrunchRenderer, NaverRenderer, TistoryRenderer, WordPressRenderer, seo_content_to_state
+)
+from run_multi_blog import load_blog_configs
+from utils.job_queue import Job, PermanentJobError
+from utils.logger import get_logger
+from utils.run_context import new_run_id, node_scope, run_scope
+
+logger = get_logger("ApiServer")
+
+# 진행 중/완료 상태
+PENDING, RUNNING, DONE, ERROR = "pending", "running", "done", "error"
+
+
+@dataclass
+class PostRecord:
+    """글 1건의 생성 상태 + 진행 이벤트 (이벤트 루프 스레드에서만 변경)"""
+
+    id: str
+    blog: str
+    day: int
+    status: str = PENDING
+    created_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+    events: List[Dict[str, Any]] = field(default_factory=list)
+    content: Optional[Dict[str, Any]] = None
+    file: Optional[str] = None
+    error: Optional[str] = None
+    _changed: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (DONE, ERROR)
+
+    def publish(self, event: Dict[str, Any]) -> None:
+        self.events.append({**event, "ts": round(time.time(), 3)})
+        # 기다리던 구독자를 깨우고 다음 대기용 이벤트로 교체
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+    async def follow(self, ping_s: float) -> AsyncIterator[Optional[Dict[str, Any]]]:
+        """처음부터 이벤트를 순서대로, 끝나면 종료 (ping_s 동안 새 이벤트가 없으면 None)"""
+        index = 0
+        while True:
+            while index < len(self.events):
+                yield self.events[index]
+                index += 1
+            if self.finished:
+                return
+            changed = self._changed
+            try:
+                await asyncio.wait_for(changed.wait(), timeout=ping_s)
+            except asyncio.TimeoutError:
+                yield None
+
+    def summary(self) -> Dict[str, Any]:
+        data: Dict[str, Any] = {
+            "post_id": self.id,
+            "blog": self.blog,
+            "day": self.day,
+            "status": self.status,
+            "created_at": self.created_at,
+            "finished_at": self.finished_at,
+            "events": len(self.events),
+            "progress": [event for event in self.events if event["event"] in ("structure", "section")],
+        }
+        if self.status == DONE:
+            data["file"] = self.file
+            data["content"] = self.content
+        if self.status == ERROR:
+            data["error"] = self.error
+        return data
+
+
+class PostStore:
+    """post_id → PostRecord (최대 max_posts건, 넘으면 오래된 완료 글부터 제외)"""
+
+    def __init__(self, max_posts: Optional[int] = None) -> None:
+        self.max_posts = max_posts or int(os.getenv("BLOG_API_MAX_POSTS", "500"))
+        self._posts: "OrderedDict[str, PostRecord]" = OrderedDict()
+
+    def add(self, record: PostRecord) -> None:
+        self._posts[record.id] = record
+        overflow = len(self._posts) - self.max_posts
+        for post_id in [post_id for post_id, post in self._posts.items() if post.finished][:max(0, overflow)]:
+            del self._posts[post_id]
+
+    def get(self, post_id: str) -> Optional[PostRecord]:
+        return self._posts.get(post_id)
+
+    def counts(self) -> Dict[str, int]:
+        counts = {PENDING: 0, RUNNING: 0, DONE: 0, ERROR: 0}
+        for post in self._posts.values():
+            counts[post.status] += 1
+        return counts
+
+
+def _sse(event: Optional[Dict[str, Any]], event_id: int) -> str:
+    if event is None:
+        return ": ping\n\n"
+    data = json.dumps(event, ensure_ascii=False)
+    return f"id: {event_id}\nevent: {event['event']}\ndata: {data}\n\n"
+
+
+class ApiService:
+    """기동 시 로드한 설정/렌더러/LLM 노드 + 생성 작업 관리"""
+
+    def __init__(self, output_dir: Optional[str] = None) -> None:
+        self.output_dir = output_dir or os.getenv("BLOG_API_OUTPUT_DIR", "outputs/content")
+        self.ping_s = float(os.getenv("BLOG_API_PING_S", "15"))
+        self.posts = PostStore()
+        self.blogs: Dict[str, Dict[str, Any]] = {}
+        self.renderers: Dict[str, BaseRenderer] = {}
+        self.writer: Any = None
+        self.tasks: Set["asyncio.Task[None]"] = set()
+        self.started_at = time.time()
+
+    def warm_up(self) -> None:
+        from nodes.seo_content_writer_node import SEOContentWriterNode
+
+        self.blogs = {config["blog_name"]: config for config in load_blog_configs()}
+        self.renderers = {
+            "naver": NaverRenderer(), "tistory": TistoryRenderer(), "wordpress": WordPressRenderer(),
+            "brunch": BrunchRenderer(), "base": BaseRenderer(),
+        }
+        try:
+            self.writer = SEOContentWriterNode()
+        except ValueError as e:
+            logger.warning(f"⚠️ SEO 작성 노드 준비 실패 (생성 요청은 503): {e}")
+        for blog in sorted(self.blogs):
+            try:
+                worker.plan_store_for(blog)
+            except PermanentJobError as e:
+                logger.warning(f"⚠️ {blog} 계획 없음 (생성 요청 시 다시 확인): {e}")
+        print(f"🔥 API 준비 완료: 블로그 {sorted(self.blogs)}, 렌더러 {sorted(self.renderers)}")
+
+    async def shutdown(self) -> None:
+        """진행 중 생성 취소 (저장 전 취소된 글은 error로 남음)"""
+        for task in list(self.tasks):
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+
+    @staticmethod
+    def _load_inputs(job: Job) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+        """계획 항목 / SERP / 톤 가이드 (계획 저장소 SQLite 조회라 스레드에서 호출)"""
+        plan_item, serp_context = worker.load_plan_item(job)
+        return plan_item, serp_context, worker.load_tone_guide(job)
+
+    async def start_generation(self, blog: str, day: int) -> PostRecord:
+        """요청 검증 후 생성 작업 시작 - 잘못된 요청은 HTTPException"""
+        if self.blogs and blog not in self.blogs:
+            raise HTTPException(404, f"알 수 없는 블로그: {blog} (가능: {', '.join(sorted(self.blogs))})")
+        if self.writer is None:
+            raise HTTPException(503, "LLM 클라이언트를 사용할 수 없습니다 (API 키 확인)")
+
+        job = Job(
+            id=0, blog=blog, day=day, stage="seo", priority=0, attempts=1, max_attempts=1,
+            lease_token="", payload={},
+        )
+        try:
+            plan_item, serp_context, tone_guide = await asyncio.to_thread(self._load_inputs, job)
+        except PermanentJobError as e:
+            raise HTTPException(404, str(e))
+
+        record = PostRecord(id=new_run_id(), blog=blog, day=day)
+        self.posts.add(record)
+        record.publish({"event": "accepted", "post_id": record.id, "blog": blog, "day": day})
+
+        task = asyncio.create_task(self._generate(record, plan_item, tone_guide, serp_context))
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+        return record
+
+    async def _generate(
+        self,
+        record: PostRecord,
+        plan_item: Dict[str, Any],
+        tone_guide: Dict[str, Any],
+        serp_context: Dict[str, Any]
+    ) -> None:
+        from nodes.seo_content_writer_node import save_contents
+
+        start = time.perf_counter()
+        record.status = RUNNING
+        with run_scope(record.id, blog=record.blog), node_scope("SEOContentWriter", day=record.day):
+            record.publish({"event": "start", "title": plan_item.get("title", "")})
+            try:
+                content = await self.writer.agenerate_single(
+                    record.day, plan_item, tone_guide, serp_context, on_progress=record.publish
+                )
+                paths = await asyncio.to_thread(
+                    save_contents, [content], os.path.join(self.output_dir, record.blog)
+                )
+            except BaseException as e:
+                record.status, record.error, record.finished_at = ERROR, f"{type(e).__name__}: {e}", time.time()
+                record.publish({"event": "error", "error": record.error})
+                if not isinstance(e, Exception):
+                    raise
+                logger.exception(f"❌ {record.blog} Day {record.day} 생성 실패")
+                return
+
+        record.content, record.file = content, paths[0]
+        record.status, record.finished_at = DONE, time.time()
+        record.publish({
+            "event": "done",
+            "post_id": record.id,
+            "file": record.file,
+            "title": content.get("title"),
+            "char_count": content.get("full_text_length", 0),
+            "elapsed_s": round(time.perf_counter() - start, 2),
+        })
+
+    async def stream(self, record: PostRecord) -> AsyncIterator[str]:
+        index = 0
+        async for event in record.follow(self.ping_s):
+            if event is not None:
+                index += 1
+            yield _sse(event, index)
+
+    def render(self, platform: str, body: Dict[str, Any]) -> Response:
+        renderer = self.renderers.get(platform)
+        if renderer is None:
+            raise HTTPException(404, f"알 수 없는 플랫폼: {platform} (가능: {', '.join(sorted(self.renderers))})")
+
+        content = body.get("content")
+        if content is None:
+            post_id = body.get("post_id")
+            if not post_id:
+                raise HTTPException(422, "post_id 또는 content가 필요합니다")
+            record = self.posts.get(post_id)
+            if record is None:
+                raise HTTPException(404, f"알 수 없는 글: {post_id}")
+            if record.status != DONE:
+                raise HTTPException(409, f"아직 완료되지 않은 글입니다 (상태: {record.status})")
+            content = record.content
+        if not isinstance(content, dict):
+            raise HTTPException(422, "content는 SEO 콘텐츠 객체여야 합니다")
+
+        # 렌더러가 상태의 content를 고쳐 쓰므로 요청마다 새 상태
+        html = renderer.render(seo_content_to_state(content, body.get("tags")))
+        if platform == "brunch":
+            return PlainTextResponse(html, media_type="text/markdown; charset=utf-8")
+        return HTMLResponse(html)
+
+    def health(self) -> Dict[str, Any]:
+        return {
+            "pid": os.getpid(),
+            "uptime_s": round(time.time() - self.started_at, 1),
+            "llm": self.writer is not None,
+            "blogs": sorted(self.blogs),
+            "posts": self.posts.counts(),
+        }
+
+
+def create_app(service: Optional[ApiService] = None) -> FastAPI:
+    service = service or ApiService()
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        # 설정/노드 로드는 파일 I/O + SDK 초기화라 스레드에서
+        await asyncio.to_thread(service.warm_up)
+        yield
+        await service.shutdown()
+
+    app = FastAPI(title="Blog Generation API", lifespan=lifespan)
+    app.state.service = service
+
+    @app.post("/plans/{blog}/days/{n}/generate")
+    async def generate(blog: str, n: int, stream: bool = True) -> Response:
+        record = await service.start_generation(blog, n)
+        if not stream:
+            return JSONResponse({"post_id": record.id, "status_url": f"/posts/{record.id}"}, status_code=202)
+        return StreamingResponse(
+            service.stream(record),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no", "X-Post-Id": record.id},
+        )
+
+    @app.get("/posts/{post_id}")
+    async def get_post(post_id: str) -> Dict[str, Any]:
+        record = service.posts.get(post_id)
+        if record is None:
+            raise HTTPException(404, f"알 수 없는 글: {post_id}")
+        return record.summary()
+
+    # 템플릿 파일 읽기 + 문자열 치환은 동기 함수로 두어 스레드 풀에서 실행
+    @app.post("/render/{platform}")
+    def render(platform: str, body: Dict[str, Any] = Body(...)) -> Response:
+        return service.render(platform, body)
+
+    @app.get("/health")
+    async def health() -> Dict[str, Any]:
+        return service.health()
+
+    return app
+
+
+app = create_app()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="블로그 글 생성 REST API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args(argv)
+
+    uvicorn.run(app, host=args.host, port=args.port)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
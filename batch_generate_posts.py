@@ -1,36 +1,41 @@
 """
 30개 블로그 포스트 일괄 생성 스크립트
-GPT+Claude 하이브리드 2단계 협업 글쓰기
+- 기본: GPT+Claude 하이브리드 2단계 협업 글쓰기
+- Batch API 모드: SEO 콘텐츠(구조 → 본문)를 OpenAI Batch API로 예약 생성 (여행 전 백필 등)
 """
 
 import json
 import os
 from datetime import datetime
 from nodes.hybrid_post_writer_node import HybridPostWriterNode
+from nodes.seo_content_writer_node import SEOContentWriterNode, save_contents
 from utils.logger import get_logger
+from utils.metrics import format_projection, format_run_summary, run_summary
+from utils.plan_store import DEFAULT_BLOG, DEFAULT_PLAN_FILE, get_plan_store, load_plan_store
+from utils.run_context import get_run_id
+from utils.profiling import format_profile_summary
+from utils.tracing import format_trace_report
 
 logger = get_logger("BatchGenerator")
 
 
-def load_content_plan(plan_file: str = "outputs/initial_pipeline_result.json"):
-    """30일 콘텐츠 계획 로드"""
+def load_content_plan(plan_file: str = DEFAULT_PLAN_FILE, blog: str = DEFAULT_BLOG):
+    """30일 콘텐츠 계획 로드 (utils.plan_store - SERP 원문/대화 기록이 든 JSON 전체는 바뀌었을 때만 다시 읽음)"""
     
-    if not os.path.exists(plan_file):
+    try:
+        store = load_plan_store(blog, plan_file, tone_guide_file=None)
+    except FileNotFoundError:
         raise FileNotFoundError(
             f"콘텐츠 계획 파일이 없습니다: {plan_file}\n"
             "먼저 'python run_full_pipeline.py'를 실행하세요."
-        )
-    
-    with open(plan_file, "r", encoding="utf-8") as f:
-        data = json.load(f)
+        ) from None
     
-    content_plan = data.get("content_plan", {})
-    plan_items = content_plan.get("30_days_plan", [])
+    plan_items = store.plan_items(blog)
     
     if not plan_items:
         raise ValueError("30일 계획이 비어있습니다.")
     
-    return plan_items, data.get("serp_data", {})
+    return plan_items, store.serp_snapshot(blog)
 
 
 def generate_batch_posts(
@@ -67,12 +72,8 @@ def generate_batch_posts(
     print(f"📅 생성 범위: Day {start_day} ~ Day {end_day} (총 {total_count}개)")
     print()
     
-    # 예상 비용 계산
-    cost_per_post = 35  # ₩35/포스트 (GPT ₩5 + Claude ₩30)
-    total_cost = cost_per_post * total_count
-    
-    print(f"💰 예상 비용: ₩{total_cost:,} (₩{cost_per_post}/포스트)")
-    print(f"⏱️  예상 시간: {total_count * 0.5:.1f}분 (30초/포스트)")
+    # 예상 비용/시간 (과거 실측치 p50/p90 기준)
+    print(format_projection(total_count))
     print()
     
     # 확인
@@ -114,6 +115,7 @@ def generate_batch_posts(
             output_file = os.path.join(output_dir, f"day{day:02d}.json")
             with open(output_file, "w", encoding="utf-8") as f:
                 json.dump(result, f, ensure_ascii=False, indent=2)
+            get_plan_store().save_post(DEFAULT_BLOG, day, "write", result, output_file)
             
             # 요약 정보
             final_content = result.get("final_content", "")
@@ -170,7 +172,13 @@ def generate_batch_posts(
         print(f"\n📈 통계:")
         print(f"   총 글자 수: {total_chars:,}자")
         print(f"   평균 글자 수: {avg_chars:,.0f}자/포스트")
-        print(f"   실제 비용: 약 ₩{successful * cost_per_post:,}")
+    
+    print()
+    print(format_run_summary(get_run_id()))
+    print(format_trace_report(get_run_id()))
+    profile_summary = format_profile_summary(get_run_id())
+    if profile_summary:
+        print(profile_summary)
     
     # 요약 파일 저장
     summary_file = os.path.join(output_dir, "generation_summary.json")
@@ -180,6 +188,8 @@ def generate_batch_posts(
         "total_count": total_count,
         "successful": successful,
         "failed": failed,
+        "run_id": get_run_id(),
+        "measured": run_summary(get_run_id()),
         "results": results
     }
     
@@ -192,6 +202,70 @@ def generate_batch_posts(
     return results
 
 
+def generate_batch_api_posts(
+    start_day: int = 1,
+    end_day: int = 30,
+    output_dir: str = "outputs/content",
+    tone_guide_file: str = "outputs/tone_style_guide.json"
+):
+    """
+    OpenAI Batch API로 SEO 콘텐츠 생성 (지연 무관, 비용/레이트 리밋 우선)
+    
+    1차 배치(구조) 완료 후 2차 배치(본문)를 제출하며,
+    결과는 outputs/content/dayXX_content.json 으로 저장
+    
+    Args:
+        start_day: 시작 일자 (1~30)
+        end_day: 종료 일자 (1~30)
+        output_dir: 출력 디렉토리
+        tone_guide_file: 문체·톤 가이드 파일
+    """
+    
+    print("\n" + "="*80)
+    print("📦 Batch API 콘텐츠 예약 생성")
+    print("="*80)
+    print()
+    
+    plan_items, serp_context = load_content_plan()
+    
+    if not os.path.exists(tone_guide_file):
+        raise FileNotFoundError(
+            f"톤 가이드 파일이 없습니다: {tone_guide_file}\n"
+            "먼저 'python -m nodes.tone_style_generator_node'를 실행하세요."
+        )
+    with open(tone_guide_file, "r", encoding="utf-8") as f:
+        tone_guide = json.load(f)
+    
+    start_day = max(1, min(start_day, len(plan_items)))
+    end_day = max(start_day, min(end_day, len(plan_items)))
+    
+    print(f"📅 생성 범위: Day {start_day} ~ Day {end_day} (총 {end_day - start_day + 1}개)")
+    print("⏱️  배치 2회 (구조 → 본문), 각각 완료까지 최대 24시간")
+    print(format_projection(end_day - start_day + 1, batch=True))
+    print()
+    
+    writer = SEOContentWriterNode()
+    results = writer.generate_all_batch(
+        content_plan=plan_items,
+        tone_guide=tone_guide,
+        serp_context=serp_context,
+        start_day=start_day,
+        end_day=end_day
+    )
+    paths = save_contents(results, output_dir)
+    store = get_plan_store()
+    for content, path in zip(results, paths):
+        store.save_post(DEFAULT_BLOG, content.get("day", 0), "seo", content, path)
+    
+    print(f"\n✅ {len(paths)}개 파일 저장: {output_dir}/")
+    print(format_run_summary(get_run_id()))
+    print(format_trace_report(get_run_id()))
+    profile_summary = format_profile_summary(get_run_id())
+    if profile_summary:
+        print(profile_summary)
+    return results
+
+
 def main():
     """메인 함수"""
     
@@ -201,16 +275,28 @@ def main():
     print("  1. 전체 생성 (Day 1~30)")
     print("  2. 범위 지정 생성")
     print("  3. 단일 생성 (1개만)")
+    print("  4. Batch API 예약 생성 (범위 지정, 비용 50% 절감)")
     
-    choice = input("\n선택 (1/2/3, 기본값=1): ").strip()
+    choice = input("\n선택 (1/2/3/4, 기본값=1): ").strip()
+    
+    if choice == "4":
+        start = input("시작 날짜 (1~30, 기본값=1): ").strip() or "1"
+        end = input("종료 날짜 (1~30, 기본값=7): ").strip() or "7"
+        try:
+            start, end = int(start), int(end)
+        except ValueError:
+            print("❌ 잘못된 입력입니다.")
+            return
+        generate_batch_api_posts(start_day=start, end_day=end)
     
-    if choice == "3":
+    elif choice == "3":
         day = input("생성할 날짜 (1~30): ").strip()
         try:
             day = int(day)
-            generate_batch_posts(start_day=day, end_day=day)
         except ValueError:
             print("❌ 잘못된 입력입니다.")
+            return
+        generate_batch_posts(start_day=day, end_day=day)
     
     elif choice == "2":
         start = input("시작 날짜 (1~30): ").strip()
@@ -218,9 +304,10 @@ def main():
         try:
             start = int(start)
             end = int(end)
-            generate_batch_posts(start_day=start, end_day=end)
         except ValueError:
             print("❌ 잘못된 입력입니다.")
+            return
+        generate_batch_posts(start_day=start, end_day=end)
     
     else:
         # 전체 생성
@@ -0,0 +1,13 @@
+"""
+생성 파이프라인 성능 벤치마크
+
+로컬 대역 서버(mock_server) 또는 녹화 카세트(utils.cassette)를 백엔드로
+시나리오별 벽시계 시간, 노드별 LLM 호출 지연 p50/p95, 글당 호출/토큰 수, 최대 RSS를 측정하고
+커밋 간 비교 가능한 JSON으로 저장
+
+사용:
+  python -m bench                                   # 전체 시나리오 → outputs/bench/<시각>-<커밋>.json
+  python -m bench --scenario seo_batch --days 10
+  python -m bench --cassette outputs/cassettes/prod.jsonl.gz   # 녹화된 실제 응답으로 재생
+  python -m bench --compare outputs/bench/a.json outputs/bench/b.json
+"""
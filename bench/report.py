@@ -0,0 +1,172 @@
+"""
+벤치마크 결과 집계 / 비교
+
+- summarize: 시나리오 1회 실행의 지표 기록(utils.metrics JSONL) → 결과 dict
+- summarize의 nodes는 노드별 LLM 호출 지연, node_wall은 노드 구간(utils.tracing) 전체 시간
+- compare: 두 결과 파일의 시나리오별 지표 차이 (값이 클수록 나쁜 지표만 비교)
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils.metrics import percentile
+
+# 비교 대상 지표 (경로, 노이즈로 보는 절대 차이)
+COMPARED_METRICS: List[Tuple[str, float]] = [
+    ("wall_s", 0.05),
+    ("peak_rss_mb", 5.0),
+    ("llm.calls", 0),
+    ("per_post.calls", 0),
+    ("per_post.tokens", 0),
+    ("per_post.wall_s", 0.01),
+]
+
+
+def node_latency(records: List[Dict[str, Any]]) -> Dict[str, Dict[str, float]]:
+    """노드별 LLM 호출 지연 p50/p95 (배치 호출 제외)"""
+    by_node: Dict[str, List[float]] = {}
+    for record in records:
+        if record.get("batch") or record.get("latency_s") is None:
+            continue
+        by_node.setdefault(record.get("node") or "(none)", []).append(record["latency_s"])
+    return {
+        node: {
+            "calls": len(latencies),
+            "p50_s": round(percentile(latencies, 50), 4),
+            "p95_s": round(percentile(latencies, 95), 4),
+        }
+        for node, latencies in sorted(by_node.items())
+    }
+
+
+def node_wall(node_spans: List[Tuple[str, float]]) -> Dict[str, Dict[str, float]]:
+    """노드 구간(utils.tracing) 벽시계 시간 p50/p95 - LLM 대기 외 전처리/파싱 포함"""
+    by_node: Dict[str, List[float]] = {}
+    for node, duration_s in node_spans:
+        by_node.setdefault(node, []).append(duration_s)
+    return {
+        node: {
+            "runs": len(durations),
+            "p50_s": round(percentile(durations, 50), 4),
+            "p95_s": round(percentile(durations, 95), 4),
+        }
+        for node, durations in sorted(by_node.items())
+    }
+
+
+def summarize(
+    name: str,
+    wall_s: float,
+    peak_rss_mb: float,
+    records: List[Dict[str, Any]],
+    outcome: Dict[str, Any],
+    http_counts: Optional[Dict[str, int]] = None,
+    node_spans: Optional[List[Tuple[str, float]]] = None,
+    coalesced_calls: int = 0
+) -> Dict[str, Any]:
+    prompt_tokens = sum(r.get("prompt_tokens", 0) for r in records)
+    completion_tokens = sum(r.get("completion_tokens", 0) for r in records)
+    posts = outcome.get("posts") or 0
+
+    result: Dict[str, Any] = {
+        "scenario": name,
+        "wall_s": round(wall_s, 4),
+        "peak_rss_mb": round(peak_rss_mb, 1),
+        "outcome": outcome,
+        "llm": {
+            "calls": len(records),
+            # single-flight로 진행 중인 동일 요청에 합류해 실제 요청을 보내지 않은 호출
+            "coalesced": coalesced_calls,
+            "errors": sum(1 for r in records if r.get("error")),
+            "prompt_tokens": prompt_tokens,
+            "cached_tokens": sum(r.get("cached_tokens", 0) for r in records),
+            "completion_tokens": completion_tokens,
+            "cost_krw": round(sum(r.get("cost_krw") or 0.0 for r in records), 2),
+        },
+        "nodes": node_latency(records),
+        "node_wall": node_wall(node_spans or []),
+        "http": http_counts or {},
+    }
+    if posts:
+        result["per_post"] = {
+            "calls": round(len(records) / posts, 3),
+            "tokens": round((prompt_tokens + completion_tokens) / posts, 1),
+            "wall_s": round(wall_s / posts, 4),
+        }
+    return result
+
+
+def _lookup(result: Dict[str, Any], path: str) -> Optional[float]:
+    value: Any = result
+    for key in path.split("."):
+        if not isinstance(value, dict) or key not in value:
+            return None
+        value = value[key]
+    return value if isinstance(value, (int, float)) else None
+
+
+def compare(base: Dict[str, Any], head: Dict[str, Any], threshold: float = 0.10) -> List[Dict[str, Any]]:
+    """
+    시나리오별 지표 비교
+
+    Returns:
+        행 목록 (regression: head가 base보다 threshold 비율 이상 + 노이즈 이상 나쁨)
+    """
+    rows: List[Dict[str, Any]] = []
+    for name, head_result in head.get("scenarios", {}).items():
+        base_result = base.get("scenarios", {}).get(name)
+        if base_result is None:
+            continue
+
+        metrics = list(COMPARED_METRICS)
+        for node in head_result.get("nodes", {}):
+            metrics.append((f"nodes.{node}.p95_s", 0.01))
+        for node in head_result.get("node_wall", {}):
+            metrics.append((f"node_wall.{node}.p95_s", 0.01))
+
+        for path, noise in metrics:
+            before = _lookup(base_result, path)
+            after = _lookup(head_result, path)
+            if before is None or after is None:
+                continue
+            delta = after - before
+            ratio = delta / before if before else (0.0 if not delta else float("inf"))
+            rows.append({
+                "scenario": name,
+                "metric": path,
+                "base": before,
+                "head": after,
+                "change": ratio,
+                "regression": ratio > threshold and delta > noise,
+            })
+    return rows
+
+
+def format_results(results: Dict[str, Any]) -> str:
+    lines = [
+        f"{'시나리오':<18}{'시간(s)':>10}{'RSS(MB)':>10}{'LLM 호출':>10}{'합류':>6}{'글당 호출':>10}{'글당 토큰':>11}"
+    ]
+    for name, result in results.get("scenarios", {}).items():
+        if "error" in result:
+            lines.append(f"{name:<18}  ❌ {result['error']}")
+            continue
+        per_post = result.get("per_post", {})
+        lines.append(
+            f"{name:<18}{result['wall_s']:>10.2f}{result['peak_rss_mb']:>10.1f}{result['llm']['calls']:>10}"
+            f"{result['llm'].get('coalesced', '-'):>6}{per_post.get('calls', '-'):>10}{per_post.get('tokens', '-'):>11}"
+        )
+        for node, stats in result.get("nodes", {}).items():
+            lines.append(f"    {node:<26} 호출 {stats['calls']:>4}  p50 {stats['p50_s']:.3f}s  p95 {stats['p95_s']:.3f}s")
+        for node, stats in result.get("node_wall", {}).items():
+            lines.append(f"    {node:<26} 실행 {stats['runs']:>4}  p50 {stats['p50_s']:.3f}s  p95 {stats['p95_s']:.3f}s (노드 전체)")
+    return "\n".join(lines)
+
+
+def format_comparison(rows: List[Dict[str, Any]]) -> str:
+    lines = []
+    for row in rows:
+        mark = "🔺" if row["regression"] else ("🔻" if row["change"] < 0 else "  ")
+        lines.append(
+            f"{mark} {row['scenario']:<18} {row['metric']:<36} "
+            f"{row['base']:>12.3f} → {row['head']:>12.3f}  ({row['change']:+.1%})"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,228 @@
+"""
+벤치마크 실행기
+
+시나리오마다 별도 프로세스(spawn)에서 실행해 최대 RSS와 모듈 전역 상태(클라이언트 풀, 캐시)를 분리
+각 프로세스는 임시 작업 디렉토리에서 자체 대역 서버를 띄우거나 카세트를 재생
+(작업 디렉토리는 끝나면 삭제, 트레이스는 결과 파일 옆 traces/에 저장 - --keep-workdir면 남김)
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import redirect_stderr, redirect_stdout
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _prepare_backend(options: Dict[str, Any]) -> Any:
+    """
+    LLM/HTTP 백엔드 준비 (노드 모듈 임포트 전에 호출)
+
+    Returns:
+        대역 서버 (카세트 재생이면 None)
+    """
+    # 재생/대역 모드에서도 클라이언트 생성에 키가 필요 (실제 API로는 나가지 않음)
+    os.environ["OPENAI_API_KEY"] = os.getenv("OPENAI_API_KEY") or "bench"
+    os.environ["ANTHROPIC_API_KEY"] = os.getenv("ANTHROPIC_API_KEY") or "bench"
+    os.environ["NAVER_CLIENT_ID"] = os.getenv("NAVER_CLIENT_ID") or "bench"
+    os.environ["NAVER_CLIENT_SECRET"] = os.getenv("NAVER_CLIENT_SECRET") or "bench"
+    os.environ["SERP_CRAWL_DELAY"] = "0"
+
+    if options.get("cassette"):
+        os.environ["BLOG_CASSETTE_MODE"] = "replay"
+        os.environ["BLOG_CASSETTE_PATH"] = options["cassette"]
+        os.environ["BLOG_CASSETTE_LATENCY"] = str(options.get("cassette_latency", 0.0))
+        return None
+
+    from mock_server import Behavior, FaultConfig, LatencyProfile, start_mock_server
+
+    behavior = Behavior(
+        latency=LatencyProfile(options["ttft_median"], options["ttft_sigma"], options["tokens_per_s"]),
+        faults=FaultConfig(),
+        seed=options["seed"],
+    )
+    server = start_mock_server(batch_delay=0.1, behavior=behavior)
+    server.state.naver_blogs = options["blogs"]
+
+    os.environ["BLOG_CASSETTE_MODE"] = "off"
+    # provider별 변수가 LLM_BASE_URL보다 우선하므로 모두 대역 서버로 지정
+    os.environ["OPENAI_BASE_URL"] = server.base_url
+    os.environ["ANTHROPIC_BASE_URL"] = server.root_url
+    os.environ["NAVER_API_BASE_URL"] = server.root_url
+    os.environ["NAVER_BLOG_BASE_URL"] = server.root_url
+    return server
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _child(name: str, options: Dict[str, Any], queue: Any) -> None:
+    """시나리오 1개 실행 (spawn된 프로세스)"""
+    sys.path.insert(0, REPO_ROOT)
+    workdir = tempfile.mkdtemp(prefix=f"bench-{name}-")
+    cwd = os.getcwd()
+    os.chdir(workdir)
+    metrics_path = os.path.join(workdir, "llm_calls.jsonl")
+    os.environ["BLOG_METRICS"] = "1"
+    os.environ["BLOG_METRICS_PATH"] = metrics_path
+
+    try:
+        server = _prepare_backend(options)
+
+        from bench.report import summarize
+        from bench.scenarios import SCENARIOS
+        from utils.llm_client import coalesced_call_count
+        from utils.metrics import MetricsStore
+        from utils.run_context import run_scope
+        from utils.tracing import export_trace, get_tracer
+
+        with open(os.path.join(workdir, "output.log"), "w", encoding="utf-8") as log, \
+                redirect_stdout(log), redirect_stderr(log):
+            with run_scope(blog="bench") as run_id:
+                start = time.perf_counter()
+                outcome = SCENARIOS[name](options)
+                wall_s = time.perf_counter() - start
+
+        http_counts = dict(server.state.counters) if server else {}
+        node_spans = [(s.name, s.duration_s) for s in get_tracer().spans(run_id) if s.kind == "node"]
+        result = summarize(
+            name, wall_s, _peak_rss_mb(), MetricsStore(metrics_path).records(), outcome, http_counts, node_spans,
+            coalesced_call_count(),
+        )
+        result["trace"] = export_trace(run_id, options["trace_dir"])
+        if options.get("keep_workdir"):
+            result["workdir"] = workdir
+        queue.put(result)
+    except Exception as e:
+        error = {"scenario": name, "error": f"{type(e).__name__}: {e}"}
+        if options.get("keep_workdir"):
+            error["workdir"] = workdir
+        queue.put(error)
+    finally:
+        os.chdir(cwd)
+        if not options.get("keep_workdir"):
+            shutil.rmtree(workdir, ignore_errors=True)
+
+
+def run_scenario(name: str, options: Dict[str, Any]) -> Dict[str, Any]:
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    process = context.Process(target=_child, args=(name, options, queue), name=f"bench-{name}")
+    process.start()
+    try:
+        result = queue.get(timeout=options["timeout"])
+    except Exception:
+        process.terminate()
+        result = {"scenario": name, "error": f"시간 초과 ({options['timeout']}s)"}
+    process.join()
+    return result
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=REPO_ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_all(names: List[str], options: Dict[str, Any]) -> Dict[str, Any]:
+    results: Dict[str, Any] = {
+        "meta": {
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "backend": "cassette" if options.get("cassette") else "mock",
+            "options": options,
+        },
+        "scenarios": {},
+    }
+    for name in names:
+        print(f"⏱️  {name} 실행 중...")
+        results["scenarios"][name] = run_scenario(name, options)
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    from bench.report import compare, format_comparison, format_results
+    from bench.scenarios import SCENARIOS
+
+    parser = argparse.ArgumentParser(description="생성 파이프라인 성능 벤치마크")
+    parser.add_argument("--scenario", nargs="+", default=["all"], choices=["all", *SCENARIOS], help="실행할 시나리오")
+    parser.add_argument("--days", type=int, default=30, help="SEO/렌더링 시나리오 글 수")
+    parser.add_argument("--blogs", type=int, default=30, help="SERP 크롤링 블로그 수 (대역 서버 검색 결과 수)")
+    parser.add_argument("--idea", default="제주도 여행", help="초기 파이프라인/크롤링 주제")
+    parser.add_argument("--ttft-median", type=float, default=0.2, help="대역 서버 TTFT 중앙값(초)")
+    parser.add_argument("--ttft-sigma", type=float, default=0.3, help="대역 서버 TTFT 로그정규 표준편차")
+    parser.add_argument("--tokens-per-s", type=float, default=0.0, help="대역 서버 출력 토큰 속도 (0이면 즉시)")
+    parser.add_argument("--seed", type=int, default=0, help="대역 서버 난수 시드")
+    parser.add_argument("--cassette", help="대역 서버 대신 재생할 카세트 파일")
+    parser.add_argument("--cassette-latency", type=float, default=0.0, help="카세트 녹화 지연 재현 배율")
+    parser.add_argument("--timeout", type=float, default=900, help="시나리오별 제한 시간(초)")
+    parser.add_argument("--out", help="결과 JSON 경로 (기본 outputs/bench/<시각>-<커밋>.json)")
+    parser.add_argument("--keep-workdir", action="store_true", help="시나리오 임시 작업 디렉토리(출력 로그 등)를 남김")
+    parser.add_argument("--compare", nargs=2, metavar=("BASE", "HEAD"), help="두 결과 파일 비교")
+    parser.add_argument("--threshold", type=float, default=0.10, help="회귀로 볼 악화 비율")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        with open(args.compare[0], "r", encoding="utf-8") as f:
+            base = json.load(f)
+        with open(args.compare[1], "r", encoding="utf-8") as f:
+            head = json.load(f)
+        rows = compare(base, head, args.threshold)
+        print(format_comparison(rows))
+        regressions = [row for row in rows if row["regression"]]
+        print(f"\n{'🔺 회귀 ' + str(len(regressions)) + '건' if regressions else '✅ 회귀 없음'} (기준 {args.threshold:.0%})")
+        return 1 if regressions else 0
+
+    names = list(SCENARIOS) if "all" in args.scenario else args.scenario
+    out = args.out or os.path.join(
+        "outputs", "bench", f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{_git_commit() or 'nogit'}.json"
+    )
+    options = {
+        "days": args.days,
+        "blogs": args.blogs,
+        "idea": args.idea,
+        "ttft_median": args.ttft_median,
+        "ttft_sigma": args.ttft_sigma,
+        "tokens_per_s": args.tokens_per_s,
+        "seed": args.seed,
+        "cassette": os.path.abspath(args.cassette) if args.cassette else None,
+        "cassette_latency": args.cassette_latency,
+        "timeout": args.timeout,
+        "trace_dir": os.path.abspath(os.path.join(os.path.dirname(out), "traces")),
+        "keep_workdir": args.keep_workdir,
+    }
+    results = run_all(names, options)
+
+    directory = os.path.dirname(out)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(out, "w", encoding="utf-8") as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+
+    print()
+    print(format_results(results))
+    print(f"\n💾 결과 저장: {out}")
+    return 1 if any("error" in r for r in results["scenarios"].values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
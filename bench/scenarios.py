@@ -0,0 +1,122 @@
+"""
+벤치마크 시나리오
+
+각 시나리오는 옵션 dict를 받아 실행하고 결과 요약(posts = 생성한 글 수 등)을 반환
+백엔드(대역 서버/카세트)와 실행 컨텍스트는 bench.run이 준비하므로 여기서는 노드 호출만 담당
+노드 모듈은 환경 변수 설정 후에 임포트되도록 함수 안에서 임포트
+"""
+
+import os
+from typing import Any, Callable, Dict, List
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 30일 글감 계획 고정값 (SEO/렌더링 시나리오 입력)
+_CATEGORIES = ["여행준비", "맛집", "숙소", "교통", "비용절약", "일정"]
+
+# 문체 가이드 고정값 (SEOContentWriterNode는 누락 키를 기본값으로 채움)
+FIXTURE_TONE_GUIDE: Dict[str, Any] = {
+    "tone_guide": {"personality": "친근하고 공감하는", "voice": "1인칭"},
+    "seo_rules": {"h2_count": 6, "h3_per_h2": 2},
+    "content_length": {"optimal": 1800},
+}
+
+
+def fixture_plan(days: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "day": day,
+            "category": _CATEGORIES[(day - 1) % len(_CATEGORIES)],
+            "title": f"제주도 여행 완벽 가이드 {day}편 - {_CATEGORIES[(day - 1) % len(_CATEGORIES)]} 총정리",
+            "content_type": "가이드",
+            "main_keywords": ["제주도 여행", _CATEGORIES[(day - 1) % len(_CATEGORIES)]],
+        }
+        for day in range(1, days + 1)
+    ]
+
+
+def _fixture_post(day: int) -> Dict[str, Any]:
+    sections = "".join(
+        f"<h2>💡 섹션 {n}</h2>"
+        + "".join(f"<h3>소주제 {n}-{m}</h3><p>본문 <strong>핵심 키워드</strong> 문단 {m}.\n\n추가 설명 TIP.</p>" for m in range(3))
+        for n in range(6)
+    )
+    return {
+        "title": f"제주도 여행 완벽 가이드 {day}편",
+        "meta_description": "제주도 여행 준비부터 일정까지 한 번에 정리했습니다.",
+        "content": sections * 4,
+        "tags": ["제주도", "여행", f"day{day}"],
+        "created_at": "2025-01-14",
+    }
+
+
+def initial_pipeline(options: Dict[str, Any]) -> Dict[str, Any]:
+    """아이디어 → 주제 선정 → 플랫폼 추천 → SERP 크롤링 → 30일 계획"""
+    from initial_pipeline import run_initial_pipeline
+
+    result = run_initial_pipeline(options.get("idea", "제주도 여행"), skip_refinement=True)
+    plan = result.get("content_plan") or {}
+    return {
+        "posts": 0,
+        "plan_days": len(plan.get("30_days_plan", [])),
+        "blogs": (result.get("serp_data") or {}).get("total_results", 0),
+    }
+
+
+def seo_batch(options: Dict[str, Any]) -> Dict[str, Any]:
+    """Day 1~N SEO 글 온라인 생성 (구조 + 본문 2회 호출/글)"""
+    from nodes.seo_content_writer_node import SEOContentWriterNode
+
+    days = options["days"]
+    results = SEOContentWriterNode().generate_all(fixture_plan(days), FIXTURE_TONE_GUIDE, start_day=1, end_day=days)
+    return {"posts": len(results)}
+
+
+def seo_batch_api(options: Dict[str, Any]) -> Dict[str, Any]:
+    """Day 1~N SEO 글 Batch API 생성 (대역 서버의 배치 완료 지연 포함)"""
+    from nodes.seo_content_writer_node import SEOContentWriterNode
+    from utils.openai_batch import OpenAIBatchRunner
+
+    days = options["days"]
+    writer = SEOContentWriterNode()
+    runner = OpenAIBatchRunner(writer.gpt, poll_interval=0.05, work_dir="batches")
+    results = writer.generate_all_batch(
+        fixture_plan(days), FIXTURE_TONE_GUIDE, start_day=1, end_day=days, runner=runner
+    )
+    return {"posts": len(results)}
+
+
+def serp_crawl(options: Dict[str, Any]) -> Dict[str, Any]:
+    """상위 N개 블로그 검색 + 블로그별 새글/인기글 목록 크롤링"""
+    from nodes.serp_crawler_node import SERPCrawlerNode
+
+    result = SERPCrawlerNode().crawl({"selected_topic": {"title": options.get("idea", "제주도 여행")}})
+    return {
+        "posts": 0,
+        "blogs": result["total_results"],
+        "crawled_posts": result["total_recent_posts"] + result["total_popular_posts"],
+    }
+
+
+def render_all(options: Dict[str, Any]) -> Dict[str, Any]:
+    """N개 글을 4개 플랫폼 템플릿으로 렌더링 (LLM 호출 없음, CPU 전용)"""
+    from html_renderers import BrunchRenderer, NaverRenderer, TistoryRenderer, WordPressRenderer
+
+    template_dir = os.path.join(REPO_ROOT, "templates")
+    renderers = [NaverRenderer(template_dir), TistoryRenderer(template_dir), WordPressRenderer(template_dir), BrunchRenderer(template_dir)]
+
+    rendered_bytes = 0
+    days = options["days"]
+    for day in range(1, days + 1):
+        for renderer in renderers:
+            rendered_bytes += len(renderer.render(_fixture_post(day)).encode("utf-8"))
+    return {"posts": days, "renders": days * len(renderers), "rendered_bytes": rendered_bytes}
+
+
+SCENARIOS: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+    "initial_pipeline": initial_pipeline,
+    "seo_batch": seo_batch,
+    "seo_batch_api": seo_batch_api,
+    "serp_crawl": serp_crawl,
+    "render_all": render_all,
+}
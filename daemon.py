@@ -0,0 +1,456 @@
+"""
+상주 생성 데몬 + 가벼운 클라이언트
+- 한 번 띄워 두면 LLM SDK/노드 모듈 임포트, .env 로드, 공유 LLM 클라이언트(커넥션 풀),
+  블로그 설정, 렌더러 템플릿을 메모리에 유지 (블로그별 30일 계획 / 문체·톤 가이드는 계획 저장소 utils.plan_store)
+- 로컬 HTTP(기본 127.0.0.1:8765) 또는 유닉스 소켓으로 생성 요청을 받고
+  진행 상황(노드 로그)을 NDJSON 스트림(한 줄에 이벤트 하나)으로 돌려줌
+- 생성 단계는 worker.py와 같은 함수(write / seo)를 사용
+- 클라이언트 명령은 표준 라이브러리만 임포트하므로 OS 스케줄러(cron 등)의 매일 작업이 가벼움
+
+사용 예:
+    python daemon.py serve --socket /tmp/blog.sock          # 데몬 (또는 --port 8765)
+    python daemon.py generate --blog woncamp --day 3        # 진행 상황을 받아 출력
+    python daemon.py generate --blog woncamp                # Day 생략 시 블로그의 다음 Day (daily_content_generator.DailyState)
+    python daemon.py status / reload
+    curl -N -X POST localhost:8765/generate -d '{"blog": "woncamp", "day": 3}'
+
+API:
+- GET  /health   → 상태 (기동 시간, 처리/진행 중 건수, 워밍 정보)
+- POST /generate → {"blog", "day"(생략 가능), "stage"("seo" 기본 / "write"), "payload"(worker 단계 인자)}
+                   응답: application/x-ndjson 스트림 (accepted → log ... → done / error, 대기 중에는 ping)
+- POST /reload   → 설정 다시 로드, 바뀐 계획/가이드 JSON은 계획 저장소로 다시 가져옴
+
+환경 변수:
+- BLOG_DAEMON_SOCKET: 유닉스 소켓 경로 (지정 시 HTTP 포트 대신 사용)
+- BLOG_DAEMON_HOST / BLOG_DAEMON_PORT: HTTP 주소 (기본 127.0.0.1 / 8765)
+- BLOG_DAEMON_WORKERS: 동시 생성 수 (기본 4, 전역 LLM 한도는 utils.budget)
+"""
+
+import argparse
+import http.client
+import json
+import os
+import queue
+import signal
+import socket
+import socketserver
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+PING_INTERVAL_S = 15.0
+
+
+def _address(args: argparse.Namespace) -> Tuple[Optional[str], str, int]:
+    """(유닉스 소켓 경로, 호스트, 포트) - 인자 > 환경 변수 > 기본값"""
+    socket_path = args.socket or os.getenv("BLOG_DAEMON_SOCKET") or None
+    host = args.host or os.getenv("BLOG_DAEMON_HOST", DEFAULT_HOST)
+    port = args.port or int(os.getenv("BLOG_DAEMON_PORT", str(DEFAULT_PORT)))
+    return socket_path, host, port
+
+
+# ---------------------------------------------------------------------------
+# 데몬
+# ---------------------------------------------------------------------------
+
+class GenerationDaemon:
+    """워밍된 상태 + 생성 실행기 (utils/노드 모듈은 serve 시에만 임포트)"""
+
+    def __init__(self, workers: Optional[int] = None) -> None:
+        import worker
+        from utils.logger import get_logger
+        from utils.progress import get_progress_hub
+
+        self.worker = worker
+        self.logger = get_logger("Daemon")
+        self.hub = get_progress_hub()
+        self.executor = ThreadPoolExecutor(
+            max_workers=workers or int(os.getenv("BLOG_DAEMON_WORKERS", "4")), thread_name_prefix="daemon-gen"
+        )
+        self.started_at = time.time()
+        self.blogs: Dict[str, Dict[str, Any]] = {}
+        self.renderers: Dict[str, Any] = {}
+        # 블로그별 일일 상태 (day 없는 요청의 다음 Day, 앞 Day가 모두 끝나야 진행)
+        self.daily: Dict[str, Any] = {}
+        self.warm: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        # day 없이 요청된 (블로그, Day) 중 생성 중인 것 - 동시 요청이 같은 Day를 받지 않게
+        self._reserved_days: Set[Tuple[str, int]] = set()
+        self.running = 0
+        self.finished = {"done": 0, "error": 0}
+
+    def warm_up(self) -> None:
+        """모듈 임포트, LLM 클라이언트, 설정/계획/가이드/템플릿 로드"""
+        start = time.perf_counter()
+        import nodes.hybrid_post_writer_node  # noqa: F401  (SDK/노드 모듈 임포트 비용을 기동 시 지불)
+        import nodes.seo_content_writer_node  # noqa: F401
+        from html_renderers import BaseRenderer, BrunchRenderer, NaverRenderer, TistoryRenderer, WordPressRenderer
+        from run_multi_blog import load_blog_configs
+        from utils.job_queue import PermanentJobError
+        from utils.llm_client import get_llm_client
+
+        clients = []
+        for kind in ("gpt", "hybrid"):
+            try:
+                get_llm_client(kind)
+                clients.append(kind)
+            except ValueError as e:
+                self.logger.warning(f"⚠️ LLM 클라이언트({kind}) 준비 실패: {e}")
+        self.blogs = {config["blog_name"]: config for config in load_blog_configs()}
+        self.renderers = {
+            "naver": NaverRenderer(), "tistory": TistoryRenderer(), "wordpress": WordPressRenderer(),
+            "brunch": BrunchRenderer(), "base": BaseRenderer(),
+        }
+
+        # 블로그별 계획/톤 가이드를 저장소로 가져옴 (원본 JSON이 바뀌었으면 다시 가져옴)
+        planned = []
+        for blog in sorted(self.blogs):
+            try:
+                self.worker.plan_store_for(blog)
+                planned.append(blog)
+            except PermanentJobError as e:
+                self.logger.warning(f"⚠️ {blog} 계획 없음 (생성 요청 시 다시 확인): {e}")
+
+        self.warm = {
+            "clients": clients,
+            "blogs": sorted(self.blogs),
+            "plans": planned,
+            "renderers": sorted(self.renderers),
+            "warm_up_s": round(time.perf_counter() - start, 3),
+        }
+        print(f"🔥 워밍 완료 ({self.warm['warm_up_s']:.2f}초): 클라이언트 {clients}, 블로그 {self.warm['blogs']}")
+
+    def reload(self) -> Dict[str, Any]:
+        self.warm_up()
+        return self.warm
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "pid": os.getpid(),
+                "uptime_s": round(time.time() - self.started_at, 1),
+                "running": self.running,
+                "finished": dict(self.finished),
+                "warm": self.warm,
+            }
+
+    def submit(self, request: Dict[str, Any]) -> Tuple[str, "queue.Queue[Dict[str, Any]]"]:
+        """요청 검증 후 실행 예약, (run_id, 진행 이벤트 큐) 반환 - 잘못된 요청은 ValueError"""
+        from utils.job_queue import Job
+        from utils.run_context import new_run_id
+
+        blog = request.get("blog")
+        if not blog:
+            raise ValueError("blog가 필요합니다")
+        if self.blogs and blog not in self.blogs:
+            raise ValueError(f"알 수 없는 블로그: {blog} (가능: {', '.join(sorted(self.blogs))})")
+        stage = request.get("stage", "seo")
+        if stage not in self.worker.STAGES:
+            raise ValueError(f"알 수 없는 단계: {stage} (가능: {', '.join(sorted(self.worker.STAGES))})")
+
+        day = request.get("day")
+        advance_daily = day is None
+        if advance_daily:
+            with self._lock:
+                state = self._daily_state(blog)
+                day = state.get_next_day()
+                # 진행 중이거나 순서를 앞질러 이미 끝난 Day는 건너뜀
+                done = state.completed_ahead()
+                while (blog, day) in self._reserved_days or day in done:
+                    day += 1
+                self._reserved_days.add((blog, day))
+        job = Job(
+            id=0, blog=blog, day=int(day), stage=stage, priority=0, attempts=1, max_attempts=1,
+            lease_token="", payload=dict(request.get("payload") or {}),
+        )
+
+        run_id = new_run_id()
+        events = self.hub.subscribe(run_id)
+        with self._lock:
+            self.running += 1
+        self.executor.submit(self._run, run_id, job, advance_daily)
+        return run_id, events
+
+    def _daily_state(self, blog: str) -> Any:
+        """블로그별 DailyState (호출자가 self._lock 보유)"""
+        if blog not in self.daily:
+            from daily_content_generator import DailyState
+            self.daily[blog] = DailyState(blog)
+        return self.daily[blog]
+
+    def _run(self, run_id: str, job: Any, advance_daily: bool) -> None:
+        from utils.run_context import run_scope
+
+        fn, _ = self.worker.STAGES[job.stage]
+        start = time.perf_counter()
+        outcome = "error"
+        with run_scope(run_id, blog=job.blog):
+            self.hub.publish(run_id, {"event": "start", "blog": job.blog, "day": job.day, "stage": job.stage})
+            try:
+                result = fn(job)
+                if advance_daily:
+                    with self._lock:
+                        # 앞 Day가 아직 안 끝났으면 완료만 기록하고 next_day는 그대로
+                        self._daily_state(job.blog).update_state(job.day)
+                outcome = "done"
+                self.hub.publish(run_id, {
+                    "event": "done", "result": result, "elapsed_s": round(time.perf_counter() - start, 2),
+                })
+            except Exception as e:
+                self.logger.exception(f"❌ {job.blog} Day {job.day} {job.stage} 생성 실패")
+                self.hub.publish(run_id, {"event": "error", "error": f"{type(e).__name__}: {e}"})
+            finally:
+                with self._lock:
+                    if advance_daily:
+                        self._reserved_days.discard((job.blog, job.day))
+                    self.running -= 1
+                    self.finished[outcome] += 1
+
+    def shutdown(self) -> None:
+        self.executor.shutdown(wait=True)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: Any
+
+    @property
+    def daemon(self) -> GenerationDaemon:
+        return self.server.daemon
+
+    def address_string(self) -> str:
+        # 유닉스 소켓이면 client_address가 빈 문자열
+        return self.client_address[0] if isinstance(self.client_address, tuple) else "unix"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        self.daemon.logger.info(f"{self.address_string()} {format % args}")
+
+    def _send_json(self, status: int, body: Dict[str, Any]) -> None:
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _read_json(self) -> Dict[str, Any]:
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        body = json.loads(self.rfile.read(length).decode("utf-8"))
+        if not isinstance(body, dict):
+            raise ValueError("요청 본문은 JSON 객체여야 합니다")
+        return body
+
+    def do_GET(self) -> None:
+        if self.path == "/health":
+            self._send_json(200, self.daemon.status())
+        else:
+            self._send_json(404, {"error": f"없는 경로: {self.path}"})
+
+    def do_POST(self) -> None:
+        try:
+            request = self._read_json()
+        except ValueError as e:
+            self._send_json(400, {"error": f"잘못된 JSON: {e}"})
+            return
+
+        if self.path == "/reload":
+            self._send_json(200, self.daemon.reload())
+        elif self.path == "/generate":
+            try:
+                run_id, events = self.daemon.submit(request)
+            except ValueError as e:
+                self._send_json(400, {"error": str(e)})
+                return
+            self._stream(run_id, events)
+        else:
+            self._send_json(404, {"error": f"없는 경로: {self.path}"})
+
+    def _stream(self, run_id: str, events: "queue.Queue[Dict[str, Any]]") -> None:
+        """진행 이벤트를 chunked NDJSON으로 전송 (클라이언트가 끊겨도 생성은 계속)"""
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson; charset=utf-8")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        try:
+            self._write_chunk({"event": "accepted", "run_id": run_id})
+            while True:
+                try:
+                    event = events.get(timeout=PING_INTERVAL_S)
+                except queue.Empty:
+                    event = {"event": "ping"}
+                self._write_chunk(event)
+                if event["event"] in ("done", "error"):
+                    break
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            self.daemon.logger.info(f"🔌 클라이언트 연결 끊김 (run {run_id}, 생성은 계속)")
+            self.close_connection = True
+        finally:
+            self.daemon.hub.unsubscribe(run_id, events)
+
+    def _write_chunk(self, event: Dict[str, Any]) -> None:
+        data = (json.dumps(event, ensure_ascii=False, default=str) + "\n").encode("utf-8")
+        self.wfile.write(f"{len(data):X}\r\n".encode("ascii") + data + b"\r\n")
+        self.wfile.flush()
+
+
+class _ThreadingUnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def serve(args: argparse.Namespace) -> int:
+    socket_path, host, port = _address(args)
+    daemon = GenerationDaemon(args.workers)
+    daemon.warm_up()
+
+    server: socketserver.BaseServer
+    if socket_path:
+        if os.path.exists(socket_path):
+            os.remove(socket_path)  # 이전 실행이 남긴 소켓 파일
+        server = _ThreadingUnixHTTPServer(socket_path, _Handler)
+        where = f"unix:{socket_path}"
+    else:
+        server = ThreadingHTTPServer((host, port), _Handler)
+        where = f"http://{host}:{server.server_address[1]}"
+    server.daemon = daemon  # type: ignore[attr-defined]
+
+    def stop(signum: int, frame: Any) -> None:
+        # serve_forever와 같은 스레드에서 shutdown을 부르면 교착되므로 별도 스레드
+        threading.Thread(target=server.shutdown, daemon=True).start()
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    print(f"🛰️  생성 데몬 대기 중: {where} (PID {os.getpid()})")
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        daemon.shutdown()
+        if socket_path and os.path.exists(socket_path):
+            os.remove(socket_path)
+        print("🛑 생성 데몬 종료")
+    return 0
+
+
+# ---------------------------------------------------------------------------
+# 클라이언트 (표준 라이브러리만 사용)
+# ---------------------------------------------------------------------------
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, socket_path: str, timeout: Optional[float] = None) -> None:
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self) -> None:
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if self.timeout is not None:
+            self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
+
+
+def _connect(args: argparse.Namespace) -> http.client.HTTPConnection:
+    socket_path, host, port = _address(args)
+    if socket_path:
+        return _UnixHTTPConnection(socket_path)
+    return http.client.HTTPConnection(host, port)
+
+
+def _print_event(event: Dict[str, Any], quiet: bool) -> None:
+    kind = event.get("event")
+    if kind == "accepted":
+        print(f"📨 접수 (run {event['run_id']})")
+    elif kind == "start":
+        print(f"🚀 {event['blog']} Day {event['day']} {event['stage']} 생성 시작")
+    elif kind == "log" and not quiet:
+        node = f"[{event['node']}] " if event.get("node") else ""
+        print(f"   {node}{event['message']}")
+    elif kind == "done":
+        result = event.get("result") or {}
+        print(f"✅ 완료 ({event.get('elapsed_s')}초): {result.get('title')} → {result.get('file')}")
+    elif kind == "error":
+        print(f"❌ 실패: {event.get('error')}")
+
+
+def client_generate(args: argparse.Namespace) -> int:
+    request: Dict[str, Any] = {"blog": args.blog, "stage": args.stage}
+    if args.day is not None:
+        request["day"] = args.day
+    if args.payload:
+        request["payload"] = json.loads(args.payload)
+
+    try:
+        conn = _connect(args)
+        conn.request("POST", "/generate", body=json.dumps(request), headers={"Content-Type": "application/json"})
+        response = conn.getresponse()
+    except OSError as e:
+        print(f"❌ 데몬에 연결할 수 없습니다: {e} (python daemon.py serve 실행 여부 확인)")
+        return 2
+
+    if response.status != 200:
+        print(f"❌ 요청 거부 ({response.status}): {json.loads(response.read() or b'{}').get('error')}")
+        return 1
+
+    outcome = None
+    for line in response:
+        if not line.strip():
+            continue
+        event = json.loads(line)
+        _print_event(event, args.quiet)
+        if event.get("event") in ("done", "error"):
+            outcome = event["event"]
+    conn.close()
+    return 0 if outcome == "done" else 1
+
+
+def client_simple(args: argparse.Namespace, method: str, path: str) -> int:
+    try:
+        conn = _connect(args)
+        conn.request(method, path)
+        response = conn.getresponse()
+        body = json.loads(response.read() or b"{}")
+    except OSError as e:
+        print(f"❌ 데몬에 연결할 수 없습니다: {e}")
+        return 2
+    print(json.dumps(body, ensure_ascii=False, indent=2))
+    return 0 if response.status == 200 else 1
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="상주 생성 데몬")
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--socket", help="유닉스 소켓 경로 (BLOG_DAEMON_SOCKET)")
+    common.add_argument("--host", help=f"HTTP 호스트 (기본 {DEFAULT_HOST})")
+    common.add_argument("--port", type=int, help=f"HTTP 포트 (기본 {DEFAULT_PORT})")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = sub.add_parser("serve", parents=[common], help="데몬 실행")
+    serve_parser.add_argument("--workers", type=int, help="동시 생성 수 (BLOG_DAEMON_WORKERS)")
+
+    generate = sub.add_parser("generate", parents=[common], help="생성 요청 (진행 상황 출력)")
+    generate.add_argument("--blog", required=True)
+    generate.add_argument("--day", type=int, help="생략 시 다음 Day")
+    generate.add_argument("--stage", default="seo", help="seo (기본) / write")
+    generate.add_argument("--payload", help="단계 인자 JSON (예: plan_file, output_dir)")
+    generate.add_argument("--quiet", action="store_true", help="노드 로그 생략")
+
+    sub.add_parser("status", parents=[common], help="데몬 상태")
+    sub.add_parser("reload", parents=[common], help="설정/계획 캐시 다시 로드")
+
+    args = parser.parse_args(argv)
+    if args.command == "serve":
+        return serve(args)
+    if args.command == "generate":
+        return client_generate(args)
+    if args.command == "status":
+        return client_simple(args, "GET", "/health")
+    return client_simple(args, "POST", "/reload")
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -11,48 +11,99 @@
   python daily_content_generator.py --day 1
   또는
   python daily_content_generator.py --auto  # 다음 Day 자동 선택
+
+상태(다음 Day)는 블로그별 파일에 저장하고, 앞 Day가 모두 끝난 뒤에만 다음 Day로 넘어감
+(Day 5가 Day 4보다 먼저 끝나도 next_day는 4에 머물다가 4가 끝나면 6으로)
+--blog 지정 시 계획/톤 가이드는 블로그 설정의 plan_file / tone_guide_file (run_multi_blog.plan_sources)
 """
 
 import json
 import os
 import sys
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Set
 import argparse
 
 # 경로 추가
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from nodes.seo_content_writer_node import SEOContentWriterNode
+from run_multi_blog import plan_sources
+from utils.metrics import format_projection, format_run_summary
+from utils.plan_store import DEFAULT_BLOG, load_plan_store
+from utils.run_context import get_run_id, node_scope
+from utils.tracing import format_trace_report
+
+
+STATE_DIR = "outputs"
+
+
+class DailyState:
+    """
+    블로그별 일일 생성 상태 (next_day + 순서를 앞질러 끝난 Day)
+
+    - 기본 블로그는 기존 outputs/daily_generation_state.json, 그 외는 daily_generation_state_<블로그>.json
+    - 동시 갱신은 호출자가 직렬화 (데몬은 자체 락 안에서 호출)
+    """
+
+    def __init__(self, blog: str = DEFAULT_BLOG, state_dir: str = STATE_DIR):
+        self.blog = blog
+        name = "daily_generation_state.json" if blog == DEFAULT_BLOG else f"daily_generation_state_{blog}.json"
+        self.state_file = os.path.join(state_dir, name)
+
+    def load(self) -> Dict[str, Any]:
+        if not os.path.exists(self.state_file):
+            return {}
+        with open(self.state_file, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def get_next_day(self) -> int:
+        """다음 생성할 Day 번호 (앞 Day가 모두 끝난 첫 미완료 Day)"""
+        return self.load().get("next_day", 1)
+
+    def completed_ahead(self) -> Set[int]:
+        """next_day보다 뒤인데 이미 끝난 Day (next_day가 이 Day들을 건너뛰며 진행)"""
+        return set(self.load().get("completed_days", []))
+
+    def update_state(self, day: int) -> int:
+        """Day 완료 기록 후 새 next_day 반환 (빈 Day가 있으면 그 앞에서 멈춤)"""
+        state = self.load()
+        next_day = state.get("next_day", 1)
+        completed = set(state.get("completed_days", [])) | {day}
+        while next_day in completed:
+            completed.discard(next_day)
+            next_day += 1
+        state = {
+            "last_generated_day": day,
+            "next_day": next_day,
+            "completed_days": sorted(d for d in completed if d > next_day),
+            "last_generated_at": datetime.now().isoformat(),
+        }
+
+        os.makedirs(os.path.dirname(self.state_file) or ".", exist_ok=True)
+        tmp_file = f"{self.state_file}.tmp"
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(state, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_file, self.state_file)
+        return next_day
 
 
 class DailyContentGenerator:
     """매일 실행하는 콘텐츠 생성기"""
     
-    def __init__(self):
+    def __init__(self, blog: str = DEFAULT_BLOG):
         self.writer = SEOContentWriterNode()
-        self.state_file = "outputs/daily_generation_state.json"
+        self.blog = blog
+        self.state = DailyState(blog)
+        self.state_file = self.state.state_file
     
     def get_next_day(self) -> int:
         """다음 생성할 Day 번호 가져오기"""
-        if not os.path.exists(self.state_file):
-            return 1
-        
-        with open(self.state_file, "r", encoding="utf-8") as f:
-            state = json.load(f)
-            return state.get("next_day", 1)
+        return self.state.get_next_day()
     
-    def update_state(self, day: int):
-        """상태 업데이트"""
-        state = {
-            "last_generated_day": day,
-            "next_day": day + 1,
-            "last_generated_at": datetime.now().isoformat(),
-        }
-        
-        os.makedirs("outputs", exist_ok=True)
-        with open(self.state_file, "w", encoding="utf-8") as f:
-            json.dump(state, f, ensure_ascii=False, indent=2)
+    def update_state(self, day: int) -> int:
+        """상태 업데이트 (새 next_day 반환)"""
+        return self.state.update_state(day)
     
     def get_latest_trends(self, keywords: List[str]) -> Dict[str, Any]:
         """
@@ -108,18 +159,14 @@ class DailyContentGenerator:
         print("="*80)
         print(f"📅 생성 일시: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         
-        # 1. 30일 계획 로드
-        with open("outputs/initial_pipeline_result.json", "r", encoding="utf-8") as f:
-            pipeline_result = json.load(f)
-            content_plan_data = pipeline_result.get("content_plan", {})
-            content_plan = content_plan_data.get("30_days_plan", [])
-            serp_result = pipeline_result.get("serp_result", {})
-        
-        if day > len(content_plan):
-            print(f"❌ Day {day}는 계획에 없습니다. (총 {len(content_plan)}일)")
+        # 1. 30일 계획 중 해당 Day만 로드 (utils.plan_store, JSON이 바뀌었을 때만 다시 가져옴)
+        store = load_plan_store(self.blog, *plan_sources(self.blog))
+        day_plan = store.plan_item(self.blog, day)
+        if day_plan is None:
+            print(f"❌ Day {day}는 계획에 없습니다. (총 {store.day_count(self.blog)}일)")
             return None
+        serp_data = store.serp_snapshot(self.blog)
         
-        day_plan = content_plan[day - 1]
         print(f"\n📌 주제: {day_plan.get('title', 'N/A')}")
         print(f"📂 카테고리: {day_plan.get('category', 'N/A')}")
         
@@ -136,28 +183,23 @@ class DailyContentGenerator:
             day_plan["keywords"].extend(trends.get("hot_keywords", []))
         
         # 3. 문체 가이드 로드
-        with open("outputs/tone_style_guide.json", "r", encoding="utf-8") as f:
-            tone_guide = json.load(f)
+        tone_guide = store.tone_guide(self.blog)
+        if tone_guide is None:
+            print("❌ 문체·톤 가이드가 없습니다. 먼저 python -m nodes.tone_style_generator_node를 실행하세요.")
+            return None
         
         # 4. 콘텐츠 생성
-        print(f"\n💰 예상 비용: ₩35")
-        print(f"⏱️  예상 시간: 30초")
+        print()
+        print(format_projection(1))
         print(f"\n🚀 생성 시작...")
         
-        results = self.writer.generate_all(
-            content_plan=content_plan,
-            tone_guide=tone_guide,
-            serp_context=serp_result,
-            start_day=day,
-            end_day=day
-        )
+        with node_scope("SEOContentWriter", day=day):
+            content = self.writer.generate_single(day, day_plan, tone_guide, serp_data)
         
-        if not results or len(results) == 0:
+        if not content:
             print(f"❌ Day {day} 생성 실패")
             return None
         
-        content = results[0]  # type: dict[str, Any]
-        
         # 5. 저장
         output_dir = "outputs/content"
         os.makedirs(output_dir, exist_ok=True)
@@ -165,9 +207,10 @@ class DailyContentGenerator:
         output_path = os.path.join(output_dir, f"day{day:02d}_content.json")
         with open(output_path, "w", encoding="utf-8") as f:
             json.dump(content, f, ensure_ascii=False, indent=2)
+        store.save_post(self.blog, day, "seo", content, output_path)
         
         # 6. 상태 업데이트
-        self.update_state(day)
+        next_day = self.update_state(day)
         
         # 7. 결과 출력
         print("\n" + "="*80)
@@ -176,13 +219,15 @@ class DailyContentGenerator:
         print(f"💾 저장 위치: {output_path}")
         print(f"📊 글자 수: {content.get('full_text_length', 0)}자")
         print(f"📝 섹션 수: {len(content.get('sections', []))}개")
+        print(format_run_summary(get_run_id()))
+        print(format_trace_report(get_run_id()))
         
         if trends:
             print(f"\n🔥 반영된 트렌드:")
             for keyword in trends.get("hot_keywords", [])[:3]:
                 print(f"   - {keyword}")
         
-        print(f"\n📅 다음 Day: {day + 1}")
+        print(f"\n📅 다음 Day: {next_day}")
         
         return content
     
@@ -231,6 +276,11 @@ def main():
         action="store_true",
         help="최신 트렌드 반영 안 함"
     )
+    parser.add_argument(
+        "--blog",
+        default=DEFAULT_BLOG,
+        help=f"계획 저장소의 블로그 이름 (기본값: {DEFAULT_BLOG})"
+    )
     parser.add_argument(
         "--regenerate",
         action="store_true",
@@ -239,7 +289,7 @@ def main():
     
     args = parser.parse_args()
     
-    generator = DailyContentGenerator()
+    generator = DailyContentGenerator(args.blog)
     
     # Day 선택
     if args.day:
@@ -8,11 +8,14 @@ from .naver_renderer import NaverRenderer
 from .tistory_renderer import TistoryRenderer
 from .wordpress_renderer import WordPressRenderer
 from .brunch_renderer import BrunchRenderer
+from .seo_content import seo_content_to_html, seo_content_to_state
 
 __all__ = [
     'BaseRenderer',
     'NaverRenderer',
     'TistoryRenderer',
     'WordPressRenderer',
-    'BrunchRenderer'
+    'BrunchRenderer',
+    'seo_content_to_html',
+    'seo_content_to_state'
 ]
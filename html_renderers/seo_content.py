@@ -0,0 +1,61 @@
+"""
+SEO Content → Render State
+SEOContentWriterNode 결과(dayXX_content.json)를 렌더러 입력 상태로 변환
+"""
+
+from datetime import datetime
+from html import escape
+from typing import Dict, Any, List, Optional
+
+
+def seo_content_to_html(content: Dict[str, Any]) -> str:
+    """오프닝 / 섹션(H2·H3·단락) / 표 / 체크리스트 / FAQ / 클로징 순서로 본문 HTML 조합"""
+    parts: List[str] = []
+
+    if content.get("opening"):
+        parts.append(f"<p>{escape(content['opening'])}</p>")
+
+    for section in content.get("sections", []):
+        emoji = section.get("h2_emoji", "")
+        h2 = escape(section.get("h2", ""))
+        parts.append(f"<h2>{emoji} {h2}</h2>" if emoji else f"<h2>{h2}</h2>")
+        for h3_content in section.get("h3_contents", []):
+            if h3_content.get("h3"):
+                parts.append(f"<h3>{escape(h3_content['h3'])}</h3>")
+            for paragraph in h3_content.get("paragraphs", []):
+                parts.append(f"<p>{escape(paragraph)}</p>")
+
+    # 표 / 체크리스트는 모델이 HTML로 작성한 그대로
+    if content.get("table_html"):
+        parts.append(content["table_html"])
+    if content.get("checklist_html"):
+        parts.append(content["checklist_html"])
+
+    faq = content.get("faq", [])
+    if faq:
+        parts.append("<h2>❓ 자주 묻는 질문</h2>")
+        for item in faq:
+            parts.append(f"<h3>Q. {escape(item.get('question', ''))}</h3>")
+            parts.append(f"<p>{escape(item.get('answer', item.get('answer_outline', '')))}</p>")
+
+    if content.get("closing"):
+        parts.append(f"<p>{escape(content['closing'])}</p>")
+
+    return "\n\n".join(parts)
+
+
+def seo_content_to_state(content: Dict[str, Any], tags: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    렌더러 render(state)에 넘길 상태 생성
+
+    Args:
+        content: SEOContentWriterNode 결과
+        tags: 태그 (생략 시 keywords_used)
+    """
+    return {
+        "title": content.get("seo_title") or content.get("title", ""),
+        "meta_description": content.get("meta_description", ""),
+        "content": seo_content_to_html(content),
+        "tags": list(tags if tags is not None else content.get("keywords_used", [])),
+        "created_at": datetime.now().strftime("%Y-%m-%d"),
+    }
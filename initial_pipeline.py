@@ -1,76 +1,103 @@
 # initial_pipeline.py
 """
-초기 단계 파이프라인
-아이디어 → 주제 선정 → 플랫폼 추천 → 30일 글감 생성
+초기 단계 파이프라인 (LangGraph StateGraph)
+아이디어 → 주제 선정 → 플랫폼 추천 → SERP 크롤링 → (문체·톤 가이드 ∥ 30일 글감) → 저장
+
+refine → expand → score → platform → serp ─┬─ tone ─┬─ save
+                                           └─ plan ─┘
+문체·톤 가이드와 30일 계획은 SERP 결과만 필요하므로 병렬 분기로 실행 (벽시계 = 임계 경로)
+save를 뺀 노드 출력은 SQLite 체크포인트(utils.checkpoint)에 저장되어, 중간 실패 후 같은 입력으로
+다시 실행하면 완료된 노드를 건너뛰고 실패한 노드부터 이어서 실행
 """
 
 import json
+import os
+import sys
+import time
+from typing import Annotated, Any, Dict, Optional, TypedDict
+
+from langgraph.graph import END, START, StateGraph
+
 from nodes.idea_refiner_node import IdeaRefinerNode
 from nodes.idea_expander_node import IdeaExpanderNode
 from nodes.topic_scorer_node import TopicScorerNode
 from nodes.platform_recommender_node import PlatformRecommenderNode
 from nodes.serp_crawler_node import SERPCrawlerNode
 from nodes.content_planner_node import ContentPlannerNode
+from nodes.tone_style_generator_node import ToneStyleGeneratorNode
+from utils.checkpoint import checkpointed_node
+from utils.graph import format_timings, merge_timings, timed_node
 from utils.logger import get_logger
+from utils.memo import set_fresh
+from utils.metrics import format_run_summary
+from utils.run_context import get_run_id
+from utils.profiling import format_profile_summary
+from utils.tracing import format_trace_report
 
 logger = get_logger("InitialPipeline")
 
+RESULT_FILE = "outputs/initial_pipeline_result.json"
+TONE_GUIDE_FILE = "outputs/tone_style_guide.json"
 
-def run_initial_pipeline(user_idea: str, skip_refinement: bool = False) -> dict:
-    """
-    초기 파이프라인 실행
-    
-    Args:
-        user_idea: 사용자 아이디어 (예: "블로그 자동화", "부동산 투자")
-        skip_refinement: True면 대화형 구체화 과정 건너뛰기 (빠른 테스트용)
-    
-    Returns:
-        전체 파이프라인 결과
-    """
-    
-    print("=" * 80)
-    print("🚀 블로그 자동화 시스템 - 초기 단계 파이프라인")
-    print("=" * 80)
+
+class InitialPipelineState(TypedDict, total=False):
+    """초기 파이프라인 상태 (노드는 자기 키만 돌려줌)"""
+    user_idea: str
+    skip_refinement: bool
+    refined_idea_result: Optional[Dict[str, Any]]
+    expanded_topics: Dict[str, Any]
+    scored_topics: Dict[str, Any]
+    platform_recommendation: Dict[str, Any]
+    serp_data: Dict[str, Any]
+    tone_style_guide: Dict[str, Any]
+    content_plan: Dict[str, Any]
+    # 병렬 분기(tone, plan)가 같은 스텝에 함께 쓰므로 리듀서로 병합
+    timings: Annotated[Dict[str, float], merge_timings]
+
+
+def _refine(state: InitialPipelineState) -> Dict[str, Any]:
+    """Step 0-0: 아이디어 구체화 (대화형 티키타카)"""
+    print("📌 Step 0-0: 아이디어 구체화 (대화형 티키타카)...")
     print()
-    
-    # Step 0-0: 아이디어 구체화 (대화형 티키타카)
-    refined_result = None
-    if not skip_refinement:
-        print("📌 Step 0-0: 아이디어 구체화 (대화형 티키타카)...")
-        print()
-        refiner = IdeaRefinerNode()
-        refined_result = refiner.refine_interactive(user_idea, auto_mode=False)
-        
-        # 구체화된 아이디어 사용
-        user_idea = refined_result["refined_idea"]
-        print()
-        print(f"✅ 아이디어 구체화 완료 (총 {len(refined_result['conversation_history'])}번의 질문)")
-        print()
-    else:
+    refined_result = IdeaRefinerNode().refine_interactive(state["user_idea"], auto_mode=False)
+
+    print()
+    print(f"✅ 아이디어 구체화 완료 (총 {len(refined_result['conversation_history'])}번의 질문)")
+    print()
+    # 이후 단계는 구체화된 아이디어 사용
+    return {"refined_idea_result": refined_result, "user_idea": refined_result["refined_idea"]}
+
+
+def _route_start(state: InitialPipelineState) -> str:
+    if state.get("skip_refinement"):
         print("⚠️  아이디어 구체화 과정을 건너뜁니다.")
         print()
-    
-    # Step 0-1: 아이디어 확장
+        return "expand"
+    return "refine"
+
+
+def _expand(state: InitialPipelineState) -> Dict[str, Any]:
+    """Step 0-1: 아이디어 확장"""
     print("📌 Step 0-1: 아이디어 확장 중...")
-    step0_1 = IdeaExpanderNode()
-    expanded_topics = step0_1.expand(user_idea)
-    
-    print(f"✅ {len(expanded_topics.get('topics', []))}개의 주제 후보 생성 완료")
+    expanded_topics = IdeaExpanderNode().expand(state["user_idea"])
+
+    topics = expanded_topics.get("topics", [])
+    print(f"✅ {len(topics)}개의 주제 후보 생성 완료")
     print()
-    
-    # 생성된 주제 미리보기
     print("📋 생성된 주제 후보:")
-    for topic in expanded_topics.get('topics', [])[:5]:
+    for topic in topics[:5]:
         print(f"  - {topic.get('title')}")
-    if len(expanded_topics.get('topics', [])) > 5:
-        print(f"  ... 외 {len(expanded_topics.get('topics', [])) - 5}개")
+    if len(topics) > 5:
+        print(f"  ... 외 {len(topics) - 5}개")
     print()
-    
-    # Step 0-2: 주제 스코어링 및 선정
+    return {"expanded_topics": expanded_topics}
+
+
+def _score(state: InitialPipelineState) -> Dict[str, Any]:
+    """Step 0-2: 주제 스코어링 및 선정"""
     print("📌 Step 0-2: 주제 스코어링 및 최적 주제 선정 중...")
-    step0_2 = TopicScorerNode()
-    scored_result = step0_2.score_and_select(expanded_topics)
-    
+    scored_result = TopicScorerNode().score_and_select(state["expanded_topics"])
+
     selected = scored_result.get("selected_topic", {})
     print(f"✅ 최종 선정 주제: {selected.get('title')}")
     print(f"   총점: {selected.get('total_score')}점")
@@ -79,78 +106,158 @@ def run_initial_pipeline(user_idea: str, skip_refinement: bool = False) -> dict:
     print(f"   - 지속성: {selected.get('sustainability_score')}")
     print(f"   - 난이도: {selected.get('difficulty_score')}")
     print()
-    
-    # Step 1: 플랫폼 추천
+    return {"scored_topics": scored_result}
+
+
+def _platform(state: InitialPipelineState) -> Dict[str, Any]:
+    """Step 1: 플랫폼 추천"""
     print("📌 Step 1: 최적 플랫폼 추천 중...")
-    step1 = PlatformRecommenderNode()
-    platform_result = step1.recommend(scored_result)
-    
-    primary = platform_result.get("primary_platform")
-    secondary = platform_result.get("secondary_platforms", [])
-    print(f"✅ 추천 플랫폼:")
-    print(f"   메인: {primary}")
-    print(f"   보조: {', '.join(secondary)}")
+    platform_result = PlatformRecommenderNode().recommend(state["scored_topics"])
+
+    print("✅ 추천 플랫폼:")
+    print(f"   메인: {platform_result.get('primary_platform')}")
+    print(f"   보조: {', '.join(platform_result.get('secondary_platforms', []))}")
     print()
-    
+
     strategy = platform_result.get("strategy", {})
-    print(f"📊 추천 전략:")
+    print("📊 추천 전략:")
     print(f"   콘텐츠 형식: {strategy.get('content_format')}")
     print(f"   포스팅 빈도: {strategy.get('posting_frequency')}")
     print(f"   수익화 방법: {strategy.get('monetization_method')}")
     print()
-    
-    # Step 2-1: SERP 크롤링
+    return {"platform_recommendation": platform_result}
+
+
+def _serp(state: InitialPipelineState) -> Dict[str, Any]:
+    """Step 2-1: SERP 크롤링"""
     print("📌 Step 2-1: 상위 블로그 수집 중...")
-    step2_1 = SERPCrawlerNode()
-    serp_result = step2_1.crawl(scored_result, platform=primary or "네이버 블로그")
-    
+    primary = state["platform_recommendation"].get("primary_platform")
+    serp_result = SERPCrawlerNode().crawl(state["scored_topics"], platform=primary or "네이버 블로그")
+
     print(f"✅ {serp_result.get('total_results')}개 블로그 수집 완료")
     print()
-    
-    # Step 2-2: 30일 콘텐츠 계획
-    print("📌 Step 2-2: 30일 콘텐츠 로테이션 생성 중...")
-    step2_2 = ContentPlannerNode()
-    content_plan = step2_2.plan(serp_result)
-    
-    plan_items = content_plan.get("30_days_plan", [])
-    print(f"✅ 30일 콘텐츠 계획 생성 완료")
+    return {"serp_data": serp_result}
+
+
+def _tone(state: InitialPipelineState) -> Dict[str, Any]:
+    """Step 2-2a: 문체·톤 가이드 (plan과 병렬)"""
+    print("📌 Step 2-2a: 문체·톤·스타일 가이드 생성 중...")
+    tone_style_guide = ToneStyleGeneratorNode().generate(state["serp_data"])
+    print("✅ 문체·톤 가이드 생성 완료")
+    return {"tone_style_guide": tone_style_guide}
+
+
+def _plan(state: InitialPipelineState) -> Dict[str, Any]:
+    """Step 2-2b: 30일 콘텐츠 계획 (tone과 병렬)"""
+    print("📌 Step 2-2b: 30일 콘텐츠 로테이션 생성 중...")
+    content_plan = ContentPlannerNode().plan(state["serp_data"])
+    print("✅ 30일 콘텐츠 계획 생성 완료")
+    return {"content_plan": content_plan}
+
+
+def _save(state: InitialPipelineState) -> Dict[str, Any]:
+    """결과 저장 (tone, plan 모두 끝난 뒤)"""
     print()
-    
-    # 샘플 글감 미리보기
+    plan_items = state["content_plan"].get("30_days_plan", [])
     print("📅 30일 글감 미리보기 (1~7일):")
     for item in plan_items[:7]:
-        day = item.get('day')
-        title = item.get('title')
-        content_type = item.get('content_type')
-        print(f"   Day {day}: [{content_type}] {title}")
+        print(f"   Day {item.get('day')}: [{item.get('content_type')}] {item.get('title')}")
     if len(plan_items) > 7:
         print(f"   ... 외 {len(plan_items) - 7}일")
     print()
-    
-    # 전체 결과 저장
-    final_result = {
-        "user_idea": user_idea,
-        "refined_idea_result": refined_result,  # 대화형 구체화 결과
-        "expanded_topics": expanded_topics,
-        "scored_topics": scored_result,
-        "platform_recommendation": platform_result,
-        "serp_data": serp_result,
-        "content_plan": content_plan
+
+    os.makedirs("outputs", exist_ok=True)
+    with open(RESULT_FILE, "w", encoding="utf-8") as f:
+        json.dump(_final_result(state), f, ensure_ascii=False, indent=2)
+    with open(TONE_GUIDE_FILE, "w", encoding="utf-8") as f:
+        json.dump(state["tone_style_guide"], f, ensure_ascii=False, indent=2)
+
+    print("=" * 80)
+    print(f"💾 전체 결과 저장 완료: {RESULT_FILE}")
+    print(f"💾 문체·톤 가이드 저장 완료: {TONE_GUIDE_FILE}")
+    print("=" * 80)
+    print()
+    return {}
+
+
+def _final_result(state: InitialPipelineState) -> Dict[str, Any]:
+    return {
+        "user_idea": state["user_idea"],
+        "refined_idea_result": state.get("refined_idea_result"),  # 대화형 구체화 결과
+        "expanded_topics": state["expanded_topics"],
+        "scored_topics": state["scored_topics"],
+        "platform_recommendation": state["platform_recommendation"],
+        "serp_data": state["serp_data"],
+        "tone_style_guide": state["tone_style_guide"],
+        "content_plan": state["content_plan"],
+        "timings": state.get("timings", {}),
     }
+
+
+def build_initial_graph(resume: bool = True) -> StateGraph:
+    """
+    초기 파이프라인 그래프 (컴파일 전)
+
+    Args:
+        resume: False면 체크포인트를 무시하고 모든 노드를 다시 실행
+    """
+    graph = StateGraph(InitialPipelineState)
+    for name, fn in [
+        ("refine", _refine),
+        ("expand", _expand),
+        ("score", _score),
+        ("platform", _platform),
+        ("serp", _serp),
+        ("tone", _tone),
+        ("plan", _plan),
+    ]:
+        graph.add_node(name, timed_node(name, checkpointed_node("initial_pipeline", name, fn, resume)))
+    # 저장은 매번 실행 (파일 쓰기만 하므로)
+    graph.add_node("save", timed_node("save", _save))
+
+    graph.add_conditional_edges(START, _route_start, ["refine", "expand"])
+    graph.add_edge("refine", "expand")
+    graph.add_edge("expand", "score")
+    graph.add_edge("score", "platform")
+    graph.add_edge("platform", "serp")
+    # SERP 이후 병렬 분기 → 둘 다 끝나면 저장
+    graph.add_edge("serp", "tone")
+    graph.add_edge("serp", "plan")
+    graph.add_edge(["tone", "plan"], "save")
+    graph.add_edge("save", END)
+    return graph
+
+
+def run_initial_pipeline(user_idea: str, skip_refinement: bool = False, resume: bool = True) -> dict:
+    """
+    초기 파이프라인 실행
     
-    # 결과를 파일로 저장
-    output_file = "outputs/initial_pipeline_result.json"
-    import os
-    os.makedirs("outputs", exist_ok=True)
+    Args:
+        user_idea: 사용자 아이디어 (예: "블로그 자동화", "부동산 투자")
+        skip_refinement: True면 대화형 구체화 과정 건너뛰기 (빠른 테스트용)
+        resume: True면 같은 입력으로 완료된 노드는 체크포인트에서 복원
     
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(final_result, f, ensure_ascii=False, indent=2)
+    Returns:
+        전체 파이프라인 결과 (timings: 노드별 실행 시간)
+    """
     
     print("=" * 80)
-    print(f"💾 전체 결과 저장 완료: {output_file}")
+    print("🚀 블로그 자동화 시스템 - 초기 단계 파이프라인")
     print("=" * 80)
     print()
     
+    app = build_initial_graph(resume=resume).compile()
+    start = time.perf_counter()
+    state = app.invoke({"user_idea": user_idea, "skip_refinement": skip_refinement, "timings": {}})
+    wall_s = time.perf_counter() - start
+    final_result = _final_result(state)
+    
+    print(format_timings(final_result["timings"], wall_s))
+    print()
+    print(format_trace_report(get_run_id()))
+    print(format_run_summary(get_run_id()))
+    print()
+    
     print("🎉 초기 단계 파이프라인 완료!")
     print()
     print("다음 단계:")
@@ -163,7 +270,10 @@ def run_initial_pipeline(user_idea: str, skip_refinement: bool = False) -> dict:
 
 
 if __name__ == "__main__":
-    # 사용 예시
+    # 사용 예시 (--fresh: 체크포인트/메모 무시하고 전부 다시 계산)
+    fresh = "--fresh" in sys.argv[1:]
+    set_fresh(fresh)
+    
     user_input = input("💡 아이디어를 입력하세요: ")
     
     if not user_input.strip():
@@ -174,4 +284,9 @@ if __name__ == "__main__":
     skip = input("\n대화형 구체화를 건너뛰시겠습니까? (y/N): ").strip().lower()
     skip_refinement = (skip == 'y' or skip == 'yes')
     
-    result = run_initial_pipeline(user_input, skip_refinement=skip_refinement)
+    result = run_initial_pipeline(user_input, skip_refinement=skip_refinement, resume=not fresh)
+
+    # BLOG_PROFILE=cpu,mem 실행 시 노드별 프로파일 요약
+    profile_summary = format_profile_summary(get_run_id())
+    if profile_summary:
+        print(profile_summary)
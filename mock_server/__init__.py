@@ -0,0 +1,17 @@
+"""
+로컬 API 대역 서버 (오프라인 테스트 / 부하 테스트용)
+- OpenAI chat.completions, Anthropic messages (스트리밍 포함)
+- OpenAI Batch API (files / batches)
+- 네이버 블로그 검색 / 데이터랩 / 블로그 글 목록 페이지
+- 지연 분포(로그정규 TTFT, 토큰 속도)와 429/500/타임아웃/절단 주입
+
+사용:
+  python -m mock_server --port 8010
+  LLM_BASE_URL=http://127.0.0.1:8010 python batch_generate_posts.py
+  NAVER_API_BASE_URL=http://127.0.0.1:8010 NAVER_BLOG_BASE_URL=http://127.0.0.1:8010 python initial_pipeline.py
+"""
+
+from mock_server.behavior import Behavior, FaultConfig, LatencyProfile
+from mock_server.server import MockAPIServer, start_mock_server
+
+__all__ = ["Behavior", "FaultConfig", "LatencyProfile", "MockAPIServer", "start_mock_server"]
@@ -0,0 +1,52 @@
+"""
+로컬 API 대역 서버 실행
+
+  python -m mock_server --host 127.0.0.1 --port 8010
+  python -m mock_server --ttft-median 0.6 --tokens-per-s 80 --rate-429 0.05 --rate-truncate 0.02
+"""
+
+import argparse
+
+from mock_server.behavior import Behavior, FaultConfig, LatencyProfile
+from mock_server.server import MockAPIServer
+
+
+def main():
+    latency = LatencyProfile.from_env()
+    faults = FaultConfig.from_env()
+
+    parser = argparse.ArgumentParser(description="로컬 API 대역 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8010)
+    parser.add_argument("--batch-delay", type=float, default=1.0, help="배치 완료까지 걸리는 시간(초)")
+    parser.add_argument("--ttft-median", type=float, default=latency.ttft_median_s, help="첫 토큰까지 시간 중앙값(초, 로그정규)")
+    parser.add_argument("--ttft-sigma", type=float, default=latency.ttft_sigma, help="첫 토큰까지 시간 로그정규 표준편차")
+    parser.add_argument("--tokens-per-s", type=float, default=latency.tokens_per_s, help="출력 토큰 속도 (0이면 즉시)")
+    parser.add_argument("--rate-429", type=float, default=faults.rate_429, help="429 주입 확률")
+    parser.add_argument("--rate-500", type=float, default=faults.rate_500, help="500 주입 확률")
+    parser.add_argument("--rate-timeout", type=float, default=faults.rate_timeout, help="무응답(타임아웃) 주입 확률")
+    parser.add_argument("--rate-truncate", type=float, default=faults.rate_truncate, help="토큰 한도 절단 주입 확률")
+    parser.add_argument("--timeout-s", type=float, default=faults.timeout_s, help="무응답 주입 시 대기 시간(초)")
+    parser.add_argument("--seed", type=int, default=None, help="난수 시드 (재현용)")
+    args = parser.parse_args()
+
+    behavior = Behavior(
+        latency=LatencyProfile(args.ttft_median, args.ttft_sigma, args.tokens_per_s),
+        faults=FaultConfig(args.rate_429, args.rate_500, args.rate_timeout, args.rate_truncate, args.timeout_s),
+        seed=args.seed,
+    )
+    server = MockAPIServer((args.host, args.port), batch_delay=args.batch_delay, behavior=behavior)
+    print(f"🧪 Mock API 서버 실행 중: {server.root_url}")
+    print(f"   LLM_BASE_URL={server.root_url}")
+    print(f"   (또는 OPENAI_BASE_URL={server.base_url} / ANTHROPIC_BASE_URL={server.root_url})")
+    print(f"   NAVER_API_BASE_URL={server.root_url} NAVER_BLOG_BASE_URL={server.root_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n종료합니다.")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+대역 서버 응답 특성 (지연 분포 / 오류 주입)
+
+- LatencyProfile: 첫 토큰까지 시간(TTFT)은 로그정규 분포, 이후 토큰은 초당 토큰 수로 스트리밍
+- FaultConfig: 요청마다 확률적으로 429 / 500 / 타임아웃(응답 없이 대기) / 토큰 한도 절단 주입
+
+환경 변수 (CLI 인자가 없을 때 기본값):
+- MOCK_TTFT_MEDIAN: TTFT 중앙값(초, 기본 0 = 지연 없음)
+- MOCK_TTFT_SIGMA: TTFT 로그정규 표준편차 (기본 0.5)
+- MOCK_TOKENS_PER_S: 출력 토큰 속도 (기본 0 = 즉시)
+- MOCK_RATE_429 / MOCK_RATE_500 / MOCK_RATE_TIMEOUT / MOCK_RATE_TRUNCATE: 주입 확률 (기본 0)
+- MOCK_TIMEOUT_S: 타임아웃 주입 시 응답 없이 대기할 시간 (기본 30)
+- MOCK_SEED: 난수 시드 (재현용)
+"""
+
+import math
+import os
+import random
+import threading
+from dataclasses import dataclass
+from typing import Optional
+
+FAULT_429 = "429"
+FAULT_500 = "500"
+FAULT_TIMEOUT = "timeout"
+FAULT_TRUNCATE = "truncate"
+
+
+def _env_float(name: str, default: float) -> float:
+    return float(os.getenv(name, str(default)))
+
+
+@dataclass
+class LatencyProfile:
+    ttft_median_s: float = 0.0
+    ttft_sigma: float = 0.5
+    tokens_per_s: float = 0.0
+
+    @classmethod
+    def from_env(cls) -> "LatencyProfile":
+        return cls(
+            ttft_median_s=_env_float("MOCK_TTFT_MEDIAN", 0.0),
+            ttft_sigma=_env_float("MOCK_TTFT_SIGMA", 0.5),
+            tokens_per_s=_env_float("MOCK_TOKENS_PER_S", 0.0),
+        )
+
+    def sample_ttft(self, rng: random.Random) -> float:
+        if self.ttft_median_s <= 0:
+            return 0.0
+        return rng.lognormvariate(math.log(self.ttft_median_s), self.ttft_sigma)
+
+    def token_delay(self, tokens: int) -> float:
+        if self.tokens_per_s <= 0:
+            return 0.0
+        return tokens / self.tokens_per_s
+
+
+@dataclass
+class FaultConfig:
+    rate_429: float = 0.0
+    rate_500: float = 0.0
+    rate_timeout: float = 0.0
+    rate_truncate: float = 0.0
+    timeout_s: float = 30.0
+
+    @classmethod
+    def from_env(cls) -> "FaultConfig":
+        return cls(
+            rate_429=_env_float("MOCK_RATE_429", 0.0),
+            rate_500=_env_float("MOCK_RATE_500", 0.0),
+            rate_timeout=_env_float("MOCK_RATE_TIMEOUT", 0.0),
+            rate_truncate=_env_float("MOCK_RATE_TRUNCATE", 0.0),
+            timeout_s=_env_float("MOCK_TIMEOUT_S", 30.0),
+        )
+
+    def pick(self, rng: random.Random) -> Optional[str]:
+        """이번 요청에 주입할 오류 (없으면 None)"""
+        roll = rng.random()
+        for fault, rate in (
+            (FAULT_429, self.rate_429),
+            (FAULT_500, self.rate_500),
+            (FAULT_TIMEOUT, self.rate_timeout),
+            (FAULT_TRUNCATE, self.rate_truncate),
+        ):
+            if roll < rate:
+                return fault
+            roll -= rate
+        return None
+
+
+class Behavior:
+    """지연/오류 설정 + 공유 난수기 (핸들러 스레드 간 공유하므로 잠금)"""
+
+    def __init__(
+        self,
+        latency: Optional[LatencyProfile] = None,
+        faults: Optional[FaultConfig] = None,
+        seed: Optional[int] = None
+    ) -> None:
+        self.latency = latency or LatencyProfile.from_env()
+        self.faults = faults or FaultConfig.from_env()
+        if seed is None and os.getenv("MOCK_SEED"):
+            seed = int(os.getenv("MOCK_SEED", "0"))
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def pick_fault(self) -> Optional[str]:
+        with self._lock:
+            return self.faults.pick(self._rng)
+
+    def sample_ttft(self) -> float:
+        with self._lock:
+            return self.latency.sample_ttft(self._rng)
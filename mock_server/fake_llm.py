@@ -0,0 +1,335 @@
+"""
+가짜 LLM 응답 생성
+- response_format(json_schema) / 도구 호출(tool_choice) 지정 시 스키마를 만족하는 예시 객체 생성
+- 스키마 없이 JSON을 요구하는 노드 프롬프트는 프롬프트에 적힌 출력 형식 예시를 그대로 돌려줌
+  (노드별 출력 형식을 서버에 따로 등록하지 않아도 파싱 가능한 JSON이 나옴)
+- system 메시지(고정 prefix)가 반복되면 cached_tokens로 집계해 프롬프트 캐시 흉내
+- max_tokens를 넘거나 절단이 주입되면 응답을 잘라 finish_reason=length / stop_reason=max_tokens
+"""
+
+import json
+import re
+import threading
+import time
+import uuid
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+_seen_prefixes: Set[str] = set()
+_seen_lock = threading.Lock()
+
+# OpenAI 자동 캐시는 1024토큰 이상, 128토큰 단위로 적중
+CACHE_MIN_TOKENS = 1024
+CACHE_BLOCK_TOKENS = 128
+# Anthropic 캐시 최소 길이 (Haiku 2048, 그 외 1024)
+ANTHROPIC_CACHE_MIN_TOKENS = {"haiku": 2048}
+
+DEFAULT_TEXT = "모의 응답입니다."
+
+# 프롬프트 형식 예시의 자리표시 값 → JSON 값 (예: "h2_count": 5-7, "table_usage": true/false)
+_RANGE_VALUE = re.compile(r"(:\s*)(-?\d+)\s*[-~]\s*\d+")
+_BOOL_CHOICE = re.compile(r"\btrue\s*/\s*false\b")
+
+
+def estimate_tokens(text: str) -> int:
+    """대략적인 토큰 수 (한글 포함 문자 2개 ≈ 1토큰)"""
+    return max(1, len(text) // 2)
+
+
+def _count_hint(name: Optional[str]) -> int:
+    """속성 이름 앞의 숫자를 배열 길이로 사용 (예: 30_days_plan → 30)"""
+    match = re.match(r"(\d+)_", name or "")
+    return int(match.group(1)) if match else 0
+
+
+def sample_from_schema(schema: Dict[str, Any], name: Optional[str] = None, index: int = 0) -> Any:
+    """JSON Schema를 만족하는 예시 값 (배열 항목은 index로 구분)"""
+    schema_type = schema.get("type", "object")
+
+    if "enum" in schema:
+        return schema["enum"][0]
+    if schema_type == "object":
+        return {
+            prop: sample_from_schema(sub, prop, index)
+            for prop, sub in schema.get("properties", {}).items()
+        }
+    if schema_type == "array":
+        count = max(schema.get("minItems", 1), _count_hint(name), 1)
+        if "maxItems" in schema:
+            count = min(count, schema["maxItems"])
+        item_schema = schema.get("items", {"type": "string"})
+        return [sample_from_schema(item_schema, None, i) for i in range(count)]
+    if schema_type == "integer":
+        return schema.get("minimum", 1) + index
+    if schema_type == "number":
+        return float(schema.get("minimum", 1))
+    if schema_type == "boolean":
+        return True
+    suffix = f" {index + 1}" if index else ""
+    return f"예시 - {schema.get('description', '텍스트')}{suffix}"
+
+
+def _json_blocks(text: str) -> List[str]:
+    """텍스트 안의 최상위 {...} 블록 (문자열 안의 괄호는 무시)"""
+    blocks: List[str] = []
+    depth = 0
+    start = -1
+    in_string = False
+    escaped = False
+    for i, ch in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+            continue
+        if ch == '"' and depth > 0:
+            in_string = True
+        elif ch == "{":
+            if depth == 0:
+                start = i
+            depth += 1
+        elif ch == "}" and depth > 0:
+            depth -= 1
+            if depth == 0:
+                blocks.append(text[start:i + 1])
+    return blocks
+
+
+def extract_json_template(text: str) -> Optional[Dict[str, Any]]:
+    """
+    프롬프트의 출력 형식 예시 JSON 추출
+
+    입력 데이터(JSON 직렬화된 이전 단계 결과)보다 출력 형식이 뒤에 오므로
+    마지막 블록부터 파싱 가능한 객체를 찾음
+    """
+    for block in reversed(_json_blocks(text)):
+        candidate = _BOOL_CHOICE.sub("true", _RANGE_VALUE.sub(r"\1\2", block))
+        try:
+            value = json.loads(candidate)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(value, dict) and value:
+            return value
+    return None
+
+
+def _message_text(content: Any) -> str:
+    """메시지 content (문자열 또는 블록 목록) → 텍스트"""
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return "".join(block.get("text", "") for block in content if isinstance(block, dict))
+    return ""
+
+
+def _wants_json(prompt: str) -> bool:
+    return "JSON" in prompt or "json" in prompt
+
+
+def completion_content(prompt: str, schema: Optional[Dict[str, Any]] = None, json_mode: bool = False) -> str:
+    """요청 형식에 맞는 응답 본문"""
+    if schema is not None:
+        return json.dumps(sample_from_schema(schema), ensure_ascii=False)
+    if json_mode or _wants_json(prompt):
+        template = extract_json_template(prompt)
+        if template is not None:
+            return json.dumps(template, ensure_ascii=False, indent=2)
+        if json_mode:
+            return "{}"
+    return DEFAULT_TEXT
+
+
+def truncate(content: str, max_tokens: Optional[int], force: bool = False) -> Tuple[str, bool]:
+    """
+    토큰 한도 절단
+
+    force면 한도와 무관하게 절반에서 자름 (절단 주입)
+    """
+    limit_chars = max_tokens * 2 if max_tokens else None
+    if force:
+        limit_chars = min(limit_chars or len(content), max(len(content) // 2, 1))
+    if limit_chars is not None and len(content) > limit_chars:
+        return content[:limit_chars], True
+    return content, False
+
+
+def _seen_before(prefix: str) -> bool:
+    with _seen_lock:
+        seen = prefix in _seen_prefixes
+        _seen_prefixes.add(prefix)
+    return seen
+
+
+# ---------------------------------------------------------------------------
+# OpenAI chat.completions
+# ---------------------------------------------------------------------------
+
+def fake_chat_completion(body: Dict[str, Any], force_truncate: bool = False) -> Dict[str, Any]:
+    """chat.completions 요청 본문 → 응답 본문"""
+    messages = body.get("messages", [])
+    response_format = body.get("response_format") or {}
+    prompt_text = "".join(_message_text(m.get("content", "")) for m in messages)
+
+    schema = None
+    if response_format.get("type") == "json_schema":
+        schema = response_format.get("json_schema", {}).get("schema", {})
+    content = completion_content(
+        prompt_text, schema=schema, json_mode=response_format.get("type") == "json_object"
+    )
+    content, truncated = truncate(content, body.get("max_tokens"), force=force_truncate)
+
+    prompt_tokens = estimate_tokens(prompt_text)
+    cached_tokens = 0
+    system = next((_message_text(m.get("content", "")) for m in messages if m.get("role") == "system"), "")
+    if system:
+        system_tokens = estimate_tokens(system)
+        if _seen_before(system) and system_tokens >= CACHE_MIN_TOKENS:
+            cached_tokens = system_tokens // CACHE_BLOCK_TOKENS * CACHE_BLOCK_TOKENS
+
+    completion_tokens = estimate_tokens(content)
+    return {
+        "id": f"chatcmpl-{uuid.uuid4().hex[:24]}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": body.get("model", "gpt-4o-mini"),
+        "choices": [{
+            "index": 0,
+            "message": {"role": "assistant", "content": content},
+            "finish_reason": "length" if truncated else "stop",
+        }],
+        "usage": {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+            "prompt_tokens_details": {"cached_tokens": cached_tokens},
+        },
+    }
+
+
+def chat_completion_chunks(response: Dict[str, Any], chunk_chars: int = 16) -> List[Dict[str, Any]]:
+    """완성 응답 → 스트리밍 청크 목록 (마지막은 stream_options.include_usage용 usage 청크)"""
+    choice = response["choices"][0]
+    content = choice["message"]["content"] or ""
+    base = {
+        "id": response["id"],
+        "object": "chat.completion.chunk",
+        "created": response["created"],
+        "model": response["model"],
+    }
+
+    chunks = [{**base, "choices": [{"index": 0, "delta": {"role": "assistant", "content": ""}, "finish_reason": None}]}]
+    for piece in split_text(content, chunk_chars):
+        chunks.append({**base, "choices": [{"index": 0, "delta": {"content": piece}, "finish_reason": None}]})
+    chunks.append({**base, "choices": [{"index": 0, "delta": {}, "finish_reason": choice["finish_reason"]}]})
+    chunks.append({**base, "choices": [], "usage": response["usage"]})
+    return chunks
+
+
+# ---------------------------------------------------------------------------
+# Anthropic messages
+# ---------------------------------------------------------------------------
+
+def _anthropic_cache_min(model: str) -> int:
+    for family, minimum in ANTHROPIC_CACHE_MIN_TOKENS.items():
+        if family in model:
+            return minimum
+    return CACHE_MIN_TOKENS
+
+
+def fake_message(body: Dict[str, Any], force_truncate: bool = False) -> Dict[str, Any]:
+    """messages 요청 본문 → 응답 본문 (tool_choice 지정 시 tool_use 블록)"""
+    model = body.get("model", "claude-3-haiku-20240307")
+    system = body.get("system") or ""
+    system_text = _message_text(system)
+    prompt_text = system_text + "".join(_message_text(m.get("content", "")) for m in body.get("messages", []))
+
+    tool_choice = body.get("tool_choice") or {}
+    tool = None
+    if tool_choice.get("type") == "tool":
+        tool = next((t for t in body.get("tools", []) if t.get("name") == tool_choice.get("name")), None)
+
+    if tool is not None:
+        content = json.dumps(sample_from_schema(tool.get("input_schema", {})), ensure_ascii=False)
+    else:
+        content = completion_content(prompt_text)
+    content, truncated = truncate(content, body.get("max_tokens"), force=force_truncate)
+
+    # cache_control이 달린 system 블록: 첫 요청은 캐시 기록, 이후는 캐시 읽기
+    cache_read = 0
+    cache_write = 0
+    cacheable = isinstance(system, list) and any(
+        isinstance(block, dict) and block.get("cache_control") for block in system
+    )
+    if cacheable:
+        system_tokens = estimate_tokens(system_text)
+        if system_tokens >= _anthropic_cache_min(model):
+            if _seen_before(system_text):
+                cache_read = system_tokens
+            else:
+                cache_write = system_tokens
+
+    if tool is not None and not truncated:
+        block: Dict[str, Any] = {
+            "type": "tool_use",
+            "id": f"toolu_{uuid.uuid4().hex[:24]}",
+            "name": tool["name"],
+            "input": json.loads(content),
+        }
+    else:
+        block = {"type": "text", "text": content}
+
+    return {
+        "id": f"msg_{uuid.uuid4().hex[:24]}",
+        "type": "message",
+        "role": "assistant",
+        "model": model,
+        "content": [block],
+        "stop_reason": "max_tokens" if truncated else ("tool_use" if tool is not None else "end_turn"),
+        "stop_sequence": None,
+        "usage": {
+            "input_tokens": max(estimate_tokens(prompt_text) - cache_read - cache_write, 0),
+            "output_tokens": estimate_tokens(content),
+            "cache_creation_input_tokens": cache_write,
+            "cache_read_input_tokens": cache_read,
+        },
+    }
+
+
+def message_events(message: Dict[str, Any], chunk_chars: int = 16) -> List[Tuple[str, Dict[str, Any]]]:
+    """완성 응답 → (이벤트 이름, 데이터) SSE 목록"""
+    block = message["content"][0]
+    usage = message["usage"]
+    start_message = {**message, "content": [], "stop_reason": None, "usage": {**usage, "output_tokens": 1}}
+
+    if block["type"] == "tool_use":
+        start_block = {"type": "tool_use", "id": block["id"], "name": block["name"], "input": {}}
+        text = json.dumps(block["input"], ensure_ascii=False)
+        deltas = [{"type": "input_json_delta", "partial_json": piece} for piece in split_text(text, chunk_chars)]
+    else:
+        start_block = {"type": "text", "text": ""}
+        deltas = [{"type": "text_delta", "text": piece} for piece in split_text(block["text"], chunk_chars)]
+
+    events: List[Tuple[str, Dict[str, Any]]] = [
+        ("message_start", {"type": "message_start", "message": start_message}),
+        ("content_block_start", {"type": "content_block_start", "index": 0, "content_block": start_block}),
+    ]
+    events.extend(
+        ("content_block_delta", {"type": "content_block_delta", "index": 0, "delta": delta})
+        for delta in deltas
+    )
+    events.extend([
+        ("content_block_stop", {"type": "content_block_stop", "index": 0}),
+        ("message_delta", {
+            "type": "message_delta",
+            "delta": {"stop_reason": message["stop_reason"], "stop_sequence": None},
+            "usage": {"output_tokens": usage["output_tokens"]},
+        }),
+        ("message_stop", {"type": "message_stop"}),
+    ])
+    return events
+
+
+def split_text(text: str, size: int) -> List[str]:
+    return [text[i:i + size] for i in range(0, len(text), size)] if text else []
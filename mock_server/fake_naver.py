@@ -0,0 +1,75 @@
+"""
+가짜 네이버 응답 생성
+- 블로그 검색 API (/v1/search/blog.json)
+- 데이터랩 검색량 (/v1/datalab/search)
+- 블로그 글 목록 페이지 (/PostList.naver) - 크롤러의 BS4 파싱 부하를 흉내내도록 본문 문단 포함
+"""
+
+import html
+from typing import Any, Dict, List
+
+POSTS_PER_PAGE = 10
+FILLER_PARAGRAPHS = 20
+
+
+def search_blog(query: str, display: int, blog_base: str, total_blogs: int) -> Dict[str, Any]:
+    """블로그 검색 결과 (링크는 blog_base 아래 blog_id/logNo 형식)"""
+    count = max(0, min(display, total_blogs))
+    items: List[Dict[str, str]] = []
+    for i in range(1, count + 1):
+        items.append({
+            "title": f"<b>{html.escape(query)}</b> 실전 후기 {i}",
+            "link": f"{blog_base}/mockblog{i:03d}/2230000{i:05d}",
+            "description": f"<b>{html.escape(query)}</b>에 대한 {i}번째 블로그 글 요약입니다.",
+            "bloggername": f"모의 블로거 {i}",
+            "bloggerlink": f"{blog_base}/mockblog{i:03d}",
+            "postdate": "20250114",
+        })
+    return {
+        "lastBuildDate": "Tue, 14 Jan 2025 09:00:00 +0900",
+        "total": total_blogs,
+        "start": 1,
+        "display": count,
+        "items": items,
+    }
+
+
+def datalab_search(body: Dict[str, Any]) -> Dict[str, Any]:
+    """키워드 그룹별 월간 검색 비율"""
+    results = []
+    for index, group in enumerate(body.get("keywordGroups", [])):
+        results.append({
+            "title": group.get("groupName", ""),
+            "keywords": group.get("keywords", []),
+            "data": [
+                {"period": f"2024-{month:02d}-01", "ratio": round(100 - index * 7 - month * 1.5, 2)}
+                for month in range(1, 13)
+            ],
+        })
+    return {
+        "startDate": body.get("startDate"),
+        "endDate": body.get("endDate"),
+        "timeUnit": body.get("timeUnit", "month"),
+        "results": results,
+    }
+
+
+def post_list_html(blog_id: str, popular: bool = False) -> str:
+    """글 목록 페이지 HTML (글 링크 + 본문 미리보기 문단)"""
+    label = "인기글" if popular else "최신글"
+    rows = []
+    for i in range(1, POSTS_PER_PAGE + 1):
+        log_no = 2230000000 + i
+        preview = " ".join(f"<p>{label} {i}번 미리보기 문단 {n}: 준비물과 일정, 비용 정리.</p>" for n in range(3))
+        rows.append(
+            f'<li class="item"><a href="/PostView.naver?blogId={blog_id}&logNo={log_no}">'
+            f"{blog_id}의 {label} 제목 {i} - 초보자를 위한 완벽 가이드</a>{preview}</li>"
+        )
+    filler = "".join(f"<p>블로그 소개 문단 {n}</p>" for n in range(FILLER_PARAGRAPHS))
+    return (
+        "<!DOCTYPE html><html lang=\"ko\"><head><meta charset=\"UTF-8\">"
+        f"<title>{blog_id} : 네이버 블로그</title></head><body>"
+        f"<div id=\"blog-intro\">{filler}</div>"
+        f"<ul class=\"post_list\">{''.join(rows)}</ul>"
+        "</body></html>"
+    )
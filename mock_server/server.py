@@ -0,0 +1,439 @@
+"""
+Mock API 서버 본체 (표준 라이브러리 http.server 기반)
+
+지원 엔드포인트 (경로 앞의 /v1 은 생략 가능):
+- POST /v1/chat/completions      OpenAI 챗 완료 (stream=True면 SSE)
+- POST /v1/messages              Anthropic 메시지 (stream=True면 SSE, tool_choice면 tool_use)
+- GET  /v1/mock/stats            요청/오류 주입 집계 (부하 테스트 확인용)
+- GET  /v1/search/blog.json      네이버 블로그 검색 (NAVER_API_BASE_URL)
+- POST /v1/datalab/search        네이버 데이터랩 검색량
+- GET  /PostList.naver           블로그 글 목록 페이지 (NAVER_BLOG_BASE_URL)
+- POST /v1/files                 파일 업로드 (multipart, purpose=batch)
+- GET  /v1/files/{id}/content    파일 내용 다운로드
+- POST /v1/batches               배치 생성
+- GET  /v1/batches/{id}          배치 상태 조회 (batch_delay 경과 후 completed)
+"""
+
+import json
+import re
+import threading
+import time
+import uuid
+from email.parser import BytesParser
+from email.policy import default as default_policy
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs
+
+from mock_server.behavior import FAULT_429, FAULT_500, FAULT_TIMEOUT, FAULT_TRUNCATE, Behavior
+from mock_server.fake_llm import (
+    chat_completion_chunks,
+    estimate_tokens,
+    fake_chat_completion,
+    fake_message,
+    message_events,
+)
+from mock_server.fake_naver import datalab_search, post_list_html, search_blog
+
+Route = Tuple[str, "re.Pattern[str]", Callable[..., None]]
+
+
+class MockState:
+    """업로드 파일과 배치 작업 상태 (메모리 보관)"""
+
+    def __init__(self, batch_delay: float = 1.0, naver_blogs: int = 30) -> None:
+        self.batch_delay = batch_delay
+        self.naver_blogs = naver_blogs
+        self.files: Dict[str, Dict[str, Any]] = {}
+        self.file_data: Dict[str, bytes] = {}
+        self.batches: Dict[str, Dict[str, Any]] = {}
+        self.counters: Dict[str, int] = {}
+        self.lock = threading.Lock()
+
+    def count(self, name: str) -> None:
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + 1
+
+    def add_file(self, data: bytes, filename: str, purpose: str) -> Dict[str, Any]:
+        file_id = f"file-{uuid.uuid4().hex[:24]}"
+        meta = {
+            "id": file_id,
+            "object": "file",
+            "bytes": len(data),
+            "created_at": int(time.time()),
+            "filename": filename,
+            "purpose": purpose,
+            "status": "processed",
+        }
+        with self.lock:
+            self.files[file_id] = meta
+            self.file_data[file_id] = data
+        return meta
+
+    def create_batch(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        input_file_id = payload.get("input_file_id", "")
+        with self.lock:
+            data = self.file_data.get(input_file_id)
+        if data is None:
+            raise KeyError(input_file_id)
+
+        total = sum(1 for line in data.decode("utf-8").splitlines() if line.strip())
+        now = int(time.time())
+        batch = {
+            "id": f"batch_{uuid.uuid4().hex[:24]}",
+            "object": "batch",
+            "endpoint": payload.get("endpoint", "/v1/chat/completions"),
+            "errors": None,
+            "input_file_id": input_file_id,
+            "completion_window": payload.get("completion_window", "24h"),
+            "status": "in_progress",
+            "output_file_id": None,
+            "error_file_id": None,
+            "created_at": now,
+            "in_progress_at": now,
+            "expires_at": now + 24 * 3600,
+            "completed_at": None,
+            "request_counts": {"total": total, "completed": 0, "failed": 0},
+            "metadata": payload.get("metadata") or {},
+        }
+        with self.lock:
+            self.batches[batch["id"]] = batch
+        return batch
+
+    def get_batch(self, batch_id: str) -> Dict[str, Any]:
+        with self.lock:
+            batch = self.batches[batch_id]
+        if batch["status"] == "in_progress" and time.time() - batch["created_at"] >= self.batch_delay:
+            self._complete(batch)
+        return batch
+
+    def _complete(self, batch: Dict[str, Any]) -> None:
+        """입력 JSONL의 각 요청에 가짜 응답을 생성해 출력/오류 파일 작성"""
+        with self.lock:
+            data = self.file_data[batch["input_file_id"]]
+
+        outputs: List[str] = []
+        errors: List[str] = []
+        for line in data.decode("utf-8").splitlines():
+            if not line.strip():
+                continue
+            request = json.loads(line)
+            custom_id = request.get("custom_id")
+            if request.get("url") != batch["endpoint"]:
+                errors.append(json.dumps({
+                    "id": f"batch_req_{uuid.uuid4().hex[:16]}",
+                    "custom_id": custom_id,
+                    "response": None,
+                    "error": {"code": "invalid_url", "message": f"지원하지 않는 URL: {request.get('url')}"},
+                }, ensure_ascii=False))
+                continue
+            outputs.append(json.dumps({
+                "id": f"batch_req_{uuid.uuid4().hex[:16]}",
+                "custom_id": custom_id,
+                "response": {
+                    "status_code": 200,
+                    "request_id": uuid.uuid4().hex,
+                    "body": fake_chat_completion(request.get("body") or {}),
+                },
+                "error": None,
+            }, ensure_ascii=False))
+
+        if outputs:
+            batch["output_file_id"] = self.add_file(
+                ("\n".join(outputs) + "\n").encode("utf-8"), "batch_output.jsonl", "batch_output"
+            )["id"]
+        if errors:
+            batch["error_file_id"] = self.add_file(
+                ("\n".join(errors) + "\n").encode("utf-8"), "batch_errors.jsonl", "batch_output"
+            )["id"]
+
+        batch["request_counts"]["completed"] = len(outputs)
+        batch["request_counts"]["failed"] = len(errors)
+        batch["status"] = "completed"
+        batch["completed_at"] = int(time.time())
+
+
+class MockRequestHandler(BaseHTTPRequestHandler):
+    """경로 패턴 → 처리 메서드 라우팅"""
+
+    server: "MockAPIServer"
+
+    def log_message(self, format: str, *args: Any) -> None:  # 테스트 출력 오염 방지
+        pass
+
+    # --- 공통 ---------------------------------------------------------------
+
+    def _path(self) -> str:
+        path = self.path.split("?", 1)[0]
+        return path[3:] if path.startswith("/v1/") else path
+
+    def _query(self) -> Dict[str, str]:
+        query = self.path.split("?", 1)[1] if "?" in self.path else ""
+        return {key: values[0] for key, values in parse_qs(query).items()}
+
+    def _read_body(self) -> bytes:
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    def _send_json(self, status: int, payload: Any, headers: Optional[Dict[str, str]] = None) -> None:
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_error(self, status: int, message: str) -> None:
+        self._send_json(status, {"error": {"message": message, "type": "invalid_request_error"}})
+
+    def _dispatch(self, method: str) -> None:
+        path = self._path()
+        for route_method, pattern, handler in self.routes():
+            if route_method != method:
+                continue
+            match = pattern.fullmatch(path)
+            if match:
+                try:
+                    handler(*match.groups())
+                except KeyError as e:
+                    self._send_error(404, f"존재하지 않는 리소스: {e}")
+                return
+        self._send_error(404, f"지원하지 않는 경로: {method} {self.path}")
+
+    def routes(self) -> List[Route]:
+        return [
+            ("POST", re.compile(r"/chat/completions"), self.chat_completions),
+            ("POST", re.compile(r"/messages"), self.messages),
+            ("GET", re.compile(r"/mock/stats"), self.stats),
+            ("GET", re.compile(r"/search/blog\.json"), self.naver_search),
+            ("POST", re.compile(r"/datalab/search"), self.naver_datalab),
+            ("GET", re.compile(r"/PostList\.naver"), self.naver_post_list),
+            ("POST", re.compile(r"/files"), self.upload_file),
+            ("GET", re.compile(r"/files/([\w-]+)/content"), self.file_content),
+            ("GET", re.compile(r"/files/([\w-]+)"), self.file_meta),
+            ("POST", re.compile(r"/batches"), self.create_batch),
+            ("GET", re.compile(r"/batches/([\w-]+)"), self.get_batch),
+        ]
+
+    def do_GET(self) -> None:
+        self._dispatch("GET")
+
+    def do_POST(self) -> None:
+        self._dispatch("POST")
+
+    # --- LLM ------------------------------------------------------------------
+
+    def _inject_fault(self, endpoint: str) -> Optional[str]:
+        """
+        오류 주입 (429/500/타임아웃은 여기서 응답까지 처리)
+
+        Returns:
+            처리가 끝났으면 해당 오류 이름, 절단 주입이면 FAULT_TRUNCATE, 정상이면 None
+        """
+        fault = self.server.behavior.pick_fault()
+        if fault is None:
+            return None
+        self.server.state.count(f"{endpoint}.{fault}")
+
+        if fault == FAULT_429:
+            # SDK 재시도 대기를 짧게 (retry-after-ms)
+            self._send_json(429, {"error": {"message": "모의 요청 한도 초과", "type": "rate_limit_error"}},
+                            headers={"retry-after-ms": "200"})
+        elif fault == FAULT_500:
+            self._send_json(500, {"error": {"message": "모의 서버 오류", "type": "api_error"}})
+        elif fault == FAULT_TIMEOUT:
+            # 응답 없이 대기 후 연결 종료 → 클라이언트 타임아웃
+            time.sleep(self.server.behavior.faults.timeout_s)
+            self.close_connection = True
+        return fault
+
+    def _start_sse(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        self.close_connection = True  # 본문 길이 대신 연결 종료로 스트림 끝 표시
+
+    def _write_event(self, data: str, event: Optional[str] = None) -> None:
+        payload = (f"event: {event}\n" if event else "") + f"data: {data}\n\n"
+        self.wfile.write(payload.encode("utf-8"))
+        self.wfile.flush()
+
+    def _pace(self, text: str) -> None:
+        """토큰 속도에 맞춰 청크 사이 대기"""
+        delay = self.server.behavior.latency.token_delay(estimate_tokens(text)) if text else 0.0
+        if delay:
+            time.sleep(delay)
+
+    def chat_completions(self) -> None:
+        body = json.loads(self._read_body() or b"{}")
+        self.server.state.count("chat.completions")
+        fault = self._inject_fault("chat.completions")
+        if fault not in (None, FAULT_TRUNCATE):
+            return
+
+        response = fake_chat_completion(body, force_truncate=fault == FAULT_TRUNCATE)
+        time.sleep(self.server.behavior.sample_ttft())
+
+        if not body.get("stream"):
+            self._pace(response["choices"][0]["message"]["content"] or "")
+            self._send_json(200, response)
+            return
+
+        include_usage = bool((body.get("stream_options") or {}).get("include_usage"))
+        self._start_sse()
+        for chunk in chat_completion_chunks(response):
+            if "usage" in chunk and not include_usage:
+                continue
+            if chunk["choices"]:
+                self._pace(chunk["choices"][0]["delta"].get("content") or "")
+            self._write_event(json.dumps(chunk, ensure_ascii=False))
+        self._write_event("[DONE]")
+
+    def messages(self) -> None:
+        body = json.loads(self._read_body() or b"{}")
+        self.server.state.count("messages")
+        fault = self._inject_fault("messages")
+        if fault not in (None, FAULT_TRUNCATE):
+            return
+
+        message = fake_message(body, force_truncate=fault == FAULT_TRUNCATE)
+        time.sleep(self.server.behavior.sample_ttft())
+
+        if not body.get("stream"):
+            block = message["content"][0]
+            self._pace(block.get("text") or json.dumps(block.get("input", {}), ensure_ascii=False))
+            self._send_json(200, message)
+            return
+
+        self._start_sse()
+        for event, data in message_events(message):
+            delta = data.get("delta", {})
+            self._pace(delta.get("text") or delta.get("partial_json") or "")
+            self._write_event(json.dumps(data, ensure_ascii=False), event=event)
+
+    def stats(self) -> None:
+        with self.server.state.lock:
+            counters = dict(self.server.state.counters)
+        self._send_json(200, counters)
+
+    # --- naver ----------------------------------------------------------------
+
+    def naver_search(self) -> None:
+        self.server.state.count("naver.search")
+        query = self._query()
+        time.sleep(self.server.behavior.sample_ttft())
+        self._send_json(200, search_blog(
+            query.get("query", ""),
+            int(query.get("display", "10")),
+            self.server.root_url,
+            self.server.state.naver_blogs,
+        ))
+
+    def naver_datalab(self) -> None:
+        self.server.state.count("naver.datalab")
+        self._send_json(200, datalab_search(json.loads(self._read_body() or b"{}")))
+
+    def naver_post_list(self) -> None:
+        self.server.state.count("naver.post_list")
+        query = self._query()
+        data = post_list_html(query.get("blogId", "unknown"), popular=query.get("orderBy") == "sim").encode("utf-8")
+        time.sleep(self.server.behavior.sample_ttft())
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    # --- files ----------------------------------------------------------------
+
+    def upload_file(self) -> None:
+        body = self._read_body()
+        content_type = self.headers.get("Content-Type", "")
+        message = BytesParser(policy=default_policy).parsebytes(
+            f"Content-Type: {content_type}\r\n\r\n".encode("utf-8") + body
+        )
+
+        data: Optional[bytes] = None
+        filename = "upload.jsonl"
+        purpose = "batch"
+        for part in message.iter_parts():
+            name = part.get_param("name", header="content-disposition")
+            if name == "file":
+                data = part.get_payload(decode=True) or b""
+                filename = part.get_filename() or filename
+            elif name == "purpose":
+                purpose = (part.get_payload(decode=True) or b"batch").decode("utf-8")
+
+        if data is None:
+            self._send_error(400, "file 필드가 없습니다")
+            return
+        self._send_json(200, self.server.state.add_file(data, filename, purpose))
+
+    def file_meta(self, file_id: str) -> None:
+        with self.server.state.lock:
+            meta = self.server.state.files[file_id]
+        self._send_json(200, meta)
+
+    def file_content(self, file_id: str) -> None:
+        with self.server.state.lock:
+            data = self.server.state.file_data[file_id]
+        self.send_response(200)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    # --- batches --------------------------------------------------------------
+
+    def create_batch(self) -> None:
+        payload = json.loads(self._read_body() or b"{}")
+        self._send_json(200, self.server.state.create_batch(payload))
+
+    def get_batch(self, batch_id: str) -> None:
+        self._send_json(200, self.server.state.get_batch(batch_id))
+
+
+class MockAPIServer(ThreadingHTTPServer):
+    """상태(MockState)를 가진 멀티스레드 HTTP 서버"""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: Tuple[str, int] = ("127.0.0.1", 0),
+        batch_delay: float = 1.0,
+        handler: type = MockRequestHandler,
+        behavior: Optional[Behavior] = None
+    ) -> None:
+        super().__init__(address, handler)
+        self.state = MockState(batch_delay=batch_delay)
+        self.behavior = behavior or Behavior()
+
+    @property
+    def root_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def base_url(self) -> str:
+        return f"{self.root_url}/v1"
+
+
+def start_mock_server(
+    port: int = 0,
+    batch_delay: float = 0.1,
+    behavior: Optional[Behavior] = None
+) -> MockAPIServer:
+    """
+    백그라운드 스레드로 서버 시작 (테스트/스크립트용)
+
+    Returns:
+        실행 중인 서버 (root_url로 LLM_BASE_URL 지정, 종료 시 shutdown())
+    """
+    server = MockAPIServer(("127.0.0.1", port), batch_delay=batch_delay, behavior=behavior)
+    thread = threading.Thread(target=server.serve_forever, name="mock-api-server", daemon=True)
+    thread.start()
+    return server
@@ -1,23 +1,31 @@
 # nodes/content_planner_node.py
-import json
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from utils.logger import get_logger
-from utils.llm_client import HybridLLMClient
+from utils.llm_client import HybridLLMClient, get_llm_client
+from utils.json_repair import parse_json_object
+from utils.schemas import CONTENT_PLAN_SCHEMA
+from utils.memo import memoize
+from utils.run_context import node_scope
 
 logger = get_logger("ContentPlannerNode")
 
+# 프롬프트/스키마를 바꾸면 올림 (이전 메모 결과 무효화)
+PROMPT_VERSION = "1"
+
 
 class ContentPlannerNode:
     """
     Step2-2: 콘텐츠 플래너 노드
     - SERP 결과 분석하여 30일 글감 로테이션 생성
     - 무한 루프 가능한 구조
-    - Claude 3.5 Sonnet 사용으로 고품질 기획
+    - HybridLLMClient 라우팅 (creative 작업, 기본 Claude)으로 고품질 기획
     """
 
-    def __init__(self) -> None:
-        self.llm = HybridLLMClient()
+    def __init__(self, llm: Optional[HybridLLMClient] = None) -> None:
+        self.llm = llm or get_llm_client("hybrid")
 
+    @memoize("ContentPlanner", version=PROMPT_VERSION)
+    @node_scope("ContentPlanner")
     def plan(self, serp_data: Dict[str, Any]) -> Dict[str, Any]:
         """30일 글감 로테이션 계획 생성"""
         logger.info("ContentPlannerNode: 30일 콘텐츠 계획 생성 시작")
@@ -35,9 +43,10 @@ class ContentPlannerNode:
             raw = self.llm.chat(
                 prompt, 
                 max_tokens=4000,  # Claude 3 Haiku 최대값 (4096)
-                task_type="creative"  # Claude 우선 사용
+                task_type="creative",  # Claude 우선 사용
+                schema=CONTENT_PLAN_SCHEMA  # 출력 형식은 스키마로 강제
             )
-            parsed = self._safe_parse_json(raw)
+            parsed = parse_json_object(raw, "ContentPlannerNode", "debug_content_planner.txt")
             logger.info(f"ContentPlannerNode: 30일 계획 생성 완료")
             return parsed
             
@@ -45,23 +54,6 @@ class ContentPlannerNode:
             logger.error(f"ContentPlannerNode 실패: {e}")
             raise
 
-    def _safe_parse_json(self, text: str) -> Dict[str, Any]:
-        try:
-            s = text.find("{")
-            e = text.rfind("}")
-            
-            if s == -1 or e == -1:
-                raise ValueError("JSON 형식을 찾을 수 없습니다")
-            
-            json_text = text[s:e+1]
-            return json.loads(json_text)
-            
-        except json.JSONDecodeError as e:
-            logger.error(f"JSON 파싱 실패: {e}")
-            with open("debug_content_planner.txt", "w", encoding="utf-8") as f:
-                f.write(text)
-            raise ValueError(f"JSON 파싱 실패: {e.msg}")
-
     def _build_prompt(self, topic: str, serp_results: List[Dict[str, Any]]) -> str:
         # 상위 30개 제목만 추출
         titles = [item.get("title", "") for item in serp_results[:30]]
@@ -109,28 +101,8 @@ class ContentPlannerNode:
 - 계획표, 예산 가이드, 템플릿, 체크리스트
 - 예: "2박3일 여행 예산 짜기", "여행 계획표 템플릿"
 
-[출력 형식]
-{{
-  "topic": "{topic}",
-  "analysis": {{
-    "primary_focus": "메인 주제 (60%)",
-    "secondary_focus": "서브 주제 (40%)",
-    "target_keywords": ["키워드1", "키워드2", "키워드3"]
-  }},
-  "30_days_plan": [
-    {{
-      "day": 1,
-      "category": "여행준비",
-      "title": "글감 제목 (40-60자)",
-      "content_type": "체크리스트",
-      "main_keywords": ["키워드1", "키워드2"]
-    }}
-  ]
-}}
-
 **필수 체크:**
-- 각 카테고리 정확히 5개씩
+- 각 카테고리 정확히 5개씩 (day 1~30)
 - 특정 지역 편중 금지 (예: 제주도만 5개 X)
 - Evergreen (언제든 재사용 가능)
-- 유효한 JSON만 출력
 """
@@ -5,10 +5,12 @@ GPT + Claude 협업 블로그 글 작성 노드
 - Stage 2 (Claude): 살 붙이기 (자연스러운 글쓰기, 스토리텔링)
 """
 
-import json
 from typing import Dict, Any, Optional
 from utils.logger import get_logger
-from utils.llm_client import LLMClient, HybridLLMClient
+from utils.llm_client import LLMClient, HybridLLMClient, get_llm_client
+from utils.json_repair import parse_json_object
+from utils.metrics import last_call_record
+from utils.run_context import node_scope
 
 logger = get_logger("HybridPostWriter")
 
@@ -20,9 +22,13 @@ class HybridPostWriterNode:
     - Claude: 고품질 살 붙이기 (자연스럽고 창의적)
     """
 
-    def __init__(self):
-        self.gpt_client = LLMClient()  # Stage 1: 뼈대
-        self.hybrid_client = HybridLLMClient()  # Stage 2: 살 붙이기
+    def __init__(
+        self,
+        gpt_client: Optional[LLMClient] = None,
+        hybrid_client: Optional[HybridLLMClient] = None
+    ):
+        self.gpt_client = gpt_client or get_llm_client("gpt")  # Stage 1: 뼈대
+        self.hybrid_client = hybrid_client or get_llm_client("hybrid")  # Stage 2: 살 붙이기
 
     def write(self, plan_item: Dict[str, Any], serp_context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
@@ -39,13 +45,16 @@ class HybridPostWriterNode:
         logger.info(f"🚀 2-Stage 협업 글쓰기 시작: {plan_item.get('title')}")
         logger.info("=" * 80)
         
-        # Stage 1: GPT로 뼈대 생성
-        skeleton = self._stage1_create_skeleton(plan_item, serp_context)
-        logger.info("✅ Stage 1 완료: 뼈대 생성 (GPT)")
-        
-        # Stage 2: Claude로 살 붙이기
-        final_post = self._stage2_add_flesh(skeleton, plan_item)
-        logger.info("✅ Stage 2 완료: 살 붙이기 (Claude)")
+        # 지표는 Day 단위로 집계
+        with node_scope("HybridPostWriter", day=plan_item.get("day")):
+            # Stage 1: GPT로 뼈대 생성
+            skeleton = self._stage1_create_skeleton(plan_item, serp_context)
+            logger.info("✅ Stage 1 완료: 뼈대 생성 (GPT)")
+            
+            # Stage 2: Claude로 살 붙이기
+            final_post = self._stage2_add_flesh(skeleton, plan_item)
+            stage2_call = last_call_record()
+            logger.info("✅ Stage 2 완료: 살 붙이기")
         
         # 최종 결과 조합
         result = {
@@ -56,8 +65,8 @@ class HybridPostWriterNode:
             "final_content": final_post,
             "word_count": len(final_post),
             "metadata": {
-                "stage1_model": "GPT-4o-mini",
-                "stage2_model": "Claude 3 Haiku",
+                "stage1_model": self.gpt_client.model,
+                "stage2_model": stage2_call.get("model") if stage2_call else "unknown",  # 라우터가 선택한 실제 모델
                 "collaboration": "2-stage hybrid"
             }
         }
@@ -87,6 +96,7 @@ class HybridPostWriterNode:
             for idx, blog in enumerate(top_3, 1):
                 serp_summary += f"{idx}. {blog.get('title')}\n"
         
+        # 지시문이 프롬프트 캐시 최소 길이(1024토큰)에 못 미쳐 고정 prefix로 나누지 않고 한 메시지로 보냄
         prompt = f"""당신은 블로그 글 구조 설계 전문가입니다.
 
 **제목:** {title}
@@ -217,19 +227,9 @@ JSON만 출력하세요:"""
             return outline_text
 
     def _safe_parse_json(self, raw_text: str) -> Dict[str, Any]:
-        """JSON 파싱 (코드 블록 제거)"""
+        """JSON 파싱 (공용 복구 엔진 사용, 실패 시 빈 dict)"""
         try:
-            # ```json ... ``` 제거
-            if "```json" in raw_text:
-                start = raw_text.find("```json") + 7
-                end = raw_text.rfind("```")
-                raw_text = raw_text[start:end].strip()
-            elif "```" in raw_text:
-                start = raw_text.find("```") + 3
-                end = raw_text.rfind("```")
-                raw_text = raw_text[start:end].strip()
-            
-            return json.loads(raw_text)
-        except Exception as e:
+            return parse_json_object(raw_text, "HybridPostWriter")
+        except ValueError as e:
             logger.error(f"JSON 파싱 실패: {e}")
             return {}
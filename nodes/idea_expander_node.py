@@ -1,8 +1,9 @@
 # nodes/idea_expander_node.py
-import json
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from utils.logger import get_logger
-from utils.llm_client import LLMClient
+from utils.llm_client import LLMClient, get_llm_client
+from utils.json_repair import parse_json_object
+from utils.run_context import node_scope
 
 logger = get_logger("IdeaExpanderNode")
 
@@ -14,9 +15,10 @@ class IdeaExpanderNode:
     - 각 주제에 대한 기본 정보 제공
     """
 
-    def __init__(self) -> None:
-        self.llm = LLMClient()
+    def __init__(self, llm: Optional[LLMClient] = None) -> None:
+        self.llm = llm or get_llm_client("gpt")
 
+    @node_scope("IdeaExpander")
     def expand(self, idea: str) -> Dict[str, Any]:
         """아이디어를 확장된 주제 리스트로 변환"""
         logger.info(f"IdeaExpanderNode: 아이디어 확장 시작 - {idea}")
@@ -25,30 +27,13 @@ class IdeaExpanderNode:
 
         try:
             raw = self.llm.chat(prompt, max_tokens=2000)
-            parsed = self._safe_parse_json(raw)
+            parsed = parse_json_object(raw, "IdeaExpanderNode", "debug_idea_expander.txt")
             logger.info(f"IdeaExpanderNode: {len(parsed.get('topics', []))}개 주제 생성 완료")
             return parsed
         except Exception as e:
             logger.error(f"IdeaExpanderNode 실패: {e}")
             raise
 
-    def _safe_parse_json(self, text: str) -> Dict[str, Any]:
-        try:
-            s = text.find("{")
-            e = text.rfind("}")
-            
-            if s == -1 or e == -1:
-                raise ValueError("JSON 형식을 찾을 수 없습니다")
-            
-            json_text = text[s:e+1]
-            return json.loads(json_text)
-            
-        except json.JSONDecodeError as e:
-            logger.error(f"JSON 파싱 실패: {e}")
-            with open("debug_idea_expander.txt", "w", encoding="utf-8") as f:
-                f.write(text)
-            raise ValueError(f"JSON 파싱 실패: {e.msg}")
-
     def _build_prompt(self, idea: str) -> str:
         return f"""
 다음 아이디어를 분석하여 블로그 주제로 확장해주세요.
@@ -7,8 +7,10 @@ GPT + Claude 하이브리드 전략:
 """
 
 from typing import Dict, Any, List, Optional
-from utils.llm_client import LLMClient, HybridLLMClient
+from utils.llm_client import LLMClient, HybridLLMClient, get_llm_client
 from utils.logger import get_logger
+from utils.json_repair import parse_json_object
+from utils.run_context import node_scope
 
 logger = get_logger("IdeaRefinerNode")
 
@@ -16,12 +18,17 @@ logger = get_logger("IdeaRefinerNode")
 class IdeaRefinerNode:
     """사용자와 대화를 통해 아이디어를 정교화하는 노드 (GPT+Claude 하이브리드)"""
     
-    def __init__(self):
-        self.gpt_client = LLMClient()  # 질문 생성용 (빠름)
-        self.hybrid_client = HybridLLMClient()  # 아이디어 합성용 (고품질)
+    def __init__(
+        self,
+        gpt_client: Optional[LLMClient] = None,
+        hybrid_client: Optional[HybridLLMClient] = None
+    ):
+        self.gpt_client = gpt_client or get_llm_client("gpt")  # 질문 생성용 (빠름)
+        self.hybrid_client = hybrid_client or get_llm_client("hybrid")  # 아이디어 합성용 (고품질)
         self.conversation_history = []
         self.max_questions = 5  # 최대 질문 횟수
     
+    @node_scope("IdeaRefiner")
     def refine_interactive(self, initial_idea: str, auto_mode: bool = False) -> Dict[str, Any]:
         """
         대화형 아이디어 정교화
@@ -203,8 +210,8 @@ A: {answer}"""
 
 충분하면 "YES", 더 필요하면 "NO"만 답하세요:"""
 
-        # GPT 사용 (빠른 충분성 판단)
-        response = self.gpt_client.chat(prompt=prompt, max_tokens=10)
+        # GPT 사용 (빠른 충분성 판단, 동시 요청과 마이크로 배치)
+        response = self.gpt_client.chat_small(prompt=prompt, max_tokens=10)
         
         return "YES" in response.upper()
     
@@ -307,19 +314,13 @@ JSON만 출력하세요 (코드 블록 없이):"""
         response = self.hybrid_client.chat(
             prompt=prompt, 
             max_tokens=1000,
-            task_type="analytical"  # Claude 사용
+            task_type="analytical",  # Claude 사용
+            expect_json=True
         )
         
         # JSON 파싱
-        import json
         try:
-            # 코드 블록 제거
-            if "```" in response:
-                response = response.split("```")[1]
-                if response.startswith("json"):
-                    response = response[4:]
-            
-            details = json.loads(response.strip())
+            details = parse_json_object(response, "IdeaRefinerNode")
             return details
         except Exception as e:
             logger.warning(f"JSON 파싱 실패: {e}")
@@ -1,10 +1,11 @@
 # nodes/keyword_expander_node.py
-import json
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 from utils.logger import get_logger
-from utils.llm_client import LLMClient
+from utils.llm_client import LLMClient, get_llm_client
 from utils.naver_datalab import NaverDataLabClient
+from utils.json_repair import parse_json_object
+from utils.run_context import node_scope
 
 logger = get_logger("KeywordExpanderNode")
 
@@ -18,10 +19,11 @@ class KeywordExpanderNode:
     - 키워드 Cluster 생성
     """
 
-    def __init__(self) -> None:
-        self.llm = LLMClient()
+    def __init__(self, llm: Optional[LLMClient] = None) -> None:
+        self.llm = llm or get_llm_client("gpt")
         self.datalab = NaverDataLabClient()
 
+    @node_scope("KeywordExpander")
     def expand(self, topic_json: Dict[str, Any]) -> Dict[str, Any]:
         logger.info("KeywordExpanderNode 시작")
 
@@ -34,7 +36,7 @@ class KeywordExpanderNode:
 
         try:
             raw_output = self.llm.chat(prompt)
-            parsed = self._safe_parse_json(raw_output)
+            parsed = parse_json_object(raw_output, "KeywordExpanderNode")
         except Exception as e:
             logger.exception("LLM keyword 생성 실패")
             raise e
@@ -85,17 +87,6 @@ class KeywordExpanderNode:
 3. JSON 외 텍스트 금지
         """
 
-    def _safe_parse_json(self, text: str) -> Dict[str, Any]:
-        try:
-            start = text.find("{")
-            end = text.rfind("}") + 1
-            cleaned = text[start:end]
-            return json.loads(cleaned)
-        except Exception:
-            logger.error("JSON 파싱 실패")
-            logger.error(text)
-            raise ValueError("LLM 응답 JSON 파싱 실패")
-
     def _fake_volume(self, keywords: List[str]) -> Dict[str, int]:
         """데이터랩 미연결 시 LLM 기반 추정 대신 단순 랜덤 값 생성"""
         volume = {}
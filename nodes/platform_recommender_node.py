@@ -1,11 +1,17 @@
 # nodes/platform_recommender_node.py
 import json
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from utils.logger import get_logger
-from utils.llm_client import LLMClient
+from utils.llm_client import LLMClient, get_llm_client
+from utils.json_repair import parse_json_object
+from utils.memo import memoize
+from utils.run_context import node_scope
 
 logger = get_logger("PlatformRecommenderNode")
 
+# 프롬프트/후처리를 바꾸면 올림 (이전 메모 결과 무효화)
+PROMPT_VERSION = "1"
+
 
 class PlatformRecommenderNode:
     """
@@ -14,9 +20,11 @@ class PlatformRecommenderNode:
     - 수익성, 1source multi use, 난이도 종합 분석
     """
 
-    def __init__(self) -> None:
-        self.llm = LLMClient()
+    def __init__(self, llm: Optional[LLMClient] = None) -> None:
+        self.llm = llm or get_llm_client("gpt")
 
+    @memoize("PlatformRecommender", version=PROMPT_VERSION)
+    @node_scope("PlatformRecommender")
     def recommend(self, topic_data: Dict[str, Any]) -> Dict[str, Any]:
         """주제에 최적화된 플랫폼 추천"""
         logger.info("PlatformRecommenderNode: 플랫폼 추천 시작")
@@ -29,7 +37,7 @@ class PlatformRecommenderNode:
 
         try:
             raw = self.llm.chat(prompt, max_tokens=2000)
-            parsed = self._safe_parse_json(raw)
+            parsed = parse_json_object(raw, "PlatformRecommenderNode", "debug_platform_recommender.txt")
             logger.info(f"PlatformRecommenderNode: 완료 - 추천 플랫폼: {parsed.get('primary_platform')}")
             return parsed
             
@@ -37,23 +45,6 @@ class PlatformRecommenderNode:
             logger.error(f"PlatformRecommenderNode 실패: {e}")
             raise
 
-    def _safe_parse_json(self, text: str) -> Dict[str, Any]:
-        try:
-            s = text.find("{")
-            e = text.rfind("}")
-            
-            if s == -1 or e == -1:
-                raise ValueError("JSON 형식을 찾을 수 없습니다")
-            
-            json_text = text[s:e+1]
-            return json.loads(json_text)
-            
-        except json.JSONDecodeError as e:
-            logger.error(f"JSON 파싱 실패: {e}")
-            with open("debug_platform_recommender.txt", "w", encoding="utf-8") as f:
-                f.write(text)
-            raise ValueError(f"JSON 파싱 실패: {e.msg}")
-
     def _build_prompt(self, topic: Dict[str, Any]) -> str:
         topic_json = json.dumps(topic, ensure_ascii=False, indent=2)
         
@@ -1,8 +1,10 @@
 # nodes/post_writer_node.py
 import json
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from utils.logger import get_logger
-from utils.llm_client import LLMClient
+from utils.llm_client import LLMClient, get_llm_client
+from utils.json_repair import parse_json_object
+from utils.run_context import node_scope
 
 logger = get_logger("PostWriterNode")
 
@@ -17,9 +19,10 @@ class PostWriterNode:
     - CTA placeholder 포함
     """
 
-    def __init__(self) -> None:
-        self.llm = LLMClient()
+    def __init__(self, llm: Optional[LLMClient] = None) -> None:
+        self.llm = llm or get_llm_client("gpt")
 
+    @node_scope("PostWriter")
     def write(self, topic_json: Dict[str, Any],
               kws_json: Dict[str, Any],
               serp_json: Dict[str, Any]) -> Dict[str, Any]:
@@ -35,49 +38,13 @@ class PostWriterNode:
 
         try:
             raw = self.llm.chat(prompt)
-            parsed = self._safe_parse_json(raw)
+            parsed = parse_json_object(raw, "PostWriterNode", "debug_json_error.txt")
             logger.info("PostWriterNode: 완료")
             return parsed
         except Exception:
             logger.error("PostWriterNode JSON 파싱 실패")
             raise
 
-    def _safe_parse_json(self, text: str) -> Dict[str, Any]:
-        try:
-            # JSON 추출
-            s = text.find("{")
-            e = text.rfind("}")
-            
-            if s == -1 or e == -1:
-                raise ValueError("JSON 형식을 찾을 수 없습니다")
-            
-            json_text = text[s:e+1]
-            
-            # 파싱 시도 - LLM이 이미 올바른 JSON을 생성했다고 가정
-            return json.loads(json_text)
-            
-        except json.JSONDecodeError as e:
-            logger.error("=" * 60)
-            logger.error("JSON 파싱 실패 - 상세 정보:")
-            logger.error(f"에러 위치: line {e.lineno}, column {e.colno}")
-            logger.error(f"에러 메시지: {e.msg}")
-            logger.error("=" * 60)
-            logger.error("원본 텍스트:")
-            logger.error(text)
-            logger.error("=" * 60)
-            
-            # JSON 텍스트를 파일로 저장 (디버깅용)
-            with open("debug_json_error.txt", "w", encoding="utf-8") as f:
-                f.write(text)
-            logger.error("원본 텍스트를 debug_json_error.txt 파일에 저장했습니다.")
-            
-            raise ValueError(f"포스트 작성 JSON 파싱 실패: {e.msg}")
-            
-        except Exception as e:
-            logger.error("LLM JSON 파싱 실패 (알 수 없는 오류)")
-            logger.error(text)
-            raise ValueError(f"포스트 작성 JSON 파싱 실패: {str(e)}")
-
     def _build_prompt(
         self,
         topic: str,
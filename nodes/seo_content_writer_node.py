@@ -10,23 +10,73 @@ Step 4: SEO 콘텐츠 자동 생성 노드
 
 출력:
 - content/dayXX_content.json (Day 1~30)
+
+웹 API용 agenerate_single은 같은 2단계를 비동기 LLM 호출로 실행하고,
+구조 완성 / 본문 섹션 완성 시점마다 진행 이벤트를 보냄
 """
 
 import json
-import logging
-from typing import Dict, Any, List, Optional
-from utils.llm_client import HybridLLMClient, LLMClient
-
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
+import os
+from typing import Callable, Dict, Any, List, Optional
+from utils.llm_client import LLMClient, UsageStats, get_llm_client
+from utils.openai_batch import OpenAIBatchRunner
+from utils.logger import get_logger
+from utils.run_context import node_scope
+from utils.json_repair import JSONRepairError, parse_json_object, repair_json
+from utils.schemas import SEO_STRUCTURE_SCHEMA, SEO_CONTENT_SCHEMA
+from utils.structured_output import StructuredOutputError
+
+logger = get_logger("SEOContentWriterNode")
+
+ProgressFn = Callable[[Dict[str, Any]], None]
+
+
+class _SectionStream:
+    """
+    스트리밍 중인 본문 JSON에서 완성된 섹션을 찾아 진행 이벤트로 보냄
+    - 새 섹션("h2") 또는 sections 다음 필드("table_html")가 나타날 때만 잘린 JSON을 복구해 확인
+    - 마지막 섹션은 다음 필드가 시작되어야 완성으로 봄
+    """
+
+    def __init__(self, total: int, report: ProgressFn) -> None:
+        self.total = total
+        self.report = report
+        self.sent = 0
+        self._markers = 0
+
+    def feed(self, text: str) -> None:
+        sections_closed = '"table_html"' in text
+        markers = text.count('"h2"') + int(sections_closed)
+        if markers == self._markers:
+            return
+        self._markers = markers
+        try:
+            sections = repair_json(text).data.get("sections", [])
+        except (JSONRepairError, AttributeError):
+            return
+        self.flush(sections if sections_closed else sections[:-1])
+
+    def flush(self, sections: List[Dict[str, Any]]) -> None:
+        for index in range(self.sent, len(sections)):
+            section = sections[index]
+            h3_contents = section.get("h3_contents", [])
+            self.report({
+                "event": "section",
+                "index": index + 1,
+                "total": self.total,
+                "h2": section.get("h2", ""),
+                "h3": [h3.get("h3", "") for h3 in h3_contents],
+                "chars": sum(len(p) for h3 in h3_contents for p in h3.get("paragraphs", [])),
+            })
+        self.sent = max(self.sent, len(sections))
 
 
 class SEOContentWriterNode:
     """SEO 콘텐츠 자동 생성 노드"""
     
-    def __init__(self):
-        self.gpt = LLMClient()  # GPT로 구조 + 본문 모두 생성 (json_mode 사용)
-        logger.info("📝 SEO Content Writer 초기화 (GPT json_mode)")
+    def __init__(self, gpt: Optional[LLMClient] = None):
+        self.gpt = gpt or get_llm_client("gpt")  # GPT로 구조 + 본문 모두 생성 (structured output)
+        logger.info("📝 SEO Content Writer 초기화 (GPT structured output)")
     
     def generate_all(
         self,
@@ -61,13 +111,111 @@ class SEOContentWriterNode:
             day_plan = content_plan[day_num - 1]
             logger.info(f"\n📌 Day {day_num}: {day_plan.get('title', 'N/A')}")
             
-            # 단일 글 생성
-            content = self.generate_single(day_num, day_plan, tone_guide, serp_context)
+            # 단일 글 생성 (지표는 Day 단위로 집계)
+            with node_scope("SEOContentWriter", day=day_num):
+                content = self.generate_single(day_num, day_plan, tone_guide, serp_context)
             results.append(content)
             
             logger.info(f"   ✅ Day {day_num} 완료 ({len(content.get('content', ''))}자)")
         
         logger.info(f"\n🎉 총 {len(results)}개 콘텐츠 생성 완료!")
+        self._log_cache_usage()
+        return results
+    
+    def _log_cache_usage(self) -> None:
+        """
+        프롬프트 캐시 적중 현황 (고정 prefix는 첫 호출만 정가)
+        prefix로 나눠 보내는 건 캐시 최소 길이(1024토큰)를 넘는 본문 지시문뿐이라 적중 토큰은 본문 단계에서만 잡힘
+        """
+        totals = self.gpt.usage.snapshot()
+        if not totals["prompt_tokens"]:
+            return
+        hit_rate = UsageStats.cache_hit_rate(totals)
+        logger.info(
+            f"💾 프롬프트 캐시: 입력 {totals['prompt_tokens']:,} 토큰 중 "
+            f"{totals['cached_tokens']:,} 토큰 캐시 적중 ({hit_rate:.0%})"
+        )
+    
+    @node_scope("SEOContentWriter")
+    def generate_all_batch(
+        self,
+        content_plan: List[Dict[str, Any]],
+        tone_guide: Dict[str, Any],
+        serp_context: Optional[Dict[str, Any]] = None,
+        start_day: int = 1,
+        end_day: int = 30,
+        runner: Optional[OpenAIBatchRunner] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Batch API로 전체 콘텐츠 생성 (예약 백필용: 느리지만 저렴, 레이트 리밋 무관)
+        
+        1차 배치: 모든 Day의 구조 요청
+        2차 배치: 1차 결과에 의존하는 본문 요청
+        
+        요청 본문은 온라인 호출과 동일(build_params)하며, 실패한 Day는 기본값으로 채움
+        
+        Returns:
+            생성된 콘텐츠 리스트 (Day 순서)
+        """
+        runner = runner or OpenAIBatchRunner(self.gpt)
+        days = [d for d in range(start_day, end_day + 1) if d <= len(content_plan)]
+        h2_count = tone_guide.get("seo_rules", {}).get("h2_count", 6)
+        
+        logger.info(f"📦 Step 4 (Batch API): SEO 콘텐츠 생성 시작 (Day {start_day}~{end_day}, {len(days)}개)")
+        
+        # 1차 배치: 구조
+        structure_requests = [
+            (
+                f"structure-day{day_num:02d}",
+                self.gpt.build_params(
+                    self._build_structure_prompt(day_num, content_plan[day_num - 1], tone_guide, serp_context),
+                    max_tokens=2000,
+                    schema=SEO_STRUCTURE_SCHEMA
+                )
+            )
+            for day_num in days
+        ]
+        day_tags = {}
+        for day_num in days:
+            day_tags[f"structure-day{day_num:02d}"] = {"day": day_num}
+            day_tags[f"content-day{day_num:02d}"] = {"day": day_num}
+        
+        structure_outputs = runner.run(
+            structure_requests, "seo_structure", schema=SEO_STRUCTURE_SCHEMA, tags=day_tags
+        )
+        
+        structures: Dict[int, Dict[str, Any]] = {}
+        for day_num in days:
+            title = content_plan[day_num - 1].get("title", "제목 없음")
+            raw = structure_outputs.get(f"structure-day{day_num:02d}")
+            structures[day_num] = self._parse_structure(raw, title, h2_count)
+        
+        # 2차 배치: 본문
+        content_prefix = self._build_content_prefix(tone_guide)
+        content_requests = [
+            (
+                f"content-day{day_num:02d}",
+                self.gpt.build_params(
+                    self._build_content_prompt(day_num, content_plan[day_num - 1], structures[day_num]),
+                    max_tokens=4000,
+                    schema=SEO_CONTENT_SCHEMA,
+                    prefix=content_prefix
+                )
+            )
+            for day_num in days
+        ]
+        content_outputs = runner.run(
+            content_requests, "seo_content", schema=SEO_CONTENT_SCHEMA, tags=day_tags
+        )
+        
+        results = []
+        for day_num in days:
+            title = content_plan[day_num - 1].get("title", "")
+            raw = content_outputs.get(f"content-day{day_num:02d}")
+            results.append(self._parse_content(raw, day_num, title, structures[day_num]))
+        
+        logger.info(f"\n🎉 총 {len(results)}개 콘텐츠 생성 완료! (Batch API)")
+        self._log_cache_usage()
         return results
     
     def generate_single(
@@ -97,6 +245,84 @@ class SEOContentWriterNode:
         
         return full_content
     
+    async def agenerate_single(
+        self,
+        day_num: int,
+        day_plan: Dict[str, Any],
+        tone_guide: Dict[str, Any],
+        serp_context: Optional[Dict[str, Any]] = None,
+        on_progress: Optional[ProgressFn] = None
+    ) -> Dict[str, Any]:
+        """
+        generate_single의 코루틴 버전 (웹 API처럼 여러 요청을 한 이벤트 루프에서 처리할 때)
+
+        Args:
+            on_progress: 진행 이벤트 콜백
+                {"event": "structure", "sections": [H2...]} → 섹션마다 {"event": "section", "index", "h2", ...}
+        """
+        report = on_progress or (lambda event: None)
+
+        structure = await self._agenerate_structure(day_num, day_plan, tone_guide, serp_context)
+        report({
+            "event": "structure",
+            "day": day_num,
+            "seo_title": structure.get("seo_title", ""),
+            "sections": [section.get("h2", "") for section in structure.get("sections", [])[:6]],
+        })
+
+        return await self._awrite_content(day_num, day_plan, structure, tone_guide, serp_context, report)
+
+    async def _agenerate_structure(
+        self,
+        day_num: int,
+        day_plan: Dict[str, Any],
+        tone_guide: Dict[str, Any],
+        serp_context: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """_generate_structure의 코루틴 버전"""
+        title = day_plan.get("title", "제목 없음")
+        h2_count = tone_guide.get("seo_rules", {}).get("h2_count", 6)
+        prompt = self._build_structure_prompt(day_num, day_plan, tone_guide, serp_context)
+
+        try:
+            response = await self.gpt.achat(prompt, max_tokens=2000, schema=SEO_STRUCTURE_SCHEMA)
+        except StructuredOutputError as e:
+            logger.error(f"❌ 구조 스키마 검증 실패: {e}")
+            return self._get_default_structure(title, h2_count)
+
+        return self._parse_structure(response, title, h2_count)
+
+    async def _awrite_content(
+        self,
+        day_num: int,
+        day_plan: Dict[str, Any],
+        structure: Dict[str, Any],
+        tone_guide: Dict[str, Any],
+        serp_context: Optional[Dict[str, Any]],
+        report: ProgressFn
+    ) -> Dict[str, Any]:
+        """_write_content의 코루틴 버전 (스트리밍 중 완성된 섹션부터 진행 이벤트)"""
+        title = day_plan.get("title", "")
+        prompt = self._build_content_prompt(day_num, day_plan, structure)
+        stream = _SectionStream(len(structure.get("sections", [])[:6]), report)
+
+        try:
+            response = await self.gpt.achat(
+                prompt=prompt,
+                max_tokens=4000,
+                schema=SEO_CONTENT_SCHEMA,
+                prefix=self._build_content_prefix(tone_guide),
+                on_delta=stream.feed
+            )
+        except StructuredOutputError as e:
+            logger.error(f"❌ 본문 스키마 검증 실패: {e}")
+            response = None
+
+        content = self._parse_content(response, day_num, title, structure)
+        # 스트리밍 중 못 보낸 섹션 (마지막 섹션, 기본 본문으로 대체된 경우 등)
+        stream.flush(content.get("sections", []))
+        return content
+
     def _generate_structure(
         self,
         day_num: int,
@@ -108,26 +334,43 @@ class SEOContentWriterNode:
         GPT를 사용하여 글 구조 생성 (빠르고 저렴)
         """
         title = day_plan.get("title", "제목 없음")
+        h2_count = tone_guide.get("seo_rules", {}).get("h2_count", 6)
+        prompt = self._build_structure_prompt(day_num, day_plan, tone_guide, serp_context)
+
+        try:
+            response = self.gpt.chat(prompt, max_tokens=2000, schema=SEO_STRUCTURE_SCHEMA)
+        except StructuredOutputError as e:
+            logger.error(f"❌ 구조 스키마 검증 실패: {e}")
+            return self._get_default_structure(title, h2_count)
+        
+        return self._parse_structure(response, title, h2_count)
+    
+    def _build_structure_prompt(
+        self,
+        day_num: int,
+        day_plan: Dict[str, Any],
+        tone_guide: Dict[str, Any],
+        serp_context: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        구조 생성 프롬프트
+        지시문이 OpenAI 캐시 최소 길이(1024토큰)에 못 미쳐 고정 prefix로 나누지 않고 한 메시지로 보냄
+        (프롬프트 캐시는 본문 prefix만 해당)
+        """
+        title = day_plan.get("title", "제목 없음")
         category = day_plan.get("category", "일반")
-        keywords = day_plan.get("keywords", [])
+        keywords = list(day_plan.get("keywords", []))
+        h2_count = tone_guide.get("seo_rules", {}).get("h2_count", 6)
+        h3_per_h2 = tone_guide.get("seo_rules", {}).get("h3_per_h2", 2)
         
         # SERP 키워드 추가
         if serp_context:
             serp_keywords = serp_context.get("top_keywords", [])
             keywords.extend(serp_keywords[:5])
         
-        h2_count = tone_guide.get("seo_rules", {}).get("h2_count", 6)
-        h3_per_h2 = tone_guide.get("seo_rules", {}).get("h3_per_h2", 2)
-        
-        prompt = f"""당신은 SEO 최적화 블로그 글 구조 설계 전문가입니다.
+        return f"""당신은 SEO 최적화 블로그 글 구조 설계 전문가입니다.
 주어진 주제에 대해 검색 엔진 최적화된 글 구조를 생성하세요.
 
-# 글 정보
-- Day: {day_num}
-- 제목: {title}
-- 카테고리: {category}
-- 키워드: {', '.join(keywords[:10])}
-
 # 구조 생성 규칙
 - H2 개수: {h2_count}개
 - H2당 H3: {h3_per_h2}개
@@ -135,80 +378,26 @@ class SEOContentWriterNode:
 - 리스트 1개: 체크리스트/단계별
 - FAQ 3개: 실제 검색 의도 기반
 
-# 출력 형식 (JSON)
-{{
-  "seo_title": "48~58자, 키워드 앞배치, 숫자 포함",
-  "meta_description": "110~150자, 행동 유도 포함",
-  "h1": "메인 제목",
-  "sections": [
-    {{
-      "h2": "H2 제목 (질문형/숫자형)",
-      "h3_list": ["H3-1", "H3-2"],
-      "content_outline": "이 섹션에서 다룰 내용 개요 1~2문장"
-    }}
-  ],
-  "table": {{
-    "title": "표 제목",
-    "headers": ["열1", "열2", "열3"],
-    "rows": [
-      ["데이터1-1", "데이터1-2", "데이터1-3"],
-      ["데이터2-1", "데이터2-2", "데이터2-3"]
-    ],
-    "insert_after_section": 2
-  }},
-  "checklist": {{
-    "title": "체크리스트/리스트 제목",
-    "items": ["항목1", "항목2", "항목3", "항목4", "항목5"],
-    "insert_after_section": 3
-  }},
-  "faq": [
-    {{
-      "question": "실제 검색될 만한 질문",
-      "answer_outline": "답변 개요 1문장"
-    }},
-    {{
-      "question": "질문2",
-      "answer_outline": "답변 개요"
-    }},
-    {{
-      "question": "질문3",
-      "answer_outline": "답변 개요"
-    }}
-  ],
-  "internal_links": [
-    {{
-      "anchor_text": "관련 글 링크 텍스트",
-      "target_day": 5,
-      "insert_after_section": 1
-    }}
-  ],
-  "image_prompts": [
-    {{
-      "position": "thumbnail",
-      "prompt": "DSLR 스타일 이미지 프롬프트",
-      "alt_text": "SEO 최적화 ALT 텍스트"
-    }},
-    {{
-      "position": "section_2",
-      "prompt": "이미지 프롬프트",
-      "alt_text": "ALT 텍스트"
-    }}
-  ]
-}}
-
-위 JSON 형식으로만 출력하세요. 추가 설명 없이 JSON만 출력하세요."""
-
-        response = self.gpt.chat(prompt, max_tokens=2000)
+# 출력
+- internal_links: 30일 계획 내 관련 Day로 연결
+- image_prompts: 썸네일 1개 + 섹션 이미지
+
+지정된 JSON 스키마로만 출력하세요.
+
+# 글 정보
+- Day: {day_num}
+- 제목: {title}
+- 카테고리: {category}
+- 키워드: {', '.join(keywords[:10])}"""
+    
+    def _parse_structure(self, response: Optional[str], title: str, h2_count: int) -> Dict[str, Any]:
+        """구조 응답 파싱 (실패 시 기본 구조)"""
+        if not response:
+            return self._get_default_structure(title, h2_count)
         
-        # JSON 파싱
+        # JSON 파싱 (잘린 응답도 복구)
         try:
-            json_str = response.strip()
-            if "```json" in json_str:
-                json_str = json_str.split("```json")[1].split("```")[0].strip()
-            elif "```" in json_str:
-                json_str = json_str.split("```")[1].split("```")[0].strip()
-            
-            structure = json.loads(json_str)
+            structure = parse_json_object(response, "SEOContentWriter.structure")
             logger.info(f"   ✅ 구조 생성 완료 (H2 {len(structure.get('sections', []))}개)")
             return structure
         except Exception as e:
@@ -255,50 +444,22 @@ class SEOContentWriterNode:
             ]
         }
     
-    def _write_content(
-        self,
-        day_num: int,
-        day_plan: Dict[str, Any],
-        structure: Dict[str, Any],
-        tone_guide: Dict[str, Any],
-        serp_context: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, Any]:
+    def _build_content_prefix(self, tone_guide: Dict[str, Any]) -> str:
         """
-        Claude를 사용하여 실제 본문 작성 (고품질)
+        본문 작성용 고정 지시문 (톤, HTML 예시, 작성 규칙)
+        Day별 값이 섞이지 않아야 30일 내내 동일한 접두부로 캐시됨
         """
-        title = day_plan.get("title", "")
-        category = day_plan.get("category", "")
-        
-        # 톤 가이드 추출
         personality = tone_guide.get("tone_guide", {}).get("personality", "친근하고 공감하는")
         voice = tone_guide.get("tone_guide", {}).get("voice", "1인칭")
         opening_example = tone_guide.get("structure_template", {}).get("opening", {}).get("example", "")
         closing_examples = tone_guide.get("structure_template", {}).get("closing", {}).get("cta_examples", [])
         optimal_length = tone_guide.get("content_length", {}).get("optimal", 1800)
         
-        # 구조에서 섹션 정보 추출
-        sections = structure.get("sections", [])[:6]  # 최대 6개
-        
-        # 모든 섹션 상세 정보 생성
-        sections_detail = ""
-        for idx, section in enumerate(sections, 1):
-            h2 = section.get('h2', f'섹션 {idx}')
-            h3_list = section.get('h3_list', [])
-            
-            sections_detail += f"\n**섹션 {idx}: {h2}**\n"
-            for h3_idx, h3 in enumerate(h3_list[:2], 1):  # H3는 최대 2개
-                sections_detail += f"- H3-{h3_idx}: {h3}\n"
-                sections_detail += f"  • 단락 1: 문제 제기 또는 배경 설명 (80~140자, 3~4문장)\n"
-                sections_detail += f"  • 단락 2: 구체적 해결책 또는 방법 (실제 예시 포함)\n"
-                sections_detail += f"  • 단락 3: 효과 또는 주의사항\n"
-        
-        prompt = f"""당신은 한국 네이버 블로그 SEO 전문 작가입니다.
+        return f"""당신은 한국 네이버 블로그 SEO 전문 작가입니다.
 아래 지침을 **정확히** 따라 블로그 글을 작성하세요.
+글 정보와 섹션 목록은 사용자 메시지로 전달됩니다.
 
-## 📋 작성할 글 정보
-- Day: {day_num}
-- 제목: {title}
-- 카테고리: {category}
+## 🎯 공통 설정
 - 톤: {personality}, {voice} 사용
 - 목표 글자 수: {optimal_length}자
 
@@ -314,14 +475,14 @@ class SEOContentWriterNode:
 - 공감 질문 1문장
 - 총 2~3문장, 80~120자
 
-### 2. 본문 섹션 (총 {len(sections)}개 - 모두 작성 필수!)
-
-⚠️ **중요: 아래 모든 섹션을 빠짐없이 작성하세요!**
-{sections_detail}
+### 2. 본문 섹션
+사용자 메시지의 모든 섹션을 순서대로 작성합니다.
+각 H3마다 3개 단락 작성 (80~140자/단락):
+- 단락 1: 문제 제기 또는 배경 설명 (80~140자, 3~4문장)
+- 단락 2: 구체적 해결책 또는 방법 (실제 예시 포함)
+- 단락 3: 효과 또는 주의사항
 
-각 H3마다 3개 단락 작성 (80~140자/단락)
-
-### 3. 표 작성 ({structure.get('table', {}).get('title', '비교표')})
+### 3. 표 작성
 HTML 형식:
 ```html
 <table border="1" style="width:100%; border-collapse:collapse;">
@@ -365,7 +526,7 @@ HTML 형식:
 - 답변: 2~3문장, 핵심만 간결하게
 
 예시:
-Q: {title}은 언제 시작하는 게 좋나요?
+Q: 여행 준비는 언제 시작하는 게 좋나요?
 A: 최소 2주 전부터 시작하는 것이 좋습니다. 특히 해외 여행이라면 한 달 전부터 준비하면 여유롭게 챙길 수 있어요.
 
 ### 6. 마무리 (60~100자)
@@ -378,117 +539,7 @@ CTA 포함:
 - 총 2문장, 60~100자
 
 ## 📤 출력 형식
-
-**중요: 아래 JSON 형식을 정확히 따르세요.**
-**⚠️ sections 배열에 {len(sections)}개의 섹션을 모두 포함하세요!**
-
-```json
-{{
-  "day": {day_num},
-  "title": "{title}",
-  "seo_title": "{structure.get('seo_title', title)}",
-  "meta_description": "{structure.get('meta_description', '')}",
-  "h1": "{structure.get('h1', title)}",
-  "opening": "오프닝 텍스트 (80~120자)",
-  "sections": [
-    {{
-      "h2": "{sections[0].get('h2', '') if sections else ''}",
-      "h2_emoji": "📌",
-      "h3_contents": [
-        {{
-          "h3": "{sections[0].get('h3_list', [''])[0] if sections and sections[0].get('h3_list') else ''}",
-          "paragraphs": ["단락1 (80~140자)", "단락2", "단락3"]
-        }},
-        {{
-          "h3": "{sections[0].get('h3_list', ['', ''])[1] if sections and len(sections[0].get('h3_list', [])) > 1 else ''}",
-          "paragraphs": ["단락1", "단락2", "단락3"]
-        }}
-      ]
-    }},
-    {{
-      "h2": "{sections[1].get('h2', '') if len(sections) > 1 else ''}",
-      "h2_emoji": "💡",
-      "h3_contents": [
-        {{
-          "h3": "{sections[1].get('h3_list', [''])[0] if len(sections) > 1 and sections[1].get('h3_list') else ''}",
-          "paragraphs": ["단락1", "단락2", "단락3"]
-        }},
-        {{
-          "h3": "{sections[1].get('h3_list', ['', ''])[1] if len(sections) > 1 and len(sections[1].get('h3_list', [])) > 1 else ''}",
-          "paragraphs": ["단락1", "단락2", "단락3"]
-        }}
-      ]
-    }},
-    {{
-      "h2": "{sections[2].get('h2', '') if len(sections) > 2 else ''}",
-      "h2_emoji": "🎯",
-      "h3_contents": [
-        {{
-          "h3": "{sections[2].get('h3_list', [''])[0] if len(sections) > 2 and sections[2].get('h3_list') else ''}",
-          "paragraphs": ["단락1", "단락2", "단락3"]
-        }},
-        {{
-          "h3": "{sections[2].get('h3_list', ['', ''])[1] if len(sections) > 2 and len(sections[2].get('h3_list', [])) > 1 else ''}",
-          "paragraphs": ["단락1", "단락2", "단락3"]
-        }}
-      ]
-    }},
-    {{
-      "h2": "{sections[3].get('h2', '') if len(sections) > 3 else ''}",
-      "h2_emoji": "✨",
-      "h3_contents": [
-        {{
-          "h3": "{sections[3].get('h3_list', [''])[0] if len(sections) > 3 and sections[3].get('h3_list') else ''}",
-          "paragraphs": ["단락1", "단락2", "단락3"]
-        }},
-        {{
-          "h3": "{sections[3].get('h3_list', ['', ''])[1] if len(sections) > 3 and len(sections[3].get('h3_list', [])) > 1 else ''}",
-          "paragraphs": ["단락1", "단락2", "단락3"]
-        }}
-      ]
-    }},
-    {{
-      "h2": "{sections[4].get('h2', '') if len(sections) > 4 else ''}",
-      "h2_emoji": "🔥",
-      "h3_contents": [
-        {{
-          "h3": "{sections[4].get('h3_list', [''])[0] if len(sections) > 4 and sections[4].get('h3_list') else ''}",
-          "paragraphs": ["단락1", "단락2", "단락3"]
-        }},
-        {{
-          "h3": "{sections[4].get('h3_list', ['', ''])[1] if len(sections) > 4 and len(sections[4].get('h3_list', [])) > 1 else ''}",
-          "paragraphs": ["단락1", "단락2", "단락3"]
-        }}
-      ]
-    }},
-    {{
-      "h2": "{sections[5].get('h2', '') if len(sections) > 5 else ''}",
-      "h2_emoji": "🎁",
-      "h3_contents": [
-        {{
-          "h3": "{sections[5].get('h3_list', [''])[0] if len(sections) > 5 and sections[5].get('h3_list') else ''}",
-          "paragraphs": ["단락1", "단락2", "단락3"]
-        }},
-        {{
-          "h3": "{sections[5].get('h3_list', ['', ''])[1] if len(sections) > 5 and len(sections[5].get('h3_list', [])) > 1 else ''}",
-          "paragraphs": ["단락1", "단락2", "단락3"]
-        }}
-      ]
-    }}
-  ],
-  "table_html": "<table>...</table>",
-  "checklist_html": "<ul><li>✅ 항목1</li></ul>",
-  "faq": [
-    {{
-      "question": "실제 검색 질문",
-      "answer": "간결한 답변 2~3문장"
-    }}
-  ],
-  "closing": "마무리 텍스트 (60~100자)",
-  "word_count": 1800,
-  "keywords_used": ["{title.split()[0]}", "키워드2", "키워드3"]
-}}
-```
+지정된 JSON 스키마를 따르고, 사용자 메시지의 출력 값(day, title, seo_title, meta_description, h1)을 그대로 사용하세요.
 
 ## ⚠️ 반드시 지켜야 할 것
 
@@ -498,24 +549,93 @@ CTA 포함:
 4. **구체성**: 추상적 표현 금지, 구체적 예시 필수
 5. **톤 일관성**: {personality}, {voice} 유지
 
-**⚠️ 중요: JSON 출력 규칙**
-- 반드시 유효한 JSON 형식
-- 모든 문자열은 한 줄로 작성 (줄바꿈 금지)
-- 따옴표는 작은따옴표(')로 대체
-- 구조 완전히 동일하게 유지
+**⚠️ 중요: 문자열 안의 따옴표는 작은따옴표(')로 대체**"""
+    
+    def _write_content(
+        self,
+        day_num: int,
+        day_plan: Dict[str, Any],
+        structure: Dict[str, Any],
+        tone_guide: Dict[str, Any],
+        serp_context: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        GPT를 사용하여 실제 본문 작성 (structured output)
+        """
+        title = day_plan.get("title", "")
+        prompt = self._build_content_prompt(day_num, day_plan, structure)
 
-위 JSON만 출력하세요."""
+        # Structured Outputs 사용 (스키마 보장 + 로컬 검증)
+        try:
+            response = self.gpt.chat(
+                prompt=prompt,
+                max_tokens=4000,
+                schema=SEO_CONTENT_SCHEMA,
+                prefix=self._build_content_prefix(tone_guide)
+            )
+        except StructuredOutputError as e:
+            logger.error(f"❌ 본문 스키마 검증 실패: {e}")
+            return self._get_default_content(day_num, title, structure)
+        
+        return self._parse_content(response, day_num, title, structure)
+    
+    def _build_content_prompt(
+        self,
+        day_num: int,
+        day_plan: Dict[str, Any],
+        structure: Dict[str, Any]
+    ) -> str:
+        """본문 작성용 Day별 suffix (글 정보 + 섹션 목록 + 출력 값)"""
+        title = day_plan.get("title", "")
+        category = day_plan.get("category", "")
+        
+        # 구조에서 섹션 정보 추출
+        sections = structure.get("sections", [])[:6]  # 최대 6개
+        
+        # 모든 섹션 상세 정보 생성
+        sections_detail = ""
+        for idx, section in enumerate(sections, 1):
+            h2 = section.get('h2', f'섹션 {idx}')
+            h3_list = section.get('h3_list', [])
+            
+            sections_detail += f"\n**섹션 {idx}: {h2}**\n"
+            for h3_idx, h3 in enumerate(h3_list[:2], 1):  # H3는 최대 2개
+                sections_detail += f"- H3-{h3_idx}: {h3}\n"
+        
+        # Day별로 달라지는 부분만 suffix로 (고정 지시문은 prefix로 캐시)
+        return f"""## 📋 작성할 글 정보
+- Day: {day_num}
+- 제목: {title}
+- 카테고리: {category}
 
-        # GPT json_mode 사용 (100% 유효한 JSON 보장)
-        response = self.gpt.chat(
-            prompt=prompt,
-            json_mode=True,
-            max_tokens=4000
-        )
+## 📑 본문 섹션 (총 {len(sections)}개 - 모두 작성 필수!)
+
+⚠️ **중요: 아래 모든 섹션을 빠짐없이 작성하세요!**
+{sections_detail}
+## 📊 표 제목: {structure.get('table', {}).get('title', '비교표')}
+
+## 📤 출력 값
+- day: {day_num}, title: "{title}"
+- seo_title: "{structure.get('seo_title', title)}"
+- meta_description: "{structure.get('meta_description', '')}"
+- h1: "{structure.get('h1', title)}"
+- **⚠️ sections 배열에 위 {len(sections)}개의 섹션을 순서대로 모두 포함하세요!**"""
+    
+    def _parse_content(
+        self,
+        response: Optional[str],
+        day_num: int,
+        title: str,
+        structure: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """본문 응답 파싱 + 검증용 전체 텍스트 조합 (실패 시 기본 본문)"""
+        if not response:
+            return self._get_default_content(day_num, title, structure)
         
-        # JSON 파싱 (GPT는 항상 유효한 JSON 반환)
+        # JSON 파싱 (max_tokens로 잘린 응답도 복구)
         try:
-            content = json.loads(response)
+            content = parse_json_object(response, "SEOContentWriter.content")
+            content["day"] = day_num  # 저장 파일명 기준이므로 요청한 Day로 고정
             
             # 전체 텍스트 조합 (검증용)
             full_text = content.get("opening", "")
@@ -530,7 +650,7 @@ CTA 포함:
             logger.info(f"   ✅ 본문 작성 완료 ({len(full_text)}자)")
             return content
             
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             logger.error(f"❌ JSON 파싱 실패 (GPT): {e}")
             logger.error(f"응답: {response[:500]}")
             return self._get_default_content(day_num, title, structure)
@@ -582,24 +702,46 @@ CTA 포함:
         }
 
 
+def save_contents(results: List[Dict[str, Any]], output_dir: str = "outputs/content") -> List[str]:
+    """
+    생성된 콘텐츠를 dayXX_content.json 파일로 저장
+    
+    Returns:
+        저장된 파일 경로 목록
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    
+    paths = []
+    for content in results:
+        day_num = content.get("day", 0)
+        output_path = os.path.join(output_dir, f"day{day_num:02d}_content.json")
+        
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(content, f, ensure_ascii=False, indent=2)
+        
+        logger.info(f"💾 Day {day_num} 저장: {output_path}")
+        paths.append(output_path)
+    
+    return paths
+
+
 if __name__ == "__main__":
     import sys
-    import os
+    from utils.metrics import format_projection, format_run_summary, run_summary
+    from utils.plan_store import DEFAULT_BLOG, DEFAULT_PLAN_FILE, load_plan_store
+    from utils.run_context import get_run_id
     
-    # 입력 파일 로드
+    # 입력 로드 (utils.plan_store - JSON이 바뀌었을 때만 다시 가져옴)
     try:
-        with open("outputs/initial_pipeline_result.json", "r", encoding="utf-8") as f:
-            pipeline_result = json.load(f)
-            content_plan = pipeline_result.get("content_plan", [])
-            serp_result = pipeline_result.get("serp_result", {})
+        store = load_plan_store(DEFAULT_BLOG)
     except FileNotFoundError:
-        logger.error("❌ outputs/initial_pipeline_result.json 파일이 없습니다.")
+        logger.error(f"❌ {DEFAULT_PLAN_FILE} 파일이 없습니다.")
         sys.exit(1)
+    content_plan = store.plan_items(DEFAULT_BLOG)
+    serp_data = store.serp_snapshot(DEFAULT_BLOG)
     
-    try:
-        with open("outputs/tone_style_guide.json", "r", encoding="utf-8") as f:
-            tone_guide = json.load(f)
-    except FileNotFoundError:
+    tone_guide = store.tone_guide(DEFAULT_BLOG)
+    if tone_guide is None:
         logger.error("❌ outputs/tone_style_guide.json 파일이 없습니다.")
         logger.error("   먼저 python -m nodes.tone_style_generator_node를 실행하세요.")
         sys.exit(1)
@@ -613,13 +755,15 @@ if __name__ == "__main__":
     print("  1. 전체 생성 (Day 1~30)")
     print("  2. 범위 지정 (예: Day 1~5)")
     print("  3. 단일 Day (예: Day 1)")
+    print("  4. 전체 생성 - Batch API (비용 50% 절감, 완료까지 최대 24시간)")
     
-    choice = input("\n선택 (1/2/3, 기본값=3): ").strip() or "3"
+    choice = input("\n선택 (1/2/3/4, 기본값=3): ").strip() or "3"
     
     start_day = 1
     end_day = 1
+    use_batch = choice == "4"
     
-    if choice == "1":
+    if choice in ("1", "4"):
         start_day = 1
         end_day = len(content_plan)
     elif choice == "2":
@@ -631,15 +775,12 @@ if __name__ == "__main__":
         day_input = input("생성할 Day (기본값=1): ").strip() or "1"
         start_day = end_day = int(day_input)
     
-    # 비용/시간 예측
+    # 비용/시간 예측 (과거 실측치 p50/p90 기준)
     count = end_day - start_day + 1
-    estimated_cost = count * 35  # ₩35/글
-    estimated_time = count * 30  # 30초/글
     
     print(f"\n📊 예상 정보:")
     print(f"   - 생성 개수: {count}개")
-    print(f"   - 예상 비용: ₩{estimated_cost}")
-    print(f"   - 예상 시간: {estimated_time}초 ({estimated_time//60}분 {estimated_time%60}초)")
+    print(format_projection(count, batch=use_batch))
     
     confirm = input(f"\n계속하시겠습니까? (y/n, 기본값=y): ").strip().lower() or "y"
     if confirm != "y":
@@ -648,26 +789,19 @@ if __name__ == "__main__":
     
     # 생성 실행
     writer = SEOContentWriterNode()
-    results = writer.generate_all(
+    generate = writer.generate_all_batch if use_batch else writer.generate_all
+    results = generate(
         content_plan=content_plan,
         tone_guide=tone_guide,
-        serp_context=serp_result,
+        serp_context=serp_data,
         start_day=start_day,
         end_day=end_day
     )
     
     # 저장
     output_dir = "outputs/content"
-    os.makedirs(output_dir, exist_ok=True)
-    
-    for content in results:
-        day_num = content.get("day", 0)
-        output_path = os.path.join(output_dir, f"day{day_num:02d}_content.json")
-        
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(content, f, ensure_ascii=False, indent=2)
-        
-        logger.info(f"💾 Day {day_num} 저장: {output_path}")
+    for content, path in zip(results, save_contents(results, output_dir)):
+        store.save_post(DEFAULT_BLOG, content.get("day", 0), "seo", content, path)
     
     # 요약 저장
     summary = {
@@ -675,7 +809,7 @@ if __name__ == "__main__":
         "total_count": len(results),
         "start_day": start_day,
         "end_day": end_day,
-        "total_cost_krw": estimated_cost,
+        "total_cost_krw": round(run_summary(get_run_id())["cost_krw"], 1),
         "files": [f"day{c.get('day', 0):02d}_content.json" for c in results]
     }
     
@@ -688,4 +822,5 @@ if __name__ == "__main__":
     print("="*80)
     print(f"\n📁 저장 위치: {output_dir}/")
     print(f"📊 총 {len(results)}개 파일 생성")
+    print(format_run_summary(get_run_id()))
     print(f"\n다음 단계: python -m nodes.image_planner_node")
@@ -1,11 +1,12 @@
 # nodes/serp_collector_node.py
-import json
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 from utils.logger import get_logger
-from utils.llm_client import LLMClient
+from utils.llm_client import LLMClient, get_llm_client
 from utils.naver_search import NaverSearchClient
 from utils.html_parser import HTMLParser
+from utils.json_repair import parse_json_object
+from utils.run_context import node_scope
 
 logger = get_logger("SERPCollectorNode")
 
@@ -19,11 +20,12 @@ class SERPCollectorNode:
     - LLM 요약
     """
 
-    def __init__(self) -> None:
+    def __init__(self, llm: Optional[LLMClient] = None) -> None:
         self.search_api = NaverSearchClient()
         self.parser = HTMLParser()
-        self.llm = LLMClient()
+        self.llm = llm or get_llm_client("gpt")
 
+    @node_scope("SERPCollector")
     def collect(self, keyword: str) -> Dict[str, Any]:
         logger.info(f"SERPCollector 시작: keyword={keyword}")
 
@@ -78,9 +80,7 @@ JSON으로 출력:
 
         try:
             raw = self.llm.chat(prompt)
-            start = raw.find("{")
-            end = raw.rfind("}") + 1
-            return json.loads(raw[start:end])
+            return parse_json_object(raw, "SERPCollectorNode")
         except Exception:
             logger.error("요약 생성 실패")
             return {"summary": "", "key_points": []}
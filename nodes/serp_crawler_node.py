@@ -1,10 +1,13 @@
 # nodes/serp_crawler_node.py
 import json
-import requests
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from bs4 import BeautifulSoup
+from utils.http_client import get_http_session
 from utils.logger import get_logger
-from utils.llm_client import LLMClient
+from utils.llm_client import LLMClient, get_llm_client
+from utils.naver_search import naver_api_base, naver_blog_base
+from utils.run_context import node_scope
+from utils.shared_cache import get_shared_cache
 import os
 import time
 from urllib.parse import urlparse
@@ -20,24 +23,36 @@ class SERPCrawlerNode:
     - 각 블로그의 인기글 목록 크롤링 (최대 10개)
     """
 
-    def __init__(self) -> None:
-        self.llm = LLMClient()
+    def __init__(self, llm: Optional[LLMClient] = None) -> None:
+        self.llm = llm or get_llm_client("gpt")
         self.naver_client_id = os.getenv("NAVER_CLIENT_ID")
         self.naver_client_secret = os.getenv("NAVER_CLIENT_SECRET")
+        self.crawl_delay = float(os.getenv("SERP_CRAWL_DELAY", "0.5"))
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
         }
 
+    @node_scope("SERPCrawler")
     def crawl(self, topic_data: Dict[str, Any], platform: str = "네이버 블로그") -> Dict[str, Any]:
-        """주제 관련 상위 블로그 수집 + 각 블로그의 새글/인기글 크롤링"""
-        logger.info("SERPCrawlerNode: SERP 크롤링 시작")
+        """
+        주제 관련 상위 블로그 수집 + 각 블로그의 새글/인기글 크롤링
 
+        같은 주제/플랫폼 크롤링은 프로세스 공유 캐시(utils.shared_cache)로 여러 블로그 파이프라인이 한 번만 수행
+        """
         selected_topic = topic_data.get("selected_topic", {})
         topic_title = selected_topic.get("title", "")
         
         if not topic_title:
             raise ValueError("크롤링할 주제가 없습니다")
 
+        return get_shared_cache("serp_crawl").get_or_compute(
+            {"topic": topic_title, "platform": platform},
+            lambda: self._crawl(topic_title, platform)
+        )
+
+    def _crawl(self, topic_title: str, platform: str) -> Dict[str, Any]:
+        logger.info("SERPCrawlerNode: SERP 크롤링 시작")
+
         # 네이버 검색 API 사용
         if platform == "네이버 블로그" and self.naver_client_id:
             results = self._search_naver_blog(topic_title)
@@ -74,7 +89,7 @@ class SERPCrawlerNode:
                 logger.warning(f"    ⚠️ 블로그 홈 URL 추출 실패")
             
             # 요청 간 딜레이 (서버 부하 방지)
-            time.sleep(0.5)
+            time.sleep(self.crawl_delay)
 
         logger.info(f"SERPCrawlerNode: 총 {len(results)}개 블로그, 새글 {total_recent_posts}개, 인기글 {total_popular_posts}개 수집 완료")
         
@@ -90,7 +105,7 @@ class SERPCrawlerNode:
     def _search_naver_blog(self, query: str, display: int = 30) -> List[Dict[str, Any]]:
         """네이버 블로그 검색 API"""
         try:
-            url = "https://openapi.naver.com/v1/search/blog.json"
+            url = f"{naver_api_base()}/v1/search/blog.json"
             headers = {
                 "X-Naver-Client-Id": self.naver_client_id,
                 "X-Naver-Client-Secret": self.naver_client_secret
@@ -101,7 +116,7 @@ class SERPCrawlerNode:
                 "sort": "sim"  # 정확도순
             }
             
-            response = requests.get(url, headers=headers, params=params)
+            response = get_http_session().get(url, headers=headers, params=params)
             response.raise_for_status()
             
             data = response.json()
@@ -152,11 +167,12 @@ class SERPCrawlerNode:
         try:
             # https://blog.naver.com/user_id/post_id -> https://blog.naver.com/user_id
             parsed = urlparse(post_url)
-            if 'blog.naver.com' in parsed.netloc:
+            blog_base = naver_blog_base()
+            if urlparse(blog_base).netloc in parsed.netloc:
                 path_parts = parsed.path.strip('/').split('/')
                 if len(path_parts) >= 1:
                     blog_id = path_parts[0]
-                    return f"https://blog.naver.com/{blog_id}"
+                    return f"{blog_base}/{blog_id}"
             return None
         except Exception as e:
             logger.error(f"블로그 홈 URL 추출 실패: {e}")
@@ -171,9 +187,9 @@ class SERPCrawlerNode:
             
             # 실제로는 iframe 내부 URL 접근 필요
             # 간단한 방법: PostList.naver API 활용
-            recent_url = f"https://blog.naver.com/PostList.naver?blogId={blog_id}&currentPage=1"
+            recent_url = f"{naver_blog_base()}/PostList.naver?blogId={blog_id}&currentPage=1"
             
-            response = requests.get(recent_url, headers=self.headers, timeout=10)
+            response = get_http_session().get(recent_url, headers=self.headers, timeout=10)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -193,7 +209,7 @@ class SERPCrawlerNode:
                     if title and len(title) > 5:  # 제목이 있는 경우만
                         posts.append({
                             'title': title[:100],  # 제목 길이 제한
-                            'url': href if href.startswith('http') else f"https://blog.naver.com{href}"
+                            'url': href if href.startswith('http') else f"{naver_blog_base()}{href}"
                         })
                 
                 if len(posts) >= max_count:
@@ -212,9 +228,9 @@ class SERPCrawlerNode:
             
             # 네이버 블로그 인기글: 조회수 순 또는 공감순
             # PostList.naver에 orderBy 파라미터 추가
-            popular_url = f"https://blog.naver.com/PostList.naver?blogId={blog_id}&currentPage=1&orderBy=sim"
+            popular_url = f"{naver_blog_base()}/PostList.naver?blogId={blog_id}&currentPage=1&orderBy=sim"
             
-            response = requests.get(popular_url, headers=self.headers, timeout=10)
+            response = get_http_session().get(popular_url, headers=self.headers, timeout=10)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -231,7 +247,7 @@ class SERPCrawlerNode:
                     if title and len(title) > 5:
                         posts.append({
                             'title': title[:100],
-                            'url': href if href.startswith('http') else f"https://blog.naver.com{href}"
+                            'url': href if href.startswith('http') else f"{naver_blog_base()}{href}"
                         })
                 
                 if len(posts) >= max_count:
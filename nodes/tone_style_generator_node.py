@@ -12,20 +12,27 @@ SERP 상위 글을 분석하여 사용자 블로그의 일관된 문체와 톤
 """
 
 import json
-import logging
 from typing import Dict, Any, List, Optional
-from utils.llm_client import HybridLLMClient
+from utils.llm_client import HybridLLMClient, get_llm_client
+from utils.json_repair import parse_json_object
+from utils.logger import get_logger
+from utils.memo import mark_uncacheable, memoize
+from utils.run_context import node_scope
 
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
+logger = get_logger("ToneStyleGeneratorNode")
+
+# 프롬프트를 바꾸면 올림 (이전 메모 결과 무효화)
+PROMPT_VERSION = "1"
 
 
 class ToneStyleGeneratorNode:
     """문체·톤·스타일 확정 노드"""
     
-    def __init__(self):
-        self.llm = HybridLLMClient()
+    def __init__(self, llm: Optional[HybridLLMClient] = None):
+        self.llm = llm or get_llm_client("hybrid")
     
+    @memoize("ToneStyleGenerator", version=PROMPT_VERSION)
+    @node_scope("ToneStyleGenerator")
     def generate(
         self, 
         serp_result: Dict[str, Any],
@@ -167,24 +174,19 @@ class ToneStyleGeneratorNode:
         response = self.llm.chat(
             prompt=prompt,
             task_type="analytical",
-            max_tokens=2000
+            max_tokens=2000,
+            expect_json=True
         )
         
         # JSON 파싱
         try:
-            # JSON 블록 추출
-            json_str = response.strip()
-            if "```json" in json_str:
-                json_str = json_str.split("```json")[1].split("```")[0].strip()
-            elif "```" in json_str:
-                json_str = json_str.split("```")[1].split("```")[0].strip()
-            
-            analysis = json.loads(json_str)
+            analysis = parse_json_object(response, "ToneStyleGenerator.analysis")
             return analysis
         except Exception as e:
             logger.error(f"❌ JSON 파싱 실패: {e}")
             logger.error(f"응답: {response[:500]}")
-            # 기본값 반환
+            # 기본값 반환 (메모에 남기지 않음)
+            mark_uncacheable("문체 분석 기본값 사용")
             return self._get_default_analysis()
     
     def _get_default_analysis(self) -> Dict[str, Any]:
@@ -319,18 +321,13 @@ SERP 상위 글 분석 결과를 바탕으로, 실제 글쓰기에 사용할 구
         response = self.llm.chat(
             prompt=prompt,
             task_type="creative",
-            max_tokens=2500
+            max_tokens=2500,
+            expect_json=True
         )
         
         # JSON 파싱
         try:
-            json_str = response.strip()
-            if "```json" in json_str:
-                json_str = json_str.split("```json")[1].split("```")[0].strip()
-            elif "```" in json_str:
-                json_str = json_str.split("```")[1].split("```")[0].strip()
-            
-            guide = json.loads(json_str)
+            guide = parse_json_object(response, "ToneStyleGenerator.guide")
             
             # 메타 정보 추가
             guide["_meta"] = {
@@ -343,6 +340,7 @@ SERP 상위 글 분석 결과를 바탕으로, 실제 글쓰기에 사용할 구
         except Exception as e:
             logger.error(f"❌ JSON 파싱 실패: {e}")
             logger.error(f"응답: {response[:500]}")
+            mark_uncacheable("가이드 기본값 사용")
             return self._get_default_guide()
     
     def _get_default_guide(self) -> Dict[str, Any]:
@@ -422,13 +420,13 @@ if __name__ == "__main__":
     # 테스트 실행
     import sys
     
-    # SERP 결과 로드
+    from utils.plan_store import DEFAULT_BLOG, DEFAULT_PLAN_FILE, load_plan_store
+    
+    # SERP 결과 로드 (utils.plan_store)
     try:
-        with open("outputs/initial_pipeline_result.json", "r", encoding="utf-8") as f:
-            pipeline_result = json.load(f)
-            serp_result = pipeline_result.get("serp_result", {})
+        serp_result = load_plan_store(DEFAULT_BLOG, tone_guide_file=None).serp_snapshot(DEFAULT_BLOG)
     except FileNotFoundError:
-        logger.error("❌ outputs/initial_pipeline_result.json 파일이 없습니다.")
+        logger.error(f"❌ {DEFAULT_PLAN_FILE} 파일이 없습니다.")
         logger.error("   먼저 run_full_pipeline.py를 실행하세요.")
         sys.exit(1)
     
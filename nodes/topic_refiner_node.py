@@ -1,8 +1,9 @@
 # nodes/topic_refiner_node.py
-import json
-from typing import Dict, Any, List
-from utils.llm_client import LLMClient
+from typing import Dict, Any, List, Optional
+from utils.llm_client import LLMClient, get_llm_client
 from utils.logger import get_logger
+from utils.json_repair import parse_json_object
+from utils.run_context import node_scope
 
 logger = get_logger("TopicRefinerNode")
 
@@ -13,9 +14,10 @@ class TopicRefinerNode:
     다음 노드가 사용할 표준 JSON 포맷으로 반환하는 모듈
     """
 
-    def __init__(self) -> None:
-        self.llm = LLMClient()
+    def __init__(self, llm: Optional[LLMClient] = None) -> None:
+        self.llm = llm or get_llm_client("gpt")
 
+    @node_scope("TopicRefiner")
     def refine(self, topic: str) -> Dict[str, Any]:
         """
         주제를 입력받아 정제된 SEO 출력 JSON 생성
@@ -27,7 +29,7 @@ class TopicRefinerNode:
 
         try:
             raw_output = self.llm.chat(prompt)
-            parsed = self._safe_parse_json(raw_output)
+            parsed = parse_json_object(raw_output, "TopicRefinerNode")
 
             logger.info("TopicRefinerNode 완료")
             return parsed
@@ -36,22 +38,6 @@ class TopicRefinerNode:
             logger.exception("TopicRefinerNode 오류")
             raise e
 
-    def _safe_parse_json(self, text: str) -> Dict[str, Any]:
-        """
-        LLM의 응답이 JSON이 아닐 가능성을 대비한 파서
-        """
-
-        try:
-            start = text.find("{")
-            end = text.rfind("}") + 1
-            cleaned = text[start:end]
-            return json.loads(cleaned)
-
-        except Exception:
-            logger.error("JSON 파싱 실패. 원본 텍스트 로그 출력.")
-            logger.error(text)
-            raise ValueError("LLM 응답 JSON 파싱 실패")
-
     def _build_prompt(self, topic: str) -> str:
         """
         LLM에 전달할 프롬프트 생성
@@ -1,11 +1,17 @@
 # nodes/topic_scorer_node.py
 import json
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from utils.logger import get_logger
-from utils.llm_client import LLMClient
+from utils.llm_client import LLMClient, get_llm_client
+from utils.json_repair import parse_json_object
+from utils.memo import memoize
+from utils.run_context import node_scope
 
 logger = get_logger("TopicScorerNode")
 
+# 프롬프트/후처리를 바꾸면 올림 (이전 메모 결과 무효화)
+PROMPT_VERSION = "1"
+
 
 class TopicScorerNode:
     """
@@ -14,9 +20,11 @@ class TopicScorerNode:
     - 최종 주제 1개 자동 선정
     """
 
-    def __init__(self) -> None:
-        self.llm = LLMClient()
+    def __init__(self, llm: Optional[LLMClient] = None) -> None:
+        self.llm = llm or get_llm_client("gpt")
 
+    @memoize("TopicScorer", version=PROMPT_VERSION)
+    @node_scope("TopicScorer")
     def score_and_select(self, topics_data: Dict[str, Any]) -> Dict[str, Any]:
         """주제들을 스코어링하고 최적의 주제 선정"""
         logger.info("TopicScorerNode: 주제 스코어링 시작")
@@ -29,7 +37,7 @@ class TopicScorerNode:
 
         try:
             raw = self.llm.chat(prompt, max_tokens=2000)
-            parsed = self._safe_parse_json(raw)
+            parsed = parse_json_object(raw, "TopicScorerNode", "debug_topic_scorer.txt")
             
             # 최고 점수 주제 자동 선정
             scored_topics = parsed.get("scored_topics", [])
@@ -44,23 +52,6 @@ class TopicScorerNode:
             logger.error(f"TopicScorerNode 실패: {e}")
             raise
 
-    def _safe_parse_json(self, text: str) -> Dict[str, Any]:
-        try:
-            s = text.find("{")
-            e = text.rfind("}")
-            
-            if s == -1 or e == -1:
-                raise ValueError("JSON 형식을 찾을 수 없습니다")
-            
-            json_text = text[s:e+1]
-            return json.loads(json_text)
-            
-        except json.JSONDecodeError as e:
-            logger.error(f"JSON 파싱 실패: {e}")
-            with open("debug_topic_scorer.txt", "w", encoding="utf-8") as f:
-                f.write(text)
-            raise ValueError(f"JSON 파싱 실패: {e.msg}")
-
     def _build_prompt(self, topics: List[Dict[str, Any]]) -> str:
         topics_json = json.dumps(topics, ensure_ascii=False, indent=2)
         
@@ -6,9 +6,16 @@ Step 0-2: 주제 스코어링
 Step 1: 플랫폼 추천
 Step 2-1: SERP 크롤링
 Step 2-2: 30일 콘텐츠 계획
+
+--fresh: 체크포인트/메모 무시하고 전부 다시 계산
 """
 
+import sys
+
 from initial_pipeline import run_initial_pipeline
+from utils.memo import set_fresh
+from utils.profiling import format_profile_summary
+from utils.run_context import get_run_id
 import json
 
 
@@ -56,8 +63,10 @@ def main():
     print()
     
     # 파이프라인 실행
+    fresh = "--fresh" in sys.argv[1:]
+    set_fresh(fresh)
     try:
-        result = run_initial_pipeline(user_idea, skip_refinement=skip_refinement)
+        result = run_initial_pipeline(user_idea, skip_refinement=skip_refinement, resume=not fresh)
         
         # 결과 요약 출력
         print("\n" + "="*80)
@@ -132,6 +141,12 @@ def main():
         print("  - python batch_generate_posts.py 실행하여 30개 포스트 일괄 생성")
         print()
         
+        # BLOG_PROFILE=cpu,mem 실행 시 노드별 프로파일 요약
+        profile_summary = format_profile_summary(get_run_id())
+        if profile_summary:
+            print(profile_summary)
+            print()
+        
         return result
         
     except KeyboardInterrupt:
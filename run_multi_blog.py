@@ -0,0 +1,296 @@
+"""
+여러 블로그 동시 실행 스크립트
+- configs/*.yaml의 블로그마다 글 생성 파이프라인을 동시에 실행
+  (블로그 아이디어로 SERP 수집(SERPCrawlerNode) → 계획의 Day별 SEO 구조 + 본문(SEOContentWriterNode) → 저장)
+- 계획 / 톤 가이드는 utils.plan_store에서 블로그별로 조회 - 설정마다 plan_file / tone_guide_file 필수
+  (공용 outputs/initial_pipeline_result.json으로 대신하지 않음, 빠지면 실행 전에 ValueError)
+- LLM 호출 / HTTP 요청은 전역 한도(utils.budget) 안에서 블로그별로 돌아가며 공정하게 분배
+- SERP 크롤링 / 검색 / 검색량 조회는 프로세스 공유 캐시(utils.shared_cache)로 블로그 간 재사용
+- 끝나면 블로그별 처리량 / 지연(p50·p95) / LLM 호출 / 한도 대기 시간 리포트
+
+사용 예:
+    python run_multi_blog.py                          # 모든 블로그 Day 1 1건씩
+    python run_multi_blog.py --posts 3 --per-blog 2   # 블로그당 Day 1~3, 블로그당 동시 2건
+    python run_multi_blog.py --blogs woncamp wonfinance --start-day 8 --reuse-serp
+
+환경 변수: BLOG_LLM_CONCURRENCY, BLOG_HTTP_CONCURRENCY (utils.budget), BLOG_SHARED_CACHE_* (utils.shared_cache)
+"""
+
+import argparse
+import glob
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import yaml
+
+from utils.budget import budget_stats
+from utils.logger import get_logger
+from utils.metrics import percentile
+from utils.plan_store import DEFAULT_BLOG, DEFAULT_PLAN_FILE, DEFAULT_TONE_GUIDE_FILE, load_plan_store
+from utils.run_context import node_scope, run_scope
+from utils.shared_cache import format_cache_stats
+from utils.tracing import get_tracer
+
+logger = get_logger("MultiBlogRunner")
+
+CONFIG_DIR = "configs"
+
+# (블로그 설정, 블로그 안에서의 실행 번호 1~) → 결과
+RunPost = Callable[[Dict[str, Any], int], Dict[str, Any]]
+
+
+def load_blog_configs(config_dir: str = CONFIG_DIR, blogs: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """configs/*.yaml 로드 (blogs 지정 시 해당 블로그만, 파일 이름순)"""
+    configs = []
+    for path in sorted(glob.glob(os.path.join(config_dir, "*.yaml"))):
+        with open(path, "r", encoding="utf-8") as f:
+            config = yaml.safe_load(f) or {}
+        config.setdefault("blog_name", os.path.splitext(os.path.basename(path))[0])
+        if blogs and config["blog_name"] not in blogs:
+            continue
+        configs.append(config)
+    return configs
+
+
+def blog_plan_files(config: Dict[str, Any]) -> Tuple[str, str]:
+    """설정의 (plan_file, tone_guide_file) - 블로그마다 자기 계획/톤 가이드가 있어야 하므로 빠지면 ValueError"""
+    missing = [key for key in ("plan_file", "tone_guide_file") if not config.get(key)]
+    if missing:
+        raise ValueError(
+            f"{config['blog_name']} 블로그 설정에 {', '.join(missing)}가 없습니다 "
+            "(블로그 전용 계획 / 톤 가이드 JSON 경로를 지정하세요 - 공용 파일로 대신하지 않음)"
+        )
+    return config["plan_file"], config["tone_guide_file"]
+
+
+def plan_sources(blog: str, config_dir: str = CONFIG_DIR) -> Tuple[Optional[str], Optional[str]]:
+    """
+    블로그의 계획/톤 가이드 원본 JSON (utils.plan_store.load_plan_store 인자)
+
+    - 블로그 구분 없는 단일 블로그 실행(DEFAULT_BLOG): 공용 JSON
+    - 설정이 있는 블로그: 설정의 plan_file / tone_guide_file (빠지면 ValueError)
+    - 설정이 없는 블로그: (None, None) - 저장소에 이미 가져온 계획만 사용
+    """
+    if blog == DEFAULT_BLOG:
+        return DEFAULT_PLAN_FILE, DEFAULT_TONE_GUIDE_FILE
+    configs = load_blog_configs(config_dir, [blog])
+    if not configs:
+        return None, None
+    return blog_plan_files(configs[0])
+
+
+def default_idea(config: Dict[str, Any]) -> str:
+    """설정의 idea, 없으면 대표 키워드로 만든 아이디어"""
+    keywords = config.get("primary_keywords") or []
+    return config.get("idea") or " ".join(keywords[:2]) or config["blog_name"]
+
+
+def seo_pipeline_runner(
+    platform: str = "네이버 블로그",
+    idea: Optional[str] = None,
+    start_day: int = 1,
+    output_dir: str = "outputs/content",
+    reuse_serp: bool = False
+) -> RunPost:
+    """
+    블로그 설정 + 실행 번호 → 글 1건 생성 함수 (실행 번호 n은 Day start_day + n - 1)
+
+    - SERP: 블로그 아이디어로 SERPCrawlerNode 수집 (같은 아이디어/플랫폼은 공유 캐시로 블로그 간 1회),
+      reuse_serp면 저장소의 SERP 스냅샷 사용
+    - 글: SEOContentWriterNode.generate_single → output_dir/<블로그>/dayXX_content.json + 저장소 posts
+    - LLM / HTTP 호출은 노드 안에서 전역 한도(utils.budget)를 블로그별로 나눠 씀
+    """
+    from nodes.seo_content_writer_node import SEOContentWriterNode, save_contents
+    from nodes.serp_crawler_node import SERPCrawlerNode
+
+    # 같은 블로그의 첫 실행들이 계획 JSON을 동시에 가져오지 않도록
+    store_lock = threading.Lock()
+
+    def run_post(config: Dict[str, Any], index: int) -> Dict[str, Any]:
+        blog = config["blog_name"]
+        day = start_day + index - 1
+        plan_file, tone_guide_file = blog_plan_files(config)
+        with store_lock:
+            store = load_plan_store(blog, plan_file, tone_guide_file)
+        plan_item = store.plan_item(blog, day)
+        if plan_item is None:
+            raise ValueError(f"Day {day}는 {blog} 계획에 없습니다 (총 {store.day_count(blog)}일)")
+        tone_guide = store.tone_guide(blog)
+        if tone_guide is None:
+            raise FileNotFoundError(f"{blog} 톤 가이드가 없습니다: {tone_guide_file}")
+
+        if reuse_serp:
+            serp_context = store.serp_snapshot(blog)
+        else:
+            topic = {"selected_topic": {"title": idea or default_idea(config)}}
+            serp_context = SERPCrawlerNode().crawl(topic, platform=platform)
+
+        with node_scope("SEOContentWriter", day=day):
+            content = SEOContentWriterNode().generate_single(day, plan_item, tone_guide, serp_context)
+        paths = save_contents([content], os.path.join(output_dir, blog))
+        store.save_post(blog, day, "seo", content, paths[0])
+        return {"file": paths[0], "title": content.get("title"), "char_count": content.get("full_text_length", 0)}
+
+    return run_post
+
+
+def _run_one(config: Dict[str, Any], run_post: RunPost, index: int) -> Dict[str, Any]:
+    blog = config["blog_name"]
+    with run_scope(blog=blog) as run_id:
+        start = time.perf_counter()
+        error = None
+        try:
+            run_post(config, index)
+        except Exception as e:
+            logger.exception(f"❌ {blog} #{index} 실행 실패")
+            error = f"{type(e).__name__}: {e}"
+        return {
+            "blog": blog,
+            "index": index,
+            "run_id": run_id,
+            "latency_s": time.perf_counter() - start,
+            "error": error,
+        }
+
+
+def run_blogs(
+    configs: List[Dict[str, Any]],
+    run_post: RunPost,
+    posts: int = 1,
+    per_blog: int = 1
+) -> Dict[str, Any]:
+    """
+    블로그별 posts건을 동시에 실행
+
+    Args:
+        configs: 블로그 설정 목록
+        run_post: (블로그 설정, 실행 번호)로 글 1건을 만드는 함수 (run_scope(blog=...) 안에서 호출됨)
+        posts: 블로그당 실행 횟수
+        per_blog: 블로그당 동시 실행 수 (블로그 간 순서는 전역 한도가 공정하게 분배)
+
+    Returns:
+        {"wall_s": 전체 벽시계, "runs": 실행별 결과 목록}
+    """
+    workers = max(1, len(configs) * per_blog)
+    start = time.perf_counter()
+    runs: List[Dict[str, Any]] = []
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="blog") as executor:
+        # 블로그를 번갈아 제출해 앞쪽 블로그가 작업자를 먼저 다 차지하지 않도록
+        futures = [
+            executor.submit(_run_one, config, run_post, index)
+            for index in range(1, posts + 1)
+            for config in configs
+        ]
+        for future in as_completed(futures):
+            runs.append(future.result())
+    return {"wall_s": time.perf_counter() - start, "runs": runs}
+
+
+def blog_report(result: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """블로그별 처리량 / 지연 / LLM·HTTP 집계"""
+    tracer = get_tracer()
+    budgets = budget_stats()
+    rows: Dict[str, Dict[str, Any]] = {}
+    for run in sorted(result["runs"], key=lambda r: (r["blog"], r["index"])):
+        row = rows.setdefault(run["blog"], {
+            "blog": run["blog"], "ok": 0, "failed": 0, "latencies": [],
+            "llm_calls": 0, "llm_latencies": [], "http_calls": 0,
+        })
+        if run["error"]:
+            row["failed"] += 1
+        else:
+            row["ok"] += 1
+            row["latencies"].append(run["latency_s"])
+        for traced in tracer.spans(run["run_id"]):
+            if traced.kind == "llm":
+                row["llm_calls"] += 1
+                row["llm_latencies"].append(traced.duration_s)
+            elif traced.kind == "http":
+                row["http_calls"] += 1
+
+    report = []
+    for blog, row in rows.items():
+        report.append({
+            "blog": blog,
+            "ok": row["ok"],
+            "failed": row["failed"],
+            "posts_per_min": row["ok"] / result["wall_s"] * 60 if result["wall_s"] else 0.0,
+            "p50_s": percentile(row["latencies"], 50),
+            "p95_s": percentile(row["latencies"], 95),
+            "llm_calls": row["llm_calls"],
+            "llm_p95_s": percentile(row["llm_latencies"], 95),
+            "http_calls": row["http_calls"],
+            "llm_wait_s": budgets.get("llm", (0, {}))[1].get(blog, {}).get("wait_s", 0.0),
+            "http_wait_s": budgets.get("http", (0, {}))[1].get(blog, {}).get("wait_s", 0.0),
+        })
+    return report
+
+
+def format_blog_report(result: Dict[str, Any]) -> str:
+    """블로그별 리포트 표 + 공유 캐시 요약"""
+    limits = {kind: limit for kind, (limit, _) in budget_stats().items()}
+    limit_text = ", ".join(f"{kind.upper()} 한도 {limit or '∞'}" for kind, limit in sorted(limits.items()))
+    lines = [
+        f"📊 블로그별 처리량/지연 (전체 벽시계 {result['wall_s']:.2f}초" + (f", {limit_text})" if limit_text else ")"),
+        f"   {'블로그':<12}{'성공':>5}{'실패':>5}{'건/분':>8}{'p50(s)':>9}{'p95(s)':>9}"
+        f"{'LLM':>6}{'LLM p95':>9}{'HTTP':>6}{'LLM대기':>9}{'HTTP대기':>9}",
+    ]
+    for row in blog_report(result):
+        lines.append(
+            f"   {row['blog']:<12}{row['ok']:>5}{row['failed']:>5}{row['posts_per_min']:>8.1f}"
+            f"{row['p50_s']:>9.2f}{row['p95_s']:>9.2f}{row['llm_calls']:>6}{row['llm_p95_s']:>9.2f}"
+            f"{row['http_calls']:>6}{row['llm_wait_s']:>9.2f}{row['http_wait_s']:>9.2f}"
+        )
+    cache_stats = format_cache_stats()
+    if cache_stats:
+        lines.append(cache_stats)
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="여러 블로그 파이프라인 동시 실행")
+    parser.add_argument("--blogs", nargs="*", help="실행할 블로그 (기본: configs/*.yaml 전체)")
+    parser.add_argument("--config-dir", default=CONFIG_DIR)
+    parser.add_argument("--posts", type=int, default=1, help="블로그당 생성 글 수 (Day start-day부터 차례로)")
+    parser.add_argument("--start-day", type=int, default=1, help="첫 글의 Day")
+    parser.add_argument("--per-blog", type=int, default=1, help="블로그당 동시 실행 수")
+    parser.add_argument("--platform", default="네이버 블로그", help="SERP 수집 플랫폼")
+    parser.add_argument("--idea", help="모든 블로그에 같은 SERP 주제 사용 (기본: 설정의 idea / 대표 키워드)")
+    parser.add_argument("--reuse-serp", action="store_true", help="SERP를 새로 수집하지 않고 저장소 스냅샷 사용")
+    parser.add_argument("--output-dir", default="outputs/content", help="결과 디렉터리 (블로그별 하위 폴더)")
+    args = parser.parse_args(argv)
+
+    configs = load_blog_configs(args.config_dir, args.blogs)
+    if not configs:
+        print(f"⚠️ 실행할 블로그 설정이 없습니다: {args.config_dir}/*.yaml")
+        return 1
+
+    # 계획/톤 가이드 경로가 빠진 설정은 생성을 시작하기 전에 알림
+    invalid = []
+    for config in configs:
+        try:
+            blog_plan_files(config)
+        except ValueError as e:
+            invalid.append(str(e))
+    if invalid:
+        for message in invalid:
+            print(f"❌ {message}")
+        return 1
+
+    print(f"🚀 {len(configs)}개 블로그 동시 실행: {', '.join(c['blog_name'] for c in configs)}")
+    runner = seo_pipeline_runner(args.platform, args.idea, args.start_day, args.output_dir, args.reuse_serp)
+    result = run_blogs(configs, runner, args.posts, args.per_blog)
+
+    print()
+    print(format_blog_report(result))
+    failed = [run for run in result["runs"] if run["error"]]
+    for run in failed:
+        print(f"   ❌ {run['blog']} #{run['index']}: {run['error']}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
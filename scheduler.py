@@ -0,0 +1,430 @@
+"""
+블로그 예약 실행기 (asyncio)
+- 예약(utils.schedule_store, SQLite)을 읽어 cron 시각마다 동작 실행 - 재시작해도 예약이 남고 놓친 실행은 따라잡음
+- 놓친 실행(catch-up)과 같은 시각의 여러 예약은 동시에 실행, 블로그별 동시 실행 수 제한
+- 예약마다 지터(0~jitter_s초 무작위 지연)로 같은 시각 예약이 한꺼번에 몰리지 않게 분산
+- 생성과 발행은 별도 예약/동작 (생성된 Day를 발행 예약이 순서대로 가져감)
+- 동작은 스레드에서 실행 (노드/LLM 호출은 동기 코드)
+
+동작:
+- generate: 계획에서 아직 생성하지 않은 가장 앞 Day를 생성 (payload: stage=seo|write, day로 고정 가능)
+- publish:  생성이 끝났고 아직 발행하지 않은 가장 앞 Day를 플랫폼 HTML로 렌더링해 발행함(outbox)에 기록
+            (payload: platform, html_path 지정 시 해당 파일을 그대로 발행)
+            플랫폼 API 연동 전까지 발행 = outputs/published/<블로그>/<플랫폼>/dayXX.html
+
+미리 생성 모드 (utils.pregen - 발행 시각에 LLM을 기다리지 않음):
+- pregenerate: 한가한 시간대에 앞으로 depth일치를 생성 → 검증 → 렌더링해 버퍼에 쌓음 (+ 시의성 글 갱신)
+- refresh:     발행이 가까워진 시의성 글만 다시 생성 (발행 몇 시간 전 예약)
+- release:     발행 시각에 버퍼의 가장 앞 글을 발행함으로 (버퍼가 비면 그때 생성, payload fallback=false면 건너뜀)
+
+사용 예:
+    python -m utils.schedule_store add --name woncamp-gen --blog woncamp --action generate --cron "0 9 * * *" --jitter 600
+    python -m utils.schedule_store add --name woncamp-pub --blog woncamp --action publish --cron "0 18 * * *" \\
+        --payload '{"platform": "tistory"}'
+    python -m utils.schedule_store add --name woncamp-pregen --blog woncamp --action pregenerate --cron "0 3 * * *" \\
+        --payload '{"platform": "tistory", "depth": 7}'
+    python -m utils.schedule_store add --name woncamp-release --blog woncamp --action release --cron "0 18 * * *"
+    python scheduler.py                 # 계속 실행
+    python scheduler.py --once          # 도래한(놓친) 실행만 처리하고 종료 (cron으로 주기 실행 시)
+
+환경 변수:
+- BLOG_SCHEDULE_DB: 예약 DB 경로 (utils.schedule_store)
+- BLOG_SCHEDULER_PER_BLOG: 블로그별 동시 실행 수 (기본 2)
+- BLOG_SCHEDULER_MAX_CATCHUP: 예약당 따라잡을 놓친 실행 수 (기본 3, 더 오래된 것은 skipped)
+- BLOG_SCHEDULER_POLL_S: 새 예약 확인 간격(초, 기본 30)
+- BLOG_PUBLISH_DIR: 발행함 위치 (기본 outputs/published)
+- BLOG_PREGEN_*: 미리 생성 버퍼 깊이/위치/시의성 기준 (utils.pregen)
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import shutil
+import signal
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+import worker
+from utils.job_queue import Job
+from utils.logger import get_logger
+from utils.pregen import is_stale, is_trend_sensitive, pregen_depth, refresh_due, validate_content
+from utils.run_context import run_scope
+from utils.schedule_store import READY, RELEASED, ScheduledRun, ScheduleStore
+
+logger = get_logger("Scheduler")
+
+ActionFn = Callable[[ScheduledRun, ScheduleStore], Dict[str, Any]]
+
+
+_reserved: Set[Tuple[str, str, int]] = set()
+_reserved_lock = threading.Lock()
+
+
+def _reserve_day(store: ScheduleStore, run: ScheduledRun, candidates: List[int]) -> Optional[int]:
+    """완료되지 않았고 다른 실행이 잡지 않은 가장 앞 Day 예약 (동시 실행되는 같은 블로그 동작끼리 겹치지 않게)"""
+    done = store.completed(run.blog, run.action)
+    with _reserved_lock:
+        for day in candidates:
+            key = (run.blog, run.action, day)
+            if day not in done and key not in _reserved:
+                _reserved.add(key)
+                return day
+    return None
+
+
+def _release_day(run: ScheduledRun, day: int) -> None:
+    with _reserved_lock:
+        _reserved.discard((run.blog, run.action, day))
+
+
+def _plan_items(run: ScheduledRun) -> List[Dict[str, Any]]:
+    """예약 블로그의 Day 순 계획 항목 (계획 저장소)"""
+    return worker.plan_store_for(run.blog, run.payload).plan_items(run.blog)
+
+
+def run_generate(run: ScheduledRun, store: ScheduleStore) -> Dict[str, Any]:
+    stage = run.payload.get("stage", "seo")
+    if stage not in worker.STAGES:
+        raise ValueError(f"알 수 없는 단계: {stage} (가능: {', '.join(sorted(worker.STAGES))})")
+
+    if run.payload.get("day"):
+        candidates = [int(run.payload["day"])]
+    else:
+        candidates = list(range(1, worker.plan_store_for(run.blog, run.payload).day_count(run.blog) + 1))
+    day = _reserve_day(store, run, candidates)
+    if day is None:
+        return {"skipped": "생성할 Day가 없습니다 (계획의 모든 Day 생성 완료)"}
+
+    try:
+        fn, _ = worker.STAGES[stage]
+        job = Job(
+            id=0, blog=run.blog, day=day, stage=stage, priority=0, attempts=1, max_attempts=1,
+            lease_token="", payload=dict(run.payload),
+        )
+        return {"day": day, "stage": stage, **fn(job)}
+    finally:
+        _release_day(run, day)
+
+
+def _render_state(data: Dict[str, Any]) -> Dict[str, Any]:
+    """생성 결과 파일 → 렌더러 상태 (seo: 섹션 구조, write: 완성 본문)"""
+    from html_renderers import seo_content_to_state
+
+    if "sections" in data:
+        return seo_content_to_state(data)
+    return {
+        "title": data.get("title", ""),
+        "meta_description": "",
+        "content": data.get("final_content", ""),
+        "tags": list(data.get("keywords", [])),
+        "created_at": datetime.now().strftime("%Y-%m-%d"),
+    }
+
+
+def _render(platform: str, data: Dict[str, Any]) -> Tuple[str, str]:
+    """생성 결과 → (플랫폼 렌더링 결과, 파일 확장자)"""
+    from html_renderers import BaseRenderer, BrunchRenderer, NaverRenderer, TistoryRenderer, WordPressRenderer
+
+    renderers = {
+        "naver": NaverRenderer, "tistory": TistoryRenderer, "wordpress": WordPressRenderer,
+        "brunch": BrunchRenderer, "base": BaseRenderer,
+    }
+    if platform not in renderers:
+        raise ValueError(f"알 수 없는 플랫폼: {platform} (가능: {', '.join(sorted(renderers))})")
+    return renderers[platform]().render(_render_state(data)), "md" if platform == "brunch" else "html"
+
+
+def _outbox_dir(blog: str, platform: str) -> str:
+    output_dir = os.path.join(os.getenv("BLOG_PUBLISH_DIR", "outputs/published"), blog, platform)
+    os.makedirs(output_dir, exist_ok=True)
+    return output_dir
+
+
+def run_publish(run: ScheduledRun, store: ScheduleStore) -> Dict[str, Any]:
+    platform = run.payload.get("platform", "base")
+    output_dir = _outbox_dir(run.blog, platform)
+
+    # 메인 파이프라인이 이미 렌더링한 HTML (SchedulerNode의 예약 발행)
+    html_path = run.payload.get("html_path")
+    if html_path:
+        target = os.path.join(output_dir, os.path.basename(html_path))
+        shutil.copyfile(html_path, target)
+        return {"file": target, "source": html_path}
+
+    generated = store.completed(run.blog, "generate")
+    day = _reserve_day(store, run, sorted(generated))
+    if day is None:
+        return {"skipped": "발행할 글이 없습니다 (생성 대기)"}
+
+    try:
+        source = generated[day]["file"]
+        with open(source, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        html, ext = _render(platform, data)
+        target = os.path.join(output_dir, f"day{day:02d}.{ext}")
+        with open(target, "w", encoding="utf-8") as f:
+            f.write(html)
+        return {"day": day, "file": target, "source": source, "title": data.get("title")}
+    finally:
+        _release_day(run, day)
+
+
+# 블로그별 버퍼 채우기 잠금 (겹친 pregenerate/refresh가 같은 Day를 두 번 만들지 않게, release는 잠그지 않음)
+_fill_locks: Dict[str, threading.Lock] = {}
+_fill_locks_lock = threading.Lock()
+
+
+def _fill_lock(blog: str) -> threading.Lock:
+    with _fill_locks_lock:
+        return _fill_locks.setdefault(blog, threading.Lock())
+
+
+def _pregenerate_day(run: ScheduledRun, store: ScheduleStore, day: int, plan_item: Dict[str, Any]) -> str:
+    """Day 하나 생성 → 검증 → 렌더링 후 버퍼에 등록 (ready / invalid 반환)"""
+    platform = run.payload.get("platform", "base")
+    buffer_dir = os.getenv("BLOG_PREGEN_DIR", "outputs/buffer")
+    fn, _ = worker.STAGES["seo"]
+    job = Job(
+        id=0, blog=run.blog, day=day, stage="seo", priority=0, attempts=1, max_attempts=1,
+        lease_token="", payload={**run.payload, "output_dir": buffer_dir},
+    )
+    content_file = fn(job)["file"]
+    with open(content_file, "r", encoding="utf-8") as f:
+        content = json.load(f)
+
+    issues = validate_content(content, worker.load_tone_guide(job))
+
+    html, ext = _render(platform, content)
+    html_dir = os.path.join(buffer_dir, run.blog, platform)
+    os.makedirs(html_dir, exist_ok=True)
+    html_file = os.path.join(html_dir, f"day{day:02d}.{ext}")
+    with open(html_file, "w", encoding="utf-8") as f:
+        f.write(html)
+
+    status = store.buffer_put(run.blog, day, platform, content_file, html_file, is_trend_sensitive(plan_item), issues)
+    if issues:
+        logger.warning(f"⚠️ {run.blog} Day {day} 검증 실패 (발행 안 함, 다음 생성 때 다시): {', '.join(issues)}")
+    return status
+
+
+def _refresh(run: ScheduledRun, store: ScheduleStore, plan_items: List[Dict[str, Any]]) -> List[int]:
+    refreshed = []
+    for item in refresh_due(store, run.blog):
+        if item.day <= len(plan_items):
+            _pregenerate_day(run, store, item.day, plan_items[item.day - 1])
+            refreshed.append(item.day)
+    return refreshed
+
+
+def _fill(run: ScheduledRun, store: ScheduleStore, depth: int) -> Dict[str, Any]:
+    """ready 항목이 depth개가 되도록 아직 만들지 않은(또는 무효였던) 앞쪽 Day부터 생성"""
+    plan_items = _plan_items(run)
+    with _fill_lock(run.blog):
+        refreshed = _refresh(run, store, plan_items)
+        items = store.buffer_items(run.blog)
+        ready = len([item for item in items if item.status == READY])
+        taken = {item.day for item in items if item.status in (READY, RELEASED)}
+        todo = [day for day in range(1, len(plan_items) + 1) if day not in taken][:max(0, depth - ready)]
+        generated, invalid = [], []
+        for day in todo:
+            status = _pregenerate_day(run, store, day, plan_items[day - 1])
+            (generated if status == READY else invalid).append(day)
+    depth_now = len(store.buffer_items(run.blog, READY))
+    return {
+        "generated": generated,
+        "invalid": invalid,
+        "refreshed": refreshed,
+        "depth": depth_now,
+        "target": depth,
+        "summary": f"버퍼 {depth_now}/{depth} (생성 {generated}, 무효 {invalid}, 갱신 {refreshed})",
+    }
+
+
+def run_pregenerate(run: ScheduledRun, store: ScheduleStore) -> Dict[str, Any]:
+    return _fill(run, store, int(run.payload.get("depth") or pregen_depth()))
+
+
+def run_refresh(run: ScheduledRun, store: ScheduleStore) -> Dict[str, Any]:
+    with _fill_lock(run.blog):
+        refreshed = _refresh(run, store, _plan_items(run))
+    return {"refreshed": refreshed, "summary": f"시의성 글 갱신 {refreshed}"}
+
+
+def run_release(run: ScheduledRun, store: ScheduleStore) -> Dict[str, Any]:
+    """버퍼의 가장 앞 ready 글을 발행함으로 (생성/렌더링 없이 파일 복사만)"""
+    for attempt in range(2):
+        for item in store.buffer_items(run.blog, READY):
+            target = os.path.join(_outbox_dir(run.blog, item.platform), os.path.basename(item.html_file))
+            shutil.copyfile(item.html_file, target)
+            # 동시에 도는 다른 release가 먼저 가져갔으면 다음 항목 (같은 Day면 같은 파일이라 복사는 무해)
+            if store.buffer_release(run.blog, item.day):
+                now = time.time()
+                age_h = max(0.0, (now - item.generated_at) / 3600)
+                stale = is_stale(item, now)
+                if stale:
+                    logger.warning(f"⚠️ {run.blog} Day {item.day} 시의성 글이 오래됨 ({age_h:.1f}시간)")
+                return {
+                    "day": item.day,
+                    "file": target,
+                    "source": item.html_file,
+                    "age_h": round(age_h, 2),
+                    "stale": stale,
+                    "trend_sensitive": item.trend_sensitive,
+                }
+        if attempt or not run.payload.get("fallback", True):
+            break
+        logger.warning(f"⚠️ {run.blog} 버퍼가 비어 있어 발행 시각에 생성합니다")
+        _fill(run, store, 1)
+    return {"skipped": "발행할 글이 없습니다 (버퍼 비어 있음)"}
+
+
+# 동작 이름 → 실행 함수
+ACTIONS: Dict[str, ActionFn] = {
+    "generate": run_generate,
+    "publish": run_publish,
+    "pregenerate": run_pregenerate,
+    "refresh": run_refresh,
+    "release": run_release,
+}
+
+
+class AsyncScheduler:
+    """예약 실행 루프 (프로세스/호스트당 하나)"""
+
+    def __init__(
+        self,
+        store: Optional[ScheduleStore] = None,
+        actions: Optional[Dict[str, ActionFn]] = None,
+        per_blog: Optional[int] = None,
+        max_catchup: Optional[int] = None,
+        poll_s: Optional[float] = None
+    ) -> None:
+        self.store = store or ScheduleStore()
+        self.actions = actions or ACTIONS
+        self.per_blog = per_blog or int(os.getenv("BLOG_SCHEDULER_PER_BLOG", "2"))
+        self.max_catchup = max_catchup or int(os.getenv("BLOG_SCHEDULER_MAX_CATCHUP", "3"))
+        self.poll_s = poll_s or float(os.getenv("BLOG_SCHEDULER_POLL_S", "30"))
+        self.processed = {"done": 0, "error": 0, "skipped": 0}
+        self._limits: Dict[str, asyncio.Semaphore] = {}
+        self._dispatched: Set[int] = set()
+        self._tasks: Set["asyncio.Task[None]"] = set()
+        self._stop: Optional[asyncio.Event] = None
+
+    def stop(self) -> None:
+        """새 실행을 시작하지 않고, 진행 중인 실행을 마친 뒤 종료"""
+        if self._stop is not None:
+            self._stop.set()
+
+    async def run(self, once: bool = False) -> Dict[str, int]:
+        """
+        예약 루프
+
+        Args:
+            once: 도래한(놓친 것 포함) 실행만 처리하고 종료
+        """
+        self._stop = asyncio.Event()
+        recovered = await asyncio.to_thread(self.store.recover)
+        if recovered:
+            logger.info(f"♻️ 중단됐던 실행 {recovered}건 다시 실행")
+        logger.info(f"⏰ 예약기 시작 (블로그별 동시 {self.per_blog}, 놓친 실행 최대 {self.max_catchup}회)")
+
+        while not self._stop.is_set():
+            await self.tick()
+            if once:
+                break
+            try:
+                await asyncio.wait_for(self._stop.wait(), timeout=await self._sleep_s())
+            except asyncio.TimeoutError:
+                pass
+
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        logger.info(f"⏰ 예약기 종료: {self.processed}")
+        return dict(self.processed)
+
+    async def _sleep_s(self) -> float:
+        """다음 실행 시각까지 (최대 poll_s - CLI로 추가된 예약도 확인)"""
+        now = datetime.now()
+        next_due = await asyncio.to_thread(self.store.next_due, now)
+        if next_due is None:
+            return self.poll_s
+        return max(0.5, min(self.poll_s, (next_due - now).total_seconds() + 0.5))
+
+    async def tick(self) -> int:
+        """도래한 실행 등록 후 아직 시작하지 않은 실행을 모두 띄움 (띄운 수 반환)"""
+        runs = await asyncio.to_thread(self.store.claim_due, datetime.now(), self.max_catchup)
+        started = 0
+        for run in runs:
+            if run.id in self._dispatched:
+                continue
+            self._dispatched.add(run.id)
+            task = asyncio.create_task(self._execute(run), name=f"run-{run.id}")
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+            started += 1
+        return started
+
+    def _limit(self, blog: str) -> asyncio.Semaphore:
+        if blog not in self._limits:
+            self._limits[blog] = asyncio.Semaphore(self.per_blog)
+        return self._limits[blog]
+
+    async def _execute(self, run: ScheduledRun) -> None:
+        label = f"{run.schedule_name} {run.blog} {run.action} ({run.due_at})"
+        try:
+            if run.jitter_s > 0:
+                await asyncio.sleep(random.uniform(0, run.jitter_s))
+            async with self._limit(run.blog):
+                fn = self.actions.get(run.action)
+                await asyncio.to_thread(self.store.start_run, run.id)
+                print(f"▶️  {label}")
+                try:
+                    if fn is None:
+                        raise ValueError(f"알 수 없는 동작: {run.action} (가능: {', '.join(sorted(self.actions))})")
+                    result = await asyncio.to_thread(self._call, fn, run)
+                except Exception as e:
+                    logger.exception(f"❌ {label} 실패")
+                    await asyncio.to_thread(self.store.fail_run, run.id, f"{type(e).__name__}: {e}")
+                    self.processed["error"] += 1
+                    return
+                await asyncio.to_thread(self.store.finish_run, run.id, result)
+                if "skipped" in result:
+                    print(f"⏭️  {label}: {result['skipped']}")
+                    self.processed["skipped"] += 1
+                else:
+                    day = f" Day {result['day']}" if result.get("day") else ""
+                    print(f"✅ {label}{day} 완료 → {result.get('file') or result.get('summary')}")
+                    self.processed["done"] += 1
+        finally:
+            self._dispatched.discard(run.id)
+
+    def _call(self, fn: ActionFn, run: ScheduledRun) -> Dict[str, Any]:
+        with run_scope(blog=run.blog):
+            return fn(run, self.store)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="블로그 예약 실행기")
+    parser.add_argument("--once", action="store_true", help="도래한(놓친) 실행만 처리하고 종료")
+    parser.add_argument("--per-blog", type=int, help="블로그별 동시 실행 수")
+    parser.add_argument("--max-catchup", type=int, help="예약당 따라잡을 놓친 실행 수")
+    args = parser.parse_args(argv)
+
+    scheduler = AsyncScheduler(per_blog=args.per_blog, max_catchup=args.max_catchup)
+
+    async def run() -> Dict[str, int]:
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(signum, scheduler.stop)
+        return await scheduler.run(once=args.once)
+
+    processed = asyncio.run(run())
+    return 1 if processed["error"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
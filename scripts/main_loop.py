@@ -1,9 +1,19 @@
 """
 Main Loop
-전체 파이프라인 실행
+전체 파이프라인 실행 (LangGraph StateGraph)
+
+topic_refiner → discovery → strategy → seo_writer ─┬─ metadata ──┬─ output ─┬─ osmu
+                                                   └─ image_alt ─┘          └─ scheduler
+메타데이터/이미지 계획은 본문만, OSMU/예약은 저장 결과만 필요하므로 병렬 분기로 실행
 """
 
-from typing import Dict, Any, Optional
+import os
+import sys
+import time
+from typing import Annotated, Any, Dict, List, Optional, TypedDict
+
+from langgraph.graph import END, START, StateGraph
+
 from topic_refiner_node import TopicRefinerNode
 from discovery_node import DiscoveryNode
 from strategy_node import StrategyNode
@@ -14,6 +24,51 @@ from output_node import OutputNode
 from scheduler_node import SchedulerNode
 from osmu_node import OSMUNode
 
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from utils.graph import format_timings, merge_timings, state_updates, timed_node
+
+
+class PipelineState(TypedDict, total=False):
+    """메인 파이프라인 상태"""
+    # 입력
+    idea: str
+    blog_name: str
+    platform: str
+    schedule_time: Optional[str]
+    # topic_refiner
+    refined_topic: str
+    topic_details: Dict[str, Any]
+    conversation_history: List[Dict[str, Any]]
+    # discovery
+    keywords: List[str]
+    competitors: List[Any]
+    trends: List[Any]
+    recommended_platforms: List[str]
+    # strategy
+    blog_config: Dict[str, Any]
+    target_audience: str
+    tone: str
+    style: str
+    writing_loop: Dict[str, Any]
+    # seo_writer
+    content: str
+    # metadata / image_alt (병렬)
+    title: str
+    tags: List[str]
+    meta_description: str
+    image_plan: List[Dict[str, Any]]
+    # output
+    output_path: str
+    html_path: str
+    metadata_path: str
+    image_plan_path: str
+    # osmu
+    osmu_scripts: Dict[str, str]
+    # scheduler (예약 발행 등록 결과)
+    scheduled_publish: Dict[str, str]
+    # 노드별 실행 시간 (병렬 분기가 같은 스텝에 함께 씀)
+    timings: Annotated[Dict[str, float], merge_timings]
+
 
 class BlogAutomationPipeline:
     """블로그 자동화 메인 파이프라인"""
@@ -28,6 +83,37 @@ class BlogAutomationPipeline:
         self.output = OutputNode()
         self.scheduler = SchedulerNode()
         self.osmu = OSMUNode()
+        self.app = self.build_graph().compile()
+    
+    def build_graph(self) -> StateGraph:
+        """노드/엣지 정의 (컴파일 전)"""
+        graph = StateGraph(PipelineState)
+        for name, node in [
+            ("topic_refiner", self.topic_refiner),
+            ("discovery", self.discovery),
+            ("strategy", self.strategy),
+            ("seo_writer", self.seo_writer),
+            ("metadata", self.metadata),
+            ("image_alt", self.image_alt),
+            ("output", self.output),
+            ("osmu", self.osmu),
+            ("scheduler", self.scheduler),
+        ]:
+            # execute(state)는 상태 전체를 돌려주므로 변경 키만 반영 (병렬 분기 충돌 방지)
+            graph.add_node(name, timed_node(name, state_updates(node.execute)))
+        
+        graph.add_edge(START, "topic_refiner")
+        graph.add_edge("topic_refiner", "discovery")
+        graph.add_edge("discovery", "strategy")
+        graph.add_edge("strategy", "seo_writer")
+        graph.add_edge("seo_writer", "metadata")
+        graph.add_edge("seo_writer", "image_alt")
+        graph.add_edge(["metadata", "image_alt"], "output")
+        graph.add_edge("output", "osmu")
+        graph.add_edge("output", "scheduler")
+        graph.add_edge("osmu", END)
+        graph.add_edge("scheduler", END)
+        return graph
     
     def run(self, idea: str, blog_name: str = "woncamp", 
             platform: str = "base",
@@ -42,46 +128,24 @@ class BlogAutomationPipeline:
             schedule_time: 예약 시간 (예: "14:30")
             
         Returns:
-            최종 상태
+            최종 상태 (timings: 노드별 실행 시간)
         """
         print("=" * 60)
         print("🚀 블로그 자동화 파이프라인 시작")
         print("=" * 60)
         
         # 초기 상태
-        state = {
+        state: PipelineState = {
             "idea": idea,
             "blog_name": blog_name,
             "platform": platform,
-            "schedule_time": schedule_time
+            "schedule_time": schedule_time,
+            "timings": {},
         }
         
-        # 0. Topic Refiner (주제 정교화)
-        state = self.topic_refiner.execute(state)
-        
-        # 1. Discovery
-        state = self.discovery.execute(state)
-        
-        # 2. Strategy
-        state = self.strategy.execute(state)
-        
-        # 3. SEO Writer
-        state = self.seo_writer.execute(state)
-        
-        # 4. Metadata
-        state = self.metadata.execute(state)
-        
-        # 5. Image Alt
-        state = self.image_alt.execute(state)
-        
-        # 6. Output
-        state = self.output.execute(state)
-        
-        # 7. OSMU
-        state = self.osmu.execute(state)
-        
-        # 8. Scheduler
-        state = self.scheduler.execute(state)
+        start = time.perf_counter()
+        state = self.app.invoke(state)
+        wall_s = time.perf_counter() - start
         
         print("=" * 60)
         print("✅ 블로그 자동화 파이프라인 완료")
@@ -89,6 +153,7 @@ class BlogAutomationPipeline:
         print(f"📁 출력 경로: {state.get('output_path')}")
         print(f"📄 HTML: {state.get('html_path')}")
         print(f"📋 메타데이터: {state.get('metadata_path')}")
+        print(format_timings(state.get("timings", {}), wall_s))
         
         return state
 
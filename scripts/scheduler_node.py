@@ -1,53 +1,68 @@
 """
 Scheduler Node
-7️⃣ 예약 실행 (schedule)
+7️⃣ 예약 실행 (utils.schedule_store)
+
+예약 시간이 있으면 렌더링된 HTML의 발행을 예약 저장소에 1회 예약으로 등록하고,
+실제 실행은 예약기(scheduler.py)가 맡음 (프로세스가 재시작돼도 예약 유지)
 """
 
-from typing import Dict, Any
-import schedule
-import time
+from typing import Dict, Any, Optional
+import os
+import sys
 from datetime import datetime
 
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.cron import CronExpr
+from utils.schedule_store import ScheduleStore, TIME_FORMAT
+
 
 class SchedulerNode:
     """블로그 포스트 예약 발행"""
-    
-    def __init__(self):
-        self.scheduled_tasks = []
-    
+
+    def __init__(self, store: Optional[ScheduleStore] = None):
+        self.store = store
+
     def execute(self, state: Dict[str, Any]) -> Dict[str, Any]:
         """
         Scheduler 노드 실행
-        
+
         Args:
             state: 현재 상태
-            
+
         Returns:
             업데이트된 상태
         """
         print("⏰ Scheduler Node 실행 중...")
-        
+
         schedule_time = state.get("schedule_time", None)
-        
-        if schedule_time:
-            self._schedule_post(state, schedule_time)
+
+        if schedule_time and state.get("html_path"):
+            state["scheduled_publish"] = self._schedule_post(state, schedule_time)
+        elif schedule_time:
+            print("⚠️ 발행할 HTML이 없어 예약하지 않음")
         else:
             print("즉시 발행 모드")
-        
+
         return state
-    
-    def _schedule_post(self, state: Dict[str, Any], schedule_time: str):
-        """포스트 예약"""
-        print(f"📅 {schedule_time}에 발행 예약")
-        
-        # TODO: 실제 스케줄링 로직 구현
-        # schedule.every().day.at(schedule_time).do(self._publish_post, state)
-        
-    def _publish_post(self, state: Dict[str, Any]):
-        """포스트 발행"""
-        print("📤 포스트 발행 중...")
-        # TODO: 실제 블로그 플랫폼 API 연동
-        
-    def run_pending(self):
-        """예약된 작업 실행"""
-        schedule.run_pending()
+
+    def _schedule_post(self, state: Dict[str, Any], schedule_time: str) -> Dict[str, Any]:
+        """포스트 예약 (schedule_time "HH:MM" 이후 가장 가까운 시각에 1회 발행)"""
+        hour, minute = (int(part) for part in schedule_time.split(":", 1))
+        daily = CronExpr(f"{minute} {hour} * * *")
+        due = daily.next_after(datetime.now())
+
+        blog = state.get("blog_name", "default")
+        name = f"{blog}-publish-{datetime.now().strftime('%Y%m%d%H%M%S')}"
+        if self.store is None:
+            self.store = ScheduleStore()
+        self.store.add(
+            name,
+            blog,
+            "publish",
+            f"{due.minute} {due.hour} {due.day} {due.month} *",
+            payload={"platform": state.get("platform", "base"), "html_path": state.get("html_path")},
+            once=True,
+        )
+        print(f"📅 {due.strftime(TIME_FORMAT)}에 발행 예약 ({name}, scheduler.py가 실행)")
+        return {"name": name, "due_at": due.strftime(TIME_FORMAT)}
@@ -9,6 +9,7 @@ import json
 from nodes.content_planner_node import ContentPlannerNode
 from utils.llm_client import LLMClient, HybridLLMClient
 from utils.logger import get_logger
+from utils.json_repair import parse_json_object
 
 logger = get_logger("AB_Test")
 
@@ -43,7 +44,7 @@ def test_gpt_only():
             
             try:
                 raw = self.llm_gpt.chat(prompt, max_tokens=4500)
-                parsed = self._safe_parse_json(raw)
+                parsed = parse_json_object(raw, "ContentPlannerNode(GPT)", "debug_content_planner.txt")
                 logger.info(f"ContentPlannerNode: 30일 계획 생성 완료 (GPT)")
                 return parsed
             except Exception as e:
@@ -66,7 +67,7 @@ def test_gpt_only():
 def test_claude_preferred():
     """Claude 우선 사용한 기획"""
     print("=" * 80)
-    print("🧠 TEST 2: Claude 3.5 Sonnet 우선 테스트")
+    print("🧠 TEST 2: Claude 우선 테스트")
     print("=" * 80)
     
     serp_data = load_serp_data()
@@ -95,7 +96,7 @@ def compare_results(gpt_result, claude_result):
     for i, item in enumerate(gpt_plan[:10], 1):
         print(f"  Day {item.get('day')}: [{item.get('category')}] {item.get('title')}")
     
-    print("\n📌 Claude 3.5 Sonnet 생성 결과 (첫 10개):")
+    print("\n📌 Claude 생성 결과 (첫 10개):")
     for i, item in enumerate(claude_plan[:10], 1):
         print(f"  Day {item.get('day')}: [{item.get('category')}] {item.get('title')}")
     
@@ -0,0 +1,8 @@
+"""pytest 공통 설정 (저장소 루트를 import 경로에 추가, 테스트용 API 키)"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
@@ -0,0 +1,145 @@
+"""FairSemaphore 블로그별 공정 분배 + 여러 블로그 파이프라인이 한 한도/공유 캐시를 나눠 쓰는지"""
+
+import json
+import threading
+import time
+
+import pytest
+
+from utils import plan_store
+from utils.budget import FairSemaphore, budget_stats, reset_budgets
+from utils.llm_client import reset_llm_clients
+from utils.shared_cache import clear_shared_caches, get_shared_cache
+
+
+def _wait_queued(semaphore, count, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while sum(len(q) for q in semaphore._waiters.values()) < count:
+        assert time.monotonic() < deadline, "대기자가 대기열에 들어가지 않음"
+        time.sleep(0.001)
+
+
+def test_fair_semaphore_round_robin_between_blogs():
+    semaphore = FairSemaphore("llm", 1)
+    semaphore.acquire("holder")
+
+    order = []
+    order_lock = threading.Lock()
+
+    def worker(tenant):
+        semaphore.acquire(tenant)
+        with order_lock:
+            order.append(tenant)
+        semaphore.release()
+
+    # 스레드를 많이 띄운 greedy가 먼저 줄 서도 quiet 차례가 사이에 끼어야 함
+    threads = []
+    for tenant in ["greedy", "greedy", "greedy", "greedy", "quiet", "quiet"]:
+        thread = threading.Thread(target=worker, args=(tenant,))
+        thread.start()
+        threads.append(thread)
+        _wait_queued(semaphore, len(threads))
+
+    semaphore.release()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert order == ["greedy", "quiet", "greedy", "quiet", "greedy", "greedy"]
+    stats = semaphore.stats()
+    assert stats["greedy"]["acquired"] == 4
+    assert stats["quiet"]["acquired"] == 2
+    assert stats["quiet"]["max_wait_s"] > 0
+
+
+def test_nested_slot_does_not_deadlock():
+    semaphore = FairSemaphore("llm", 1)
+    with semaphore.slot("blog"):
+        with semaphore.slot("blog"):
+            pass
+    assert semaphore.stats()["blog"]["acquired"] == 1
+
+
+@pytest.fixture
+def mock_env(tmp_path, monkeypatch):
+    from mock_server import start_mock_server
+
+    server = start_mock_server()
+    monkeypatch.delenv("ANTHROPIC_BASE_URL", raising=False)
+    monkeypatch.setenv("OPENAI_BASE_URL", server.base_url)
+    monkeypatch.setenv("NAVER_API_BASE_URL", server.root_url)
+    monkeypatch.setenv("NAVER_BLOG_BASE_URL", server.root_url)
+    monkeypatch.setenv("NAVER_CLIENT_ID", "id")
+    monkeypatch.setenv("NAVER_CLIENT_SECRET", "secret")
+    monkeypatch.setenv("SERP_CRAWL_DELAY", "0")
+    monkeypatch.setenv("BLOG_LLM_CONCURRENCY", "1")
+    monkeypatch.setenv("BLOG_PLAN_DB", str(tmp_path / "plan.sqlite"))
+    monkeypatch.setattr(plan_store, "_store", None)
+    reset_llm_clients()
+    reset_budgets()
+    clear_shared_caches()
+    yield tmp_path
+    server.shutdown()
+    reset_llm_clients()
+    reset_budgets()
+    if plan_store._store is not None:
+        plan_store._store.close()
+
+
+def test_blogs_share_llm_budget_and_serp_cache(mock_env):
+    from run_multi_blog import run_blogs, seo_pipeline_runner
+
+    tone_file = mock_env / "tone.json"
+    tone_file.write_text(json.dumps({"seo_rules": {"h2_count": 2}}), encoding="utf-8")
+
+    # 블로그마다 다른 계획 (같은 프롬프트면 LLM 단일 비행으로 합쳐져 블로그별 호출이 안 보임)
+    blogs = ["alpha", "beta", "gamma"]
+    configs = []
+    for blog in blogs:
+        plan = {"content_plan": {"30_days_plan": [
+            {"day": day, "title": f"{blog} 캠핑 입문 {day}", "category": "가이드", "main_keywords": ["캠핑"]}
+            for day in (1, 2)
+        ]}, "serp_data": {}}
+        plan_file = mock_env / f"{blog}_plan.json"
+        plan_file.write_text(json.dumps(plan, ensure_ascii=False), encoding="utf-8")
+        configs.append({"blog_name": blog, "plan_file": str(plan_file), "tone_guide_file": str(tone_file)})
+    serp_cache = get_shared_cache("serp_crawl")
+    misses_before = serp_cache.stats()["misses"]
+
+    runner = seo_pipeline_runner(idea="캠핑 입문", output_dir=str(mock_env / "content"))
+    result = run_blogs(configs, runner, posts=2, per_blog=2)
+
+    assert [run["error"] for run in result["runs"]] == [None] * 6
+    for blog in blogs:
+        assert (mock_env / "content" / blog / "day02_content.json").exists()
+
+    # 같은 아이디어의 SERP는 블로그 3개가 한 번만 수집
+    assert serp_cache.stats()["misses"] - misses_before == 1
+
+    limit, per_blog = budget_stats()["llm"]
+    assert limit == 1
+    # 블로그마다 구조 + 본문 × 2건이 모두 같은 한도를 거침 (SERP를 수집한 블로그는 그 호출만큼 더)
+    acquired = sorted(per_blog[blog]["acquired"] for blog in blogs)
+    assert acquired[0] >= 4
+    assert acquired[1] == acquired[0]
+    assert "http" in budget_stats()
+
+
+def test_blog_configs_require_their_own_plan_and_tone_guide(tmp_path, capsys):
+    from run_multi_blog import main, plan_sources
+    from utils.plan_store import DEFAULT_BLOG, DEFAULT_PLAN_FILE
+
+    (tmp_path / "alpha.yaml").write_text('plan_file: "alpha_plan.json"\n', encoding="utf-8")
+    (tmp_path / "beta.yaml").write_text(
+        'plan_file: "beta_plan.json"\ntone_guide_file: "beta_tone.json"\n', encoding="utf-8"
+    )
+
+    # 공용 계획으로 대신하지 않고 실행 전에 실패
+    assert main(["--config-dir", str(tmp_path)]) == 1
+    assert "alpha 블로그 설정에 tone_guide_file가 없습니다" in capsys.readouterr().out
+    with pytest.raises(ValueError):
+        plan_sources("alpha", str(tmp_path))
+
+    assert plan_sources("beta", str(tmp_path)) == ("beta_plan.json", "beta_tone.json")
+    # 설정이 없는 블로그는 저장소에 가져온 계획만, 단일 블로그 실행만 공용 JSON
+    assert plan_sources("gamma", str(tmp_path)) == (None, None)
+    assert plan_sources(DEFAULT_BLOG, str(tmp_path))[0] == DEFAULT_PLAN_FILE
@@ -0,0 +1,87 @@
+"""카세트: 대역 서버 응답을 녹화한 뒤 네트워크 없이 재생, 녹화에 없는 요청은 cassette_miss"""
+
+import json
+
+import pytest
+import requests
+
+from mock_server import start_mock_server
+from utils.cassette import Cassette, CassetteAdapter, CassetteTransport, httpx
+
+
+class NoNetworkTransport(httpx.BaseTransport):
+    """재생 중 실제 전송이 일어나면 실패"""
+
+    def handle_request(self, request):
+        raise AssertionError(f"재생 중 네트워크 요청: {request.url}")
+
+
+@pytest.fixture
+def server():
+    server = start_mock_server()
+    yield server
+    server.shutdown()
+
+
+def test_httpx_record_then_replay(server, tmp_path):
+    path = str(tmp_path / "llm.jsonl.gz")
+    body = {"model": "gpt-4o-mini", "messages": [{"role": "user", "content": "캠핑 장비 추천"}], "max_tokens": 50}
+
+    recorder = Cassette(path, mode="record")
+    with httpx.Client(transport=CassetteTransport(recorder, httpx.HTTPTransport())) as client:
+        recorded = client.post(f"{server.base_url}/chat/completions", json=body)
+    assert recorded.status_code == 200
+    assert recorder.stats()["recorded"] == 1
+    upstream_calls = server.state.counters["chat.completions"]
+
+    player = Cassette(path, mode="replay")
+    with httpx.Client(transport=CassetteTransport(player, NoNetworkTransport())) as client:
+        # JSON 키 순서가 달라도 같은 요청
+        replayed = client.post(f"{server.base_url}/chat/completions", json=dict(reversed(list(body.items()))))
+        assert replayed.status_code == 200
+        assert replayed.json() == recorded.json()
+        assert replayed.headers["content-type"] == recorded.headers["content-type"]
+
+        missed = client.post(f"{server.base_url}/chat/completions", json={**body, "max_tokens": 60})
+    assert missed.status_code == 404
+    assert missed.json()["error"]["type"] == "cassette_miss"
+    assert player.stats()["hits"] == 1
+    assert player.stats()["misses"] == 1
+    assert server.state.counters["chat.completions"] == upstream_calls
+
+
+def test_requests_record_then_replay_in_order(server, tmp_path):
+    path = str(tmp_path / "naver.jsonl.gz")
+    url = f"{server.root_url}/search/blog.json"
+
+    recorder = Cassette(path, mode="record")
+    session = requests.Session()
+    session.mount("http://", CassetteAdapter(recorder))
+    first = session.get(url, params={"query": "캠핑", "display": 3})
+    second = session.get(url, params={"query": "캠핑", "display": 3})
+    assert recorder.stats()["recorded"] == 2
+
+    player = Cassette(path, mode="replay")
+    session = requests.Session()
+    session.mount("http://", CassetteAdapter(player))
+    upstream_calls = server.state.counters["naver.search"]
+
+    # 같은 요청은 녹화 순서대로, 다 쓰면 마지막 응답 반복
+    assert session.get(url, params={"query": "캠핑", "display": 3}).content == first.content
+    assert session.get(url, params={"query": "캠핑", "display": 3}).content == second.content
+    assert session.get(url, params={"query": "캠핑", "display": 3}).content == second.content
+
+    missed = session.get(url, params={"query": "재테크", "display": 3})
+    assert missed.status_code == 404
+    assert json.loads(missed.text)["error"]["type"] == "cassette_miss"
+    assert player.stats()["hits"] == 3
+    assert player.stats()["misses"] == 1
+    assert server.state.counters["naver.search"] == upstream_calls
+
+
+def test_replay_without_file_misses_everything(tmp_path):
+    player = Cassette(str(tmp_path / "없음.jsonl.gz"), mode="replay")
+    with httpx.Client(transport=CassetteTransport(player, NoNetworkTransport())) as client:
+        response = client.get("http://mock.invalid/v1/models")
+    assert response.status_code == 404
+    assert player.stats()["misses"] == 1
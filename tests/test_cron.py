@@ -0,0 +1,74 @@
+"""cron 표현식 파싱 / 다음 실행 시각 / 놓친 실행 처리"""
+
+from datetime import datetime
+
+import pytest
+
+from utils.cron import CronError, CronExpr
+from utils.schedule_store import ScheduleStore
+
+
+def test_fields_ranges_steps_lists_and_names():
+    cron = CronExpr("*/15 9-18/3 1,15 jan-mar mon-fri")
+    assert cron.minutes == {0, 15, 30, 45}
+    assert cron.hours == {9, 12, 15, 18}
+    assert cron.days == {1, 15}
+    assert cron.months == {1, 2, 3}
+    assert cron.weekdays == {0, 1, 2, 3, 4}  # datetime.weekday() 기준 월~금
+
+
+def test_sunday_as_zero_or_seven_and_aliases():
+    assert CronExpr("0 0 * * 0").weekdays == CronExpr("0 0 * * 7").weekdays == {6}
+    assert CronExpr("@daily").next_after(datetime(2026, 3, 1, 12, 0)) == datetime(2026, 3, 2, 0, 0)
+
+
+@pytest.mark.parametrize("expr", ["* * * *", "60 * * * *", "*/0 * * * *", "x * * * *", "0 0 31 2 *"])
+def test_invalid_expressions_raise_cron_error(expr):
+    with pytest.raises(CronError):
+        CronExpr(expr).next_after(datetime(2026, 1, 1))
+
+
+def test_next_after_weekdays_only():
+    cron = CronExpr("30 9 * * 1-5")
+    # 2026-10-16은 금요일 → 다음은 월요일 09:30
+    assert cron.next_after(datetime(2026, 10, 16, 9, 30)) == datetime(2026, 10, 19, 9, 30)
+    assert cron.next_after(datetime(2026, 10, 16, 9, 29, 59)) == datetime(2026, 10, 16, 9, 30)
+
+
+def test_day_or_weekday_when_both_given():
+    cron = CronExpr("0 0 13 * 5")  # 13일 또는 금요일
+    assert cron.next_after(datetime(2026, 10, 10)) == datetime(2026, 10, 13)
+    assert cron.next_after(datetime(2026, 10, 13)) == datetime(2026, 10, 16)
+
+
+def test_between_keeps_latest_limit():
+    cron = CronExpr("0 * * * *")
+    start, end = datetime(2026, 10, 18, 0, 0), datetime(2026, 10, 18, 5, 0)
+    assert len(cron.between(start, end)) == 5
+    assert cron.between(start, end, limit=2) == [datetime(2026, 10, 18, 4, 0), datetime(2026, 10, 18, 5, 0)]
+
+
+def test_claim_due_skips_missed_runs_beyond_catchup(tmp_path):
+    store = ScheduleStore(str(tmp_path / "schedules.sqlite"))
+    try:
+        store.add("hourly", "woncamp", "pregenerate", "0 * * * *", now=datetime(2026, 10, 18, 0, 30))
+
+        runs = store.claim_due(datetime(2026, 10, 18, 6, 0), max_catchup=2)
+        assert [run.due_at for run in runs] == ["2026-10-18 05:00", "2026-10-18 06:00"]
+        statuses = [row["status"] for row in store.runs(limit=10)]
+        assert statuses.count("skipped") == 4
+
+        # 같은 시각에 다시 불러도 새 실행이 생기지 않음 (pending 2건만 그대로)
+        assert len(store.claim_due(datetime(2026, 10, 18, 6, 0), max_catchup=2)) == 2
+    finally:
+        store.close()
+
+
+def test_once_schedule_disables_after_first_claim(tmp_path):
+    store = ScheduleStore(str(tmp_path / "schedules.sqlite"))
+    try:
+        store.add("once", "woncamp", "pregenerate", "0 9 * * *", once=True, now=datetime(2026, 10, 18, 8, 0))
+        assert len(store.claim_due(datetime(2026, 10, 19, 10, 0))) == 1
+        assert store.schedules(enabled_only=True) == []
+    finally:
+        store.close()
@@ -0,0 +1,90 @@
+"""일일 생성 상태: 블로그별 next_day, 순서대로 끝난 Day까지만 진행 (데몬 day 생략 요청 포함)"""
+
+import threading
+
+import pytest
+
+import worker
+from daemon import GenerationDaemon
+from daily_content_generator import DailyState
+from utils.job_queue import RetryPolicy
+
+
+def test_next_day_waits_for_earlier_days(tmp_path):
+    state = DailyState("woncamp", state_dir=str(tmp_path))
+    assert state.get_next_day() == 1
+
+    assert state.update_state(2) == 1
+    assert state.completed_ahead() == {2}
+    assert state.update_state(1) == 3
+    assert state.completed_ahead() == set()
+
+
+def test_state_is_per_blog(tmp_path):
+    DailyState("woncamp", state_dir=str(tmp_path)).update_state(1)
+    assert DailyState("wonfinance", state_dir=str(tmp_path)).get_next_day() == 1
+    assert DailyState("woncamp", state_dir=str(tmp_path)).get_next_day() == 2
+
+
+@pytest.fixture
+def daemon(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    d = GenerationDaemon(workers=4)
+    yield d
+    d.shutdown()
+
+
+def _use_stage(monkeypatch, fn):
+    monkeypatch.setitem(worker.STAGES, "seo", (fn, RetryPolicy()))
+
+
+def _finish(daemon, run_id, events):
+    try:
+        while True:
+            event = events.get(timeout=5)
+            if event["event"] in ("done", "error"):
+                return event
+    finally:
+        daemon.hub.unsubscribe(run_id, events)
+
+
+def test_failed_day_is_retried_and_blogs_do_not_share_next_day(daemon, monkeypatch):
+    failures = {("woncamp", 1)}
+
+    def stage(job):
+        if (job.blog, job.day) in failures:
+            failures.discard((job.blog, job.day))
+            raise RuntimeError("일시적 오류")
+        return {"day": job.day}
+
+    _use_stage(monkeypatch, stage)
+
+    assert _finish(daemon, *daemon.submit({"blog": "woncamp"}))["event"] == "error"
+    assert _finish(daemon, *daemon.submit({"blog": "wonfinance"}))["result"] == {"day": 1}
+    # 실패한 Day 1을 다시 받음 (다른 블로그의 완료가 next_day를 밀지 않음)
+    assert _finish(daemon, *daemon.submit({"blog": "woncamp"}))["result"] == {"day": 1}
+    assert _finish(daemon, *daemon.submit({"blog": "woncamp"}))["result"] == {"day": 2}
+
+    assert DailyState("woncamp").get_next_day() == 3
+    assert DailyState("wonfinance").get_next_day() == 2
+
+
+def test_out_of_order_completion_does_not_skip_unfinished_day(daemon, monkeypatch):
+    gates = {1: threading.Event(), 2: threading.Event()}
+
+    def stage(job):
+        assert gates[job.day].wait(5)
+        return {"day": job.day}
+
+    _use_stage(monkeypatch, stage)
+
+    first = daemon.submit({"blog": "woncamp"})
+    second = daemon.submit({"blog": "woncamp"})
+
+    gates[2].set()
+    assert _finish(daemon, *second)["result"] == {"day": 2}
+    assert DailyState("woncamp").get_next_day() == 1
+
+    gates[1].set()
+    assert _finish(daemon, *first)["result"] == {"day": 1}
+    assert DailyState("woncamp").get_next_day() == 3
@@ -0,0 +1,118 @@
+"""작업 큐 / 작업자: 우선순위 임대, 만료 회수, 토큰 검증, 재시도·백오프, dead 처리"""
+
+import pytest
+
+import worker
+from utils.job_queue import JobQueue, PermanentJobError, RetryPolicy, parse_days
+
+
+@pytest.fixture
+def queue(tmp_path):
+    q = JobQueue(str(tmp_path / "queue.sqlite"))
+    yield q
+    q.close()
+
+
+def test_lease_prefers_priority_then_fifo(queue):
+    low = queue.enqueue("woncamp", 1, "seo")
+    high = queue.enqueue("woncamp", 2, "seo", priority=5)
+    later_low = queue.enqueue("woncamp", 3, "seo")
+
+    assert [queue.lease("w", 60).id for _ in range(3)] == [high, low, later_low]
+    assert queue.lease("w", 60) is None
+
+
+def test_lease_filters_stages_and_enqueue_is_idempotent(queue):
+    first = queue.enqueue("woncamp", 1, "write")
+    assert queue.enqueue("woncamp", 1, "write") == first
+    queue.enqueue("woncamp", 1, "seo")
+
+    job = queue.lease("w", 60, stages=["seo"])
+    assert job.stage == "seo"
+    assert queue.lease("w", 60, stages=["seo"]) is None
+
+
+def test_expired_lease_is_reaped_and_old_token_rejected(queue):
+    queue.enqueue("woncamp", 1, "seo")
+    stale = queue.lease("w1", lease_s=-1)
+
+    # 만료된 임대는 다음 임대 때 대기열로 돌아가 새 토큰으로 넘어감
+    fresh = queue.lease("w2", lease_s=60)
+    assert fresh.id == stale.id
+    assert fresh.attempts == 2
+    assert fresh.lease_token != stale.lease_token
+
+    assert queue.heartbeat(stale, 60) is False
+    assert queue.complete(stale, {"file": "old"}) is False
+    assert queue.fail(stale, "boom", 10) is None
+
+    assert queue.heartbeat(fresh, 60) is True
+    assert queue.complete(fresh, {"file": "new"}) is True
+    assert queue.get(fresh.id)["status"] == "done"
+
+
+def test_expired_lease_on_last_attempt_goes_dead(queue):
+    queue.enqueue("woncamp", 1, "seo", max_attempts=1)
+    queue.lease("w1", lease_s=-1)
+
+    assert queue.lease("w2", 60) is None
+    dead = queue.dead_jobs()
+    assert len(dead) == 1
+    assert "임대 만료" in dead[0]["last_error"]
+
+
+def test_retry_waits_for_delay_then_dead_letters(queue):
+    job_id = queue.enqueue("woncamp", 1, "seo", max_attempts=2)
+
+    job = queue.lease("w", 60)
+    assert queue.fail(job, "timeout", retry_delay_s=3600) == "retry"
+    assert queue.lease("w", 60) is None  # 지연 전에는 임대 불가
+
+    assert queue.fail(job, "late", 0) is None  # 재시도로 넘어가며 토큰이 무효
+    queue._conn.execute("UPDATE jobs SET available_at = 0 WHERE id = ?", (job_id,))
+    job = queue.lease("w", 60)
+    assert job.attempts == 2
+    assert queue.fail(job, "timeout again", retry_delay_s=0) == "dead"
+
+    assert queue.get(job_id) is None
+    assert queue.counts() == {"seo": {"dead": 1}}
+    assert queue.dead_jobs()[0]["last_error"] == "timeout again"
+
+
+def test_requeue_dead_resets_attempts(queue):
+    job_id = queue.enqueue("woncamp", 1, "seo", priority=3)
+    job = queue.lease("w", 60)
+    assert queue.fail(job, "bad plan", retry_delay_s=None) == "dead"
+
+    assert queue.requeue_dead() == 1
+    assert queue.dead_jobs() == []
+    job = queue.lease("w", 60)
+    assert (job.id, job.attempts, job.priority) == (job_id, 1, 3)
+
+
+def test_retry_policy_backoff_is_capped():
+    policy = RetryPolicy(base_delay_s=10, max_delay_s=60, backoff=2)
+    assert [policy.delay_s(n) for n in range(1, 6)] == [10, 20, 40, 60, 60]
+
+
+def test_parse_days():
+    assert parse_days("1-3, 7") == [1, 2, 3, 7]
+
+
+def test_worker_retries_then_dead_letters_permanent_errors(queue, monkeypatch):
+    def flaky(job):
+        if job.day == 2:
+            raise PermanentJobError("계획 없음")
+        if job.attempts == 1:
+            raise RuntimeError("일시적 오류")
+        return {"file": f"day{job.day:02d}.json"}
+
+    monkeypatch.setitem(worker.STAGES, "seo", (flaky, RetryPolicy(base_delay_s=0, max_delay_s=0)))
+    queue.enqueue("woncamp", 1, "seo")
+    queue.enqueue("woncamp", 2, "seo")
+
+    processed = worker.Worker(queue, stages=["seo"], lease_s=60, poll_s=0.01).run(drain=True)
+
+    assert processed == {"done": 1, "retry": 1, "dead": 1, "lost": 0}
+    assert queue.counts() == {"seo": {"done": 1, "dead": 1}}
+    assert queue.dead_jobs()[0]["attempts"] == 1
@@ -0,0 +1,63 @@
+"""부분 JSON 복구: 펜스/앞뒤 텍스트/제어문자/트레일링 콤마/잘린 응답"""
+
+import pytest
+
+from utils.json_repair import JSONRepairError, parse_json_object, repair_json
+
+
+def test_valid_json_is_untouched():
+    result = repair_json('{"a": [1, 2], "b": "x"}')
+    assert result.data == {"a": [1, 2], "b": "x"}
+    assert not result.repaired
+
+
+def test_fences_and_surrounding_text_are_stripped():
+    text = '다음은 결과입니다:\n```json\n{"title": "캠핑"}\n```\n도움이 되었길 바랍니다.'
+    result = repair_json(text)
+    assert result.data == {"title": "캠핑"}
+
+    result = repair_json('결과: {"title": "캠핑"} 끝')
+    assert result.data == {"title": "캠핑"}
+    assert result.repairs == ["strip_leading_text", "strip_trailing_text"]
+
+
+def test_raw_newlines_in_strings_and_trailing_commas():
+    result = repair_json('{"body": "첫 줄\n둘째 줄", "tags": ["a", "b",],}')
+    assert result.data == {"body": "첫 줄\n둘째 줄", "tags": ["a", "b"]}
+    assert "escape_control_chars" in result.repairs
+    assert "remove_trailing_comma" in result.repairs
+
+
+def test_truncated_string_and_brackets_are_closed():
+    result = repair_json('{"sections": [{"h2": "준비물", "body": "텐트와 침낭')
+    assert result.data == {"sections": [{"h2": "준비물", "body": "텐트와 침낭"}]}
+    assert result.repairs == ["close_string_and_brackets"]
+
+
+def test_truncated_key_drops_partial_element():
+    result = repair_json('{"faq": [{"q": "언제?", "a": "봄"}, {"q": "어디')
+    assert result.data["faq"][0] == {"q": "언제?", "a": "봄"}
+
+    result = repair_json('{"a": 1, "b": [1, 2], "c')
+    assert result.data == {"a": 1, "b": [1, 2]}
+    assert result.repairs == ["drop_partial_element"]
+
+
+def test_dangling_colon_becomes_null():
+    assert repair_json('{"a": 1, "b":').data == {"a": 1, "b": None}
+
+
+@pytest.mark.parametrize("text", ["", "   ", "JSON이 없는 답변", '{"a": }'])
+def test_unrecoverable_text_raises(text):
+    with pytest.raises(JSONRepairError):
+        repair_json(text)
+
+
+def test_parse_json_object_requires_object_and_saves_debug_file(tmp_path):
+    with pytest.raises(JSONRepairError):
+        parse_json_object("[1, 2]", "test")
+
+    debug_file = tmp_path / "raw.txt"
+    with pytest.raises(JSONRepairError):
+        parse_json_object("형식 없음", "test", debug_file=str(debug_file))
+    assert debug_file.read_text(encoding="utf-8") == "형식 없음"
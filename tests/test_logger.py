@@ -0,0 +1,76 @@
+"""로깅 큐 리스너: fork 전후로 기록해도 로그 호출 하나당 파일에 정확히 한 줄 (중복/누락 없음)"""
+
+import json
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 리스너/큐가 모듈 전역이라 깨끗한 프로세스에서 실행
+SCRIPT = textwrap.dedent("""
+    import multiprocessing
+    import os
+    import sys
+
+    from utils.logger import get_logger
+
+    logger = get_logger("ForkTest")
+
+
+    def child_logs(tag):
+        for i in range(50):
+            logger.info(f"{tag} {i}")
+
+
+    # 부모 큐에 기록이 쌓인 상태로 fork (자식이 부모 큐를 다시 쓰면 중복)
+    for i in range(200):
+        logger.info(f"parent-before {i}")
+
+    pid = os.fork()
+    if pid == 0:
+        child_logs("fork-child")
+        sys.exit(0)  # atexit에서 자식 리스너가 남은 기록을 씀
+    os.waitpid(pid, 0)
+
+    process = multiprocessing.get_context("fork").Process(target=child_logs, args=("mp-child",))
+    process.start()
+    process.join()
+
+    for i in range(20):
+        logger.info(f"parent-after {i}")
+""")
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="fork 미지원 플랫폼")
+def test_one_record_per_log_call_across_fork(tmp_path):
+    log_file = tmp_path / "app.log"
+    env = {
+        **os.environ,
+        "PYTHONPATH": REPO_ROOT,
+        "BLOG_LOG_FILE": str(log_file),
+        "BLOG_LOG_FORMAT": "json",
+        "BLOG_LOG_CONSOLE": "0",
+    }
+    subprocess.run([sys.executable, "-c", SCRIPT], cwd=str(tmp_path), env=env, check=True, timeout=60)
+
+    records = [json.loads(line) for line in log_file.read_text(encoding="utf-8").splitlines()]
+    messages = [record["msg"] for record in records]
+    expected = (
+        [f"parent-before {i}" for i in range(200)]
+        + [f"fork-child {i}" for i in range(50)]
+        + [f"mp-child {i}" for i in range(50)]
+        + [f"parent-after {i}" for i in range(20)]
+    )
+    assert sorted(messages) == sorted(expected)
+
+    # 자식 기록은 자식 프로세스가 직접 씀
+    processes = {}
+    for record in records:
+        processes.setdefault(record["msg"].rsplit(" ", 1)[0], set()).add(record["process"])
+    assert all(len(pids) == 1 for pids in processes.values())
+    assert processes["parent-before"] == processes["parent-after"]
+    assert len({pid for pids in processes.values() for pid in pids}) == 3
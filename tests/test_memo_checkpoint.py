@@ -0,0 +1,85 @@
+"""메모이제이션 키 / 기본값 대체 결과를 메모·체크포인트에 저장하지 않는지"""
+
+import pytest
+
+from utils import checkpoint, memo
+from utils.checkpoint import CheckpointStore, checkpointed_node
+from utils.memo import mark_uncacheable, memoize
+
+
+class FakeClient:
+    def __init__(self, model):
+        self.model = model
+
+    def identity(self):
+        return [f"openai:{self.model}"]
+
+
+class FakeNode:
+    def __init__(self, model="gpt-a", fail=False):
+        self.llm = FakeClient(model)
+        self.fail = fail
+        self.calls = 0
+
+    @memoize("FakeNode", version="1")
+    def run(self, topic):
+        self.calls += 1
+        if self.fail:
+            mark_uncacheable("기본값 사용")
+            return {"default": True}
+        return {"model": self.llm.model, "topic": topic}
+
+
+@pytest.fixture(autouse=True)
+def isolated_stores(tmp_path, monkeypatch):
+    monkeypatch.setenv("BLOG_MEMO_DIR", str(tmp_path / "memo"))
+    monkeypatch.delenv("BLOG_MEMO", raising=False)
+    monkeypatch.delenv("BLOG_MEMO_FRESH", raising=False)
+    monkeypatch.delenv("BLOG_CHECKPOINT", raising=False)
+    memo.set_fresh(False)
+    monkeypatch.setattr(checkpoint, "_store", CheckpointStore(str(tmp_path / "checkpoints.sqlite")))
+
+
+def test_memo_hit_for_same_model():
+    first, second = FakeNode(), FakeNode()
+    first.run("캠핑")
+    assert second.run("캠핑") == {"model": "gpt-a", "topic": "캠핑"}
+    assert second.calls == 0
+
+
+def test_memo_key_includes_model():
+    FakeNode("gpt-a").run("캠핑")
+    other = FakeNode("gpt-b")
+    assert other.run("캠핑") == {"model": "gpt-b", "topic": "캠핑"}
+    assert other.calls == 1
+
+
+def test_uncacheable_result_not_memoized():
+    FakeNode(fail=True).run("캠핑")
+    retry = FakeNode()
+    assert retry.run("캠핑")["model"] == "gpt-a"
+    assert retry.calls == 1
+
+
+def test_checkpoint_skips_uncacheable_output():
+    node = FakeNode(fail=True)
+    step = checkpointed_node("test", "fake", lambda state: {"result": node.run(state["topic"])})
+
+    step({"topic": "캠핑"})
+    step({"topic": "캠핑"})
+
+    assert node.calls == 2  # 기본값 결과는 복원하지 않고 다시 실행
+    assert checkpoint.get_checkpoint_store().get("test", "fake", checkpoint.input_hash({"topic": "캠핑"})) is None
+
+
+def test_checkpoint_restores_good_output():
+    node = FakeNode()
+    step = checkpointed_node("test", "fake", lambda state: {"result": node.run(state["topic"])})
+
+    step({"topic": "캠핑"})
+    memo.set_fresh(True)  # 메모가 아니라 체크포인트에서 복원되는지
+    try:
+        assert step({"topic": "캠핑"}) == {"result": {"model": "gpt-a", "topic": "캠핑"}}
+    finally:
+        memo.set_fresh(False)
+    assert node.calls == 1
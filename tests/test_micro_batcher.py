@@ -0,0 +1,103 @@
+"""MicroBatcher: 혼자 온 요청은 바로 전송, 진행 중에 몰린 요청만 묶음, requests_sent 집계, 종료"""
+
+import json
+import re
+import threading
+import time
+
+import pytest
+
+from utils.llm_client import MicroBatcher
+
+
+class HalfAnsweringClient:
+    """배치 요청에는 홀수 번호 작업만 답해 짝수 작업이 개별 호출로 보충되게 함"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.calls = 0
+
+    def chat(self, prompt, max_tokens=1000, schema=None, **kwargs):
+        with self._lock:
+            self.calls += 1
+        time.sleep(0.001)
+        if schema is None:
+            return "single"
+        indexes = [int(i) for i in re.findall(r"\[작업 (\d+)\]", prompt)]
+        return json.dumps({"answers": [{"index": i, "answer": f"a{i}"} for i in indexes if i % 2]})
+
+
+def test_requests_sent_matches_client_calls():
+    client = HalfAnsweringClient()
+    batcher = MicroBatcher(client, window_ms=5, max_items=4)
+
+    futures = [batcher.submit(f"질문 {i}") for i in range(40)]
+    results = [f.result(timeout=10) for f in futures]
+
+    assert len(results) == 40
+    assert batcher.submitted == 40
+    assert batcher.requests_sent == client.calls
+    batcher.shutdown()
+
+
+def test_lone_requests_do_not_wait_for_window():
+    client = HalfAnsweringClient()
+    batcher = MicroBatcher(client, window_ms=2000)
+
+    start = time.monotonic()
+    assert [batcher.submit(f"질문 {i}").result(timeout=5) for i in range(3)] == ["single"] * 3
+    assert time.monotonic() - start < 1.0
+    assert client.calls == 3
+    batcher.shutdown()
+
+
+class GatedClient(HalfAnsweringClient):
+    """첫 호출을 gate가 열릴 때까지 붙잡아 그동안 들어온 요청이 쌓이게 함"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.gate = threading.Event()
+        self.started = threading.Event()
+
+    def chat(self, prompt, max_tokens=1000, schema=None, **kwargs):
+        self.started.set()
+        assert self.gate.wait(5)
+        if schema is None:
+            with self._lock:
+                self.calls += 1
+            return "single"
+        indexes = [int(i) for i in re.findall(r"\[작업 (\d+)\]", prompt)]
+        with self._lock:
+            self.calls += 1
+        return json.dumps({"answers": [{"index": i, "answer": f"a{i}"} for i in indexes]})
+
+
+def test_requests_arriving_while_one_is_in_flight_are_batched():
+    client = GatedClient()
+    batcher = MicroBatcher(client, window_ms=50, max_items=3)
+
+    first = batcher.submit("질문 0")
+    assert client.started.wait(5)
+    rest = [batcher.submit(f"질문 {i}") for i in range(1, 4)]
+    client.gate.set()
+
+    assert first.result(timeout=5) == "single"
+    assert [f.result(timeout=5) for f in rest] == ["a1", "a2", "a3"]
+    assert client.calls == 2
+    batcher.shutdown()
+
+
+def test_shutdown_flushes_pending_and_rejects_new_work():
+    client = GatedClient()
+    batcher = MicroBatcher(client, window_ms=5000)
+
+    first = batcher.submit("질문 0")
+    assert client.started.wait(5)
+    pending = batcher.submit("질문 1")
+    client.gate.set()
+    batcher.shutdown()
+
+    assert first.result(timeout=0) == "single"
+    assert pending.result(timeout=0) == "single"
+    with pytest.raises(RuntimeError):
+        batcher.submit("질문 2")
@@ -0,0 +1,94 @@
+"""대역 서버 스트리밍: stream=true 요청은 SSE 청크(OpenAI/Anthropic 형식)로 토큰 속도에 맞춰 보냄"""
+
+import json
+import time
+
+import pytest
+
+from mock_server import start_mock_server
+from mock_server.behavior import Behavior, LatencyProfile
+from mock_server.fake_llm import estimate_tokens
+from utils.cassette import httpx
+
+CHAT_BODY = {
+    "model": "gpt-4o-mini",
+    "messages": [{"role": "user", "content": "초보자를 위한 캠핑 장비 목록을 알려주세요"}],
+    "max_tokens": 200,
+}
+
+
+@pytest.fixture
+def server():
+    server = start_mock_server()
+    yield server
+    server.shutdown()
+
+
+def read_events(response):
+    """SSE 본문 → [(event, data)] (event 줄이 없으면 None)"""
+    events = []
+    event = None
+    for line in response.iter_lines():
+        if line.startswith("event: "):
+            event = line[len("event: "):]
+        elif line.startswith("data: "):
+            events.append((event, line[len("data: "):]))
+            event = None
+    return events
+
+
+def test_chat_completion_streams_chunks_then_done(server):
+    full = httpx.post(f"{server.base_url}/chat/completions", json=CHAT_BODY).json()
+    body = {**CHAT_BODY, "stream": True, "stream_options": {"include_usage": True}}
+
+    with httpx.stream("POST", f"{server.base_url}/chat/completions", json=body) as response:
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "text/event-stream"
+        events = read_events(response)
+
+    assert events[-1] == (None, "[DONE]")
+    chunks = [json.loads(data) for _, data in events[:-1]]
+    deltas = [chunk["choices"][0]["delta"].get("content") or "" for chunk in chunks if chunk["choices"]]
+    assert len(deltas) > 1
+    assert "".join(deltas) == full["choices"][0]["message"]["content"]
+    assert chunks[-1]["choices"] == []
+    assert chunks[-1]["usage"]["completion_tokens"] == full["usage"]["completion_tokens"]
+
+
+def test_usage_chunk_only_when_requested(server):
+    with httpx.stream("POST", f"{server.base_url}/chat/completions", json={**CHAT_BODY, "stream": True}) as response:
+        chunks = [json.loads(data) for _, data in read_events(response)[:-1]]
+    assert all("usage" not in chunk for chunk in chunks)
+
+
+def test_messages_stream_anthropic_events(server):
+    body = {"model": "claude-sonnet-4-5", "max_tokens": 200, "stream": True,
+            "messages": [{"role": "user", "content": "캠핑 요리 팁"}]}
+    with httpx.stream("POST", f"{server.base_url}/messages", json=body) as response:
+        assert response.headers["content-type"] == "text/event-stream"
+        events = read_events(response)
+
+    names = [event for event, _ in events]
+    assert names[:2] == ["message_start", "content_block_start"]
+    assert names[-3:] == ["content_block_stop", "message_delta", "message_stop"]
+    assert all(json.loads(data)["type"] == event for event, data in events)
+    text = "".join(json.loads(data)["delta"]["text"] for event, data in events if event == "content_block_delta")
+    assert text == httpx.post(f"{server.base_url}/messages", json={**body, "stream": False}).json()["content"][0]["text"]
+
+
+def test_chunks_are_paced_by_token_rate():
+    # 청크마다 토큰 속도만큼 기다린 뒤 보내므로 한꺼번에 도착하지 않음
+    server = start_mock_server(behavior=Behavior(latency=LatencyProfile(tokens_per_s=200)))
+    try:
+        arrivals = []
+        with httpx.stream("POST", f"{server.base_url}/chat/completions", json={**CHAT_BODY, "stream": True}) as response:
+            for line in response.iter_lines():
+                if line.startswith("data: "):
+                    arrivals.append((time.perf_counter(), line[len("data: "):]))
+    finally:
+        server.shutdown()
+
+    assert arrivals[-1][1] == "[DONE]"
+    pieces = [json.loads(data)["choices"][0]["delta"].get("content") or "" for _, data in arrivals[:-1]]
+    expected = sum(estimate_tokens(piece) for piece in pieces if piece) / 200
+    assert arrivals[-1][0] - arrivals[0][0] >= expected * 0.8
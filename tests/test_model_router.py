@@ -0,0 +1,146 @@
+"""모델 라우터 선택 규칙: 오버라이드 → 관측 부족 시 정적 기본값/탐색 → 품질 하한 → 원당 처리량"""
+
+import pytest
+
+from utils.llm_client import HybridLLMClient
+from utils.model_router import ModelRouter
+from utils.structured_output import StructuredOutputError
+
+CANDIDATES = ["gpt", "claude"]
+
+
+def make_router(**kwargs):
+    options = {"window": 10, "min_samples": 3, "quality_floor": 0.9, "explore_rate": 0.0, "overrides": {}}
+    options.update(kwargs)
+    return ModelRouter(**options)
+
+
+def observe(router, option, n, latency_s=1.0, ok=True, json_valid=True, cost_krw=1.0, task_type="creative"):
+    for _ in range(n):
+        router.record(task_type, option, latency_s, ok, json_valid, cost_krw)
+
+
+def test_override_wins_when_available(monkeypatch):
+    monkeypatch.setenv("LLM_ROUTE_OVERRIDES", "ToneStyleGenerator=gpt, bad-item")
+    router = ModelRouter(min_samples=3, explore_rate=0.0)
+    assert router.overrides == {"ToneStyleGenerator": "gpt"}
+    assert router.choose("creative", CANDIDATES, node="ToneStyleGenerator") == "gpt"
+
+    # 오버라이드 후보를 쓸 수 없으면 일반 규칙
+    router.set_override("ToneStyleGenerator", "claude")
+    assert router.choose("creative", ["gpt"], node="ToneStyleGenerator") == "gpt"
+    router.set_override("ToneStyleGenerator", None)
+    assert router.choose("creative", CANDIDATES, node="ToneStyleGenerator") == "claude"
+
+
+def test_static_defaults_until_enough_samples():
+    router = make_router()
+    assert router.choose("simple", CANDIDATES) == "gpt"
+    assert router.choose("creative", CANDIDATES) == "claude"
+    assert router.choose("analytical", CANDIDATES) == "claude"
+    assert router.choose("unknown", CANDIDATES) == "gpt"
+
+    # 한쪽만 관측이 충분해도 정적 기본값 유지
+    observe(router, "gpt", 5, latency_s=0.1)
+    assert router.choose("creative", CANDIDATES) == "claude"
+
+
+def test_exploration_tries_under_sampled_candidate():
+    router = make_router(explore_rate=1.0)
+    assert router.choose("creative", CANDIDATES) == "gpt"
+
+
+def test_cheapest_fast_candidate_above_quality_floor():
+    router = make_router()
+    observe(router, "gpt", 3, latency_s=1.0, cost_krw=1.0)
+    observe(router, "claude", 3, latency_s=2.0, cost_krw=5.0)
+    assert router.choose("creative", CANDIDATES) == "gpt"
+
+
+def test_quality_floor_excludes_invalid_json():
+    router = make_router()
+    observe(router, "gpt", 3, latency_s=0.1, json_valid=False)
+    observe(router, "claude", 3, latency_s=2.0, cost_krw=5.0)
+    assert router.choose("creative", CANDIDATES) == "claude"
+
+
+def test_best_quality_when_no_candidate_qualifies():
+    router = make_router()
+    observe(router, "gpt", 2, ok=False)
+    observe(router, "gpt", 2)
+    observe(router, "claude", 1, ok=False)
+    observe(router, "claude", 3, latency_s=9.0, cost_krw=9.0)
+    assert router.choose("creative", CANDIDATES) == "claude"
+
+
+def test_rolling_window_forgets_old_failures():
+    router = make_router(window=3)
+    observe(router, "claude", 3, ok=False)
+    observe(router, "claude", 3, latency_s=0.5, cost_krw=0.5)
+    observe(router, "gpt", 3, latency_s=1.0, cost_krw=1.0)
+    assert router.snapshot()["creative"]["claude"]["success_rate"] == 1.0
+    assert router.choose("creative", CANDIDATES) == "claude"
+
+
+def test_no_candidates_raise():
+    with pytest.raises(ValueError):
+        make_router().choose("simple", [])
+
+
+def test_warm_start_skips_batch_and_unknown_providers():
+    router = make_router()
+    records = [
+        {"task_type": "simple", "provider": "openai", "latency_s": 1.0, "cost_krw": 2.0},
+        {"task_type": "simple", "provider": "anthropic", "latency_s": 1.0, "error": "429"},
+        {"task_type": "simple", "provider": "openai", "batch": True},
+        {"task_type": "simple", "provider": "other"},
+        {"provider": "openai"},
+    ]
+    assert router.warm_start(records) == 2
+    snapshot = router.snapshot()["simple"]
+    assert snapshot["gpt"]["samples"] == 1
+    assert snapshot["claude"]["success_rate"] == 0.0
+
+
+class FakeClient:
+    def __init__(self, model, reply="ok", error=None):
+        self.model = model
+        self.reply = reply
+        self.error = error
+        self.calls = 0
+
+    def chat(self, prompt, max_tokens=1000, schema=None, prefix=None):
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        return self.reply
+
+
+def test_hybrid_auto_records_observations_for_router():
+    router = make_router()
+    gpt = FakeClient("gpt-fake", reply='{"a": 1}')
+    claude = FakeClient("claude-fake", error=StructuredOutputError("스키마 불일치"))
+    client = HybridLLMClient(gpt_client=gpt, claude_client=claude, router=router)
+
+    assert client.chat("질문", task_type="simple", expect_json=True) == '{"a": 1}'
+    with pytest.raises(StructuredOutputError):
+        client.chat("질문", task_type="creative", schema={"type": "object"})
+
+    snapshot = router.snapshot()
+    assert snapshot["simple"]["gpt"]["json_valid_rate"] == 1.0
+    # 스키마 검증 실패는 호출 성공 + JSON 무효로 기록 (품질 하한 판단에 반영)
+    assert snapshot["creative"]["claude"]["success_rate"] == 1.0
+    assert snapshot["creative"]["claude"]["json_valid_rate"] == 0.0
+
+
+def test_hybrid_without_claude_routes_to_gpt():
+    router = make_router()
+    gpt = FakeClient("gpt-fake")
+    client = HybridLLMClient(gpt_client=gpt, router=router)
+    # Claude 키가 없는 환경과 같은 상태로
+    client.claude_available = False
+    client.claude_client = None
+
+    assert client.chat("질문", task_type="creative") == "ok"
+    assert client.chat("질문", prefer_model="claude") == "ok"
+    assert gpt.calls == 2
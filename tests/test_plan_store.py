@@ -0,0 +1,120 @@
+"""계획 저장소: JSON 가져오기, 원본이 바뀌면 다시 가져오기, Day/키워드 조회, 작업자 조회"""
+
+import json
+import os
+
+import pytest
+
+import worker
+from utils import plan_store
+from utils.job_queue import Job, PermanentJobError
+from utils.plan_store import PlanStore, load_plan_store
+
+
+def make_result(titles, topic="캠핑"):
+    return {
+        "content_plan": {
+            "topic": topic,
+            "30_days_plan": [
+                {"title": title, "category": "가이드" if i % 2 else "후기", "main_keywords": [topic, f"키워드{i}"]}
+                for i, title in enumerate(titles, 1)
+            ],
+        },
+        "serp_data": {"topic": topic, "serp_results": [{"title": "상위 글"}]},
+    }
+
+
+def write_json(path, data, mtime=None):
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+    return str(path)
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setenv("BLOG_PLAN_DB", str(tmp_path / "plan_store.sqlite"))
+    monkeypatch.setattr(plan_store, "_store", None)
+    yield plan_store.get_plan_store()
+    plan_store._store.close()
+
+
+def test_import_and_export_round_trip(tmp_path):
+    store = PlanStore(str(tmp_path / "plan_store.sqlite"))
+    try:
+        result = make_result(["첫 캠핑", "장비 고르기"])
+        result["tone_style_guide"] = {"tone": "친근"}
+        assert store.import_result("woncamp", result) == 2
+
+        assert store.day_count("woncamp") == 2
+        assert store.tone_guide("woncamp") == {"tone": "친근"}
+        assert store.serp_snapshot("woncamp")["topic"] == "캠핑"
+        exported = store.export_result("woncamp")
+        assert [item["title"] for item in exported["content_plan"]["30_days_plan"]] == ["첫 캠핑", "장비 고르기"]
+        assert exported["content_plan"]["topic"] == "캠핑"
+    finally:
+        store.close()
+
+
+def test_reimport_only_when_source_mtime_changes(store, tmp_path):
+    plan_file = write_json(tmp_path / "plan.json", make_result(["첫 캠핑"]), mtime=1000)
+    tone_file = write_json(tmp_path / "tone.json", {"tone": "친근"}, mtime=1000)
+
+    load_plan_store("woncamp", plan_file, tone_file)
+    assert store.import_file("woncamp", plan_file) is False
+    assert store.import_tone_guide_file("woncamp", tone_file) is False
+
+    write_json(tmp_path / "plan.json", make_result(["첫 캠핑", "겨울 캠핑"]), mtime=2000)
+    write_json(tmp_path / "tone.json", {"tone": "차분"}, mtime=2000)
+    load_plan_store("woncamp", plan_file, tone_file)
+    assert store.plan_item("woncamp", 2)["title"] == "겨울 캠핑"
+    assert store.tone_guide("woncamp") == {"tone": "차분"}
+
+    # 원본이 사라져도 저장소의 계획은 그대로 사용
+    os.remove(plan_file)
+    assert load_plan_store("woncamp", plan_file, tone_file).day_count("woncamp") == 2
+    with pytest.raises(FileNotFoundError):
+        load_plan_store("wonfinance", plan_file, None)
+
+
+def test_day_and_keyword_lookup(store):
+    store.import_result("woncamp", make_result(["첫 캠핑", "장비 고르기", "겨울 캠핑"]))
+    store.import_result("wonfinance", make_result(["예금 비교"], topic="재테크"))
+
+    item = store.plan_item("woncamp", 2)
+    assert item["title"] == "장비 고르기"
+    item["title"] = "고침"
+    assert store.plan_item("woncamp", 2)["title"] == "장비 고르기"
+    assert store.plan_item("woncamp", 4) is None
+    assert [item["title"] for item in store.plan_items("woncamp", start_day=2)] == ["장비 고르기", "겨울 캠핑"]
+
+    assert [row["day"] for row in store.find_days("woncamp", keyword="키워드2")] == [2]
+    assert [row["day"] for row in store.find_days(keyword="캠핑")] == [1, 2, 3]
+    assert [row["blog"] for row in store.find_days(keyword="재테크")] == ["wonfinance"]
+    assert [row["day"] for row in store.find_days("woncamp", category="가이드")] == [1, 3]
+    assert store.categories("woncamp") == {"가이드": 2, "후기": 1}
+
+
+def _job(blog, day, payload):
+    return Job(id=0, blog=blog, day=day, stage="seo", priority=0, attempts=1, max_attempts=1,
+               lease_token="", payload=payload)
+
+
+def test_worker_reads_plan_per_blog_from_store(store, tmp_path):
+    store.import_result("woncamp", make_result(["첫 캠핑"]))
+    store.put_tone_guide("woncamp", {"tone": "친근"})
+    store.import_result("wonfinance", make_result(["예금 비교"], topic="재테크"))
+    payload = {"plan_file": str(tmp_path / "없음.json"), "tone_guide_file": str(tmp_path / "없음.json")}
+
+    plan_item, serp_context = worker.load_plan_item(_job("woncamp", 1, payload))
+    assert plan_item["title"] == "첫 캠핑"
+    assert serp_context["topic"] == "캠핑"
+    assert worker.load_plan_item(_job("wonfinance", 1, payload))[0]["title"] == "예금 비교"
+    assert worker.load_tone_guide(_job("woncamp", 1, payload)) == {"tone": "친근"}
+
+    with pytest.raises(PermanentJobError):
+        worker.load_plan_item(_job("woncamp", 2, payload))
+    with pytest.raises(PermanentJobError):
+        worker.load_tone_guide(_job("wonfinance", 1, payload))
+    with pytest.raises(PermanentJobError):
+        worker.load_plan_item(_job("wonhealth", 1, payload))
@@ -0,0 +1,165 @@
+"""미리 생성 버퍼: 깊이만큼 채우기, 검증 실패 글 제외/재생성, 오래된 시의성 글 갱신"""
+
+import json
+import os
+import sqlite3
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+import scheduler
+import worker
+from utils import plan_store
+from utils.job_queue import RetryPolicy
+from utils.pregen import buffer_report, is_stale, is_trend_sensitive, refresh_due, validate_content
+from utils.schedule_store import INVALID, READY, RELEASED, ScheduledRun, ScheduleStore
+
+TONE_GUIDE = {"content_length": {"min": 1000}}
+TITLES = ["이번 주 캠핑 할인 소식", "캠핑 장비 고르기", "겨울 캠핑 준비", "캠핑 요리"]
+
+
+def make_content(title, length=1200, paragraphs=("텐트는 가볍고 설치가 쉬운 것으로 고릅니다.",)):
+    return {
+        "title": title,
+        "sections": [{"h2": "준비물", "h3_contents": [{"h3": "텐트", "paragraphs": list(paragraphs)}]}],
+        "full_text_length": length,
+    }
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("BLOG_PREGEN_DIR", str(tmp_path / "buffer"))
+    monkeypatch.setenv("BLOG_PUBLISH_DIR", str(tmp_path / "published"))
+    monkeypatch.setenv("BLOG_PLAN_DB", str(tmp_path / "plan_store.sqlite"))
+    monkeypatch.setattr(plan_store, "_store", None)
+    plans = plan_store.get_plan_store()
+    plans.import_result("woncamp", {"content_plan": {"topic": "캠핑", "30_days_plan": [{"title": t} for t in TITLES]}})
+    plans.put_tone_guide("woncamp", TONE_GUIDE)
+
+    store = ScheduleStore(str(tmp_path / "schedules.sqlite"))
+    yield store
+    store.close()
+    plans.close()
+
+
+@pytest.fixture
+def generated(monkeypatch):
+    """SEO 단계 대역: Day별 생성 횟수 기록, bad에 든 Day는 생성 실패 대체 본문"""
+    calls = []
+    bad = set()
+
+    def stage(job):
+        calls.append(job.day)
+        paragraphs = ("내용을 작성 중입니다.",) if job.day in bad else ("텐트는 가볍고 설치가 쉬운 것으로 고릅니다.",)
+        path = os.path.join(job.payload["output_dir"], job.blog, f"day{job.day:02d}.json")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(make_content(TITLES[job.day - 1], paragraphs=paragraphs), f, ensure_ascii=False)
+        return {"file": path}
+
+    monkeypatch.setitem(worker.STAGES, "seo", (stage, RetryPolicy()))
+    return calls, bad
+
+
+def make_run(action, **payload):
+    return ScheduledRun(id=0, schedule_id=0, schedule_name=f"woncamp-{action}", blog="woncamp",
+                        action=action, due_at="", jitter_s=0.0, payload=payload)
+
+
+def age_item(store, day, hours):
+    """버퍼 항목의 생성 시각을 hours시간 전으로"""
+    conn = sqlite3.connect(store.path)
+    try:
+        with conn:
+            conn.execute("UPDATE buffer SET generated_at = ? WHERE blog = ? AND day = ?",
+                         (time.time() - hours * 3600, "woncamp", day))
+    finally:
+        conn.close()
+
+
+def test_validate_content_rejects_placeholder_short_and_empty():
+    assert validate_content(make_content("첫 캠핑"), TONE_GUIDE) == []
+    assert validate_content(make_content("첫 캠핑", paragraphs=["자세한 내용은 곧 업데이트됩니다."])) == [
+        "기본 본문 (생성 실패 대체)",
+    ]
+    # 최소 글자 수의 절반(BLOG_PREGEN_MIN_LENGTH_RATIO 기본 0.5)까지 허용
+    assert validate_content(make_content("첫 캠핑", length=500), TONE_GUIDE) == []
+    assert validate_content(make_content("첫 캠핑", length=499), TONE_GUIDE) == ["글자 수 부족 (499자 < 500자)"]
+    assert validate_content({"sections": []}) == ["제목 없음", "섹션 없음"]
+
+
+def test_trend_sensitive_from_plan_item():
+    assert is_trend_sensitive({"title": "이번 주 캠핑 할인 소식"})
+    assert not is_trend_sensitive({"title": "캠핑 장비 고르기"})
+    assert not is_trend_sensitive({"title": "최신 텐트", "trend_sensitive": False})
+
+
+def test_pregenerate_fills_buffer_to_depth(store, generated):
+    calls, _ = generated
+
+    result = scheduler.run_pregenerate(make_run("pregenerate", depth=2), store)
+    assert result["generated"] == [1, 2]
+    assert result["depth"] == 2
+    assert [item.day for item in store.buffer_items("woncamp", READY)] == [1, 2]
+    assert all(os.path.exists(item.html_file) for item in store.buffer_items("woncamp"))
+
+    # 이미 깊이만큼 있으면 생성하지 않음
+    assert scheduler.run_pregenerate(make_run("pregenerate", depth=2), store)["generated"] == []
+    assert calls == [1, 2]
+
+    # 하나 발행하면 다음 Day로 다시 채움 (발행한 Day는 다시 만들지 않음)
+    assert scheduler.run_release(make_run("release"), store)["day"] == 1
+    assert scheduler.run_pregenerate(make_run("pregenerate", depth=2), store)["generated"] == [3]
+    assert [item.day for item in store.buffer_items("woncamp", READY)] == [2, 3]
+    assert [item.status for item in store.buffer_items("woncamp")][0] == RELEASED
+    assert buffer_report(store)[0]["depth"] == 2
+
+
+def test_invalid_content_is_not_released_and_is_regenerated(store, generated):
+    calls, bad = generated
+    bad.add(1)
+
+    result = scheduler.run_pregenerate(make_run("pregenerate", depth=2), store)
+    assert result["invalid"] == [1]
+    assert result["generated"] == [2]
+    invalid = store.buffer_items("woncamp", INVALID)
+    assert [item.day for item in invalid] == [1]
+    assert invalid[0].issues == ["기본 본문 (생성 실패 대체)"]
+
+    # 무효 글은 건너뛰고 ready 글만 발행
+    assert scheduler.run_release(make_run("release", fallback=False), store)["day"] == 2
+
+    # 다음 채우기에서 무효였던 Day부터 다시 생성
+    bad.clear()
+    assert scheduler.run_pregenerate(make_run("pregenerate", depth=2), store)["generated"] == [1, 3]
+    assert calls == [1, 2, 1, 3]
+    assert store.buffer_items("woncamp", INVALID) == []
+
+
+def test_stale_trend_item_is_refreshed_before_release(store, generated):
+    calls, _ = generated
+    scheduler.run_pregenerate(make_run("pregenerate", depth=2), store)
+    age_item(store, 1, hours=30)
+    age_item(store, 2, hours=30)
+
+    items = {item.day: item for item in store.buffer_items("woncamp", READY)}
+    # 시의성 글(Day 1)만 오래됨으로 봄
+    assert is_stale(items[1])
+    assert not is_stale(items[2])
+    assert buffer_report(store)[0]["stale"] == 1
+
+    # release 예약이 없으면 발행 시각을 몰라 갱신 대상 없음
+    assert refresh_due(store, "woncamp") == []
+
+    release_at = datetime.now() + timedelta(hours=1)
+    store.add("woncamp-release", "woncamp", "release", f"{release_at.minute} {release_at.hour} * * *")
+    assert [item.day for item in refresh_due(store, "woncamp")] == [1]
+
+    assert scheduler.run_refresh(make_run("refresh"), store)["refreshed"] == [1]
+    assert calls == [1, 2, 1]
+    refreshed = store.buffer_items("woncamp", READY)[0]
+    assert not is_stale(refreshed)
+    # 발행 직전 구간 안에서 새로 만든 글은 다시 갱신하지 않음
+    assert refresh_due(store, "woncamp") == []
@@ -0,0 +1,77 @@
+"""노드 프로파일링: BLOG_PROFILE이 켜졌을 때만 노드별 파일과 요약표를 남김 (바깥 노드만 측정)"""
+
+import os
+import tracemalloc
+
+import pytest
+
+from utils.profiling import format_profile_summary, profile_records
+from utils.run_context import node_scope, run_scope
+
+
+def busy_node(name, day=None):
+    with node_scope(name, day=day):
+        data = [str(i) * 10 for i in range(20000)]
+        return sum(len(item) for item in data)
+
+
+@pytest.fixture
+def profile_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("BLOG_PROFILE_DIR", str(tmp_path))
+    was_tracing = tracemalloc.is_tracing()
+    yield tmp_path
+    # mem 측정이 켠 tracemalloc은 다른 테스트를 느리게 하므로 끔
+    if not was_tracing:
+        tracemalloc.stop()
+
+
+def test_no_summary_without_blog_profile(profile_dir, monkeypatch):
+    monkeypatch.delenv("BLOG_PROFILE", raising=False)
+    with run_scope() as run_id:
+        busy_node("ContentPlanner")
+
+    assert profile_records(run_id) == []
+    assert format_profile_summary(run_id) == ""
+    assert list(profile_dir.iterdir()) == []
+
+
+def test_unknown_modes_are_ignored(profile_dir, monkeypatch):
+    monkeypatch.setenv("BLOG_PROFILE", "gpu, ")
+    with run_scope() as run_id:
+        busy_node("ContentPlanner")
+    assert format_profile_summary(run_id) == ""
+
+
+def test_cpu_and_mem_profile_per_node(profile_dir, monkeypatch):
+    monkeypatch.setenv("BLOG_PROFILE", "cpu,mem")
+    with run_scope() as run_id:
+        busy_node("ContentPlanner")
+        busy_node("SEOContentWriter", day=1)
+        busy_node("SEOContentWriter", day=2)
+
+    records = profile_records(run_id)
+    assert [(r["node"], r["day"]) for r in records] == [
+        ("ContentPlanner", None), ("SEOContentWriter", 1), ("SEOContentWriter", 2),
+    ]
+    assert all("top_function" in r and "peak_kb" in r for r in records)
+
+    files = sorted(os.listdir(profile_dir / run_id))
+    assert any(name.endswith("-SEOContentWriter-day2.prof") for name in files)
+    assert any(name.endswith("-ContentPlanner.mem.txt") for name in files)
+
+    summary = format_profile_summary(run_id)
+    assert summary.startswith("🔬 노드 프로파일 (cpu, mem)")
+    # 같은 노드의 여러 실행은 한 줄로 합산
+    row = next(line for line in summary.splitlines() if "SEOContentWriter" in line)
+    assert row.split()[1] == "2"
+    assert str(profile_dir / run_id) in summary
+
+
+def test_nested_node_is_measured_by_outer_node_only(profile_dir, monkeypatch):
+    monkeypatch.setenv("BLOG_PROFILE", "cpu")
+    with run_scope() as run_id:
+        with node_scope("DailyContentGenerator"):
+            busy_node("SEOContentWriter", day=1)
+
+    assert [r["node"] for r in profile_records(run_id)] == ["DailyContentGenerator"]
+    assert "SEOContentWriter" not in format_profile_summary(run_id)
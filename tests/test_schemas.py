@@ -0,0 +1,40 @@
+"""구조화 출력 스키마가 OpenAI strict 모드 규칙을 지키는지"""
+
+from typing import Any, Dict, Iterator, Tuple
+
+import pytest
+
+from utils.llm_client import BATCH_ANSWERS_SCHEMA, get_llm_client
+from utils.schemas import CONTENT_PLAN_SCHEMA, SEO_CONTENT_SCHEMA, SEO_STRUCTURE_SCHEMA
+
+SCHEMAS = {
+    "content_plan": CONTENT_PLAN_SCHEMA,
+    "seo_structure": SEO_STRUCTURE_SCHEMA,
+    "seo_content": SEO_CONTENT_SCHEMA,
+    "batch_answers": BATCH_ANSWERS_SCHEMA,
+}
+
+
+def _objects(schema: Dict[str, Any], path: str = "$") -> Iterator[Tuple[str, Dict[str, Any]]]:
+    if schema.get("type") == "object":
+        yield path, schema
+        for name, child in schema.get("properties", {}).items():
+            yield from _objects(child, f"{path}.{name}")
+    if schema.get("type") == "array":
+        yield from _objects(schema.get("items", {}), f"{path}[]")
+
+
+@pytest.mark.parametrize("name", sorted(SCHEMAS))
+def test_schema_is_strict_compatible(name):
+    for path, obj in _objects(SCHEMAS[name]):
+        assert obj.get("additionalProperties") is False, path
+        assert sorted(obj.get("required", [])) == sorted(obj["properties"]), path
+
+
+def test_build_params_requests_strict_schema():
+    params = get_llm_client("gpt").build_params("prompt", schema=SEO_STRUCTURE_SCHEMA)
+    json_schema = params["response_format"]["json_schema"]
+
+    assert json_schema["strict"] is True
+    assert json_schema["name"] == "seo_structure"
+    assert "title" not in json_schema["schema"]
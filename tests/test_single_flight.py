@@ -0,0 +1,125 @@
+"""single-flight: 동시에 들어온 같은 요청은 실제 호출 1번, 합류 수는 실행 요약에 표시"""
+
+import asyncio
+import contextvars
+import threading
+
+from utils import llm_client
+from utils.llm_client import LLMClient, SingleFlight
+from utils.metrics import run_summary
+from utils.run_context import run_scope
+
+
+def test_concurrent_identical_calls_share_one_upstream_call():
+    group = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def upstream():
+        calls.append(1)
+        assert release.wait(5)
+        return "답변"
+
+    results = []
+    with run_scope() as run_id:
+        # 파이프라인처럼 실행 컨텍스트를 복사해 스레드 시작 (합류 수가 이 실행에 귀속)
+        def call():
+            results.append(group.do("key", upstream))
+
+        threads = [threading.Thread(target=contextvars.copy_context().run, args=(call,)) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        while group.coalesced_calls < 3:
+            threading.Event().wait(0.001)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+    assert len(calls) == 1
+    assert results == ["답변"] * 4
+    assert run_summary(run_id, records=[])["coalesced_calls"] == 3
+
+    # 끝난 요청은 다시 보냄
+    assert group.do("key", upstream) == "답변"
+    assert len(calls) == 2
+
+
+def test_leader_error_is_shared_with_followers():
+    group = SingleFlight()
+    release = threading.Event()
+    errors = []
+
+    def upstream():
+        assert release.wait(5)
+        raise RuntimeError("429")
+
+    def call():
+        try:
+            group.do("key", upstream)
+        except RuntimeError as e:
+            errors.append(str(e))
+
+    threads = [threading.Thread(target=call) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    while group.coalesced_calls < 2:
+        threading.Event().wait(0.001)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+    assert errors == ["429"] * 3
+
+
+def test_achat_joins_identical_in_flight_request(monkeypatch):
+    monkeypatch.setenv("LLM_STREAM", "0")
+    client = LLMClient()
+    calls = []
+    deltas = []
+
+    async def fake_acreate(params, on_delta=None):
+        calls.append(params)
+        await asyncio.sleep(0.05)
+        return "답변"
+
+    monkeypatch.setattr(client, "_acreate", fake_acreate)
+
+    async def main():
+        return await asyncio.gather(
+            client.achat("같은 질문", max_tokens=50),
+            client.achat("같은 질문", max_tokens=50, on_delta=deltas.append),
+            client.achat("다른 질문", max_tokens=50),
+        )
+
+    assert asyncio.run(main()) == ["답변"] * 3
+    assert len(calls) == 2
+    # 합류한 호출도 on_delta를 끝에 한 번 받음
+    assert deltas == ["답변"]
+
+
+def test_sync_chat_joins_async_leader(monkeypatch):
+    monkeypatch.setenv("LLM_STREAM", "0")
+    client = LLMClient()
+    release = threading.Event()
+    calls = []
+
+    async def fake_acreate(params, on_delta=None):
+        calls.append(params)
+        await asyncio.to_thread(release.wait, 5)
+        return "답변"
+
+    monkeypatch.setattr(client, "_acreate", fake_acreate)
+    monkeypatch.setattr(client, "_create", lambda params: calls.append(params) or "동기 답변")
+
+    async def main():
+        leader = asyncio.create_task(client.achat("같은 질문", max_tokens=50))
+        while not calls:
+            await asyncio.sleep(0.001)
+        joined = llm_client._single_flight.coalesced_calls + 1
+        follower = asyncio.create_task(asyncio.to_thread(client.chat, "같은 질문", 50))
+        while llm_client._single_flight.coalesced_calls < joined:
+            await asyncio.sleep(0.001)
+        release.set()
+        return await asyncio.gather(leader, follower)
+
+    assert asyncio.run(main()) == ["답변", "답변"]
+    assert len(calls) == 1
@@ -0,0 +1,55 @@
+"""복구 불가능한 구조화 출력 → 노드가 기본 구조/본문으로 대체하는지"""
+
+import asyncio
+
+import pytest
+
+from nodes.seo_content_writer_node import SEOContentWriterNode
+from utils.llm_client import UsageStats, validated_json
+from utils.schemas import SEO_STRUCTURE_SCHEMA
+from utils.structured_output import StructuredOutputError
+
+BROKEN_REPLY = "죄송합니다, 요청하신 형식으로 답할 수 없습니다."
+
+DAY_PLAN = {"day": 1, "title": "캠핑 입문", "category": "가이드", "content_type": "how-to", "main_keywords": ["캠핑"]}
+TONE_GUIDE = {"seo_rules": {"h2_count": 4}}
+
+
+class BrokenClient:
+    """LLMClient처럼 응답을 validated_json으로 검증하지만 응답이 항상 JSON이 아님"""
+
+    model = "fake"
+
+    def __init__(self) -> None:
+        self.usage = UsageStats()
+        self.calls = 0
+
+    def chat(self, prompt, max_tokens=1000, json_mode=False, schema=None, prefix=None):
+        self.calls += 1
+        return validated_json(BROKEN_REPLY, schema, "BrokenClient")
+
+    async def achat(self, prompt, max_tokens=1000, json_mode=False, schema=None, prefix=None, on_delta=None):
+        self.calls += 1
+        return validated_json(BROKEN_REPLY, schema, "BrokenClient")
+
+
+def test_validated_json_wraps_repair_error():
+    with pytest.raises(StructuredOutputError):
+        validated_json(BROKEN_REPLY, SEO_STRUCTURE_SCHEMA, "test")
+
+
+def test_generate_all_falls_back_to_default_content():
+    client = BrokenClient()
+    results = SEOContentWriterNode(gpt=client).generate_all([DAY_PLAN], TONE_GUIDE, start_day=1, end_day=1)
+
+    assert len(results) == 1
+    assert results[0]["sections"]
+    assert client.calls == 2  # 구조 1회 + 본문 1회, 예외로 중단되지 않음
+
+
+def test_agenerate_single_falls_back_to_default_content():
+    client = BrokenClient()
+    content = asyncio.run(SEOContentWriterNode(gpt=client).agenerate_single(1, DAY_PLAN, TONE_GUIDE))
+
+    assert content["sections"]
+    assert client.calls == 2
@@ -0,0 +1,122 @@
+"""트레이싱: 구간 중첩(부모/run_id 상속, 스레드 전파, 오류 표시)과 요약표/Chrome trace/folded stack 보고서"""
+
+import contextvars
+import json
+import threading
+import uuid
+
+import pytest
+
+from utils.tracing import (
+    Span,
+    folded_stacks,
+    format_trace_report,
+    get_tracer,
+    span,
+    summarize_spans,
+)
+
+
+@pytest.fixture
+def run_id():
+    run_id = f"test-{uuid.uuid4().hex[:8]}"
+    yield run_id
+    get_tracer().clear(run_id)
+
+
+def by_name(run_id):
+    return {s.name: s for s in get_tracer().spans(run_id)}
+
+
+def test_nested_spans_link_parent_and_inherit_run_id(run_id):
+    with span("pipeline", run_id=run_id) as root:
+        with span("node", kind="node", day=3) as node:
+            with span("llm", kind="llm", model=None) as llm:
+                llm.set(tokens=120, status=None)
+        with span("render", kind="cpu"):
+            pass
+
+    spans = by_name(run_id)
+    assert spans["pipeline"].parent_id is None
+    assert spans["node"].parent_id == root.span_id
+    assert spans["llm"].parent_id == node.span_id
+    assert spans["render"].parent_id == root.span_id
+    assert all(s.run_id == run_id for s in spans.values())
+    # None 속성은 기록하지 않음
+    assert spans["node"].attrs == {"day": 3}
+    assert spans["llm"].attrs == {"tokens": 120}
+    assert spans["pipeline"].end_ns >= spans["render"].end_ns >= spans["llm"].end_ns
+
+
+def test_child_thread_with_copied_context_keeps_parent(run_id):
+    with span("pipeline", run_id=run_id) as root:
+        def work():
+            with span("worker"):
+                pass
+
+        thread = threading.Thread(target=contextvars.copy_context().run, args=(work,), name="worker-1")
+        thread.start()
+        thread.join(5)
+
+    worker = by_name(run_id)["worker"]
+    assert worker.parent_id == root.span_id
+    assert worker.thread_name == "worker-1"
+
+
+def test_error_is_recorded_and_span_closed(run_id):
+    with pytest.raises(ValueError):
+        with span("pipeline", run_id=run_id):
+            with span("parse"):
+                raise ValueError("잘못된 JSON")
+
+    spans = by_name(run_id)
+    assert spans["parse"].attrs["error"] == "ValueError"
+    assert spans["pipeline"].attrs["error"] == "ValueError"
+    assert spans["parse"].end_ns is not None
+    # 바깥 구간이 끝나면 현재 구간이 비워져 다음 구간은 최상위
+    with span("next", run_id=run_id):
+        pass
+    assert by_name(run_id)["next"].parent_id is None
+
+
+def make_span(name, span_id, parent_id, start_ms, end_ms, kind="internal"):
+    return Span(name=name, kind=kind, span_id=span_id, parent_id=parent_id, run_id="r",
+                start_ns=start_ms * 1_000_000, thread_id=1, thread_name="main", end_ns=end_ms * 1_000_000)
+
+
+def test_self_time_excludes_children():
+    spans = [
+        make_span("pipeline", 1, None, 0, 100),
+        make_span("llm", 2, 1, 10, 70, kind="llm"),
+        make_span("llm", 3, 1, 70, 90, kind="llm"),
+    ]
+    rows = {row["name"]: row for row in summarize_spans(spans)}
+    assert rows["llm"]["count"] == 2
+    assert rows["llm"]["total_s"] == pytest.approx(0.08)
+    assert rows["pipeline"]["self_s"] == pytest.approx(0.02)
+    assert summarize_spans(spans)[0]["name"] == "llm"
+    assert folded_stacks(spans) == ["pipeline 20000", "pipeline;llm 80000"]
+
+
+def test_report_prints_summary_and_writes_trace_files(run_id, tmp_path):
+    with span("pipeline", run_id=run_id):
+        with span("llm", kind="llm"):
+            pass
+
+    report = format_trace_report(run_id, trace_dir=str(tmp_path))
+    assert "구간 2개" in report
+    assert "pipeline" in report and "llm" in report
+
+    trace = json.loads((tmp_path / f"{run_id}.trace.json").read_text(encoding="utf-8"))
+    events = [e for e in trace["traceEvents"] if e["ph"] == "X"]
+    assert [e["name"] for e in events] == ["pipeline", "llm"]
+    assert events[1]["args"]["parent_id"] == events[0]["args"]["span_id"]
+    assert any(e["ph"] == "M" for e in trace["traceEvents"])
+    assert (tmp_path / f"{run_id}.folded").exists()
+    assert str(tmp_path / f"{run_id}.trace.json") in report
+
+
+def test_report_without_spans(tmp_path):
+    report = format_trace_report("없는-실행", trace_dir=str(tmp_path))
+    assert report == "🧭 트레이스: 기록된 구간 없음"
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,224 @@
+# utils/budget.py
+"""
+전역 동시 실행 한도 (블로그 간 공정 분배)
+
+- 여러 블로그 파이프라인이 한 프로세스에서 함께 돌 때 LLM 호출 / HTTP 요청의 동시 실행 수를 제한
+- 한도가 차면 블로그(run_context의 blog)별 대기열에 줄 서고, 슬롯이 나면 블로그 순서대로 돌아가며 넘겨줌
+  (스레드를 많이 띄운 블로그가 슬롯을 독점하지 않음 - 블로그 안에서는 먼저 온 순서)
+- 블로그별 획득 횟수 / 대기 시간을 집계해 멀티 블로그 리포트에 사용
+- 같은 스레드가 이미 슬롯을 쥐고 있으면 중첩 획득은 그냥 통과 (교착 방지)
+- asyncio 코루틴은 aslot()으로 같은 한도를 나눠 씀 (대기 중에도 이벤트 루프를 막지 않음)
+
+환경 변수:
+- BLOG_LLM_CONCURRENCY: LLM 동시 호출 한도 (기본 8, 0이면 제한 없음)
+- BLOG_HTTP_CONCURRENCY: HTTP 동시 요청 한도 (기본 HTTP_POOL_SIZE 또는 16, 0이면 제한 없음)
+"""
+
+import asyncio
+import os
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Deque, Dict, Iterator, List, Optional, Tuple, Union
+
+from utils.logger import get_logger
+
+logger = get_logger("Budget")
+
+DEFAULT_TENANT = "-"
+
+
+class _LoopWaiter:
+    """코루틴 대기자 (release 스레드가 아니라 대기자의 이벤트 루프에서 깨움)"""
+
+    def __init__(self, semaphore: "FairSemaphore") -> None:
+        self.semaphore = semaphore
+        self.loop = asyncio.get_running_loop()
+        self.future: "asyncio.Future[None]" = self.loop.create_future()
+
+    def set(self) -> None:
+        self.loop.call_soon_threadsafe(self._grant)
+
+    def _grant(self) -> None:
+        if self.future.cancelled():
+            # 넘겨받기 직전에 대기가 취소됨 → 슬롯을 다음 대기자에게
+            self.semaphore.release()
+        else:
+            self.future.set_result(None)
+
+
+Waiter = Union[threading.Event, _LoopWaiter]
+
+
+class FairSemaphore:
+    """
+    테넌트(블로그)별 라운드 로빈 세마포어
+
+    release 시 슬롯을 다음 차례 테넌트의 가장 오래된 대기자에게 바로 넘김 (깨어난 스레드끼리 경쟁 없음)
+    """
+
+    def __init__(self, name: str, limit: int) -> None:
+        self.name = name
+        self.limit = limit
+        self._lock = threading.Lock()
+        self._available = limit
+        self._waiters: Dict[str, Deque[Waiter]] = {}
+        self._turns: Deque[str] = deque()
+        self._local = threading.local()
+        self._stats: Dict[str, Dict[str, Any]] = {}
+
+    def acquire(self, tenant: str = DEFAULT_TENANT) -> None:
+        start = time.perf_counter()
+        with self._lock:
+            if self._try_acquire(tenant):
+                return
+            waiter = threading.Event()
+            self._enqueue(tenant, waiter)
+
+        waiter.wait()
+        with self._lock:
+            self._record(tenant, time.perf_counter() - start)
+
+    async def acquire_async(self, tenant: str = DEFAULT_TENANT) -> None:
+        """acquire의 코루틴 버전 (스레드 대기자와 같은 대기열에서 순서를 받음)"""
+        start = time.perf_counter()
+        with self._lock:
+            if self._try_acquire(tenant):
+                return
+            waiter = _LoopWaiter(self)
+            self._enqueue(tenant, waiter)
+
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            with self._lock:
+                removed = self._dequeue(tenant, waiter)
+            if not removed and waiter.future.done() and not waiter.future.cancelled():
+                # 슬롯을 넘겨받은 뒤 취소됨 (넘겨받기 전 취소는 _grant가 반납)
+                self.release()
+            raise
+        with self._lock:
+            self._record(tenant, time.perf_counter() - start)
+
+    def _try_acquire(self, tenant: str) -> bool:
+        if self._available > 0 and not self._turns:
+            self._available -= 1
+            self._record(tenant, 0.0)
+            return True
+        return False
+
+    def _enqueue(self, tenant: str, waiter: Waiter) -> None:
+        queue = self._waiters.setdefault(tenant, deque())
+        if not queue:
+            self._turns.append(tenant)
+        queue.append(waiter)
+
+    def _dequeue(self, tenant: str, waiter: Waiter) -> bool:
+        """아직 슬롯을 못 받은 대기자를 대기열에서 뺌 (이미 넘겨받았으면 False)"""
+        queue = self._waiters.get(tenant)
+        if not queue or waiter not in queue:
+            return False
+        queue.remove(waiter)
+        if not queue:
+            del self._waiters[tenant]
+            self._turns.remove(tenant)
+        return True
+
+    def release(self) -> None:
+        with self._lock:
+            if not self._turns:
+                self._available += 1
+                return
+            tenant = self._turns.popleft()
+            queue = self._waiters[tenant]
+            waiter = queue.popleft()
+            if queue:
+                self._turns.append(tenant)
+            else:
+                del self._waiters[tenant]
+            waiter.set()
+
+    def _record(self, tenant: str, wait_s: float) -> None:
+        row = self._stats.setdefault(tenant, {"acquired": 0, "wait_s": 0.0, "max_wait_s": 0.0})
+        row["acquired"] += 1
+        row["wait_s"] += wait_s
+        row["max_wait_s"] = max(row["max_wait_s"], wait_s)
+
+    @contextmanager
+    def slot(self, tenant: Optional[str] = None) -> Iterator[None]:
+        """슬롯 하나 점유 (tenant 생략 시 현재 run_context의 blog, 한도 0이면 통과)"""
+        if self.limit <= 0 or getattr(self._local, "held", 0):
+            yield
+            return
+
+        if tenant is None:
+            from utils.run_context import current_context
+            tenant = current_context().get("blog") or DEFAULT_TENANT
+
+        self.acquire(tenant)
+        self._local.held = 1
+        try:
+            yield
+        finally:
+            self._local.held = 0
+            self.release()
+
+    @asynccontextmanager
+    async def aslot(self, tenant: Optional[str] = None) -> AsyncIterator[None]:
+        """slot의 코루틴 버전 (코루틴은 스레드를 공유하므로 중첩 통과 없이 매번 획득)"""
+        if self.limit <= 0:
+            yield
+            return
+
+        if tenant is None:
+            from utils.run_context import current_context
+            tenant = current_context().get("blog") or DEFAULT_TENANT
+
+        await self.acquire_async(tenant)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """테넌트별 {acquired, wait_s, max_wait_s}"""
+        with self._lock:
+            return {tenant: dict(row) for tenant, row in self._stats.items()}
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+def _limit_from_env(kind: str) -> int:
+    if kind == "llm":
+        return int(os.getenv("BLOG_LLM_CONCURRENCY", "8"))
+    if kind == "http":
+        return int(os.getenv("BLOG_HTTP_CONCURRENCY", os.getenv("HTTP_POOL_SIZE", "16")))
+    raise ValueError(f"알 수 없는 예산 종류: {kind}")
+
+
+_budgets: Dict[str, FairSemaphore] = {}
+_budgets_lock = threading.Lock()
+
+
+def get_budget(kind: str) -> FairSemaphore:
+    """프로세스 공용 한도 ("llm" / "http")"""
+    with _budgets_lock:
+        if kind not in _budgets:
+            _budgets[kind] = FairSemaphore(kind, _limit_from_env(kind))
+        return _budgets[kind]
+
+
+def reset_budgets() -> None:
+    """한도 초기화 (환경 변수 변경 후 / 테스트용)"""
+    with _budgets_lock:
+        _budgets.clear()
+
+
+def budget_stats() -> Dict[str, Tuple[int, Dict[str, Dict[str, Any]]]]:
+    """종류별 (한도, 테넌트별 집계)"""
+    with _budgets_lock:
+        budgets: List[FairSemaphore] = list(_budgets.values())
+    return {budget.name: (budget.limit, budget.stats()) for budget in budgets}
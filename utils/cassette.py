@@ -0,0 +1,278 @@
+# utils/cassette.py
+"""
+HTTP 녹화/재생 (cassette)
+- record: 실제 API 요청/응답 쌍을 원래 지연 시간과 함께 gzip JSONL 카세트에 기록
+- replay: 네트워크 없이 카세트에서 응답 (선택적으로 녹화된 지연 재현)
+- LLM 클라이언트(httpx transport)와 네이버 API/크롤러(requests adapter) 모두 같은 카세트 사용
+
+환경 변수:
+- BLOG_CASSETTE_MODE: off(기본) / record / replay
+- BLOG_CASSETTE_PATH: 카세트 파일 (기본 outputs/cassettes/default.jsonl.gz)
+- BLOG_CASSETTE_LATENCY: replay 시 녹화 지연 배율 (기본 0 = 지연 없음, 1 = 원래 속도)
+
+사용 예:
+  BLOG_CASSETTE_MODE=record python initial_pipeline.py     # 1회 실제 호출로 녹화
+  BLOG_CASSETTE_MODE=replay python initial_pipeline.py     # 이후 오프라인 재현
+"""
+
+import base64
+import gzip
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+try:  # openai/anthropic SDK 최신 버전은 httpx 대신 httpx2 패키지를 사용 (http_client 타입이 일치해야 함)
+    import httpx2 as httpx
+except ImportError:
+    import httpx
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from utils.hashing import canonical_hash
+from utils.logger import get_logger
+
+logger = get_logger("Cassette")
+
+DEFAULT_CASSETTE_PATH = "outputs/cassettes/default.jsonl.gz"
+CASSETTE_MODES = ("off", "record", "replay")
+
+# 녹화 시 보존할 응답 헤더 (인증/쿠키 등은 저장하지 않음)
+_KEPT_HEADERS = ("content-type", "x-request-id")
+
+
+def cassette_mode() -> str:
+    mode = os.getenv("BLOG_CASSETTE_MODE", "off").lower()
+    if mode not in CASSETTE_MODES:
+        raise ValueError(f"BLOG_CASSETTE_MODE는 {CASSETTE_MODES} 중 하나여야 합니다: {mode}")
+    return mode
+
+
+def request_fingerprint(method: str, url: str, body: Optional[bytes]) -> str:
+    """
+    요청 식별 키 (메서드 + URL + 본문)
+    JSON 본문은 키 순서와 무관하게 정규화, 헤더(인증키)는 제외
+    """
+    payload: Any = None
+    if body:
+        try:
+            payload = json.loads(body)
+        except (ValueError, UnicodeDecodeError):
+            payload = base64.b64encode(body).decode("ascii")
+    return canonical_hash({"method": method.upper(), "url": url, "body": payload})
+
+
+class Cassette:
+    """
+    요청 키 → 응답 목록 저장소 (스레드 안전)
+    같은 키의 요청이 여러 번이면 녹화 순서대로 재생하고, 다 쓰면 마지막 응답을 반복
+    """
+
+    def __init__(self, path: str, mode: str = "replay", latency_scale: float = 0.0) -> None:
+        self.path = path
+        self.mode = mode
+        self.latency_scale = latency_scale
+        self._entries: Dict[str, List[Dict[str, Any]]] = {}
+        self._cursor: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.recorded = 0
+
+        if mode == "replay":
+            self._load()
+
+    def _load(self) -> None:
+        if not os.path.exists(self.path):
+            logger.warning(f"⚠️ 카세트 파일 없음: {self.path} (모든 요청이 miss 처리됩니다)")
+            return
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                entry = json.loads(line)
+                self._entries.setdefault(entry["key"], []).append(entry)
+        count = sum(len(v) for v in self._entries.values())
+        logger.info(f"📼 카세트 로드: {self.path} ({count}건)")
+
+    def lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entries = self._entries.get(key)
+            if not entries:
+                self.misses += 1
+                return None
+            index = self._cursor.get(key, 0)
+            self._cursor[key] = index + 1
+            self.hits += 1
+            return entries[min(index, len(entries) - 1)]
+
+    def record(
+        self,
+        key: str,
+        method: str,
+        url: str,
+        status: int,
+        headers: Dict[str, str],
+        body: bytes,
+        latency_s: float
+    ) -> None:
+        entry = {
+            "key": key,
+            "method": method.upper(),
+            "url": url,
+            "status": status,
+            "headers": {k: v for k, v in headers.items() if k.lower() in _KEPT_HEADERS},
+            "body_b64": base64.b64encode(body).decode("ascii"),
+            "latency_s": round(latency_s, 4),
+            "recorded_at": time.time(),
+        }
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        with self._lock:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            # gzip 멤버를 이어붙이는 방식이라 append가 안전 (gzip.open으로 전체를 연속 읽기 가능)
+            with gzip.open(self.path, "at", encoding="utf-8") as f:
+                f.write(line)
+            self.recorded += 1
+
+    def replay_delay(self, entry: Dict[str, Any]) -> None:
+        if self.latency_scale > 0:
+            time.sleep(entry.get("latency_s", 0.0) * self.latency_scale)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "path": self.path,
+            "hits": self.hits,
+            "misses": self.misses,
+            "recorded": self.recorded,
+        }
+
+
+def _miss_body(key: str, url: str) -> bytes:
+    message = f"cassette miss: {url} ({key[:12]})"
+    return json.dumps({"error": {"message": message, "type": "cassette_miss"}}).encode("utf-8")
+
+
+# ---------------------------------------------------------------------------
+# httpx (OpenAI / Anthropic SDK)
+# ---------------------------------------------------------------------------
+
+class CassetteTransport(httpx.BaseTransport):
+    """httpx 전송 계층 래퍼 (SDK 클라이언트의 http_client에 장착)"""
+
+    def __init__(self, cassette: Cassette, inner: Optional[httpx.BaseTransport] = None) -> None:
+        self.cassette = cassette
+        self.inner = inner or httpx.HTTPTransport()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        body = request.read()
+        url = str(request.url)
+        key = request_fingerprint(request.method, url, body)
+
+        if self.cassette.mode == "replay":
+            entry = self.cassette.lookup(key)
+            if entry is None:
+                logger.warning(f"📼 카세트 miss: {request.method} {url}")
+                return httpx.Response(404, content=_miss_body(key, url), request=request)
+            self.cassette.replay_delay(entry)
+            return httpx.Response(
+                entry["status"],
+                headers=entry.get("headers", {}),
+                content=base64.b64decode(entry["body_b64"]),
+                request=request,
+            )
+
+        start = time.perf_counter()
+        response = self.inner.handle_request(request)
+        content = response.read()  # 스트리밍 응답도 전부 읽어 기록 (SDK는 본문에서 SSE를 다시 파싱)
+        latency = time.perf_counter() - start
+        response.close()
+
+        self.cassette.record(key, request.method, url, response.status_code, dict(response.headers), content, latency)
+        headers = {k: v for k, v in response.headers.items() if k.lower() not in ("content-encoding", "content-length", "transfer-encoding")}
+        return httpx.Response(response.status_code, headers=headers, content=content, request=request)
+
+    def close(self) -> None:
+        self.inner.close()
+
+
+# ---------------------------------------------------------------------------
+# requests (네이버 API / 블로그 크롤링)
+# ---------------------------------------------------------------------------
+
+class CassetteAdapter(HTTPAdapter):
+    """requests 어댑터 래퍼 (공유 Session에 장착)"""
+
+    def __init__(self, cassette: Cassette, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.cassette = cassette
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:  # type: ignore[override]
+        body = request.body.encode("utf-8") if isinstance(request.body, str) else request.body
+        url = request.url or ""
+        key = request_fingerprint(request.method or "GET", url, body)
+
+        if self.cassette.mode == "replay":
+            entry = self.cassette.lookup(key)
+            if entry is None:
+                logger.warning(f"📼 카세트 miss: {request.method} {url}")
+                return self._build(request, 404, {"content-type": "application/json"}, _miss_body(key, url))
+            self.cassette.replay_delay(entry)
+            return self._build(request, entry["status"], entry.get("headers", {}), base64.b64decode(entry["body_b64"]))
+
+        start = time.perf_counter()
+        response = super().send(request, **kwargs)
+        content = response.content
+        latency = time.perf_counter() - start
+        self.cassette.record(key, request.method or "GET", url, response.status_code, dict(response.headers), content, latency)
+        return response
+
+    @staticmethod
+    def _build(request: requests.PreparedRequest, status: int, headers: Dict[str, str], content: bytes) -> requests.Response:
+        response = requests.Response()
+        response.status_code = status
+        response.headers = requests.structures.CaseInsensitiveDict(headers)
+        response._content = content
+        response.url = request.url or ""
+        response.request = request
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers) or "utf-8"
+        return response
+
+
+# ---------------------------------------------------------------------------
+# 프로세스 공용 카세트
+# ---------------------------------------------------------------------------
+
+_cassette: Optional[Cassette] = None
+_cassette_key: Optional[Tuple[str, str, float]] = None
+_cassette_lock = threading.Lock()
+
+
+def get_cassette() -> Optional[Cassette]:
+    """환경 변수 설정에 맞는 공용 카세트 (off면 None)"""
+    global _cassette, _cassette_key
+    mode = cassette_mode()
+    if mode == "off":
+        return None
+
+    path = os.getenv("BLOG_CASSETTE_PATH", DEFAULT_CASSETTE_PATH)
+    latency_scale = float(os.getenv("BLOG_CASSETTE_LATENCY", "0"))
+    key = (mode, path, latency_scale)
+
+    with _cassette_lock:
+        if _cassette is None or _cassette_key != key:
+            _cassette = Cassette(path, mode=mode, latency_scale=latency_scale)
+            _cassette_key = key
+            logger.info(f"📼 카세트 {mode} 모드: {path}")
+        return _cassette
+
+
+def httpx_transport(inner: httpx.BaseTransport) -> httpx.BaseTransport:
+    """LLM 클라이언트용 transport (카세트 off면 inner 그대로)"""
+    cassette = get_cassette()
+    return CassetteTransport(cassette, inner) if cassette else inner
@@ -0,0 +1,149 @@
+# utils/checkpoint.py
+"""
+노드 단위 체크포인트 (SQLite)
+
+- 그래프 노드의 출력(부분 상태)을 (파이프라인, 노드, 노드 입력 해시)로 저장
+- 같은 입력으로 다시 실행하면 완료된 노드는 저장된 출력으로 건너뛰고 첫 미완료 노드부터 실행
+  (앞 노드 출력이 같으면 다음 노드 입력 해시도 같으므로 실패 지점까지 연쇄적으로 복원됨)
+- 어느 실행(run_id)이 만든 출력인지 함께 기록
+- 노드가 mark_uncacheable()로 표시한 출력(기본값 대체 등)은 저장하지 않아 다음 실행에서 다시 시도
+- WAL 모드 + 잠금으로 병렬 분기/여러 프로세스에서 동시에 써도 안전
+
+환경 변수:
+- BLOG_CHECKPOINT: "0"이면 사용 안 함
+- BLOG_CHECKPOINT_DB: DB 경로 (기본 outputs/checkpoints.sqlite)
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from functools import wraps
+from typing import Any, Dict, Optional, Tuple
+
+from utils.graph import NodeFn
+from utils.hashing import canonical_hash
+from utils.logger import get_logger
+from utils.memo import collect_uncacheable
+from utils.run_context import get_run_id
+
+logger = get_logger("Checkpoint")
+
+DEFAULT_CHECKPOINT_DB = "outputs/checkpoints.sqlite"
+
+# 입력 해시에서 제외할 상태 키 (실행마다 달라지는 측정값)
+_VOLATILE_KEYS = ("timings",)
+
+
+class CheckpointStore:
+    """노드 출력 저장소"""
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        self.path = path or os.getenv("BLOG_CHECKPOINT_DB", DEFAULT_CHECKPOINT_DB)
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS node_checkpoints (
+                pipeline   TEXT NOT NULL,
+                node       TEXT NOT NULL,
+                input_hash TEXT NOT NULL,
+                run_id     TEXT,
+                output     TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                PRIMARY KEY (pipeline, node, input_hash)
+            )
+            """
+        )
+        self._conn.commit()
+
+    def get(self, pipeline: str, node: str, input_hash: str) -> Optional[Tuple[Dict[str, Any], Optional[str]]]:
+        """저장된 (출력, run_id) - 없으면 None"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT output, run_id FROM node_checkpoints WHERE pipeline = ? AND node = ? AND input_hash = ?",
+                (pipeline, node, input_hash),
+            ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0]), row[1]
+
+    def put(self, pipeline: str, node: str, input_hash: str, output: Dict[str, Any], run_id: Optional[str]) -> None:
+        payload = json.dumps(output, ensure_ascii=False, default=str)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO node_checkpoints VALUES (?, ?, ?, ?, ?, ?)",
+                (pipeline, node, input_hash, run_id, payload, time.time()),
+            )
+            self._conn.commit()
+
+    def clear(self, pipeline: Optional[str] = None) -> int:
+        """체크포인트 삭제 (pipeline 지정 시 해당 파이프라인만), 삭제 건수 반환"""
+        with self._lock:
+            if pipeline is None:
+                cursor = self._conn.execute("DELETE FROM node_checkpoints")
+            else:
+                cursor = self._conn.execute("DELETE FROM node_checkpoints WHERE pipeline = ?", (pipeline,))
+            self._conn.commit()
+            return cursor.rowcount
+
+
+_store: Optional[CheckpointStore] = None
+_store_lock = threading.Lock()
+
+
+def get_checkpoint_store() -> CheckpointStore:
+    """프로세스 공용 체크포인트 저장소"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = CheckpointStore()
+        return _store
+
+
+def input_hash(state: Dict[str, Any]) -> str:
+    """노드 입력(상태) 해시 - 측정값 키 제외"""
+    return canonical_hash({key: value for key, value in state.items() if key not in _VOLATILE_KEYS})
+
+
+def checkpointed_node(pipeline: str, name: str, fn: NodeFn, resume: bool = True) -> NodeFn:
+    """
+    노드 함수 래핑 - 같은 입력의 완료 기록이 있으면 건너뛰고, 없으면 실행 후 출력 저장
+
+    Args:
+        pipeline: 파이프라인 이름 (같은 노드 이름을 쓰는 그래프끼리 구분)
+        name: 노드 이름
+        fn: 부분 상태를 돌려주는 노드 함수
+        resume: False면 저장된 출력을 쓰지 않고 다시 실행 (저장은 함)
+    """
+    if os.getenv("BLOG_CHECKPOINT", "1") == "0":
+        return fn
+
+    @wraps(fn)
+    def run(state: Dict[str, Any]) -> Dict[str, Any]:
+        store = get_checkpoint_store()
+        key = input_hash(state)
+        if resume:
+            saved = store.get(pipeline, name, key)
+            if saved is not None:
+                output, saved_run_id = saved
+                print(f"♻️  {name}: 체크포인트에서 복원 (run {saved_run_id})")
+                logger.info(f"♻️ {pipeline}.{name} 체크포인트 복원 (run {saved_run_id}, 입력 {key[:12]})")
+                return output
+
+        with collect_uncacheable() as reasons:
+            output = dict(fn(state) or {})
+        if reasons:
+            # 기본값 대체 등 (utils.memo.mark_uncacheable) - 다음 실행에서 다시 시도
+            logger.info(f"⏭️ {pipeline}.{name} 체크포인트 저장 안 함: {', '.join(reasons)}")
+        else:
+            store.put(pipeline, name, key, output, get_run_id())
+        return output
+
+    return run
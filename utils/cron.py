@@ -0,0 +1,126 @@
+# utils/cron.py
+"""
+cron 표현식 (분 시 일 월 요일, 로컬 시각)
+
+- 필드: *, 숫자, 범위(1-5), 간격(*/15, 9-18/3), 목록(1,15,30)
+- 요일: 0~6 (0 = 일요일, 7도 일요일), 월/요일 영문 약어(jan, mon 등) 허용
+- 일과 요일을 둘 다 지정하면 둘 중 하나만 맞아도 실행 (표준 cron과 동일)
+- 별칭: @hourly, @daily, @weekly, @monthly
+
+사용 예:
+    cron = CronExpr("30 9 * * 1-5")           # 평일 09:30
+    cron.next_after(datetime.now())
+    cron.between(last_run, now)               # 놓친 실행 시각 목록
+"""
+
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Set
+
+ALIASES: Dict[str, str] = {
+    "@hourly": "0 * * * *",
+    "@daily": "0 0 * * *",
+    "@weekly": "0 0 * * 0",
+    "@monthly": "0 0 1 * *",
+}
+
+_MONTH_NAMES = {name: i for i, name in enumerate(
+    ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"], 1
+)}
+_DOW_NAMES = {name: i for i, name in enumerate(["sun", "mon", "tue", "wed", "thu", "fri", "sat"])}
+
+# 다음 실행 시각을 찾을 최대 범위 (2월 30일처럼 영원히 안 오는 표현식 방지)
+_SEARCH_LIMIT = timedelta(days=366 * 5)
+
+
+class CronError(ValueError):
+    """잘못된 cron 표현식"""
+
+
+def _parse_value(text: str, names: Dict[str, int]) -> int:
+    lowered = text.lower()
+    if lowered in names:
+        return names[lowered]
+    try:
+        return int(text)
+    except ValueError:
+        raise CronError(f"숫자가 아닙니다: {text}") from None
+
+
+def _parse_field(text: str, low: int, high: int, names: Optional[Dict[str, int]] = None) -> Set[int]:
+    values: Set[int] = set()
+    for part in text.split(","):
+        step = 1
+        if "/" in part:
+            part, step_text = part.split("/", 1)
+            step = int(step_text)
+            if step <= 0:
+                raise CronError(f"간격은 1 이상이어야 합니다: {text}")
+        if part == "*":
+            start, end = low, high
+        elif "-" in part:
+            start_text, end_text = part.split("-", 1)
+            start, end = _parse_value(start_text, names or {}), _parse_value(end_text, names or {})
+        else:
+            start = _parse_value(part, names or {})
+            end = high if step > 1 else start
+        if not (low <= start <= high and low <= end <= high and start <= end):
+            raise CronError(f"범위를 벗어났습니다 ({low}~{high}): {text}")
+        values.update(range(start, end + 1, step))
+    return values
+
+
+class CronExpr:
+    """5필드 cron 표현식"""
+
+    def __init__(self, expr: str) -> None:
+        self.expr = expr.strip()
+        fields = ALIASES.get(self.expr.lower(), self.expr).split()
+        if len(fields) != 5:
+            raise CronError(f"cron 필드는 5개여야 합니다 (분 시 일 월 요일): {expr}")
+        minute, hour, day, month, dow = fields
+        self.minutes = _parse_field(minute, 0, 59)
+        self.hours = _parse_field(hour, 0, 23)
+        self.days = _parse_field(day, 1, 31)
+        self.months = _parse_field(month, 1, 12, _MONTH_NAMES)
+        # cron 요일(0=일)을 datetime.weekday()(0=월) 기준으로 변환, 7도 일요일
+        self.weekdays = {(value - 1) % 7 for value in _parse_field(dow, 0, 7, _DOW_NAMES)}
+        self._day_any = day == "*"
+        self._dow_any = dow == "*"
+
+    def __repr__(self) -> str:
+        return f"CronExpr({self.expr!r})"
+
+    def _day_matches(self, t: datetime) -> bool:
+        in_days = t.day in self.days
+        in_weekdays = t.weekday() in self.weekdays
+        if self._day_any or self._dow_any:
+            return in_days and in_weekdays
+        return in_days or in_weekdays
+
+    def next_after(self, after: datetime) -> datetime:
+        """after 이후(초과) 첫 실행 시각 (분 단위)"""
+        t = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = t + _SEARCH_LIMIT
+        while t < limit:
+            if t.month not in self.months:
+                t = (t.replace(day=1, hour=0, minute=0) + timedelta(days=32)).replace(day=1)
+            elif not self._day_matches(t):
+                t = t.replace(hour=0, minute=0) + timedelta(days=1)
+            elif t.hour not in self.hours:
+                t = t.replace(minute=0) + timedelta(hours=1)
+            elif t.minute not in self.minutes:
+                t += timedelta(minutes=1)
+            else:
+                return t
+        raise CronError(f"실행 시각이 오지 않는 표현식입니다: {self.expr}")
+
+    def between(self, after: datetime, until: datetime, limit: Optional[int] = None) -> List[datetime]:
+        """after 초과 ~ until 이하의 실행 시각 (limit 지정 시 가장 최근 limit개)"""
+        times: List[datetime] = []
+        t = self.next_after(after)
+        while t <= until:
+            times.append(t)
+            if limit is not None and len(times) > limit:
+                times.pop(0)
+            t = self.next_after(t)
+        return times
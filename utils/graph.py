@@ -0,0 +1,72 @@
+# utils/graph.py
+"""
+LangGraph StateGraph 공용 도구
+
+- merge_timings: 병렬 분기가 같은 스텝에 함께 쓰는 timings 키의 리듀서
+- timed_node: 노드 함수 실행 시간을 timings에 기록 (트레이스 구간 kind="graph"도 함께)
+- state_updates: 상태 전체를 돌려주는 기존 execute(state) 노드를 변경 키만 돌려주도록 변환
+  (병렬 분기가 같은 키를 동시에 쓰면 LangGraph가 InvalidUpdateError를 내므로)
+- format_timings: 노드별 시간 + 순차 실행 합계 대비 실제 벽시계(병렬 절약분) 표
+"""
+
+import time
+from functools import wraps
+from typing import Any, Callable, Dict, Mapping, Optional
+
+from utils.run_context import get_run_id
+from utils.tracing import span
+
+NodeFn = Callable[[Dict[str, Any]], Optional[Dict[str, Any]]]
+
+
+def merge_timings(left: Optional[Dict[str, float]], right: Optional[Dict[str, float]]) -> Dict[str, float]:
+    """노드별 실행 시간 병합 (같은 노드가 다시 돌면 누적)"""
+    merged = dict(left or {})
+    for node, seconds in (right or {}).items():
+        merged[node] = round(merged.get(node, 0.0) + seconds, 4)
+    return merged
+
+
+def timed_node(name: str, fn: NodeFn) -> NodeFn:
+    """노드 함수 래핑 - 반환한 부분 상태에 {"timings": {name: 초}} 추가"""
+
+    @wraps(fn)
+    def run(state: Dict[str, Any]) -> Dict[str, Any]:
+        start = time.perf_counter()
+        with span(name, kind="graph", run_id=get_run_id()):
+            update = dict(fn(state) or {})
+        update["timings"] = {name: round(time.perf_counter() - start, 4)}
+        return update
+
+    return run
+
+
+def state_updates(execute: Callable[[Dict[str, Any]], Dict[str, Any]]) -> NodeFn:
+    """상태를 제자리 수정 후 통째로 돌려주는 execute(state)를 변경/추가된 키만 돌려주는 노드로 변환"""
+
+    @wraps(execute)
+    def run(state: Dict[str, Any]) -> Dict[str, Any]:
+        before = dict(state)
+        after = execute(dict(state))
+        return {
+            key: value for key, value in after.items()
+            if key not in before or (before[key] is not value and before[key] != value)
+        }
+
+    return run
+
+
+def format_timings(timings: Mapping[str, float], wall_s: float) -> str:
+    """노드별 실행 시간표 (실행 순서 유지)"""
+    if not timings:
+        return "⏱️  노드 실행 시간: 기록 없음"
+
+    sequential = sum(timings.values())
+    lines = [f"⏱️  노드 실행 시간 (벽시계 {wall_s:.2f}초)"]
+    for node, seconds in timings.items():
+        share = seconds / wall_s if wall_s else 0.0
+        lines.append(f"   {node:<24}{seconds:>9.2f}초{share:>8.1%}")
+    saved = sequential - wall_s
+    if saved > 0.01:
+        lines.append(f"   순차 실행 합계 {sequential:.2f}초 → 병렬 분기로 {saved:.2f}초 절약")
+    return "\n".join(lines)
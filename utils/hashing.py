@@ -0,0 +1,20 @@
+# utils/hashing.py
+"""
+정규화(canonical) 해시
+- dict 키 순서와 무관하게 같은 입력이면 같은 해시
+- LLM 요청 키, 노드 입력 해시 등에 공통 사용
+"""
+
+import hashlib
+import json
+from typing import Any
+
+
+def canonical_json(obj: Any) -> str:
+    """키 정렬 + 공백 제거된 JSON 문자열 (직렬화 불가 값은 str 처리)"""
+    return json.dumps(obj, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+def canonical_hash(obj: Any) -> str:
+    """정규화 JSON의 SHA-256 hex digest"""
+    return hashlib.sha256(canonical_json(obj).encode("utf-8")).hexdigest()
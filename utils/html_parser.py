@@ -1,7 +1,7 @@
 # utils/html_parser.py
-import requests
 from bs4 import BeautifulSoup
 from typing import Dict, Any, List
+from utils.http_client import get_http_session
 from utils.logger import get_logger
 
 logger = get_logger("HTMLParser")
@@ -12,7 +12,7 @@ class HTMLParser:
 
     def fetch(self, url: str) -> str:
         try:
-            res = requests.get(url, timeout=7)
+            res = get_http_session().get(url, timeout=7)
             res.raise_for_status()
             return res.text
         except Exception as e:
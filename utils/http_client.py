@@ -0,0 +1,65 @@
+# utils/http_client.py
+"""
+공유 HTTP 세션 (requests)
+- 네이버 검색/데이터랩 API, 블로그 크롤링이 같은 커넥션 풀을 재사용
+- 카세트 모드(BLOG_CASSETTE_MODE)면 녹화/재생 어댑터를 장착
+- 요청마다 트레이스 구간(kind="http") 기록
+- 전역 HTTP 동시 요청 한도(utils.budget, 블로그 간 공정 분배) 안에서 요청
+"""
+
+import os
+import threading
+from typing import Any, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from utils.budget import get_budget
+from utils.cassette import CassetteAdapter, get_cassette
+from utils.run_context import get_run_id
+from utils.tracing import span
+
+
+class TracedSession(requests.Session):
+    """요청 단위 트레이스 구간을 남기는 Session (구간 이름은 메서드 + 호스트, 전역 HTTP 한도 슬롯 안에서)"""
+
+    def request(self, method: str, url: str, *args: Any, **kwargs: Any) -> requests.Response:  # type: ignore[override]
+        parsed = urlparse(url)
+        with get_budget("http").slot(), span(f"http {method.upper()} {parsed.netloc}", kind="http", run_id=get_run_id(), path=parsed.path) as traced:
+            response = super().request(method, url, *args, **kwargs)
+            if traced:
+                traced.set(status=response.status_code, bytes=response.headers.get("Content-Length"))
+            return response
+
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def get_http_session() -> requests.Session:
+    """프로세스 공용 requests.Session"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            pool_size = int(os.getenv("HTTP_POOL_SIZE", "16"))
+            cassette = get_cassette()
+            if cassette is not None:
+                adapter: HTTPAdapter = CassetteAdapter(cassette, pool_connections=pool_size, pool_maxsize=pool_size)
+            else:
+                adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+
+            session = TracedSession()
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _session = session
+        return _session
+
+
+def reset_http_session() -> None:
+    """세션 초기화 (테스트/카세트 모드 변경용)"""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+        _session = None
@@ -0,0 +1,400 @@
+# utils/job_queue.py
+"""
+영속 작업 큐 (SQLite WAL)
+
+- 작업 하나 = (블로그, Day, 단계), 같은 조합은 한 번만 등록 (force로 다시 등록)
+- 우선순위가 높은 작업부터, 같으면 먼저 등록한 순서로 임대(lease)
+- 임대에는 만료 시각이 있고 작업자는 처리 중 하트비트로 연장, 작업자가 죽어 만료되면 다음 임대 때 다시 대기열로
+- 임대마다 새 토큰을 발급해, 만료 후 다른 작업자가 가져간 작업의 결과를 이전 작업자가 덮어쓰지 못함
+- 실패 시 작업자가 정한 지연 후 재시도, 시도 횟수를 다 쓰거나 재시도 불가 오류면 dead_jobs 테이블로 이동
+- 여러 프로세스(worker.py --processes N)가 같은 DB를 공유
+
+주의: SQLite WAL은 같은 호스트의 프로세스끼리만 안전 (네트워크 파일시스템 공유는 잠금이 보장되지 않음)
+
+환경 변수:
+- BLOG_QUEUE_DB: DB 경로 (기본 outputs/job_queue.sqlite)
+- BLOG_QUEUE_MAX_ATTEMPTS: 작업당 기본 최대 시도 횟수 (기본 3)
+
+CLI:
+    python -m utils.job_queue enqueue --blog woncamp --days 1-7 --stage write --priority 5
+    python -m utils.job_queue status
+    python -m utils.job_queue dead
+    python -m utils.job_queue requeue-dead [--id 3]
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+
+from utils.logger import get_logger
+
+logger = get_logger("JobQueue")
+
+DEFAULT_QUEUE_DB = "outputs/job_queue.sqlite"
+
+QUEUED = "queued"
+LEASED = "leased"
+DONE = "done"
+
+
+class PermanentJobError(Exception):
+    """재시도해도 성공할 수 없는 작업 오류 (바로 dead_jobs로 이동)"""
+
+
+@dataclass
+class RetryPolicy:
+    """실패 후 재시도 간격 (지수 백오프)"""
+    base_delay_s: float = 30.0
+    max_delay_s: float = 600.0
+    backoff: float = 2.0
+
+    def delay_s(self, attempt: int) -> float:
+        """attempt번째 시도가 실패한 뒤 기다릴 시간"""
+        return min(self.max_delay_s, self.base_delay_s * self.backoff ** max(attempt - 1, 0))
+
+
+@dataclass
+class Job:
+    id: int
+    blog: str
+    day: int
+    stage: str
+    priority: int
+    attempts: int
+    max_attempts: int
+    lease_token: str
+    payload: Dict[str, Any] = field(default_factory=dict)
+
+
+class JobQueue:
+    """SQLite 작업 큐 (프로세스마다 인스턴스 하나)"""
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        self.path = path or os.getenv("BLOG_QUEUE_DB", DEFAULT_QUEUE_DB)
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        # 트랜잭션은 BEGIN IMMEDIATE로 직접 관리 (임대는 읽고 쓰는 사이에 다른 프로세스가 끼면 안 됨)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                id            INTEGER PRIMARY KEY AUTOINCREMENT,
+                blog          TEXT NOT NULL,
+                day           INTEGER NOT NULL,
+                stage         TEXT NOT NULL,
+                priority      INTEGER NOT NULL DEFAULT 0,
+                status        TEXT NOT NULL,
+                attempts      INTEGER NOT NULL DEFAULT 0,
+                max_attempts  INTEGER NOT NULL,
+                payload       TEXT NOT NULL DEFAULT '{}',
+                result        TEXT,
+                last_error    TEXT,
+                available_at  REAL NOT NULL,
+                lease_owner   TEXT,
+                lease_token   TEXT,
+                lease_expires REAL,
+                created_at    REAL NOT NULL,
+                updated_at    REAL NOT NULL,
+                UNIQUE (blog, day, stage)
+            );
+            CREATE INDEX IF NOT EXISTS jobs_ready ON jobs (status, priority DESC, available_at, id);
+            CREATE TABLE IF NOT EXISTS dead_jobs (
+                id           INTEGER PRIMARY KEY,
+                blog         TEXT NOT NULL,
+                day          INTEGER NOT NULL,
+                stage        TEXT NOT NULL,
+                priority     INTEGER NOT NULL,
+                attempts     INTEGER NOT NULL,
+                max_attempts INTEGER NOT NULL,
+                payload      TEXT NOT NULL,
+                last_error   TEXT,
+                failed_at    REAL NOT NULL
+            );
+            """
+        )
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            else:
+                self._conn.execute("COMMIT")
+
+    def enqueue(
+        self,
+        blog: str,
+        day: int,
+        stage: str,
+        priority: int = 0,
+        payload: Optional[Dict[str, Any]] = None,
+        max_attempts: Optional[int] = None,
+        force: bool = False
+    ) -> int:
+        """
+        작업 등록 (이미 있으면 기존 id 반환)
+
+        Args:
+            force: 완료/대기 중인 같은 작업을 처음 상태로 되돌려 다시 실행 (임대 중이면 그대로 둠)
+        """
+        now = time.time()
+        attempts = max_attempts or int(os.getenv("BLOG_QUEUE_MAX_ATTEMPTS", "3"))
+        body = json.dumps(payload or {}, ensure_ascii=False)
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM dead_jobs WHERE blog = ? AND day = ? AND stage = ?", (blog, day, stage))
+            row = conn.execute(
+                "SELECT id, status FROM jobs WHERE blog = ? AND day = ? AND stage = ?", (blog, day, stage)
+            ).fetchone()
+            if row is not None:
+                if force and row["status"] != LEASED:
+                    conn.execute(
+                        """
+                        UPDATE jobs SET status = ?, priority = ?, attempts = 0, max_attempts = ?, payload = ?,
+                            result = NULL, last_error = NULL, available_at = ?, updated_at = ?
+                        WHERE id = ?
+                        """,
+                        (QUEUED, priority, attempts, body, now, now, row["id"]),
+                    )
+                return int(row["id"])
+            cursor = conn.execute(
+                """
+                INSERT INTO jobs (blog, day, stage, priority, status, max_attempts, payload, available_at, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (blog, day, stage, priority, QUEUED, attempts, body, now, now, now),
+            )
+            return int(cursor.lastrowid)
+
+    def lease(self, worker_id: str, lease_s: float, stages: Optional[List[str]] = None) -> Optional[Job]:
+        """실행 가능한 작업 중 우선순위가 가장 높은 것 하나를 임대 (없으면 None)"""
+        now = time.time()
+        with self._transaction() as conn:
+            self._reap(conn, now)
+            query = "SELECT * FROM jobs WHERE status = ? AND available_at <= ?"
+            params: List[Any] = [QUEUED, now]
+            if stages:
+                query += f" AND stage IN ({', '.join('?' for _ in stages)})"
+                params.extend(stages)
+            row = conn.execute(query + " ORDER BY priority DESC, available_at, id LIMIT 1", params).fetchone()
+            if row is None:
+                return None
+
+            token = uuid.uuid4().hex
+            conn.execute(
+                """
+                UPDATE jobs SET status = ?, attempts = attempts + 1, lease_owner = ?, lease_token = ?,
+                    lease_expires = ?, updated_at = ?
+                WHERE id = ?
+                """,
+                (LEASED, worker_id, token, now + lease_s, now, row["id"]),
+            )
+            return Job(
+                id=row["id"], blog=row["blog"], day=row["day"], stage=row["stage"], priority=row["priority"],
+                attempts=row["attempts"] + 1, max_attempts=row["max_attempts"], lease_token=token,
+                payload=json.loads(row["payload"]),
+            )
+
+    def heartbeat(self, job: Job, lease_s: float) -> bool:
+        """임대 연장 - 이미 만료되어 다른 작업자에게 넘어갔으면 False"""
+        now = time.time()
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET lease_expires = ?, updated_at = ? WHERE id = ? AND status = ? AND lease_token = ?",
+                (now + lease_s, now, job.id, LEASED, job.lease_token),
+            )
+            return cursor.rowcount == 1
+
+    def complete(self, job: Job, result: Optional[Dict[str, Any]] = None) -> bool:
+        """완료 기록 - 임대를 잃은 뒤면 False (결과 무시)"""
+        now = time.time()
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                """
+                UPDATE jobs SET status = ?, result = ?, last_error = NULL, lease_owner = NULL, lease_token = NULL,
+                    lease_expires = NULL, updated_at = ?
+                WHERE id = ? AND status = ? AND lease_token = ?
+                """,
+                (DONE, json.dumps(result or {}, ensure_ascii=False, default=str), now, job.id, LEASED, job.lease_token),
+            )
+            return cursor.rowcount == 1
+
+    def fail(self, job: Job, error: str, retry_delay_s: Optional[float]) -> Optional[str]:
+        """
+        실패 기록
+
+        Args:
+            retry_delay_s: 재시도까지 기다릴 시간 (None이면 재시도 불가 → dead)
+
+        Returns:
+            "retry" / "dead" (임대를 잃은 뒤면 None)
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT * FROM jobs WHERE id = ? AND status = ? AND lease_token = ?", (job.id, LEASED, job.lease_token)
+            ).fetchone()
+            if row is None:
+                return None
+            if retry_delay_s is None or row["attempts"] >= row["max_attempts"]:
+                self._bury(conn, row, error, now)
+                return "dead"
+            conn.execute(
+                """
+                UPDATE jobs SET status = ?, last_error = ?, available_at = ?, lease_owner = NULL, lease_token = NULL,
+                    lease_expires = NULL, updated_at = ?
+                WHERE id = ?
+                """,
+                (QUEUED, error, now + retry_delay_s, now, job.id),
+            )
+            return "retry"
+
+    def _reap(self, conn: sqlite3.Connection, now: float) -> None:
+        """임대가 만료된 작업(작업자 중단)을 대기열로 되돌림 - 시도 횟수를 다 썼으면 dead"""
+        expired = conn.execute(
+            "SELECT * FROM jobs WHERE status = ? AND lease_expires < ?", (LEASED, now)
+        ).fetchall()
+        for row in expired:
+            error = f"임대 만료 (작업자 {row['lease_owner']} 응답 없음)"
+            if row["attempts"] >= row["max_attempts"]:
+                self._bury(conn, row, error, now)
+                logger.warning(f"⚰️ 작업 {row['id']} ({row['blog']} Day {row['day']} {row['stage']}) dead: {error}")
+                continue
+            conn.execute(
+                """
+                UPDATE jobs SET status = ?, last_error = ?, available_at = ?, lease_owner = NULL, lease_token = NULL,
+                    lease_expires = NULL, updated_at = ?
+                WHERE id = ?
+                """,
+                (QUEUED, error, now, now, row["id"]),
+            )
+            logger.warning(f"♻️ 작업 {row['id']} ({row['blog']} Day {row['day']} {row['stage']}) 재대기: {error}")
+
+    def _bury(self, conn: sqlite3.Connection, row: sqlite3.Row, error: str, now: float) -> None:
+        conn.execute(
+            "INSERT OR REPLACE INTO dead_jobs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (row["id"], row["blog"], row["day"], row["stage"], row["priority"], row["attempts"],
+             row["max_attempts"], row["payload"], error, now),
+        )
+        conn.execute("DELETE FROM jobs WHERE id = ?", (row["id"],))
+
+    def requeue_dead(self, job_id: Optional[int] = None) -> int:
+        """dead 작업을 시도 횟수 0으로 다시 대기열에 (job_id 없으면 전체), 옮긴 건수 반환"""
+        now = time.time()
+        with self._transaction() as conn:
+            query = "SELECT * FROM dead_jobs" + (" WHERE id = ?" if job_id is not None else "")
+            rows = conn.execute(query, (job_id,) if job_id is not None else ()).fetchall()
+            for row in rows:
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO jobs (id, blog, day, stage, priority, status, max_attempts, payload,
+                        last_error, available_at, created_at, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (row["id"], row["blog"], row["day"], row["stage"], row["priority"], QUEUED,
+                     row["max_attempts"], row["payload"], row["last_error"], now, now, now),
+                )
+                conn.execute("DELETE FROM dead_jobs WHERE id = ?", (row["id"],))
+            return len(rows)
+
+    def counts(self) -> Dict[str, Dict[str, int]]:
+        """단계별 상태 건수 (dead 포함)"""
+        with self._lock:
+            rows = self._conn.execute("SELECT stage, status, COUNT(*) AS n FROM jobs GROUP BY stage, status").fetchall()
+            dead = self._conn.execute("SELECT stage, COUNT(*) AS n FROM dead_jobs GROUP BY stage").fetchall()
+        counts: Dict[str, Dict[str, int]] = {}
+        for row in rows:
+            counts.setdefault(row["stage"], {})[row["status"]] = row["n"]
+        for row in dead:
+            counts.setdefault(row["stage"], {})["dead"] = row["n"]
+        return counts
+
+    def dead_jobs(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute("SELECT * FROM dead_jobs ORDER BY failed_at").fetchall()
+        return [dict(row) for row in rows]
+
+    def get(self, job_id: int) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return dict(row) if row is not None else None
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def parse_days(spec: str) -> List[int]:
+    """"1-7,10" → [1, 2, ..., 7, 10]"""
+    days: List[int] = []
+    for part in spec.split(","):
+        part = part.strip()
+        if "-" in part:
+            start, end = part.split("-", 1)
+            days.extend(range(int(start), int(end) + 1))
+        elif part:
+            days.append(int(part))
+    return days
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="글 생성 작업 큐 관리")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    enqueue = sub.add_parser("enqueue", help="작업 등록")
+    enqueue.add_argument("--blog", required=True, nargs="+")
+    enqueue.add_argument("--days", required=True, help="예: 1-7,10")
+    enqueue.add_argument("--stage", required=True)
+    enqueue.add_argument("--priority", type=int, default=0)
+    enqueue.add_argument("--max-attempts", type=int)
+    enqueue.add_argument("--payload", default="{}", help="단계 함수에 넘길 JSON (예: plan_file)")
+    enqueue.add_argument("--force", action="store_true", help="완료된 작업도 다시 실행")
+
+    sub.add_parser("status", help="단계별 상태 건수")
+    sub.add_parser("dead", help="dead 작업 목록")
+    requeue = sub.add_parser("requeue-dead", help="dead 작업 다시 대기열로")
+    requeue.add_argument("--id", type=int)
+
+    args = parser.parse_args(argv)
+    queue = JobQueue()
+
+    if args.command == "enqueue":
+        payload = json.loads(args.payload)
+        ids = [
+            queue.enqueue(blog, day, args.stage, args.priority, payload, args.max_attempts, args.force)
+            for blog in args.blog
+            for day in parse_days(args.days)
+        ]
+        print(f"📥 작업 {len(ids)}건 등록 ({args.stage}, 우선순위 {args.priority}) → {queue.path}")
+    elif args.command == "status":
+        counts = queue.counts()
+        if not counts:
+            print("   (작업 없음)")
+        for stage, row in sorted(counts.items()):
+            text = "  ".join(f"{status} {row.get(status, 0)}" for status in (QUEUED, LEASED, DONE, "dead"))
+            print(f"   {stage:<12}{text}")
+    elif args.command == "dead":
+        for row in queue.dead_jobs():
+            print(f"   #{row['id']} {row['blog']} Day {row['day']} {row['stage']} (시도 {row['attempts']}회): {row['last_error']}")
+    elif args.command == "requeue-dead":
+        print(f"♻️  dead 작업 {queue.requeue_dead(args.id)}건 재등록")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,292 @@
+# utils/json_repair.py
+"""
+부분 JSON 복구 엔진
+LLM 응답이 잘리거나 살짝 깨져도 재생성 없이 최대한 살려서 파싱
+
+복구 단계:
+1. 코드 펜스(```json ... ```) 제거
+2. 앞/뒤 설명 텍스트 제거
+3. 문자열 안의 날것 줄바꿈/제어문자 이스케이프
+4. 닫히지 않은 문자열·괄호 닫기
+5. 그래도 안 되면 마지막 미완성 요소를 버리고 닫기
+6. orjson으로 파싱 (없으면 표준 json)
+"""
+
+import json
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 환경에서도 동작
+    orjson = None
+
+from utils.logger import get_logger
+
+logger = get_logger("JSONRepair")
+
+_FENCE_RE = re.compile(r"```(?:json|JSON)?[ \t]*\n?(.*?)(?:```|$)", re.DOTALL)
+_CONTROL_ESCAPES = {"\n": "\\n", "\r": "\\r", "\t": "\\t"}
+
+
+class JSONRepairError(ValueError):
+    """복구 후에도 JSON 파싱이 불가능한 경우"""
+
+
+@dataclass
+class RepairResult:
+    """복구 결과 (파싱된 데이터 + 적용된 복구 내역)"""
+
+    data: Any
+    repairs: List[str] = field(default_factory=list)
+
+    @property
+    def repaired(self) -> bool:
+        return bool(self.repairs)
+
+
+def _loads(text: str) -> Any:
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _strip_fences(text: str, repairs: List[str]) -> str:
+    if "```" not in text:
+        return text
+    match = _FENCE_RE.search(text)
+    if not match:
+        return text
+    repairs.append("strip_code_fence")
+    return match.group(1)
+
+
+def _escape_control_chars(text: str, repairs: List[str]) -> str:
+    """문자열 리터럴 내부의 날것 제어문자만 이스케이프"""
+    out = []
+    in_str = False
+    esc = False
+    changed = False
+
+    for ch in text:
+        if in_str:
+            if esc:
+                esc = False
+            elif ch == "\\":
+                esc = True
+            elif ch == '"':
+                in_str = False
+            elif ch < " ":
+                out.append(_CONTROL_ESCAPES.get(ch, f"\\u{ord(ch):04x}"))
+                changed = True
+                continue
+        elif ch == '"':
+            in_str = True
+        out.append(ch)
+
+    if changed:
+        repairs.append("escape_control_chars")
+    return "".join(out)
+
+
+def _remove_trailing_commas(text: str, repairs: List[str]) -> str:
+    """문자열 밖의 `,}` / `,]` 패턴 제거"""
+    out: List[str] = []
+    in_str = False
+    esc = False
+    changed = False
+
+    for ch in text:
+        if in_str:
+            if esc:
+                esc = False
+            elif ch == "\\":
+                esc = True
+            elif ch == '"':
+                in_str = False
+        elif ch == '"':
+            in_str = True
+        elif ch in "}]":
+            # 직전의 공백을 건너뛰고 콤마가 있으면 제거
+            idx = len(out) - 1
+            while idx >= 0 and out[idx].isspace():
+                idx -= 1
+            if idx >= 0 and out[idx] == ",":
+                del out[idx]
+                changed = True
+        out.append(ch)
+
+    if changed:
+        repairs.append("remove_trailing_comma")
+    return "".join(out)
+
+
+def _scan(text: str) -> Tuple[int, List[str], bool, List[Tuple[int, Tuple[str, ...]]]]:
+    """
+    JSON 구조 스캔
+
+    Returns:
+        (최상위 값이 끝난 위치 또는 -1, 열린 괄호 스택, 문자열 안에서 끝났는지,
+         안전하게 잘라낼 수 있는 위치 목록 [(위치, 그 시점의 스택)])
+    """
+    stack: List[str] = []
+    in_str = False
+    esc = False
+    safe_points: List[Tuple[int, Tuple[str, ...]]] = []
+
+    for i, ch in enumerate(text):
+        if in_str:
+            if esc:
+                esc = False
+            elif ch == "\\":
+                esc = True
+            elif ch == '"':
+                in_str = False
+            continue
+
+        if ch == '"':
+            in_str = True
+        elif ch in "{[":
+            stack.append(ch)
+            safe_points.append((i + 1, tuple(stack)))
+        elif ch in "}]":
+            if stack:
+                stack.pop()
+            if not stack:
+                return i + 1, stack, False, safe_points
+            safe_points.append((i + 1, tuple(stack)))
+        elif ch == ",":
+            safe_points.append((i, tuple(stack)))
+
+    return -1, stack, in_str, safe_points
+
+
+def _closers(stack: Tuple[str, ...] | List[str]) -> str:
+    return "".join("}" if opener == "{" else "]" for opener in reversed(stack))
+
+
+def _close_in_place(text: str, stack: List[str], in_str: bool) -> str:
+    """잘린 지점 그대로 문자열/괄호를 닫기"""
+    if in_str:
+        text += '"'
+    text = text.rstrip()
+    if text.endswith(","):
+        text = text[:-1]
+    elif text.endswith(":"):
+        text += " null"
+    return text + _closers(stack)
+
+
+def _drop_partial(text: str, safe_points: List[Tuple[int, Tuple[str, ...]]]) -> Optional[str]:
+    """마지막 완성 요소까지만 남기고 닫기"""
+    if not safe_points:
+        return None
+    pos, stack = safe_points[-1]
+    head = text[:pos].rstrip()
+    if head.endswith(","):
+        head = head[:-1]
+    return head + _closers(stack)
+
+
+def repair_json(text: str) -> RepairResult:
+    """
+    LLM 응답 텍스트를 복구하여 파싱
+
+    Args:
+        text: LLM 원본 응답
+
+    Returns:
+        RepairResult (data + repairs)
+
+    Raises:
+        JSONRepairError: 복구 불가
+    """
+    if not text or not text.strip():
+        raise JSONRepairError("빈 응답입니다")
+
+    repairs: List[str] = []
+    body = _strip_fences(text.strip(), repairs)
+
+    # JSON 시작 위치 (앞쪽 설명 텍스트 제거)
+    starts = [i for i in (body.find("{"), body.find("[")) if i != -1]
+    if not starts:
+        raise JSONRepairError("JSON 형식을 찾을 수 없습니다")
+    start = min(starts)
+    if body[:start].strip():
+        repairs.append("strip_leading_text")
+    body = body[start:]
+
+    body = _escape_control_chars(body, repairs)
+
+    end, stack, in_str, safe_points = _scan(body)
+    if end != -1:
+        if body[end:].strip():
+            repairs.append("strip_trailing_text")
+        body = body[:end]
+
+    body = _remove_trailing_commas(body, repairs)
+
+    try:
+        return RepairResult(_loads(body), repairs)
+    except ValueError as first_error:
+        if end != -1:
+            raise JSONRepairError(f"JSON 파싱 실패: {first_error}") from first_error
+
+    # 여기부터는 잘린(truncated) 응답
+    closed = _close_in_place(body, stack, in_str)
+    try:
+        data = _loads(closed)
+        repairs.append("close_string_and_brackets" if in_str else "close_brackets")
+        return RepairResult(data, repairs)
+    except ValueError:
+        pass
+
+    dropped = _drop_partial(body, safe_points)
+    if dropped is not None:
+        try:
+            data = _loads(dropped)
+            repairs.append("drop_partial_element")
+            return RepairResult(data, repairs)
+        except ValueError as e:
+            raise JSONRepairError(f"JSON 복구 실패: {e}") from e
+
+    raise JSONRepairError("JSON 복구 실패: 완성된 요소가 없습니다")
+
+
+def parse_json_object(
+    text: str,
+    source: str = "LLM",
+    debug_file: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    노드 공용 JSON 파서 (복구 포함)
+
+    Args:
+        text: LLM 원본 응답
+        source: 로그에 남길 호출 노드 이름
+        debug_file: 실패 시 원본을 저장할 파일 경로 (선택)
+
+    Returns:
+        파싱된 JSON 객체
+
+    Raises:
+        ValueError: 복구 불가 또는 최상위가 객체가 아닌 경우
+    """
+    try:
+        result = repair_json(text)
+    except JSONRepairError as e:
+        logger.error(f"{source}: {e}")
+        if debug_file:
+            with open(debug_file, "w", encoding="utf-8") as f:
+                f.write(text or "")
+            logger.error(f"{source}: 원본 텍스트를 {debug_file} 파일에 저장했습니다.")
+        raise
+
+    if result.repaired:
+        logger.warning(f"{source}: JSON 복구 적용 - {', '.join(result.repairs)}")
+
+    if not isinstance(result.data, dict):
+        raise JSONRepairError(f"{source}: JSON 객체가 아닙니다 ({type(result.data).__name__})")
+
+    return result.data
@@ -1,50 +1,665 @@
 # utils/llm_client.py
+import asyncio
+import atexit
 import os
+import json
 import logging
-from typing import Dict, Any, Literal
-from openai import OpenAI, OpenAIError
+import contextvars
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Any, Awaitable, Callable, List, Literal, Optional, Tuple, TypeVar
+try:  # openai/anthropic SDK 최신 버전은 httpx 대신 httpx2 패키지를 사용 (http_client 타입이 일치해야 함)
+    import httpx2 as httpx
+except ImportError:
+    import httpx
+from openai import AsyncOpenAI, OpenAI, OpenAIError
 from anthropic import Anthropic, AnthropicError
-from anthropic.types import TextBlock
+from anthropic.types import TextBlock, ToolUseBlock
 from dotenv import load_dotenv
 
 from utils.logger import get_logger
+from utils.budget import get_budget
+from utils.cassette import get_cassette, httpx_transport
+from utils.hashing import canonical_hash
+from utils.metrics import clear_last_call_record, last_call_record, record_coalesced_call, record_llm_call
+from utils.model_router import ModelRouter, get_model_router
+from utils.run_context import current_node, get_run_id, task_scope
+from utils.tracing import span
+from utils.json_repair import JSONRepairError, parse_json_object, repair_json
+from utils.structured_output import (
+    StructuredOutputError,
+    schema_name,
+    to_json_schema,
+    validate_structured,
+)
 
 # .env 파일 로드
 load_dotenv()
 
 logger = get_logger("LLMClient")
 
+T = TypeVar("T")
+
+DEFAULT_GPT_MODEL = "gpt-4o-mini"
+DEFAULT_CLAUDE_MODEL = "claude-3-haiku-20240307"  # Claude 3 Haiku (저렴하고 빠름)
+
+
+class UsageStats:
+    """
+    토큰 사용량 누적 (프롬프트 캐시 적중 포함)
+    - prompt_tokens: 입력 토큰 전체 (캐시 적중분 포함)
+    - cached_tokens: 캐시에서 읽은 입력 토큰 (할인 적용분)
+    - cache_write_tokens: 캐시에 새로 기록한 입력 토큰 (Anthropic 전용)
+    """
+
+    FIELDS = ("calls", "prompt_tokens", "completion_tokens", "cached_tokens", "cache_write_tokens")
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.totals: Dict[str, int] = {name: 0 for name in self.FIELDS}
+        self.last: Dict[str, int] = {}
+
+    def record(self, usage: Dict[str, int]) -> None:
+        with self._lock:
+            self.last = dict(usage)
+            self.totals["calls"] += 1
+            for name in self.FIELDS[1:]:
+                self.totals[name] += usage.get(name, 0)
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self.totals)
+
+    @staticmethod
+    def cache_hit_rate(totals: Dict[str, int]) -> float:
+        """입력 토큰 중 캐시 적중 비율 (0.0 ~ 1.0)"""
+        prompt_tokens = totals.get("prompt_tokens", 0)
+        return totals.get("cached_tokens", 0) / prompt_tokens if prompt_tokens else 0.0
+
+
+def _openai_usage(response: Any) -> Dict[str, int]:
+    """OpenAI 응답의 usage → 공통 형식 (prompt_tokens_details.cached_tokens 포함)"""
+    usage = getattr(response, "usage", None)
+    if usage is None:
+        return {}
+    details = getattr(usage, "prompt_tokens_details", None)
+    return {
+        "prompt_tokens": usage.prompt_tokens or 0,
+        "completion_tokens": usage.completion_tokens or 0,
+        "cached_tokens": (getattr(details, "cached_tokens", 0) or 0) if details else 0,
+    }
+
+
+def _anthropic_usage(response: Any) -> Dict[str, int]:
+    """Anthropic 응답의 usage → 공통 형식 (input_tokens는 캐시 분을 제외한 값)"""
+    usage = getattr(response, "usage", None)
+    if usage is None:
+        return {}
+    cache_read = getattr(usage, "cache_read_input_tokens", 0) or 0
+    cache_write = getattr(usage, "cache_creation_input_tokens", 0) or 0
+    return {
+        "prompt_tokens": (usage.input_tokens or 0) + cache_read + cache_write,
+        "completion_tokens": usage.output_tokens or 0,
+        "cached_tokens": cache_read,
+        "cache_write_tokens": cache_write,
+    }
+
+
+def _is_valid_json(text: str) -> bool:
+    """복구 엔진으로 파싱 가능한 JSON 응답인지"""
+    try:
+        repair_json(text)
+        return True
+    except JSONRepairError:
+        return False
+
+
+def _base_url(provider: str) -> Optional[str]:
+    """
+    API 주소 (로컬 대역 서버 등)
+    provider별 환경 변수(OPENAI_BASE_URL / ANTHROPIC_BASE_URL)가 우선,
+    LLM_BASE_URL 하나로 두 provider를 같은 서버에 연결 (None이면 SDK 기본값)
+    """
+    if provider == "openai":
+        explicit = os.getenv("OPENAI_BASE_URL")
+        suffix = "/v1"  # OpenAI SDK는 base_url에 /v1 포함, Anthropic SDK는 경로에 /v1을 붙임
+    else:
+        explicit = os.getenv("ANTHROPIC_BASE_URL")
+        suffix = ""
+    if explicit:
+        return explicit
+    shared = os.getenv("LLM_BASE_URL")
+    return shared.rstrip("/") + suffix if shared else None
+
+
+def _streaming_enabled() -> bool:
+    """스트리밍 호출 여부 (첫 토큰까지 시간 측정용, LLM_STREAM=0이면 비활성)"""
+    return os.getenv("LLM_STREAM", "1") != "0"
+
+
+class SingleFlight:
+    """
+    동일 키의 동시 요청을 하나로 합치는 single-flight 그룹
+    - 첫 호출자(leader)만 실제 요청을 보내고
+    - 진행 중에 들어온 같은 키의 호출자는 leader의 결과(또는 예외)를 공유
+    - do(스레드)와 ado(코루틴)는 같은 진행 중 목록을 써서 동기/비동기 호출자끼리도 합류
+    - 합류 수는 실행별로 utils.metrics에 기록 (실행 요약에 표시)
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, Future] = {}
+        self.coalesced_calls = 0
+
+    def _join(self, key: str) -> Tuple[Future, bool]:
+        """(진행 중 Future, leader 여부) - 같은 키가 진행 중이면 합류"""
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is None:
+                future = Future()
+                self._inflight[key] = future
+                return future, True
+            self.coalesced_calls += 1
+        logger.info(f"🔗 동일 요청 합류 (single-flight): {key[:12]}")
+        record_coalesced_call()
+        return future, False
+
+    def _finish(self, key: str, future: Future, result: Any = None, error: Optional[BaseException] = None) -> None:
+        with self._lock:
+            self._inflight.pop(key, None)
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def do(self, key: str, fn: Callable[[], T]) -> T:
+        future, is_leader = self._join(key)
+        if not is_leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            self._finish(key, future, error=e)
+            raise
+        self._finish(key, future, result)
+        return result
+
+    async def ado(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """do의 코루틴 버전 (합류한 쪽은 이벤트 루프를 막지 않고 대기)"""
+        future, is_leader = self._join(key)
+        if not is_leader:
+            # 기다리던 쪽이 취소돼도 leader의 Future는 취소하지 않음
+            return await asyncio.shield(asyncio.wrap_future(future))
+
+        try:
+            result = await fn()
+        except BaseException as e:
+            self._finish(key, future, error=e)
+            raise
+        self._finish(key, future, result)
+        return result
+
+
+# 프로세스 전역 single-flight 그룹 (클라이언트 인스턴스와 무관하게 합류)
+_single_flight = SingleFlight()
+
+
+def request_key(provider: str, params: Dict[str, Any]) -> str:
+    """provider + 요청 파라미터로 만든 요청 키"""
+    return canonical_hash({"provider": provider, "params": params})
+
+
+def coalesced_call_count() -> int:
+    """single-flight로 합쳐진(실제 요청을 보내지 않은) 호출 수"""
+    return _single_flight.coalesced_calls
+
+# 마이크로 배치 응답 스키마 (작업 번호별 답변)
+BATCH_ANSWERS_SCHEMA: Dict[str, Any] = {
+    "title": "batch_answers",
+    "type": "object",
+    "properties": {
+        "answers": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "index": {"type": "integer", "minimum": 1},
+                    "answer": {"type": "string"},
+                },
+                "required": ["index", "answer"],
+                "additionalProperties": False,
+            },
+        }
+    },
+    "required": ["answers"],
+    "additionalProperties": False,
+}
+
+
+def _estimate_tokens(text: str) -> int:
+    """대략적인 토큰 수 추정 (한글 기준 2자 ≈ 1토큰)"""
+    return max(1, len(text) // 2)
+
+
+@dataclass
+class _BatchItem:
+    prompt: str
+    max_tokens: int
+    future: Future = field(default_factory=Future)
+    # 제출한 쪽의 실행 컨텍스트 (지표의 node/day 귀속용)
+    context: contextvars.Context = field(default_factory=contextvars.copy_context)
+
+    @property
+    def cost_tokens(self) -> int:
+        return _estimate_tokens(self.prompt) + self.max_tokens
+
+
+class MicroBatcher:
+    """
+    작은 LLM 작업을 짧은 윈도우 동안 모아 한 번의 요청으로 처리
+    - 진행 중인 배치 요청이 없으면 기다리지 않고 바로 전송 (순차 호출은 윈도우만큼 늦어지지 않음)
+    - 요청이 진행 중일 때 들어온 작업은 window_ms 동안 max_items / max_tokens 한도 내에서 묶음
+    - 번호가 붙은 작업 목록을 한 프롬프트로 보내고 answers[index]로 분리
+    - 누락된 답변은 개별 호출로 보충
+    """
+
+    def __init__(
+        self,
+        client: "LLMClient",
+        window_ms: int = 50,
+        max_items: int = 8,
+        max_tokens: int = 3000
+    ) -> None:
+        self.client = client
+        self.window = window_ms / 1000
+        self.max_items = max_items
+        self.max_tokens = max_tokens
+
+        self._pending: List[_BatchItem] = []
+        self._cond = threading.Condition()
+        self._worker: Optional[threading.Thread] = None
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="llm-batch")
+        # 전송 후 아직 끝나지 않은 배치 수 (0이면 새 작업을 바로 전송)
+        self._active = 0
+        self._closed = False
+        atexit.register(self.shutdown)
+
+        self.submitted = 0
+        self.requests_sent = 0
+
+    def submit(self, prompt: str, max_tokens: int = 200) -> Future:
+        """작업 등록 후 Future 반환"""
+        item = _BatchItem(prompt, max_tokens)
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("MicroBatcher가 종료되었습니다")
+            self._pending.append(item)
+            self.submitted += 1
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="llm-batcher", daemon=True)
+                self._worker.start()
+            self._cond.notify()
+        return item.future
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if not self._pending:
+                    return
+
+                # 다른 배치가 진행 중일 때만 윈도우가 끝나거나 한도가 찰 때까지 대기
+                deadline = time.monotonic() + self.window
+                while self._active and not self._closed and not self._is_full():
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+
+                batch = self._take_batch()
+                self._active += 1
+
+            self._executor.submit(batch[0].context.run, self._dispatch, batch)
+
+    def _is_full(self) -> bool:
+        total = sum(item.cost_tokens for item in self._pending)
+        return len(self._pending) >= self.max_items or total >= self.max_tokens
+
+    def _take_batch(self) -> List[_BatchItem]:
+        batch: List[_BatchItem] = []
+        total = 0
+        while self._pending and len(batch) < self.max_items:
+            item = self._pending[0]
+            if batch and total + item.cost_tokens > self.max_tokens:
+                break
+            batch.append(self._pending.pop(0))
+            total += item.cost_tokens
+        return batch
+
+    def _dispatch(self, batch: List[_BatchItem]) -> None:
+        try:
+            self._send(batch)
+        finally:
+            with self._cond:
+                self._active -= 1
+                self._cond.notify_all()
+
+    def _send(self, batch: List[_BatchItem]) -> None:
+        if len(batch) == 1:
+            self._run_single(batch[0])
+            return
+
+        self._count_request()
+        logger.info(f"📦 마이크로 배치 전송: {len(batch)}개 작업 → 1회 호출")
+
+        try:
+            raw = self.client.chat(
+                self._build_prompt(batch),
+                max_tokens=sum(item.max_tokens for item in batch) + 20 * len(batch),
+                schema=BATCH_ANSWERS_SCHEMA
+            )
+            answers = {
+                a["index"]: a["answer"]
+                for a in json.loads(raw).get("answers", [])
+            }
+        except Exception as e:
+            logger.warning(f"마이크로 배치 실패, 개별 호출로 대체: {e}")
+            answers = {}
+
+        for idx, item in enumerate(batch, 1):
+            if idx in answers:
+                item.future.set_result(answers[idx])
+            else:
+                self._run_single(item)
+
+    def _count_request(self) -> None:
+        # 디스패치는 executor 스레드에서 병렬로 돌기 때문에 카운터도 락 안에서 증가
+        with self._cond:
+            self.requests_sent += 1
+
+    def _run_single(self, item: _BatchItem) -> None:
+        self._count_request()
+        try:
+            item.future.set_result(self.client.chat(item.prompt, max_tokens=item.max_tokens))
+        except Exception as e:
+            item.future.set_exception(e)
+
+    def shutdown(self) -> None:
+        """대기 중 작업을 보낸 뒤 배치 스레드와 executor 종료 (프로세스 종료 시 atexit로 호출)"""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+            worker = self._worker
+        if worker is not None:
+            worker.join()
+        self._executor.shutdown(wait=True)
+        atexit.unregister(self.shutdown)
+
+    def _build_prompt(self, batch: List[_BatchItem]) -> str:
+        tasks = "\n\n".join(
+            f"[작업 {idx}]\n{item.prompt.strip()}"
+            for idx, item in enumerate(batch, 1)
+        )
+        return f"""다음 {len(batch)}개의 서로 독립적인 작업에 각각 답하세요.
+각 작업의 지시(출력 형식, 길이 제한 포함)를 개별적으로 따르고, 작업 내용을 섞지 마세요.
+answers 배열에 작업 번호(index)와 해당 작업의 답(answer)을 모든 작업에 대해 넣으세요.
+
+{tasks}"""
+
+
+def validated_json(content: str, schema: Any, source: str) -> str:
+    """
+    구조화 출력 결과를 파싱·로컬 검증 후 JSON 문자열로 반환
+
+    Raises:
+        StructuredOutputError: 복구 불가능한 JSON 또는 스키마 검증 실패 (호출자는 이 예외 하나로 기본값 대체)
+    """
+    try:
+        data = parse_json_object(content, source)
+    except JSONRepairError as e:
+        raise StructuredOutputError(f"JSON 복구 실패: {e}") from e
+    data = validate_structured(data, schema)
+    return json.dumps(data, ensure_ascii=False)
+
+
 class LLMClient:
     """OpenAI 기반 LLM 호출 래퍼 클래스"""
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        model: str = DEFAULT_GPT_MODEL,
+        http_client: Optional[httpx.Client] = None
+    ) -> None:
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key:
             raise ValueError("OPENAI_API_KEY가 .env에 설정되지 않았습니다.")
 
+        self.model = model
+        self._api_key = api_key
+
         try:
-            self.client = OpenAI(api_key=api_key)
+            self.client = OpenAI(api_key=api_key, base_url=_base_url("openai"), http_client=http_client)
         except Exception as e:
             logger.exception("OpenAI 클라이언트 초기화 실패")
             raise e
 
-    def chat(self, prompt: str, max_tokens: int = 3000, json_mode: bool = False) -> str:
-        """GPT 챗 완료 호출"""
+        self._async_client: Optional[AsyncOpenAI] = None
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._batcher: Optional[MicroBatcher] = None
+        self._batcher_lock = threading.Lock()
+        self.usage = UsageStats()
 
-        try:
-            params = {
-                "model": "gpt-4o-mini",
-                "messages": [{"role": "user", "content": prompt}],
-                "max_tokens": max_tokens
+    @property
+    def batcher(self) -> MicroBatcher:
+        """소형 작업용 마이크로 배처 (최초 사용 시 생성)"""
+        with self._batcher_lock:
+            if self._batcher is None:
+                self._batcher = MicroBatcher(
+                    self,
+                    window_ms=int(os.getenv("LLM_BATCH_WINDOW_MS", "50")),
+                    max_items=int(os.getenv("LLM_BATCH_MAX_ITEMS", "8")),
+                    max_tokens=int(os.getenv("LLM_BATCH_MAX_TOKENS", "3000")),
+                )
+            return self._batcher
+
+    def identity(self) -> List[str]:
+        """결과 재사용 키에 넣을 provider/모델 (utils.memo)"""
+        return [f"openai:{self.model}"]
+
+    def chat_small(self, prompt: str, max_tokens: int = 200) -> str:
+        """
+        짧은 응답용 호출 (판단/라벨/태그 등)
+        혼자 들어온 요청은 바로 전송, 앞선 요청이 진행 중일 때 동시에 들어온 소형 요청끼리는
+        묶여 한 번의 API 호출로 처리될 수 있음
+        """
+        return self.batcher.submit(prompt, max_tokens).result()
+
+    def build_params(
+        self,
+        prompt: str,
+        max_tokens: int = 3000,
+        json_mode: bool = False,
+        schema: Optional[Any] = None,
+        prefix: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        chat.completions 요청 본문 생성
+        온라인 호출(chat)과 Batch API 요청 파일이 같은 본문을 쓰도록 분리
+        """
+        messages = [{"role": "user", "content": prompt}]
+        if prefix:
+            messages.insert(0, {"role": "system", "content": prefix})
+
+        params: Dict[str, Any] = {
+            "model": self.model,
+            "messages": messages,
+            "max_tokens": max_tokens
+        }
+
+        if schema is not None:
+            # Structured Outputs: provider가 스키마에 맞춰 디코딩 (strict - 스키마를 벗어난 출력이 나오지 않음)
+            params["response_format"] = {
+                "type": "json_schema",
+                "json_schema": {
+                    "name": schema_name(schema),
+                    "schema": {k: v for k, v in to_json_schema(schema).items() if k != "title"},
+                    "strict": True,
+                },
             }
-            
+        elif json_mode:
             # JSON 모드 활성화 (유효한 JSON만 반환)
-            if json_mode:
-                params["response_format"] = {"type": "json_object"}
-            
-            response = self.client.chat.completions.create(**params)
-            content = response.choices[0].message.content
-            return content if content else ""
+            params["response_format"] = {"type": "json_object"}
+
+        return params
+
+    def chat(
+        self,
+        prompt: str,
+        max_tokens: int = 3000,
+        json_mode: bool = False,
+        schema: Optional[Any] = None,
+        prefix: Optional[str] = None
+    ) -> str:
+        """
+        GPT 챗 완료 호출
+
+        Args:
+            prompt: 입력 프롬프트 (호출마다 달라지는 부분)
+            max_tokens: 최대 토큰 수
+            json_mode: JSON 모드 (유효한 JSON만 반환)
+            schema: JSON Schema dict 또는 Pydantic 모델 (structured output 모드)
+            prefix: 호출 간 동일한 고정 지시문. system 메시지로 맨 앞에 두어
+                OpenAI 자동 프롬프트 캐시(1024토큰 이상 동일 접두부)가 적중하도록 함.
+                1024토큰 미만이면 캐시되지 않고 일반 입력 토큰으로 과금됨
+
+        Returns:
+            응답 텍스트 (schema 지정 시 검증된 JSON 문자열)
+        """
+
+        try:
+            params = self.build_params(prompt, max_tokens, json_mode, schema, prefix)
+
+            content = _single_flight.do(
+                request_key("openai", params),
+                lambda: self._create(params)
+            )
+
+            if schema is not None:
+                return validated_json(content, schema, "LLMClient")
+            return content
+
+        except OpenAIError as e:
+            logger.error("OpenAI API 오류 발생")
+            raise e
+
+        except Exception as e:
+            logger.exception("LLM 호출 실패")
+            raise e
+
+    def _create(self, params: Dict[str, Any]) -> str:
+        """
+        실제 API 호출 + 사용량/지표 기록 (single-flight leader만 실행하므로 중복 집계 없음)
+        스트리밍으로 받아 첫 토큰까지 시간(TTFT)을 함께 측정
+        전역 LLM 동시 호출 한도(utils.budget) 슬롯을 잡은 뒤 호출 (대기 시간은 지연에 포함하지 않음)
+        """
+        with get_budget("llm").slot(), span("openai.chat", kind="llm", run_id=get_run_id(), model=self.model) as traced:
+            start = time.perf_counter()
+            ttft: Optional[float] = None
+            usage: Dict[str, int] = {}
+
+            try:
+                if _streaming_enabled():
+                    parts: List[str] = []
+                    stream = self.client.chat.completions.create(
+                        **params, stream=True, stream_options={"include_usage": True}
+                    )
+                    for chunk in stream:
+                        if chunk.choices:
+                            delta = chunk.choices[0].delta.content
+                            if delta:
+                                if ttft is None:
+                                    ttft = time.perf_counter() - start
+                                parts.append(delta)
+                        if getattr(chunk, "usage", None):
+                            usage = _openai_usage(chunk)
+                    content = "".join(parts)
+                else:
+                    response = self.client.chat.completions.create(**params)
+                    usage = _openai_usage(response)
+                    content = response.choices[0].message.content or ""
+            except Exception as e:
+                record_llm_call("openai", self.model, usage, time.perf_counter() - start, ttft, error=type(e).__name__)
+                raise
+
+            self.usage.record(usage)
+            record_llm_call("openai", self.model, usage, time.perf_counter() - start, ttft)
+            if traced:
+                traced.set(ttft_s=ttft, **usage)
+            return content
+
+
+    def _async_openai(self) -> AsyncOpenAI:
+        """현재 이벤트 루프용 AsyncOpenAI (비동기 커넥션 풀은 루프에 묶이므로 루프가 바뀌면 새로 생성)"""
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_loop is not loop:
+            self._async_client = AsyncOpenAI(
+                api_key=self._api_key,
+                base_url=_base_url("openai"),
+                http_client=_pooled_async_http_client(),
+            )
+            self._async_loop = loop
+        return self._async_client
+
+    async def achat(
+        self,
+        prompt: str,
+        max_tokens: int = 3000,
+        json_mode: bool = False,
+        schema: Optional[Any] = None,
+        prefix: Optional[str] = None,
+        on_delta: Optional[Callable[[str], None]] = None
+    ) -> str:
+        """
+        chat의 코루틴 버전 (웹 API처럼 이벤트 루프 하나로 여러 요청을 동시에 처리할 때)
+
+        - 응답 대기 / 전역 LLM 한도 대기 모두 이벤트 루프를 막지 않음
+        - on_delta: 스트리밍 중 지금까지 받은 전체 텍스트로 호출 (섹션별 진행 보고용)
+        - 같은 요청이 진행 중이면 single-flight로 합류 (동기 chat 호출자와도 결과 공유,
+          합류한 쪽은 스트리밍 중간 결과 없이 끝에 on_delta 한 번)
+        - 카세트 모드는 동기 transport만 지원하므로 스레드에서 chat으로 처리 (on_delta는 끝에 한 번)
+        """
+        try:
+            if get_cassette() is not None:
+                content = await asyncio.to_thread(self.chat, prompt, max_tokens, json_mode, schema, prefix)
+                if on_delta is not None:
+                    on_delta(content)
+                return content
+
+            params = self.build_params(prompt, max_tokens, json_mode, schema, prefix)
+            streamed = False
+
+            def report(text: str) -> None:
+                nonlocal streamed
+                streamed = True
+                if on_delta is not None:
+                    on_delta(text)
+
+            content = await _single_flight.ado(
+                request_key("openai", params),
+                lambda: self._acreate(params, report if on_delta is not None else None)
+            )
+            if on_delta is not None and not streamed:
+                on_delta(content)
+
+            if schema is not None:
+                return validated_json(content, schema, "LLMClient")
+            return content
 
         except OpenAIError as e:
             logger.error("OpenAI API 오류 발생")
@@ -54,30 +669,126 @@ class LLMClient:
             logger.exception("LLM 호출 실패")
             raise e
 
+    async def _acreate(self, params: Dict[str, Any], on_delta: Optional[Callable[[str], None]] = None) -> str:
+        """_create의 코루틴 버전 (사용량/지표/구간 기록 동일)"""
+        async with get_budget("llm").aslot():
+            with span("openai.chat", kind="llm", run_id=get_run_id(), model=self.model, mode="async") as traced:
+                start = time.perf_counter()
+                ttft: Optional[float] = None
+                usage: Dict[str, int] = {}
+                client = self._async_openai()
+
+                try:
+                    if _streaming_enabled() or on_delta is not None:
+                        parts: List[str] = []
+                        stream = await client.chat.completions.create(
+                            **params, stream=True, stream_options={"include_usage": True}
+                        )
+                        async for chunk in stream:
+                            if chunk.choices:
+                                delta = chunk.choices[0].delta.content
+                                if delta:
+                                    if ttft is None:
+                                        ttft = time.perf_counter() - start
+                                    parts.append(delta)
+                                    if on_delta is not None:
+                                        on_delta("".join(parts))
+                            if getattr(chunk, "usage", None):
+                                usage = _openai_usage(chunk)
+                        content = "".join(parts)
+                    else:
+                        response = await client.chat.completions.create(**params)
+                        usage = _openai_usage(response)
+                        content = response.choices[0].message.content or ""
+                except Exception as e:
+                    record_llm_call("openai", self.model, usage, time.perf_counter() - start, ttft, error=type(e).__name__)
+                    raise
+
+                self.usage.record(usage)
+                record_llm_call("openai", self.model, usage, time.perf_counter() - start, ttft)
+                if traced:
+                    traced.set(ttft_s=ttft, **usage)
+                return content
+
 
 class ClaudeClient:
     """Claude (Anthropic) 기반 LLM 호출 래퍼 클래스"""
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        model: str = DEFAULT_CLAUDE_MODEL,
+        http_client: Optional[httpx.Client] = None
+    ) -> None:
         api_key = os.getenv("ANTHROPIC_API_KEY")
         if not api_key:
             raise ValueError("ANTHROPIC_API_KEY가 .env에 설정되지 않았습니다.")
 
+        self.model = model
+
         try:
-            self.client = Anthropic(api_key=api_key)
+            self.client = Anthropic(api_key=api_key, base_url=_base_url("anthropic"), http_client=http_client)
         except Exception as e:
             logger.exception("Anthropic 클라이언트 초기화 실패")
             raise e
 
-    def chat(self, prompt: str, max_tokens: int = 3000) -> str:
-        """Claude 챗 완료 호출"""
+        self.usage = UsageStats()
+
+    def identity(self) -> List[str]:
+        """결과 재사용 키에 넣을 provider/모델 (utils.memo)"""
+        return [f"anthropic:{self.model}"]
+
+    def chat(
+        self,
+        prompt: str,
+        max_tokens: int = 3000,
+        schema: Optional[Any] = None,
+        prefix: Optional[str] = None
+    ) -> str:
+        """
+        Claude 챗 완료 호출
+
+        schema 지정 시 도구 호출(tool use)을 강제하여 스키마에 맞는 입력을 받고,
+        검증된 JSON 문자열을 반환
+
+        prefix 지정 시 system 블록에 cache_control(ephemeral) 브레이크포인트를 달아
+        도구 정의 + 고정 지시문까지를 프롬프트 캐시로 재사용
+        (모델별 최소 길이(1024토큰~)에 못 미치면 브레이크포인트는 무시되고 캐시되지 않음)
+        """
 
         try:
-            response = self.client.messages.create(
-                model="claude-3-haiku-20240307",  # Claude 3 Haiku (저렴하고 빠름)
-                max_tokens=max_tokens,
-                messages=[{"role": "user", "content": prompt}]
+            params: Dict[str, Any] = {
+                "model": self.model,
+                "max_tokens": max_tokens,
+                "messages": [{"role": "user", "content": prompt}]
+            }
+
+            if schema is not None:
+                name = schema_name(schema)
+                params["tools"] = [{
+                    "name": name,
+                    "description": "결과를 지정된 JSON 구조로 제출합니다.",
+                    "input_schema": to_json_schema(schema),
+                }]
+                params["tool_choice"] = {"type": "tool", "name": name}
+
+            if prefix:
+                params["system"] = [{
+                    "type": "text",
+                    "text": prefix,
+                    "cache_control": {"type": "ephemeral"},
+                }]
+
+            response = _single_flight.do(
+                request_key("anthropic", params),
+                lambda: self._create(params)
             )
+
+            if schema is not None:
+                for block in response.content:
+                    if isinstance(block, ToolUseBlock):
+                        content = json.dumps(block.input, ensure_ascii=False)
+                        return validated_json(content, schema, "ClaudeClient")
+                raise StructuredOutputError("Claude 응답에 tool_use 블록이 없습니다")
             
             # Claude API 응답 형식: response.content[0].text
             if response.content and len(response.content) > 0:
@@ -95,37 +806,81 @@ class ClaudeClient:
             logger.exception("Claude 호출 실패")
             raise e
 
+    def _create(self, params: Dict[str, Any]) -> Any:
+        """실제 API 호출 + 사용량/지표 기록 (스트리밍 시 TTFT 측정, 전역 LLM 한도 슬롯 안에서)"""
+        with get_budget("llm").slot(), span("anthropic.messages", kind="llm", run_id=get_run_id(), model=self.model) as traced:
+            start = time.perf_counter()
+            ttft: Optional[float] = None
+
+            try:
+                if _streaming_enabled():
+                    with self.client.messages.stream(**params) as stream:
+                        for event in stream:
+                            if ttft is None and event.type == "content_block_delta":
+                                ttft = time.perf_counter() - start
+                        response = stream.get_final_message()
+                else:
+                    response = self.client.messages.create(**params)
+            except Exception as e:
+                record_llm_call("anthropic", self.model, {}, time.perf_counter() - start, ttft, error=type(e).__name__)
+                raise
+
+            usage = _anthropic_usage(response)
+            self.usage.record(usage)
+            record_llm_call("anthropic", self.model, usage, time.perf_counter() - start, ttft)
+            if traced:
+                traced.set(ttft_s=ttft, **usage)
+            return response
+
 
 class HybridLLMClient:
     """
     하이브리드 LLM 클라이언트
     - 작업 유형에 따라 GPT 또는 Claude를 자동 선택
-    - 비용 효율성과 성능의 균형 유지
+    - 품질 하한 안에서 원당 처리량이 가장 좋은 모델로 라우팅 (utils.model_router)
     """
 
-    def __init__(self) -> None:
-        # GPT 초기화 (필수)
+    def __init__(
+        self,
+        gpt_client: Optional[LLMClient] = None,
+        claude_client: Optional[ClaudeClient] = None,
+        router: Optional[ModelRouter] = None
+    ) -> None:
+        self.router = router or get_model_router()
+
+        # GPT 초기화 (필수) - 레지스트리의 공유 클라이언트 재사용
         try:
-            self.gpt_client = LLMClient()
+            self.gpt_client = gpt_client or get_llm_client("gpt")
         except Exception as e:
             logger.error("GPT 클라이언트 초기화 실패")
             raise e
 
         # Claude 초기화 (선택)
+        self.claude_client: Optional[ClaudeClient] = None
         try:
-            self.claude_client = ClaudeClient()
+            self.claude_client = claude_client or get_llm_client("claude")
             self.claude_available = True
             logger.info("✅ Claude API 사용 가능")
         except Exception as e:
             logger.warning(f"⚠️ Claude API 사용 불가 (GPT만 사용): {e}")
             self.claude_available = False
 
+    def identity(self) -> List[str]:
+        """결과 재사용 키에 넣을 provider/모델 (Claude를 쓸 수 없으면 GPT만)"""
+        ids = self.gpt_client.identity()
+        if self.claude_available and self.claude_client is not None:
+            ids += self.claude_client.identity()
+        return ids
+
     def chat(
         self, 
         prompt: str, 
         max_tokens: int = 3000,
         prefer_model: Literal["gpt", "claude", "auto"] = "auto",
-        task_type: Literal["simple", "creative", "analytical"] = "simple"
+        task_type: Literal["simple", "creative", "analytical"] = "simple",
+        schema: Optional[Any] = None,
+        prefix: Optional[str] = None,
+        expect_json: bool = False
     ) -> str:
         """
         프롬프트에 따라 최적의 모델 선택
@@ -134,10 +889,12 @@ class HybridLLMClient:
             prompt: 입력 프롬프트
             max_tokens: 최대 토큰 수
             prefer_model: 선호 모델 ("gpt", "claude", "auto")
-            task_type: 작업 유형
-                - simple: 단순 작업 (GPT 사용)
-                - creative: 창의적 작업 (Claude 우선)
-                - analytical: 분석 작업 (Claude 우선)
+            task_type: 작업 유형 (simple / creative / analytical)
+                auto 모드에서 라우터가 작업 유형별 관측(지연, 오류율, JSON 유효율, 비용)으로
+                모델을 선택. 노드별 고정은 LLM_ROUTE_OVERRIDES 또는 router.set_override
+            schema: JSON Schema dict 또는 Pydantic 모델 (structured output 모드)
+            prefix: 호출 간 동일한 고정 지시문 (프롬프트 캐시 대상)
+            expect_json: schema 없이 JSON 응답을 기대하는 경우 (JSON 유효율 관측용)
         
         Returns:
             LLM 응답 텍스트
@@ -145,28 +902,138 @@ class HybridLLMClient:
         
         # 명시적으로 GPT 요청
         if prefer_model == "gpt":
-            logger.info("🤖 GPT-4o-mini 사용")
-            return self.gpt_client.chat(prompt, max_tokens)
+            logger.info(f"🤖 {self.gpt_client.model} 사용")
+            return self.gpt_client.chat(prompt, max_tokens, schema=schema, prefix=prefix)
         
         # 명시적으로 Claude 요청
         if prefer_model == "claude":
             if self.claude_available:
-                logger.info("🧠 Claude 3.5 Sonnet 사용")
-                return self.claude_client.chat(prompt, max_tokens)
+                logger.info(f"🧠 {self.claude_client.model} 사용")
+                return self.claude_client.chat(prompt, max_tokens, schema=schema, prefix=prefix)
             else:
                 logger.warning("⚠️ Claude 불가, GPT로 대체")
-                return self.gpt_client.chat(prompt, max_tokens)
+                return self.gpt_client.chat(prompt, max_tokens, schema=schema, prefix=prefix)
         
-        # auto: 작업 유형에 따라 자동 선택
-        if task_type == "simple":
-            logger.info("🤖 GPT-4o-mini 사용 (단순 작업)")
-            return self.gpt_client.chat(prompt, max_tokens)
-        
-        # creative, analytical 작업은 Claude 우선
-        if self.claude_available:
-            logger.info(f"🧠 Claude 3.5 Sonnet 사용 ({task_type} 작업)")
-            return self.claude_client.chat(prompt, max_tokens)
+        # auto: 관측 기반 라우터가 작업 유형별로 선택 (관측 부족 시 simple → GPT, 그 외 → Claude)
+        candidates = ["gpt", "claude"] if self.claude_available else ["gpt"]
+        option = self.router.choose(task_type, candidates, node=current_node())
+        client: Any = self.claude_client if option == "claude" else self.gpt_client
+        icon = "🧠" if option == "claude" else "🤖"
+        logger.info(f"{icon} {client.model} 사용 ({task_type} 작업)")
+
+        clear_last_call_record()
+        start = time.perf_counter()
+        try:
+            with task_scope(task_type):
+                response = client.chat(prompt, max_tokens, schema=schema, prefix=prefix)
+        except StructuredOutputError:
+            self.router.record(task_type, option, time.perf_counter() - start, ok=True, json_valid=False)
+            raise
+        except Exception:
+            self.router.record(task_type, option, time.perf_counter() - start, ok=False)
+            raise
+
+        record = last_call_record()
+        json_valid = None
+        if schema is not None:
+            json_valid = True  # 클라이언트에서 검증 통과
+        elif expect_json:
+            json_valid = _is_valid_json(response)
+        self.router.record(
+            task_type, option,
+            latency_s=time.perf_counter() - start,
+            ok=True,
+            json_valid=json_valid,
+            cost_krw=record.get("cost_krw") if record else None,
+        )
+        return response
+
+    def usage_totals(self) -> Dict[str, Dict[str, int]]:
+        """provider별 누적 토큰 사용량 (캐시 적중 포함)"""
+        totals = {"gpt": self.gpt_client.usage.snapshot()}
+        if self.claude_available and self.claude_client is not None:
+            totals["claude"] = self.claude_client.usage.snapshot()
+        return totals
+
+
+
+# ---------------------------------------------------------------------------
+# 공유 클라이언트 레지스트리
+# ---------------------------------------------------------------------------
+
+ClientKind = Literal["gpt", "claude", "hybrid"]
+
+_registry: Dict[Tuple[str, str], Any] = {}
+_registry_lock = threading.RLock()
+
+
+def _pooled_http_client() -> httpx.Client:
+    """provider별 공유 커넥션 풀 (keep-alive 재사용, 카세트 모드면 녹화/재생 transport)"""
+    limits = httpx.Limits(
+        max_connections=int(os.getenv("LLM_MAX_CONNECTIONS", "32")),
+        max_keepalive_connections=int(os.getenv("LLM_MAX_KEEPALIVE", "16")),
+        keepalive_expiry=60.0,
+    )
+    return httpx.Client(
+        transport=httpx_transport(httpx.HTTPTransport(limits=limits)),
+        limits=limits,
+        timeout=httpx.Timeout(float(os.getenv("LLM_TIMEOUT", "120")), connect=10.0),
+    )
+
+
+def _pooled_async_http_client() -> httpx.AsyncClient:
+    """_pooled_http_client의 비동기 버전 (이벤트 루프당 하나, 카세트 transport는 동기 전용이라 미적용)"""
+    limits = httpx.Limits(
+        max_connections=int(os.getenv("LLM_MAX_CONNECTIONS", "32")),
+        max_keepalive_connections=int(os.getenv("LLM_MAX_KEEPALIVE", "16")),
+        keepalive_expiry=60.0,
+    )
+    return httpx.AsyncClient(
+        limits=limits,
+        timeout=httpx.Timeout(float(os.getenv("LLM_TIMEOUT", "120")), connect=10.0),
+    )
+
+
+def get_llm_client(kind: ClientKind = "gpt", model: Optional[str] = None) -> Any:
+    """
+    프로세스 전역 공유 LLM 클라이언트 반환 (thread-safe)
+    - provider/model당 하나의 인스턴스와 커넥션 풀을 재사용
+    - 노드 생성 시마다 SDK 클라이언트와 httpx 풀을 새로 만들지 않음
+
+    Args:
+        kind: "gpt" | "claude" | "hybrid"
+        model: 모델명 (생략 시 기본 모델)
+
+    Raises:
+        ValueError: API 키 미설정 등으로 생성 불가 (실패는 캐시하지 않음)
+    """
+    if kind == "gpt":
+        key = (kind, model or DEFAULT_GPT_MODEL)
+    elif kind == "claude":
+        key = (kind, model or DEFAULT_CLAUDE_MODEL)
+    elif kind == "hybrid":
+        key = (kind, "")
+    else:
+        raise ValueError(f"알 수 없는 클라이언트 종류: {kind}")
+
+    with _registry_lock:
+        client = _registry.get(key)
+        if client is not None:
+            return client
+
+        if kind == "gpt":
+            client = LLMClient(model=key[1], http_client=_pooled_http_client())
+        elif kind == "claude":
+            client = ClaudeClient(model=key[1], http_client=_pooled_http_client())
         else:
-            logger.warning(f"⚠️ Claude 불가, GPT로 대체 ({task_type} 작업)")
-            return self.gpt_client.chat(prompt, max_tokens)
+            client = HybridLLMClient()
+
+        _registry[key] = client
+        logger.info(f"🔌 공유 LLM 클라이언트 생성: {kind} {key[1]}".rstrip())
+        return client
+
 
+def reset_llm_clients() -> None:
+    """레지스트리 초기화 (테스트/설정 변경용)"""
+    with _registry_lock:
+        _registry.clear()
@@ -1,21 +1,245 @@
 # utils/logger.py
+"""
+공용 로깅 설정
+
+- 모든 get_logger() 로거가 QueueHandler 하나를 공유하고, 파일 쓰기는 QueueListener 스레드가 전담
+  (노드/워커 스레드, asyncio 루프에서는 큐에 넣기만 하므로 I/O로 막히지 않음)
+- 파일 핸들러는 프로세스당 하나, 여러 프로세스가 같은 파일에 써도 롤오버는 파일 잠금 아래에서 한 번만
+- fork된 자식 프로세스는 첫 로그에서 자체 큐/리스너를 새로 띄움
+- 큐에 넣는 시점에 run_id / node / day / blog(utils.run_context)를 기록에 붙임
+- 같은 위치의 반복 경고는 일정 시간 동안 한 번만 기록하고 생략 횟수를 다음 기록에 표시
+
+환경 변수:
+- BLOG_LOG_FILE: 로그 파일 (기본 app.log)
+- BLOG_LOG_MAX_BYTES / BLOG_LOG_BACKUPS: 롤오버 크기 (기본 2000000) / 보관 개수 (기본 5)
+- BLOG_LOG_FORMAT: text (기본) / json (JSON lines, run_id/node/day/blog 필드 포함)
+- BLOG_LOG_LEVEL: 기본 INFO
+- BLOG_LOG_CONSOLE: "1"이면 stderr에도 출력
+- BLOG_LOG_RATE_WINDOW: 반복 경고 억제 구간(초, 기본 60, 0이면 억제 안 함)
+"""
+
+import atexit
+import json
 import logging
-from logging.handlers import RotatingFileHandler
+import multiprocessing.util
+import os
+import queue
+import re
+import sys
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Any, Dict, Optional, Tuple
 
-def get_logger(name: str) -> logging.Logger:
-    logger = logging.getLogger(name)
-    logger.setLevel(logging.INFO)
+try:
+    import fcntl
+except ImportError:  # Windows: 프로세스 간 롤오버 잠금 없음
+    fcntl = None
 
-    formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    )
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+CONTEXT_FIELDS = ("run_id", "node", "day", "blog")
+
+
+class ProcessSafeRotatingFileHandler(RotatingFileHandler):
+    """
+    여러 프로세스가 공유하는 로그 파일용 RotatingFileHandler
+
+    - 롤오버는 <파일>.lock 잠금 아래에서 수행하고, 잠금 대기 중 다른 프로세스가 이미 돌렸으면 다시 열기만 함
+    - 다른 프로세스가 파일을 돌린 뒤에는 새 파일로 다시 열어 이어 씀
+    """
+
+    def __init__(self, filename: str, max_bytes: int, backup_count: int) -> None:
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8", delay=True)
+        self._lock_path = self.baseFilename + ".lock"
+
+    def _rotated_elsewhere(self) -> bool:
+        try:
+            return os.fstat(self.stream.fileno()).st_ino != os.stat(self.baseFilename).st_ino
+        except OSError:
+            return True
+
+    def _reopen(self) -> None:
+        if self.stream is not None:
+            self.stream.close()
+            self.stream = None  # FileHandler.emit이 다음 기록에서 다시 엶
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        if self.stream is not None and self._rotated_elsewhere():
+            self._reopen()
+        return bool(super().shouldRollover(record))
+
+    def doRollover(self) -> None:
+        if fcntl is None:
+            super().doRollover()
+            return
+        with open(self._lock_path, "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                if os.path.exists(self.baseFilename) and os.path.getsize(self.baseFilename) < self.maxBytes:
+                    self._reopen()
+                    return
+                super().doRollover()
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+class JsonFormatter(logging.Formatter):
+    """JSON lines (한 줄에 기록 하나)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            "ts": self.formatTime(record, "%Y-%m-%dT%H:%M:%S") + f".{int(record.msecs):03d}",
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+            "process": record.process,
+            "thread": record.threadName,
+        }
+        for key in CONTEXT_FIELDS:
+            value = getattr(record, key, None)
+            if value is not None:
+                entry[key] = value
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class ContextFilter(logging.Filter):
+    """기록 스레드/태스크의 실행 컨텍스트를 붙임 (리스너 스레드에서는 contextvars를 볼 수 없으므로 큐 넣기 전에)"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        # run_context → tracing → logger 순환 임포트를 피하려고 지연 임포트
+        from utils.run_context import current_context
+
+        context = current_context()
+        for key in CONTEXT_FIELDS:
+            setattr(record, key, context.get(key))
+        return True
+
+
+class RateLimitFilter(logging.Filter):
+    """같은 위치의 반복 경고 억제 (숫자만 다른 메시지는 같은 경고로 봄)"""
+
+    _digits = re.compile(r"\d+")
+
+    def __init__(self, window_s: float) -> None:
+        super().__init__()
+        self.window_s = window_s
+        self._seen: Dict[Tuple[str, int, str], Tuple[float, int]] = {}
+        self._lock = threading.Lock()
 
-    file_handler = RotatingFileHandler(
-        "app.log", maxBytes=2_000_000, backupCount=5
+    def filter(self, record: logging.LogRecord) -> bool:
+        if self.window_s <= 0 or record.levelno < logging.WARNING:
+            return True
+
+        key = (record.name, record.lineno, self._digits.sub("#", str(record.msg)))
+        now = time.monotonic()
+        with self._lock:
+            last, suppressed = self._seen.get(key, (0.0, 0))
+            if last and now - last < self.window_s:
+                self._seen[key] = (last, suppressed + 1)
+                return False
+            self._seen[key] = (now, 0)
+
+        if suppressed:
+            record.msg = f"{record.msg} (지난 {self.window_s:g}초간 같은 경고 {suppressed}회 생략)"
+        return True
+
+
+class _ProcessQueueHandler(QueueHandler):
+    """현재 프로세스의 리스너가 없으면(첫 기록, fork 직후) 띄운 뒤 큐에 넣음"""
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        self.queue = _ensure_listener()
+        self.queue.put_nowait(record)
+
+
+def _build_handlers() -> Tuple[logging.Handler, ...]:
+    formatter: logging.Formatter = (
+        JsonFormatter() if os.getenv("BLOG_LOG_FORMAT", "text").lower() == "json" else logging.Formatter(TEXT_FORMAT)
+    )
+    file_handler = ProcessSafeRotatingFileHandler(
+        os.getenv("BLOG_LOG_FILE", "app.log"),
+        max_bytes=int(os.getenv("BLOG_LOG_MAX_BYTES", "2000000")),
+        backup_count=int(os.getenv("BLOG_LOG_BACKUPS", "5")),
     )
     file_handler.setFormatter(formatter)
+    handlers: Tuple[logging.Handler, ...] = (file_handler,)
+
+    if os.getenv("BLOG_LOG_CONSOLE", "0") == "1":
+        console = logging.StreamHandler(sys.stderr)
+        console.setFormatter(formatter)
+        handlers += (console,)
+    return handlers
+
+
+_lock = threading.Lock()
+_queue: Optional[queue.Queue] = None
+_listener: Optional[QueueListener] = None
+_listener_pid: Optional[int] = None
+_queue_handler: Optional[_ProcessQueueHandler] = None
+
+
+def _ensure_listener() -> queue.Queue:
+    """현재 프로세스의 큐/리스너 (없으면 생성)"""
+    global _queue, _listener, _listener_pid
+    if _listener_pid == os.getpid() and _queue is not None:
+        return _queue
+    with _lock:
+        if _listener_pid != os.getpid() or _queue is None:
+            _queue = queue.Queue()
+            _listener = QueueListener(_queue, *_build_handlers(), respect_handler_level=True)
+            _listener.start()
+            _listener_pid = os.getpid()
+            # multiprocessing 자식은 atexit 없이 os._exit로 끝나므로 종료 훅을 따로 등록
+            multiprocessing.util.Finalize(None, shutdown_logging, exitpriority=0)
+        return _queue
+
+
+def shutdown_logging() -> None:
+    """남은 기록을 모두 쓰고 리스너 종료 (프로세스 종료 시 자동 호출)"""
+    global _listener, _listener_pid, _queue
+    with _lock:
+        if _listener is not None and _listener_pid == os.getpid():
+            _listener.stop()
+            for handler in _listener.handlers:
+                handler.close()
+        _listener = None
+        _listener_pid = None
+        _queue = None
+
+
+def _after_fork_in_child() -> None:
+    # 부모의 리스너 스레드는 자식에 없음, 잠금도 fork 시점 상태로 복사되므로 새로 만듦
+    global _lock, _listener, _listener_pid, _queue
+    _lock = threading.Lock()
+    _listener = None
+    _listener_pid = None
+    _queue = None
+
+
+atexit.register(shutdown_logging)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+def _shared_queue_handler() -> _ProcessQueueHandler:
+    global _queue_handler
+    with _lock:
+        if _queue_handler is None:
+            handler = _ProcessQueueHandler(queue.Queue())
+            handler.addFilter(RateLimitFilter(float(os.getenv("BLOG_LOG_RATE_WINDOW", "60"))))
+            handler.addFilter(ContextFilter())
+            _queue_handler = handler
+        return _queue_handler
+
+
+def get_logger(name: str) -> logging.Logger:
+    logger = logging.getLogger(name)
+    logger.setLevel(os.getenv("BLOG_LOG_LEVEL", "INFO").upper())
 
-    if not logger.handlers:
-        logger.addHandler(file_handler)
+    handler = _shared_queue_handler()
+    if handler not in logger.handlers:
+        logger.addHandler(handler)
 
     return logger
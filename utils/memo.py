@@ -0,0 +1,226 @@
+# utils/memo.py
+"""
+노드 입력 해시 메모이제이션 (실행 간 재사용)
+
+- @memoize("TopicScorer", version=PROMPT_VERSION): 인자(self 제외) 정규화 해시 + 프롬프트 버전 + 노드가 쓰는
+  LLM provider/모델(self.llm)이 같으면 저장된 결과를 그대로 반환 (LLM 호출 없음, 모델을 바꾸면 다시 계산)
+- 결과는 outputs/memo/<이름>/<해시>.json 파일 하나씩 (사람이 열어볼 수 있는 산출물, 원자적 교체)
+- 프롬프트를 바꾸면 노드의 PROMPT_VERSION을 올려 이전 결과를 자동 무효화
+- 기본값 대체 등 품질이 떨어진 결과는 노드가 mark_uncacheable()로 표시해 저장하지 않음
+  (collect_uncacheable()로 다른 저장 계층도 같은 표시를 확인 - utils.checkpoint)
+- 강제 재계산: set_fresh(True) / BLOG_MEMO_FRESH=1 / CLI --fresh (읽기만 건너뛰고 새 결과로 덮어씀)
+- 무효화: invalidate(name, key) 또는 python -m utils.memo clear [--name 이름]
+
+환경 변수:
+- BLOG_MEMO: "0"이면 사용 안 함
+- BLOG_MEMO_DIR: 저장 위치 (기본 outputs/memo)
+- BLOG_MEMO_FRESH: "1"이면 항상 재계산
+"""
+
+import argparse
+import json
+import os
+import shutil
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from utils.hashing import canonical_hash
+from utils.logger import get_logger
+from utils.run_context import get_run_id
+
+logger = get_logger("Memo")
+
+DEFAULT_MEMO_DIR = "outputs/memo"
+
+_fresh = False
+# 현재 메모이즈 호출 안에서 결과를 저장하지 말라는 표시 (사유 목록)
+_uncacheable: ContextVar[Optional[List[str]]] = ContextVar("memo_uncacheable", default=None)
+
+
+def memo_dir() -> str:
+    return os.getenv("BLOG_MEMO_DIR", DEFAULT_MEMO_DIR)
+
+
+def set_fresh(fresh: bool = True) -> None:
+    """프로세스 전체 강제 재계산 (CLI --fresh)"""
+    global _fresh
+    _fresh = fresh
+
+
+def is_fresh() -> bool:
+    return _fresh or os.getenv("BLOG_MEMO_FRESH", "0") == "1"
+
+
+def mark_uncacheable(reason: str) -> None:
+    """진행 중인 메모이즈 호출 결과를 저장하지 않음 (예: LLM 실패로 기본값 반환)"""
+    reasons = _uncacheable.get()
+    if reasons is not None:
+        reasons.append(reason)
+
+
+@contextmanager
+def collect_uncacheable() -> Iterator[List[str]]:
+    """
+    블록 안에서 mark_uncacheable()된 사유 수집 (비어 있지 않으면 결과를 저장하지 말 것)
+
+    중첩되면 안쪽 사유가 바깥 범위에도 전달됨 (체크포인트 노드 안의 메모이즈 노드 등)
+    """
+    outer = _uncacheable.get()
+    reasons: List[str] = []
+    token = _uncacheable.set(reasons)
+    try:
+        yield reasons
+    finally:
+        _uncacheable.reset(token)
+        if outer is not None:
+            outer.extend(reasons)
+
+
+def client_identity(node: Any) -> List[str]:
+    """노드가 쓰는 LLM 클라이언트(self.llm)의 provider/모델 목록"""
+    client = getattr(node, "llm", None)
+    if client is None:
+        return []
+    if hasattr(client, "identity"):
+        return list(client.identity())
+    return [f"{type(client).__name__}:{getattr(client, 'model', '')}"]
+
+
+def memo_key(
+    name: str,
+    version: str,
+    args: tuple,
+    kwargs: Dict[str, Any],
+    clients: Optional[List[str]] = None
+) -> str:
+    return canonical_hash({
+        "name": name, "version": version, "clients": clients or [], "args": list(args), "kwargs": kwargs,
+    })
+
+
+def _path(name: str, key: str) -> str:
+    return os.path.join(memo_dir(), name, f"{key}.json")
+
+
+def load(name: str, key: str) -> Optional[Dict[str, Any]]:
+    """저장된 항목 (value, version, run_id, created_at) - 없거나 깨졌으면 None"""
+    try:
+        with open(_path(name, key), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"⚠️ 메모 파일 읽기 실패 ({name}/{key[:12]}): {e}")
+        return None
+
+
+def store(name: str, key: str, version: str, value: Any) -> None:
+    path = _path(name, key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    entry = {"name": name, "version": version, "run_id": get_run_id(), "created_at": time.time(), "value": value}
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(entry, f, ensure_ascii=False, indent=2, default=str)
+    os.replace(tmp_path, path)
+
+
+def invalidate(name: Optional[str] = None, key: Optional[str] = None) -> int:
+    """
+    저장된 결과 삭제
+
+    Args:
+        name: 노드 이름 (없으면 전체)
+        key: 특정 입력 해시 (name과 함께)
+
+    Returns:
+        삭제한 항목 수
+    """
+    root = memo_dir()
+    if name and key:
+        try:
+            os.remove(_path(name, key))
+            return 1
+        except FileNotFoundError:
+            return 0
+
+    targets = [os.path.join(root, name)] if name else [os.path.join(root, d) for d in _names()]
+    removed = 0
+    for directory in targets:
+        if os.path.isdir(directory):
+            removed += sum(1 for f in os.listdir(directory) if f.endswith(".json"))
+            shutil.rmtree(directory)
+    return removed
+
+
+def _names() -> List[str]:
+    root = memo_dir()
+    if not os.path.isdir(root):
+        return []
+    return sorted(d for d in os.listdir(root) if os.path.isdir(os.path.join(root, d)))
+
+
+def memoize(name: str, version: str = "1") -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    노드 메서드 메모이제이션 데코레이터 (첫 인자 self는 키에서 제외)
+
+    사용 예:
+        @memoize("ContentPlanner", version=PROMPT_VERSION)
+        @node_scope("ContentPlanner")
+        def plan(self, serp_data): ...
+    """
+
+    def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+        @wraps(fn)
+        def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            if os.getenv("BLOG_MEMO", "1") == "0":
+                return fn(self, *args, **kwargs)
+
+            key = memo_key(name, version, args, kwargs, client_identity(self))
+            if not is_fresh():
+                entry = load(name, key)
+                if entry is not None:
+                    logger.info(f"♻️ {name} 메모 적중 ({key[:12]}, run {entry.get('run_id')})")
+                    return entry["value"]
+
+            with collect_uncacheable() as reasons:
+                value = fn(self, *args, **kwargs)
+
+            if reasons:
+                logger.info(f"⏭️ {name} 결과 저장 안 함: {', '.join(reasons)}")
+            else:
+                try:
+                    store(name, key, version, value)
+                except (OSError, TypeError) as e:
+                    logger.warning(f"⚠️ {name} 메모 저장 실패: {e}")
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="노드 메모이제이션 저장소 관리")
+    parser.add_argument("command", choices=["list", "clear"])
+    parser.add_argument("--name", help="노드 이름 (없으면 전체)")
+    parser.add_argument("--key", help="입력 해시 (clear에서 --name과 함께)")
+    args = parser.parse_args(argv)
+
+    if args.command == "clear":
+        removed = invalidate(args.name, args.key)
+        print(f"🗑️  메모 {removed}건 삭제 ({memo_dir()})")
+        return 0
+
+    for name in ([args.name] if args.name else _names()):
+        directory = os.path.join(memo_dir(), name)
+        files = [f for f in os.listdir(directory) if f.endswith(".json")] if os.path.isdir(directory) else []
+        size_kb = sum(os.path.getsize(os.path.join(directory, f)) for f in files) / 1024
+        print(f"   {name:<24}{len(files):>6}건{size_kb:>10.1f}KB")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,332 @@
+# utils/metrics.py
+"""
+LLM 호출 지표 저장소
+- 호출마다 토큰(prompt/completion/cached), 지연 시간, 첫 토큰까지 시간(TTFT),
+  모델, 호출 노드를 append-only JSONL에 기록
+- 가격표로 호출 비용(USD/KRW) 계산
+- 과거 기록의 글당 비용/시간 p50·p90으로 예상치 산출 (고정 추정치 대체)
+
+환경 변수:
+- BLOG_METRICS_PATH: 저장 경로 (기본 outputs/metrics/llm_calls.jsonl)
+- BLOG_METRICS: "0"이면 기록 안 함
+- USD_KRW: 환율 (기본 1400)
+"""
+
+import json
+import os
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, Iterable, List, Optional
+
+from utils.logger import get_logger
+from utils.run_context import current_context, get_run_id
+
+logger = get_logger("Metrics")
+
+DEFAULT_METRICS_PATH = "outputs/metrics/llm_calls.jsonl"
+
+# 1M 토큰당 USD (input / cached_input / cache_write / output)
+PRICE_TABLE: Dict[str, Dict[str, float]] = {
+    "gpt-4o-mini": {"input": 0.15, "cached_input": 0.075, "output": 0.60},
+    "gpt-4o": {"input": 2.50, "cached_input": 1.25, "output": 10.00},
+    "claude-3-haiku-20240307": {"input": 0.25, "cached_input": 0.03, "cache_write": 0.30, "output": 1.25},
+    "claude-3-5-haiku-20241022": {"input": 0.80, "cached_input": 0.08, "cache_write": 1.00, "output": 4.00},
+    "claude-3-5-sonnet-20241022": {"input": 3.00, "cached_input": 0.30, "cache_write": 3.75, "output": 15.00},
+}
+
+# OpenAI Batch API 할인율
+BATCH_DISCOUNT = 0.5
+
+
+def usd_to_krw() -> float:
+    return float(os.getenv("USD_KRW", "1400"))
+
+
+def _price_for(model: str) -> Optional[Dict[str, float]]:
+    if model in PRICE_TABLE:
+        return PRICE_TABLE[model]
+    # 날짜 접미사가 붙은 스냅샷 이름 (예: gpt-4o-mini-2024-07-18)
+    for name in sorted(PRICE_TABLE, key=len, reverse=True):
+        if model.startswith(name):
+            return PRICE_TABLE[name]
+    return None
+
+
+def call_cost_usd(model: str, usage: Dict[str, int], batch: bool = False) -> float:
+    """
+    호출 1회 비용 (USD)
+
+    usage의 prompt_tokens는 캐시 적중/기록분을 포함한 입력 전체 기준
+    """
+    price = _price_for(model)
+    if price is None:
+        return 0.0
+
+    cached = usage.get("cached_tokens", 0)
+    cache_write = usage.get("cache_write_tokens", 0)
+    uncached = max(usage.get("prompt_tokens", 0) - cached - cache_write, 0)
+
+    cost = (
+        uncached * price["input"]
+        + cached * price.get("cached_input", price["input"])
+        + cache_write * price.get("cache_write", price["input"])
+        + usage.get("completion_tokens", 0) * price["output"]
+    ) / 1_000_000
+
+    return cost * BATCH_DISCOUNT if batch else cost
+
+
+class MetricsStore:
+    """append-only JSONL 지표 저장소 (스레드 안전)"""
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        self.path = path or os.getenv("BLOG_METRICS_PATH", DEFAULT_METRICS_PATH)
+        self.enabled = os.getenv("BLOG_METRICS", "1") != "0"
+        self._lock = threading.Lock()
+
+    def append(self, record: Dict[str, Any]) -> None:
+        if not self.enabled:
+            return
+        line = json.dumps(record, ensure_ascii=False)
+        try:
+            with self._lock:
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(line + "\n")
+        except OSError as e:
+            # 지표 기록 실패가 글 생성을 막으면 안 됨
+            logger.warning(f"⚠️ 지표 기록 실패: {e}")
+
+    def records(self) -> List[Dict[str, Any]]:
+        if not os.path.exists(self.path):
+            return []
+        records = []
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue  # 중간에 잘린 줄은 무시
+        return records
+
+
+# 현재 컨텍스트에서 마지막으로 기록된 호출 (라우터가 비용/지연 관측에 사용)
+_last_record: ContextVar[Optional[Dict[str, Any]]] = ContextVar("last_llm_record", default=None)
+
+_store: Optional[MetricsStore] = None
+_store_lock = threading.Lock()
+
+
+def get_metrics_store() -> MetricsStore:
+    """프로세스 공용 저장소"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = MetricsStore()
+        return _store
+
+
+def record_llm_call(
+    provider: str,
+    model: str,
+    usage: Dict[str, int],
+    latency_s: Optional[float],
+    ttft_s: Optional[float] = None,
+    batch: bool = False,
+    error: Optional[str] = None,
+    **extra: Any
+) -> Dict[str, Any]:
+    """
+    LLM 호출 1건 기록
+
+    Args:
+        provider: "openai" / "anthropic"
+        model: 실제 모델명
+        usage: 공통 형식 토큰 사용량
+        latency_s: 요청 시작~응답 완료 (배치는 None)
+        ttft_s: 요청 시작~첫 토큰 (스트리밍 시)
+        batch: Batch API 여부 (할인 적용)
+        error: 실패 시 예외 이름
+        extra: 추가 필드 (예: day, custom_id)
+    """
+    cost_usd = call_cost_usd(model, usage, batch=batch)
+    record: Dict[str, Any] = {
+        "ts": time.time(),
+        **current_context(),
+        "provider": provider,
+        "model": model,
+        "prompt_tokens": usage.get("prompt_tokens", 0),
+        "completion_tokens": usage.get("completion_tokens", 0),
+        "cached_tokens": usage.get("cached_tokens", 0),
+        "cache_write_tokens": usage.get("cache_write_tokens", 0),
+        "latency_s": round(latency_s, 3) if latency_s is not None else None,
+        "ttft_s": round(ttft_s, 3) if ttft_s is not None else None,
+        "batch": batch,
+        "cost_usd": round(cost_usd, 6),
+        "cost_krw": round(cost_usd * usd_to_krw(), 2),
+        "error": error,
+    }
+    record.update({key: value for key, value in extra.items() if value is not None})
+    get_metrics_store().append(record)
+    _last_record.set(record)
+    return record
+
+
+# 실행별 single-flight 합류 호출 수 (실제 요청이 없어 JSONL에는 기록하지 않음, 프로세스 메모리)
+_coalesced: Dict[str, int] = {}
+_coalesced_lock = threading.Lock()
+
+
+def record_coalesced_call() -> None:
+    """진행 중인 동일 요청에 합류한 호출 1건 (utils.llm_client.SingleFlight)"""
+    run_id = get_run_id()
+    with _coalesced_lock:
+        _coalesced[run_id] = _coalesced.get(run_id, 0) + 1
+
+
+def coalesced_calls(run_id: str) -> int:
+    with _coalesced_lock:
+        return _coalesced.get(run_id, 0)
+
+
+def last_call_record() -> Optional[Dict[str, Any]]:
+    """현재 컨텍스트의 마지막 LLM 호출 기록 (single-flight 합류 호출은 기록 없음)"""
+    return _last_record.get()
+
+
+def clear_last_call_record() -> None:
+    _last_record.set(None)
+
+
+# ---------------------------------------------------------------------------
+# 집계
+# ---------------------------------------------------------------------------
+
+def percentile(values: List[float], q: float) -> float:
+    """선형 보간 백분위수 (q: 0~100)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    pos = (len(ordered) - 1) * q / 100
+    low = int(pos)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (pos - low)
+
+
+def post_stats(records: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    글(run_id + day) 단위 비용/시간 집계
+
+    시간은 해당 글에 속한 호출 지연의 합 (배치 호출은 시간 집계에서 제외)
+    """
+    posts: Dict[tuple, Dict[str, Any]] = {}
+    for record in records:
+        if record.get("day") is None:
+            continue
+        key = (record.get("run_id"), record.get("day"))
+        post = posts.setdefault(key, {
+            "run_id": key[0], "day": key[1], "calls": 0,
+            "cost_krw": 0.0, "seconds": 0.0, "batch": False,
+        })
+        post["calls"] += 1
+        post["cost_krw"] += record.get("cost_krw") or 0.0
+        post["seconds"] += record.get("latency_s") or 0.0
+        post["batch"] = post["batch"] or bool(record.get("batch"))
+    return list(posts.values())
+
+
+def run_summary(run_id: str, records: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+    """한 번의 실행에 대한 실측 합계와 글당 평균"""
+    records = records if records is not None else get_metrics_store().records()
+    run_records = [r for r in records if r.get("run_id") == run_id]
+    posts = post_stats(run_records)
+
+    total_cost = sum(r.get("cost_krw") or 0.0 for r in run_records)
+    total_seconds = sum(r.get("latency_s") or 0.0 for r in run_records)
+    return {
+        "run_id": run_id,
+        "calls": len(run_records),
+        "coalesced_calls": coalesced_calls(run_id),
+        "posts": len(posts),
+        "prompt_tokens": sum(r.get("prompt_tokens", 0) for r in run_records),
+        "cached_tokens": sum(r.get("cached_tokens", 0) for r in run_records),
+        "completion_tokens": sum(r.get("completion_tokens", 0) for r in run_records),
+        "cost_krw": total_cost,
+        "seconds": total_seconds,
+        "cost_per_post_krw": total_cost / len(posts) if posts else 0.0,
+        "seconds_per_post": total_seconds / len(posts) if posts else 0.0,
+    }
+
+
+def project_posts(count: int, batch: bool = False, records: Optional[List[Dict[str, Any]]] = None) -> Optional[Dict[str, Any]]:
+    """
+    과거 글당 실측치의 p50/p90으로 count개 생성 시 비용/시간 예상
+
+    Returns:
+        예상치 dict, 이력이 없으면 None
+    """
+    records = records if records is not None else get_metrics_store().records()
+    posts = [p for p in post_stats(records) if p["batch"] == batch]
+    if not posts:
+        return None
+
+    costs = [p["cost_krw"] for p in posts]
+    seconds = [p["seconds"] for p in posts]
+    return {
+        "samples": len(posts),
+        "cost_p50_krw": percentile(costs, 50) * count,
+        "cost_p90_krw": percentile(costs, 90) * count,
+        "seconds_p50": percentile(seconds, 50) * count,
+        "seconds_p90": percentile(seconds, 90) * count,
+        "cost_per_post_p50_krw": percentile(costs, 50),
+        "seconds_per_post_p50": percentile(seconds, 50),
+    }
+
+
+def _format_seconds(seconds: float) -> str:
+    if seconds < 60:
+        return f"{seconds:.0f}초"
+    return f"{int(seconds // 60)}분 {int(seconds % 60)}초"
+
+
+def format_projection(count: int, batch: bool = False) -> str:
+    """CLI 출력용 예상 비용/시간 문자열"""
+    projection = project_posts(count, batch=batch)
+    if projection is None:
+        return "💰 예상 비용/시간: 측정 이력 없음 (첫 실행 후 실측치로 예측합니다)"
+
+    lines = [
+        f"💰 예상 비용: ₩{projection['cost_p50_krw']:,.0f} (p50) ~ ₩{projection['cost_p90_krw']:,.0f} (p90)"
+        f"  [글당 ₩{projection['cost_per_post_p50_krw']:,.1f}, 과거 {projection['samples']}개 기준]",
+    ]
+    if not batch:
+        lines.append(
+            f"⏱️  예상 시간: {_format_seconds(projection['seconds_p50'])} (p50) ~ "
+            f"{_format_seconds(projection['seconds_p90'])} (p90)"
+        )
+    return "\n".join(lines)
+
+
+def format_run_summary(run_id: str) -> str:
+    """CLI 출력용 실측 요약 문자열"""
+    summary = run_summary(run_id)
+    if not summary["calls"]:
+        return "📏 실측: 기록된 LLM 호출 없음"
+
+    lines = [
+        f"📏 실측 비용: ₩{summary['cost_krw']:,.1f} "
+        f"(LLM 호출 {summary['calls']}회, 동일 요청 합류 {summary['coalesced_calls']}회)",
+        f"   토큰: 입력 {summary['prompt_tokens']:,} (캐시 {summary['cached_tokens']:,}) / 출력 {summary['completion_tokens']:,}",
+    ]
+    if summary["posts"]:
+        lines.append(
+            f"   글당: ₩{summary['cost_per_post_krw']:,.1f}, "
+            f"{_format_seconds(summary['seconds_per_post'])} (LLM 대기 시간 기준)"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,281 @@
+# utils/model_router.py
+"""
+관측 기반 모델 라우터 (HybridLLMClient auto 모드)
+
+작업 유형(task_type)별로 후보 모델("gpt"/"claude")의 최근 호출을 롤링 윈도우로 관측:
+- 지연 시간, 오류율, JSON 유효율, 호출당 비용(원)
+
+선택 규칙:
+1. 노드별 오버라이드가 있으면 그대로 사용 (LLM_ROUTE_OVERRIDES / set_override)
+2. 관측이 부족한 후보가 있으면 기존 정적 규칙(simple → GPT, 그 외 → Claude)을 따르되
+   일정 확률(explore_rate)로 다른 후보를 시험
+3. 품질 하한(성공률 × JSON 유효율 ≥ quality_floor)을 넘는 후보 중
+   원당 기대 처리량(성공률 / (평균 지연 × 평균 비용))이 가장 큰 후보
+4. 하한을 넘는 후보가 없으면 품질이 가장 높은 후보
+
+환경 변수:
+- LLM_ROUTE_WINDOW: 롤링 윈도우 크기 (기본 50)
+- LLM_ROUTE_MIN_SAMPLES: 비교에 필요한 최소 관측 수 (기본 5)
+- LLM_ROUTE_QUALITY_FLOOR: 품질 하한 (기본 0.9)
+- LLM_ROUTE_EXPLORE: 탐색 확률 (기본 0.1)
+- LLM_ROUTE_OVERRIDES: 노드별 고정 (예: "ToneStyleGenerator=claude,TopicScorer=gpt")
+"""
+
+import os
+import random
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
+
+from utils.logger import get_logger
+from utils.metrics import get_metrics_store
+
+logger = get_logger("ModelRouter")
+
+# 관측이 부족할 때 쓰는 정적 기본값 (기존 HybridLLMClient 규칙)
+STATIC_DEFAULTS: Dict[str, str] = {
+    "simple": "gpt",
+    "creative": "claude",
+    "analytical": "claude",
+}
+
+# 지표 저장소의 provider → 라우팅 후보 이름
+PROVIDER_OPTIONS: Dict[str, str] = {
+    "openai": "gpt",
+    "anthropic": "claude",
+}
+
+# 비용이 0으로 기록된 경우(가격표에 없는 모델) 나눗셈 보호용 최소 비용(원)
+_MIN_COST_KRW = 0.01
+
+
+@dataclass
+class Observation:
+    latency_s: float
+    ok: bool
+    json_valid: Optional[bool]
+    cost_krw: Optional[float]
+
+
+class RouteStats:
+    """(task_type, 후보) 하나의 롤링 윈도우"""
+
+    def __init__(self, window: int) -> None:
+        self.observations: Deque[Observation] = deque(maxlen=window)
+
+    def add(self, observation: Observation) -> None:
+        self.observations.append(observation)
+
+    @property
+    def samples(self) -> int:
+        return len(self.observations)
+
+    @property
+    def success_rate(self) -> float:
+        if not self.observations:
+            return 1.0
+        return sum(1 for o in self.observations if o.ok) / len(self.observations)
+
+    @property
+    def json_valid_rate(self) -> float:
+        checked = [o.json_valid for o in self.observations if o.ok and o.json_valid is not None]
+        if not checked:
+            return 1.0
+        return sum(1 for valid in checked if valid) / len(checked)
+
+    @property
+    def quality(self) -> float:
+        return self.success_rate * self.json_valid_rate
+
+    @property
+    def mean_latency(self) -> float:
+        latencies = [o.latency_s for o in self.observations if o.ok]
+        return sum(latencies) / len(latencies) if latencies else float("inf")
+
+    @property
+    def mean_cost_krw(self) -> float:
+        costs = [o.cost_krw for o in self.observations if o.ok and o.cost_krw is not None]
+        return max(sum(costs) / len(costs), _MIN_COST_KRW) if costs else _MIN_COST_KRW
+
+    @property
+    def throughput_per_won(self) -> float:
+        """원당 기대 처리량 (성공 호출/초/원)"""
+        if self.mean_latency in (0, float("inf")):
+            return 0.0
+        return self.success_rate / (self.mean_latency * self.mean_cost_krw)
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "samples": self.samples,
+            "success_rate": round(self.success_rate, 3),
+            "json_valid_rate": round(self.json_valid_rate, 3),
+            "mean_latency_s": round(self.mean_latency, 3) if self.samples else None,
+            "mean_cost_krw": round(self.mean_cost_krw, 3),
+            "throughput_per_won": round(self.throughput_per_won, 4),
+        }
+
+
+def _parse_overrides(raw: str) -> Dict[str, str]:
+    overrides: Dict[str, str] = {}
+    for item in raw.split(","):
+        if "=" not in item:
+            continue
+        node, option = item.split("=", 1)
+        if node.strip() and option.strip():
+            overrides[node.strip()] = option.strip()
+    return overrides
+
+
+class ModelRouter:
+    """작업 유형별 관측 기반 후보 선택기 (스레드 안전)"""
+
+    def __init__(
+        self,
+        window: Optional[int] = None,
+        min_samples: Optional[int] = None,
+        quality_floor: Optional[float] = None,
+        explore_rate: Optional[float] = None,
+        overrides: Optional[Dict[str, str]] = None
+    ) -> None:
+        self.window = window or int(os.getenv("LLM_ROUTE_WINDOW", "50"))
+        self.min_samples = min_samples or int(os.getenv("LLM_ROUTE_MIN_SAMPLES", "5"))
+        self.quality_floor = (
+            quality_floor if quality_floor is not None
+            else float(os.getenv("LLM_ROUTE_QUALITY_FLOOR", "0.9"))
+        )
+        self.explore_rate = (
+            explore_rate if explore_rate is not None
+            else float(os.getenv("LLM_ROUTE_EXPLORE", "0.1"))
+        )
+        self.overrides = _parse_overrides(os.getenv("LLM_ROUTE_OVERRIDES", ""))
+        self.overrides.update(overrides or {})
+
+        self._stats: Dict[Tuple[str, str], RouteStats] = {}
+        self._lock = threading.Lock()
+        self._random = random.Random()
+
+    def _get(self, task_type: str, option: str) -> RouteStats:
+        key = (task_type, option)
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = RouteStats(self.window)
+            self._stats[key] = stats
+        return stats
+
+    # --- 오버라이드 -------------------------------------------------------------
+
+    def set_override(self, node: str, option: Optional[str]) -> None:
+        """노드별 고정 후보 지정 (None이면 해제)"""
+        with self._lock:
+            if option is None:
+                self.overrides.pop(node, None)
+            else:
+                self.overrides[node] = option
+
+    # --- 관측 / 선택 ------------------------------------------------------------
+
+    def record(
+        self,
+        task_type: str,
+        option: str,
+        latency_s: float,
+        ok: bool,
+        json_valid: Optional[bool] = None,
+        cost_krw: Optional[float] = None
+    ) -> None:
+        with self._lock:
+            self._get(task_type, option).add(Observation(latency_s, ok, json_valid, cost_krw))
+
+    def choose(self, task_type: str, candidates: List[str], node: Optional[str] = None) -> str:
+        """
+        후보 중 하나 선택
+
+        Args:
+            task_type: 작업 유형
+            candidates: 사용 가능한 후보 (예: ["gpt", "claude"])
+            node: 호출 노드 이름 (오버라이드 조회용)
+        """
+        if not candidates:
+            raise ValueError("선택 가능한 모델 후보가 없습니다")
+
+        with self._lock:
+            override = self.overrides.get(node) if node else None
+            if override in candidates:
+                return override
+
+            if len(candidates) == 1:
+                return candidates[0]
+
+            default = STATIC_DEFAULTS.get(task_type, candidates[0])
+            if default not in candidates:
+                default = candidates[0]
+
+            stats = {option: self._get(task_type, option) for option in candidates}
+
+            # 관측 부족: 정적 기본값 + 탐색
+            if any(s.samples < self.min_samples for s in stats.values()):
+                if self._random.random() < self.explore_rate:
+                    under_sampled = [o for o, s in stats.items() if s.samples < self.min_samples and o != default]
+                    pool = under_sampled or [o for o in candidates if o != default]
+                    return self._random.choice(pool)
+                return default
+
+            qualified = [o for o, s in stats.items() if s.quality >= self.quality_floor]
+            if not qualified:
+                best = max(candidates, key=lambda o: stats[o].quality)
+                logger.warning(
+                    f"⚠️ {task_type}: 품질 하한({self.quality_floor:.2f})을 넘는 모델 없음 → "
+                    f"{best} (품질 {stats[best].quality:.2f})"
+                )
+                return best
+
+            return max(qualified, key=lambda o: stats[o].throughput_per_won)
+
+    def warm_start(self, records: Iterable[Dict[str, Any]]) -> int:
+        """
+        지표 저장소(utils.metrics)의 과거 하이브리드 호출로 윈도우 채우기
+        (JSON 유효 여부는 기록되지 않으므로 미확인으로 둠)
+
+        Returns:
+            반영한 관측 수
+        """
+        count = 0
+        with self._lock:
+            for record in records:
+                task_type = record.get("task_type")
+                option = PROVIDER_OPTIONS.get(record.get("provider", ""))
+                if not task_type or not option or record.get("batch"):
+                    continue
+                self._get(task_type, option).add(Observation(
+                    latency_s=record.get("latency_s") or 0.0,
+                    ok=record.get("error") is None,
+                    json_valid=None,
+                    cost_krw=record.get("cost_krw"),
+                ))
+                count += 1
+        return count
+
+    def snapshot(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """task_type → 후보 → 요약 지표"""
+        with self._lock:
+            result: Dict[str, Dict[str, Dict[str, float]]] = {}
+            for (task_type, option), stats in self._stats.items():
+                result.setdefault(task_type, {})[option] = stats.summary()
+            return result
+
+
+_router: Optional[ModelRouter] = None
+_router_lock = threading.Lock()
+
+
+def get_model_router() -> ModelRouter:
+    """프로세스 공용 라우터 (하이브리드 클라이언트끼리 관측 공유)"""
+    global _router
+    with _router_lock:
+        if _router is None:
+            _router = ModelRouter()
+            warmed = _router.warm_start(get_metrics_store().records()[-2000:])
+            if warmed:
+                logger.info(f"🧭 모델 라우터: 과거 호출 {warmed}건으로 초기화")
+        return _router
@@ -2,10 +2,12 @@
 import os
 import json
 import logging
-import requests
 from typing import Dict, List, Any
 
+from utils.http_client import get_http_session
 from utils.logger import get_logger
+from utils.naver_search import naver_api_base
+from utils.shared_cache import get_shared_cache
 
 logger = get_logger("NaverDataLab")
 
@@ -20,16 +22,23 @@ class NaverDataLabClient:
         if not self.client_id or not self.client_secret:
             logger.warning("NAVER_CLIENT_ID 또는 NAVER_CLIENT_SECRET 미설정. LLM fallback을 사용합니다.")
 
-        self.url = "https://openapi.naver.com/v1/datalab/search"
+        self.url = f"{naver_api_base()}/v1/datalab/search"
 
     def get_volume(self, keywords: List[str]) -> Dict[str, Any]:
         """
-        키워드 검색량 조회
+        키워드 검색량 조회 (같은 프로세스의 다른 블로그 파이프라인과 결과 공유, fallback은 저장 안 함)
         """
 
         if not self.client_id or not self.client_secret:
             return {"fallback": True}
 
+        return get_shared_cache("datalab_volume").get_or_compute(
+            {"keywords": keywords},
+            lambda: self._get_volume(keywords),
+            cacheable=lambda value: not value["fallback"]
+        )
+
+    def _get_volume(self, keywords: List[str]) -> Dict[str, Any]:
         headers = {
             "X-Naver-Client-Id": self.client_id,
             "X-Naver-Client-Secret": self.client_secret,
@@ -44,7 +53,7 @@ class NaverDataLabClient:
         }
 
         try:
-            response = requests.post(self.url, headers=headers, data=json.dumps(body))
+            response = get_http_session().post(self.url, headers=headers, data=json.dumps(body))
             response.raise_for_status()
             result = response.json()
             return {"fallback": False, "result": result}
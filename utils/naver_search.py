@@ -1,12 +1,23 @@
 # utils/naver_search.py
 import os
-import requests
 from typing import Dict, List, Any
+from utils.http_client import get_http_session
 from utils.logger import get_logger
+from utils.shared_cache import get_shared_cache
 
 logger = get_logger("NaverSearch")
 
 
+def naver_api_base() -> str:
+    """네이버 오픈 API 주소 (NAVER_API_BASE_URL로 로컬 대역 서버 지정 가능)"""
+    return os.getenv("NAVER_API_BASE_URL", "https://openapi.naver.com").rstrip("/")
+
+
+def naver_blog_base() -> str:
+    """네이버 블로그 주소 (NAVER_BLOG_BASE_URL로 로컬 대역 서버 지정 가능)"""
+    return os.getenv("NAVER_BLOG_BASE_URL", "https://blog.naver.com").rstrip("/")
+
+
 class NaverSearchClient:
     """네이버 검색 API 클라이언트"""
 
@@ -17,9 +28,16 @@ class NaverSearchClient:
         if not self.client_id or not self.client_secret:
             raise ValueError("NAVER_CLIENT_ID 또는 NAVER_CLIENT_SECRET이 .env에 없습니다.")
 
-        self.url = "https://openapi.naver.com/v1/search/blog.json"
+        self.url = f"{naver_api_base()}/v1/search/blog.json"
 
     def search(self, query: str, num: int = 10) -> List[Dict[str, Any]]:
+        """블로그 검색 (같은 프로세스의 다른 블로그 파이프라인과 결과 공유)"""
+        return get_shared_cache("naver_search").get_or_compute(
+            {"query": query, "num": num},
+            lambda: self._search(query, num)
+        )
+
+    def _search(self, query: str, num: int) -> List[Dict[str, Any]]:
         headers = {
             "X-Naver-Client-Id": self.client_id,
             "X-Naver-Client-Secret": self.client_secret,
@@ -33,7 +51,7 @@ class NaverSearchClient:
         }
 
         try:
-            res = requests.get(self.url, headers=headers, params=params, timeout=5)
+            res = get_http_session().get(self.url, headers=headers, params=params, timeout=5)
             res.raise_for_status()
             data = res.json()
             return data.get("items", [])
@@ -0,0 +1,222 @@
+# utils/openai_batch.py
+"""
+OpenAI Batch API 실행기
+- 지연 시간은 상관없고 비용/레이트 리밋이 중요한 예약 백필용 (정가 대비 50% 할인, 최대 24시간)
+- 요청 JSONL 작성 → 파일 업로드 → 배치 생성 → 폴링 → 결과 파일 다운로드
+- LLM_BASE_URL(또는 OPENAI_BASE_URL)을 로컬 대역 서버(mock_server)로 지정하면 오프라인 테스트 가능
+"""
+
+import json
+import os
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from openai import OpenAIError
+
+from utils.logger import get_logger
+from utils.llm_client import LLMClient, get_llm_client, validated_json
+from utils.metrics import record_llm_call
+
+logger = get_logger("OpenAIBatch")
+
+BATCH_ENDPOINT = "/v1/chat/completions"
+TERMINAL_STATUSES = ("completed", "failed", "expired", "cancelled")
+
+
+class BatchJobError(RuntimeError):
+    """배치 작업이 완료되지 못한 경우 (failed/expired/cancelled/시간 초과)"""
+
+
+class OpenAIBatchRunner:
+    """
+    chat.completions 요청 묶음을 Batch API로 실행
+
+    사용 예:
+        runner = OpenAIBatchRunner()
+        bodies = [("day01", llm.build_params(prompt, schema=SCHEMA))]
+        outputs = runner.run(bodies, name="structure", schema=SCHEMA)
+    """
+
+    def __init__(
+        self,
+        llm: Optional[LLMClient] = None,
+        poll_interval: float = 30.0,
+        timeout: float = 24 * 3600,
+        work_dir: str = "outputs/batches"
+    ) -> None:
+        self.llm = llm or get_llm_client("gpt")
+        self.poll_interval = float(os.getenv("OPENAI_BATCH_POLL_INTERVAL", poll_interval))
+        self.timeout = timeout
+        self.work_dir = work_dir
+
+    def write_requests(self, requests: List[Tuple[str, Dict[str, Any]]], name: str) -> str:
+        """요청 목록을 Batch API 입력 JSONL 파일로 저장"""
+        os.makedirs(self.work_dir, exist_ok=True)
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        path = os.path.join(self.work_dir, f"{name}_{stamp}.jsonl")
+
+        with open(path, "w", encoding="utf-8") as f:
+            for custom_id, body in requests:
+                line = {
+                    "custom_id": custom_id,
+                    "method": "POST",
+                    "url": BATCH_ENDPOINT,
+                    "body": body,
+                }
+                f.write(json.dumps(line, ensure_ascii=False) + "\n")
+
+        logger.info(f"📦 배치 요청 {len(requests)}건 저장: {path}")
+        return path
+
+    def submit(self, input_path: str, name: str) -> str:
+        """입력 파일 업로드 + 배치 생성, batch id 반환"""
+        client = self.llm.client
+        with open(input_path, "rb") as f:
+            uploaded = client.files.create(file=f, purpose="batch")
+
+        batch = client.batches.create(
+            input_file_id=uploaded.id,
+            endpoint=BATCH_ENDPOINT,
+            completion_window="24h",
+            metadata={"job": name},
+        )
+        logger.info(f"🚀 배치 제출: {batch.id} ({name})")
+        return batch.id
+
+    def wait(self, batch_id: str) -> Any:
+        """종료 상태가 될 때까지 폴링"""
+        client = self.llm.client
+        deadline = time.monotonic() + self.timeout
+
+        while True:
+            batch = client.batches.retrieve(batch_id)
+            counts = getattr(batch, "request_counts", None)
+            if counts is not None:
+                logger.info(
+                    f"   ⏳ {batch_id}: {batch.status} "
+                    f"({counts.completed}/{counts.total} 완료, 실패 {counts.failed})"
+                )
+            else:
+                logger.info(f"   ⏳ {batch_id}: {batch.status}")
+
+            if batch.status in TERMINAL_STATUSES:
+                return batch
+            if time.monotonic() > deadline:
+                raise BatchJobError(f"배치 대기 시간 초과: {batch_id}")
+            time.sleep(self.poll_interval)
+
+    def fetch_results(
+        self,
+        batch: Any,
+        schema: Optional[Any] = None,
+        tags: Optional[Dict[str, Dict[str, Any]]] = None
+    ) -> Dict[str, Optional[str]]:
+        """
+        결과 파일을 읽어 custom_id별 응답 텍스트로 변환
+
+        실패한 요청(오류 파일 포함)과 스키마 검증 실패는 None
+        tags: custom_id별 지표에 덧붙일 필드 (예: {"day": 3})
+        """
+        tags = tags or {}
+        client = self.llm.client
+        results: Dict[str, Optional[str]] = {}
+
+        if batch.output_file_id:
+            text = client.files.content(batch.output_file_id).text
+            for line in text.splitlines():
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                custom_id = record.get("custom_id")
+                results[custom_id] = self._parse_record(record, schema, tags.get(custom_id, {}))
+
+        if getattr(batch, "error_file_id", None):
+            text = client.files.content(batch.error_file_id).text
+            for line in text.splitlines():
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                custom_id = record.get("custom_id")
+                logger.error(f"❌ 배치 요청 실패 ({custom_id}): {record.get('error')}")
+                results.setdefault(custom_id, None)
+
+        return results
+
+    def _parse_record(
+        self,
+        record: Dict[str, Any],
+        schema: Optional[Any],
+        tag: Dict[str, Any]
+    ) -> Optional[str]:
+        custom_id = record.get("custom_id")
+        response = record.get("response") or {}
+        if record.get("error") or response.get("status_code") != 200:
+            logger.error(f"❌ 배치 요청 실패 ({custom_id}): {record.get('error') or response.get('status_code')}")
+            return None
+
+        body = response.get("body") or {}
+        usage = body.get("usage") or {}
+        details = usage.get("prompt_tokens_details") or {}
+        usage = {
+            "prompt_tokens": usage.get("prompt_tokens", 0),
+            "completion_tokens": usage.get("completion_tokens", 0),
+            "cached_tokens": details.get("cached_tokens", 0) or 0,
+        }
+        self.llm.usage.record(usage)
+        record_llm_call(
+            "openai", body.get("model", self.llm.model), usage, None,
+            batch=True, custom_id=custom_id, **tag
+        )
+
+        choices = body.get("choices") or [{}]
+        content = (choices[0].get("message") or {}).get("content") or ""
+        if schema is None:
+            return content
+
+        try:
+            return validated_json(content, schema, f"OpenAIBatch.{custom_id}")
+        except ValueError as e:
+            logger.error(f"❌ 스키마 검증 실패 ({custom_id}): {e}")
+            return None
+
+    def run(
+        self,
+        requests: List[Tuple[str, Dict[str, Any]]],
+        name: str,
+        schema: Optional[Any] = None,
+        tags: Optional[Dict[str, Dict[str, Any]]] = None
+    ) -> Dict[str, Optional[str]]:
+        """
+        작성 → 제출 → 대기 → 결과 수집을 한 번에 실행
+
+        Args:
+            requests: (custom_id, chat.completions 요청 본문) 목록
+            name: 작업 이름 (파일명/metadata)
+            schema: 응답 검증용 스키마 (선택)
+            tags: custom_id별 지표 필드 (선택)
+
+        Returns:
+            {custom_id: 응답 텍스트 또는 None}
+
+        Raises:
+            BatchJobError: 배치가 completed 상태로 끝나지 않은 경우
+        """
+        if not requests:
+            return {}
+
+        input_path = self.write_requests(requests, name)
+        try:
+            batch_id = self.submit(input_path, name)
+            batch = self.wait(batch_id)
+        except OpenAIError as e:
+            logger.error(f"OpenAI Batch API 오류: {e}")
+            raise
+
+        if batch.status != "completed":
+            raise BatchJobError(f"배치 {batch_id} 종료 상태: {batch.status}")
+
+        results = self.fetch_results(batch, schema, tags)
+        succeeded = sum(1 for value in results.values() if value is not None)
+        logger.info(f"✅ 배치 완료: {batch_id} ({succeeded}/{len(requests)} 성공)")
+        return results
@@ -0,0 +1,477 @@
+# utils/plan_store.py
+"""
+계획/콘텐츠 저장소 (SQLite WAL)
+
+- initial_pipeline_result.json 전체(SERP 원문, 대화 기록 포함)를 매번 읽지 않고 (블로그, Day)로 계획 항목 하나를 바로 조회
+- 테이블: plans(블로그별 계획 정보), days(Day별 계획 항목), day_keywords(키워드 색인),
+  serp_snapshots(SERP 수집 결과), tone_guides(문체·톤 가이드), posts(생성 결과)
+- 카테고리 / 키워드(정확히 일치) 색인 조회
+- JSON 가져오기/내보내기: 기존 initial_pipeline_result.json / tone_style_guide.json 형식 그대로
+  (load_plan_store는 JSON 원본이 가져온 뒤에 바뀌었으면 다시 가져오므로 JSON을 직접 고쳐도 반영됨)
+
+환경 변수:
+- BLOG_PLAN_DB: DB 경로 (기본 outputs/plan_store.sqlite)
+
+CLI:
+    python -m utils.plan_store import --blog woncamp [--file outputs/initial_pipeline_result.json] [--tone-guide ...]
+    python -m utils.plan_store export --blog woncamp --out outputs/woncamp_plan.json
+    python -m utils.plan_store list
+    python -m utils.plan_store days --blog woncamp [--category 가이드] [--keyword 캠핑]
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+from utils.logger import get_logger
+
+logger = get_logger("PlanStore")
+
+DEFAULT_PLAN_DB = "outputs/plan_store.sqlite"
+DEFAULT_PLAN_FILE = "outputs/initial_pipeline_result.json"
+DEFAULT_TONE_GUIDE_FILE = "outputs/tone_style_guide.json"
+# 블로그 구분 없이 실행하는 단일 블로그 스크립트(daily_content_generator 등)의 블로그 이름
+DEFAULT_BLOG = "default"
+
+PLAN_KEY = "30_days_plan"
+# 색인할 계획 항목의 키워드 필드
+KEYWORD_FIELDS = ("main_keywords", "sub_keywords", "keywords")
+
+
+def _keywords(item: Dict[str, Any]) -> List[str]:
+    words: List[str] = []
+    for key in KEYWORD_FIELDS:
+        values = item.get(key) or []
+        for value in [values] if isinstance(values, str) else values:
+            word = str(value).strip()
+            if word and word not in words:
+                words.append(word)
+    return words
+
+
+def _mtime(path: str) -> float:
+    return os.path.getmtime(path)
+
+
+class PlanStore:
+    """SQLite 계획/콘텐츠 저장소 (프로세스마다 인스턴스 하나)"""
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        self.path = path or os.getenv("BLOG_PLAN_DB", DEFAULT_PLAN_DB)
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS plans (
+                blog          TEXT PRIMARY KEY,
+                topic         TEXT NOT NULL DEFAULT '',
+                plan_meta     TEXT NOT NULL DEFAULT '{}',
+                extra         TEXT NOT NULL DEFAULT '{}',
+                source        TEXT NOT NULL DEFAULT '',
+                source_mtime  REAL NOT NULL DEFAULT 0,
+                imported_at   REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS days (
+                blog          TEXT NOT NULL,
+                day           INTEGER NOT NULL,
+                category      TEXT NOT NULL DEFAULT '',
+                content_type  TEXT NOT NULL DEFAULT '',
+                title         TEXT NOT NULL DEFAULT '',
+                item          TEXT NOT NULL,
+                PRIMARY KEY (blog, day)
+            );
+            CREATE INDEX IF NOT EXISTS days_category ON days (blog, category, day);
+            CREATE TABLE IF NOT EXISTS day_keywords (
+                blog     TEXT NOT NULL,
+                keyword  TEXT NOT NULL,
+                day      INTEGER NOT NULL,
+                PRIMARY KEY (keyword, blog, day)
+            );
+            CREATE TABLE IF NOT EXISTS serp_snapshots (
+                id             INTEGER PRIMARY KEY AUTOINCREMENT,
+                blog           TEXT NOT NULL,
+                topic          TEXT NOT NULL DEFAULT '',
+                total_results  INTEGER NOT NULL DEFAULT 0,
+                data           TEXT NOT NULL,
+                taken_at       REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS serp_blog ON serp_snapshots (blog, id);
+            CREATE TABLE IF NOT EXISTS tone_guides (
+                blog          TEXT PRIMARY KEY,
+                data          TEXT NOT NULL,
+                source        TEXT NOT NULL DEFAULT '',
+                source_mtime  REAL NOT NULL DEFAULT 0,
+                updated_at    REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS posts (
+                blog        TEXT NOT NULL,
+                day         INTEGER NOT NULL,
+                stage       TEXT NOT NULL,
+                title       TEXT NOT NULL DEFAULT '',
+                char_count  INTEGER NOT NULL DEFAULT 0,
+                file        TEXT,
+                content     TEXT NOT NULL,
+                created_at  REAL NOT NULL,
+                PRIMARY KEY (blog, day, stage)
+            );
+            """
+        )
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            else:
+                self._conn.execute("COMMIT")
+
+    # ---- 가져오기 / 내보내기 ----
+
+    def import_result(self, blog: str, result: Dict[str, Any], source: str = "", source_mtime: float = 0.0) -> int:
+        """
+        초기 파이프라인 결과(initial_pipeline_result.json 형식) 가져오기 (블로그의 기존 계획은 교체)
+
+        Returns:
+            가져온 Day 수
+        """
+        content_plan = dict(result.get("content_plan") or {})
+        items = content_plan.pop(PLAN_KEY, [])
+        extra = {
+            key: value for key, value in result.items()
+            if key not in ("content_plan", "serp_data", "tone_style_guide")
+        }
+        serp = result.get("serp_data")
+        now = time.time()
+        with self._transaction() as conn:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO plans (blog, topic, plan_meta, extra, source, source_mtime, imported_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                (blog, str(content_plan.get("topic", "")), json.dumps(content_plan, ensure_ascii=False),
+                 json.dumps(extra, ensure_ascii=False), source, source_mtime, now),
+            )
+            conn.execute("DELETE FROM days WHERE blog = ?", (blog,))
+            conn.execute("DELETE FROM day_keywords WHERE blog = ?", (blog,))
+            for index, item in enumerate(items, 1):
+                # Day 번호는 목록 순서 기준 (기존 코드가 plan_items[day - 1]로 읽던 것과 같게)
+                conn.execute(
+                    "INSERT INTO days (blog, day, category, content_type, title, item) VALUES (?, ?, ?, ?, ?, ?)",
+                    (blog, index, str(item.get("category", "")), str(item.get("content_type", "")),
+                     str(item.get("title", "")), json.dumps(item, ensure_ascii=False)),
+                )
+                conn.executemany(
+                    "INSERT OR IGNORE INTO day_keywords (blog, keyword, day) VALUES (?, ?, ?)",
+                    [(blog, word, index) for word in _keywords(item)],
+                )
+            if serp:
+                self._insert_serp(conn, blog, serp, now)
+            if result.get("tone_style_guide"):
+                self._put_tone_guide(conn, blog, result["tone_style_guide"], source, source_mtime, now)
+        logger.info(f"📥 {blog} 계획 {len(items)}일 가져옴{f' ({source})' if source else ''}")
+        return len(items)
+
+    def import_file(self, blog: str, plan_file: str = DEFAULT_PLAN_FILE, force: bool = False) -> bool:
+        """JSON 파일이 마지막으로 가져온 뒤 바뀌었으면 다시 가져오기 (가져왔으면 True, 파일이 없으면 FileNotFoundError)"""
+        mtime = _mtime(plan_file)
+        if not force:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT source, source_mtime FROM plans WHERE blog = ?", (blog,)
+                ).fetchone()
+            if row is not None and row["source"] == plan_file and row["source_mtime"] >= mtime:
+                return False
+        with open(plan_file, "r", encoding="utf-8") as f:
+            result = json.load(f)
+        self.import_result(blog, result, source=plan_file, source_mtime=mtime)
+        return True
+
+    def import_tone_guide_file(self, blog: str, path: str = DEFAULT_TONE_GUIDE_FILE, force: bool = False) -> bool:
+        """문체·톤 가이드 JSON이 바뀌었으면 다시 가져오기 (가져왔으면 True, 파일이 없으면 FileNotFoundError)"""
+        mtime = _mtime(path)
+        if not force:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT source, source_mtime FROM tone_guides WHERE blog = ?", (blog,)
+                ).fetchone()
+            if row is not None and row["source"] == path and row["source_mtime"] >= mtime:
+                return False
+        with open(path, "r", encoding="utf-8") as f:
+            guide = json.load(f)
+        with self._transaction() as conn:
+            self._put_tone_guide(conn, blog, guide, path, mtime, time.time())
+        return True
+
+    def export_result(self, blog: str) -> Dict[str, Any]:
+        """initial_pipeline_result.json 형식으로 내보내기 (최신 SERP / 문체·톤 가이드 포함, 계획이 없으면 KeyError)"""
+        with self._lock:
+            row = self._conn.execute("SELECT plan_meta, extra FROM plans WHERE blog = ?", (blog,)).fetchone()
+        if row is None:
+            raise KeyError(f"계획이 없습니다: {blog}")
+        result = json.loads(row["extra"])
+        result["serp_data"] = self.serp_snapshot(blog)
+        tone_guide = self.tone_guide(blog)
+        if tone_guide is not None:
+            result["tone_style_guide"] = tone_guide
+        result["content_plan"] = {**json.loads(row["plan_meta"]), PLAN_KEY: self.plan_items(blog)}
+        return result
+
+    # ---- 계획 조회 ----
+
+    def blogs(self) -> List[Dict[str, Any]]:
+        """블로그별 계획 요약 (주제, Day 수, 원본, 가져온 시각)"""
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT plans.blog, plans.topic, plans.source, plans.imported_at, COUNT(days.day) AS days
+                FROM plans LEFT JOIN days ON days.blog = plans.blog
+                GROUP BY plans.blog ORDER BY plans.blog
+                """
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def has_plan(self, blog: str) -> bool:
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM plans WHERE blog = ?", (blog,)).fetchone() is not None
+
+    def day_count(self, blog: str) -> int:
+        with self._lock:
+            return int(self._conn.execute("SELECT COUNT(*) FROM days WHERE blog = ?", (blog,)).fetchone()[0])
+
+    def plan_item(self, blog: str, day: int) -> Optional[Dict[str, Any]]:
+        """Day 계획 항목 하나 (없으면 None, 호출자가 고쳐도 되는 새 dict)"""
+        with self._lock:
+            row = self._conn.execute("SELECT item FROM days WHERE blog = ? AND day = ?", (blog, day)).fetchone()
+        return json.loads(row["item"]) if row is not None else None
+
+    def plan_items(self, blog: str, start_day: int = 1, end_day: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Day 순 계획 항목 (start_day~end_day)"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT item FROM days WHERE blog = ? AND day >= ? AND day <= ? ORDER BY day",
+                (blog, start_day, end_day if end_day is not None else 2 ** 31),
+            ).fetchall()
+        return [json.loads(row["item"]) for row in rows]
+
+    def find_days(
+        self,
+        blog: Optional[str] = None,
+        category: Optional[str] = None,
+        keyword: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """카테고리 / 키워드로 Day 찾기 (blog, day, category, content_type, title)"""
+        query = "SELECT days.blog, days.day, days.category, days.content_type, days.title FROM days"
+        params: List[Any] = []
+        if keyword is not None:
+            query += " JOIN day_keywords ON day_keywords.blog = days.blog AND day_keywords.day = days.day"
+            query += " WHERE day_keywords.keyword = ?"
+            params.append(keyword.strip())
+        else:
+            query += " WHERE 1 = 1"
+        if blog is not None:
+            query += " AND days.blog = ?"
+            params.append(blog)
+        if category is not None:
+            query += " AND days.category = ?"
+            params.append(category)
+        with self._lock:
+            rows = self._conn.execute(query + " ORDER BY days.blog, days.day", params).fetchall()
+        return [dict(row) for row in rows]
+
+    def categories(self, blog: str) -> Dict[str, int]:
+        """카테고리별 Day 수"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT category, COUNT(*) AS n FROM days WHERE blog = ? GROUP BY category ORDER BY MIN(day)", (blog,)
+            ).fetchall()
+        return {row["category"]: row["n"] for row in rows}
+
+    # ---- SERP / 문체·톤 가이드 ----
+
+    def _insert_serp(self, conn: sqlite3.Connection, blog: str, data: Dict[str, Any], now: float) -> int:
+        cursor = conn.execute(
+            "INSERT INTO serp_snapshots (blog, topic, total_results, data, taken_at) VALUES (?, ?, ?, ?, ?)",
+            (blog, str(data.get("topic", "")), int(data.get("total_results") or len(data.get("serp_results", []))),
+             json.dumps(data, ensure_ascii=False), now),
+        )
+        return int(cursor.lastrowid)
+
+    def add_serp_snapshot(self, blog: str, data: Dict[str, Any]) -> int:
+        """SERP 수집 결과 추가 (이전 스냅숏은 기록으로 남음)"""
+        with self._transaction() as conn:
+            return self._insert_serp(conn, blog, data, time.time())
+
+    def serp_snapshot(self, blog: str) -> Dict[str, Any]:
+        """가장 최근 SERP 수집 결과 (없으면 빈 dict)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM serp_snapshots WHERE blog = ? ORDER BY id DESC LIMIT 1", (blog,)
+            ).fetchone()
+        return json.loads(row["data"]) if row is not None else {}
+
+    def _put_tone_guide(
+        self, conn: sqlite3.Connection, blog: str, guide: Dict[str, Any], source: str, source_mtime: float, now: float
+    ) -> None:
+        conn.execute(
+            "INSERT OR REPLACE INTO tone_guides (blog, data, source, source_mtime, updated_at) VALUES (?, ?, ?, ?, ?)",
+            (blog, json.dumps(guide, ensure_ascii=False), source, source_mtime, now),
+        )
+
+    def put_tone_guide(self, blog: str, guide: Dict[str, Any]) -> None:
+        with self._transaction() as conn:
+            self._put_tone_guide(conn, blog, guide, "", 0.0, time.time())
+
+    def tone_guide(self, blog: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM tone_guides WHERE blog = ?", (blog,)).fetchone()
+        return json.loads(row["data"]) if row is not None else None
+
+    # ---- 생성 결과 ----
+
+    def save_post(
+        self,
+        blog: str,
+        day: int,
+        stage: str,
+        content: Dict[str, Any],
+        file: Optional[str] = None
+    ) -> None:
+        """생성 결과 기록/교체 (stage: seo / write)"""
+        char_count = content.get("full_text_length") or len(content.get("final_content", ""))
+        with self._transaction() as conn:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO posts (blog, day, stage, title, char_count, file, content, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (blog, day, stage, str(content.get("title") or content.get("seo_title") or ""), int(char_count),
+                 file, json.dumps(content, ensure_ascii=False), time.time()),
+            )
+
+    def post(self, blog: str, day: int, stage: str = "seo") -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content FROM posts WHERE blog = ? AND day = ? AND stage = ?", (blog, day, stage)
+            ).fetchone()
+        return json.loads(row["content"]) if row is not None else None
+
+    def posts(self, blog: str, stage: Optional[str] = None) -> List[Dict[str, Any]]:
+        """생성 결과 목록 (본문 제외: blog, day, stage, title, char_count, file, created_at)"""
+        query = "SELECT blog, day, stage, title, char_count, file, created_at FROM posts WHERE blog = ?"
+        params: List[Any] = [blog]
+        if stage is not None:
+            query += " AND stage = ?"
+            params.append(stage)
+        with self._lock:
+            rows = self._conn.execute(query + " ORDER BY day, stage", params).fetchall()
+        return [dict(row) for row in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_store: Optional[PlanStore] = None
+_store_lock = threading.Lock()
+
+
+def get_plan_store() -> PlanStore:
+    """프로세스 공용 저장소 (BLOG_PLAN_DB)"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = PlanStore()
+        return _store
+
+
+def load_plan_store(
+    blog: str = DEFAULT_BLOG,
+    plan_file: Optional[str] = DEFAULT_PLAN_FILE,
+    tone_guide_file: Optional[str] = DEFAULT_TONE_GUIDE_FILE
+) -> PlanStore:
+    """
+    JSON 원본이 가져온 뒤에 바뀌었으면 다시 가져온 뒤 공용 저장소 반환
+
+    JSON 파일이 없거나(None이면 저장소만 사용) 저장소에 이미 있으면 그대로 사용
+    (계획이 어디에도 없으면 FileNotFoundError)
+    """
+    store = get_plan_store()
+    if plan_file and os.path.exists(plan_file):
+        store.import_file(blog, plan_file)
+    elif not store.has_plan(blog):
+        source = plan_file or "블로그 설정의 plan_file"
+        raise FileNotFoundError(f"{blog} 콘텐츠 계획이 없습니다: {source} (저장소 {store.path}에도 없음)")
+    if tone_guide_file and os.path.exists(tone_guide_file):
+        store.import_tone_guide_file(blog, tone_guide_file)
+    return store
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="계획/콘텐츠 저장소")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    imp = sub.add_parser("import", help="JSON 결과 가져오기 (블로그의 기존 계획 교체)")
+    imp.add_argument("--blog", default=DEFAULT_BLOG)
+    imp.add_argument("--file", default=DEFAULT_PLAN_FILE)
+    imp.add_argument("--tone-guide", help=f"문체·톤 가이드 JSON (예: {DEFAULT_TONE_GUIDE_FILE})")
+
+    exp = sub.add_parser("export", help="initial_pipeline_result.json 형식으로 내보내기")
+    exp.add_argument("--blog", default=DEFAULT_BLOG)
+    exp.add_argument("--out", required=True)
+
+    sub.add_parser("list", help="블로그별 계획 요약")
+    days = sub.add_parser("days", help="Day 목록 (카테고리/키워드 필터)")
+    days.add_argument("--blog")
+    days.add_argument("--category")
+    days.add_argument("--keyword")
+
+    args = parser.parse_args(argv)
+    store = PlanStore()
+
+    if args.command == "import":
+        store.import_file(args.blog, args.file, force=True)
+        if args.tone_guide:
+            store.import_tone_guide_file(args.blog, args.tone_guide, force=True)
+        print(f"📥 {args.blog}: {store.day_count(args.blog)}일 계획 가져옴 → {store.path}")
+    elif args.command == "export":
+        result = store.export_result(args.blog)
+        directory = os.path.dirname(args.out)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        print(f"📤 {args.blog}: {len(result['content_plan'][PLAN_KEY])}일 계획 내보냄 → {args.out}")
+    elif args.command == "list":
+        rows = store.blogs()
+        if not rows:
+            print("   (계획 없음)")
+        for row in rows:
+            print(f"   {row['blog']:<12}{row['days']:>3}일  {row['topic'] or '-'}  ({row['source'] or '직접 등록'})")
+            for category, count in store.categories(row["blog"]).items():
+                print(f"      - {category or '(없음)'}: {count}일")
+    else:
+        rows = store.find_days(args.blog, args.category, args.keyword)
+        if not rows:
+            print("   (해당 Day 없음)")
+        for row in rows:
+            print(f"   {row['blog']:<12}Day {row['day']:>2}  [{row['category']}] {row['title']}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,168 @@
+# utils/pregen.py
+"""
+미리 생성 버퍼 (발행 시각과 생성 시각 분리)
+
+- 한가한 시간대에 앞으로 N일치 글을 생성 → 검증 → 렌더링해 버퍼(utils.schedule_store buffer 테이블)에 쌓아 두고
+  발행 시각에는 완성된 산출물만 꺼내 발행 (LLM 지연이 발행 시각에 영향을 주지 않음)
+- 시의성 있는 Day(트렌드/이벤트/할인 등)는 발행 직전 구간에 다시 생성해 최신 상태로 발행
+- 버퍼 깊이 / 오래된 정도(staleness)를 블로그별로 집계
+
+scheduler.py의 동작: pregenerate(버퍼 채우기 + 시의성 갱신), refresh(시의성 갱신만), release(발행 시각에 꺼내기)
+
+환경 변수:
+- BLOG_PREGEN_DEPTH: 유지할 버퍼 깊이 (기본 7일치)
+- BLOG_PREGEN_DIR: 산출물 위치 (기본 outputs/buffer)
+- BLOG_PREGEN_MAX_AGE_H: 시의성 글이 이 시간보다 오래되면 stale (기본 24)
+- BLOG_PREGEN_REFRESH_WITHIN_H: 발행까지 이 시간 안으로 남은 시의성 글을 다시 생성 (기본 6)
+- BLOG_PREGEN_TREND_KEYWORDS: 시의성 판단 단어 (쉼표 구분)
+- BLOG_PREGEN_MIN_LENGTH_RATIO: 톤 가이드 최소 글자 수 대비 허용 비율 (기본 0.5)
+
+CLI:
+    python -m utils.pregen          # 블로그별 버퍼 깊이 / stale / 다음 발행 시각
+"""
+
+import os
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from utils.cron import CronExpr
+from utils.schedule_store import INVALID, READY, TIME_FORMAT, BufferItem, ScheduleStore
+
+DEFAULT_TREND_KEYWORDS = "트렌드,최신,뉴스,이슈,이벤트,할인,시즌,신상,출시,오늘,이번 주,이번주,올해,실시간"
+
+# 기본 본문(생성 실패 시 대체 본문)에 들어가는 문구
+_PLACEHOLDER_TEXTS = ("내용을 작성 중입니다.", "자세한 내용은 곧 업데이트됩니다.")
+
+
+def pregen_depth() -> int:
+    return int(os.getenv("BLOG_PREGEN_DEPTH", "7"))
+
+
+def target_depth(store: ScheduleStore, blog: str) -> int:
+    """블로그의 pregenerate 예약 payload depth (여러 개면 가장 큰 값, 없으면 BLOG_PREGEN_DEPTH)"""
+    depths = [
+        int(s.payload["depth"]) for s in store.schedules(enabled_only=True)
+        if s.blog == blog and s.action == "pregenerate" and s.payload.get("depth")
+    ]
+    return max(depths) if depths else pregen_depth()
+
+
+def max_age_s() -> float:
+    return float(os.getenv("BLOG_PREGEN_MAX_AGE_H", "24")) * 3600
+
+
+def refresh_within_s() -> float:
+    return float(os.getenv("BLOG_PREGEN_REFRESH_WITHIN_H", "6")) * 3600
+
+
+def is_trend_sensitive(plan_item: Dict[str, Any]) -> bool:
+    """계획 항목의 trend_sensitive 값, 없으면 제목/카테고리/유형에 시의성 단어가 있는지"""
+    if "trend_sensitive" in plan_item:
+        return bool(plan_item["trend_sensitive"])
+    words = [w.strip() for w in os.getenv("BLOG_PREGEN_TREND_KEYWORDS", DEFAULT_TREND_KEYWORDS).split(",") if w.strip()]
+    text = " ".join(str(plan_item.get(key, "")) for key in ("title", "category", "content_type"))
+    return any(word in text for word in words)
+
+
+def validate_content(content: Dict[str, Any], tone_guide: Optional[Dict[str, Any]] = None) -> List[str]:
+    """
+    발행 전 검증 (문제 목록, 비어 있으면 통과)
+    - 섹션 없음 / 생성 실패 시 기본 본문 / 톤 가이드 최소 글자 수 미달
+    """
+    issues = []
+    sections = content.get("sections", [])
+    if not content.get("title"):
+        issues.append("제목 없음")
+    if not sections:
+        issues.append("섹션 없음")
+    paragraphs = [p for s in sections for h3 in s.get("h3_contents", []) for p in h3.get("paragraphs", [])]
+    if any(p in _PLACEHOLDER_TEXTS for p in paragraphs):
+        issues.append("기본 본문 (생성 실패 대체)")
+    min_length = (tone_guide or {}).get("content_length", {}).get("min")
+    if min_length:
+        required = int(min_length * float(os.getenv("BLOG_PREGEN_MIN_LENGTH_RATIO", "0.5")))
+        if content.get("full_text_length", 0) < required:
+            issues.append(f"글자 수 부족 ({content.get('full_text_length', 0)}자 < {required}자)")
+    return issues
+
+
+def release_times(store: ScheduleStore, blog: str, count: int, now: Optional[datetime] = None) -> List[datetime]:
+    """블로그의 release 예약으로 본 앞으로 count번의 발행 시각 (버퍼 앞쪽 항목부터 차례로 발행)"""
+    now = now or datetime.now()
+    crons = [CronExpr(s.cron) for s in store.schedules(enabled_only=True) if s.blog == blog and s.action == "release"]
+    times: List[datetime] = []
+    cursors = [now] * len(crons)
+    while crons and len(times) < count:
+        upcoming = [cron.next_after(cursor) for cron, cursor in zip(crons, cursors)]
+        index = min(range(len(upcoming)), key=lambda i: upcoming[i])
+        times.append(upcoming[index])
+        cursors[index] = upcoming[index]
+    return times
+
+
+def is_stale(item: BufferItem, now_ts: Optional[float] = None) -> bool:
+    """시의성 글이 최대 허용 시간보다 오래됨"""
+    return item.trend_sensitive and (now_ts or time.time()) - item.generated_at > max_age_s()
+
+
+def refresh_due(store: ScheduleStore, blog: str, now: Optional[datetime] = None) -> List[BufferItem]:
+    """
+    다시 생성할 시의성 글: 발행까지 refresh 구간 안으로 들어왔는데 그 구간 시작 전에 생성된 항목
+    (release 예약이 없으면 발행 시각을 알 수 없어 대상 없음)
+    """
+    now = now or datetime.now()
+    ready = store.buffer_items(blog, READY)
+    window = timedelta(seconds=refresh_within_s())
+    due = []
+    for item, release_at in zip(ready, release_times(store, blog, len(ready), now)):
+        if not item.trend_sensitive or release_at - now > window:
+            continue
+        if datetime.fromtimestamp(item.generated_at) < release_at - window:
+            due.append(item)
+    return due
+
+
+def buffer_report(store: ScheduleStore, now: Optional[datetime] = None) -> List[Dict[str, Any]]:
+    """블로그별 버퍼 깊이 / 무효 / stale / 가장 오래된 항목 나이 / 다음 발행 시각"""
+    now = now or datetime.now()
+    now_ts = now.timestamp()
+    blogs = sorted({item.blog for item in store.buffer_items()} | {
+        s.blog for s in store.schedules(enabled_only=True) if s.action in ("pregenerate", "release")
+    })
+    report = []
+    for blog in blogs:
+        items = store.buffer_items(blog)
+        ready = [item for item in items if item.status == READY]
+        next_release = release_times(store, blog, 1, now)
+        report.append({
+            "blog": blog,
+            "depth": len(ready),
+            "target": target_depth(store, blog),
+            "days": [item.day for item in ready],
+            "invalid": len([item for item in items if item.status == INVALID]),
+            "trend_sensitive": len([item for item in ready if item.trend_sensitive]),
+            "stale": len([item for item in ready if is_stale(item, now_ts)]),
+            "oldest_age_h": max(((now_ts - item.generated_at) / 3600 for item in ready), default=0.0),
+            "next_release": next_release[0].strftime(TIME_FORMAT) if next_release else None,
+        })
+    return report
+
+
+def format_buffer_report(store: ScheduleStore, now: Optional[datetime] = None) -> str:
+    lines = [
+        "📦 미리 생성 버퍼",
+        f"   {'블로그':<12}{'깊이':>6}{'무효':>5}{'시의성':>6}{'stale':>6}{'최고령(h)':>10}  다음 발행",
+    ]
+    for row in buffer_report(store, now):
+        lines.append(
+            f"   {row['blog']:<12}{row['depth']:>3}/{row['target']:<2}{row['invalid']:>5}{row['trend_sensitive']:>6}"
+            f"{row['stale']:>6}{row['oldest_age_h']:>10.1f}  {row['next_release'] or '-'}"
+        )
+    if len(lines) == 2:
+        lines.append("   (버퍼 없음)")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    print(format_buffer_report(ScheduleStore()))
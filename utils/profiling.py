@@ -0,0 +1,204 @@
+# utils/profiling.py
+"""
+노드 단위 프로파일링 (옵트인)
+
+BLOG_PROFILE=cpu,mem 설정 시 node_scope(utils.run_context)로 감싼 노드마다
+- cpu: cProfile → outputs/profiles/<run_id>/<순번>-<노드>[-dayN].prof (+ .txt 누적 시간 상위 함수)
+- mem: tracemalloc 스냅샷 차이 → <순번>-<노드>[-dayN].mem.txt (할당 상위 위치)
+실행 끝에 format_profile_summary()로 노드별 요약표 출력
+
+주의:
+- 중첩 노드는 스레드별 가장 바깥 노드만 측정 (cProfile은 스레드당 하나만 활성화 가능)
+- tracemalloc은 프로세스 전역이라 노드가 병렬로 돌면 할당이 섞여 집계됨
+- 측정 오버헤드가 커서 벽시계 비교(bench)와 함께 켜지 말 것
+
+환경 변수:
+- BLOG_PROFILE: cpu, mem 중 쉼표 구분 (비우면 꺼짐)
+- BLOG_PROFILE_DIR: 저장 위치 (기본 outputs/profiles)
+- BLOG_PROFILE_TOP: 파일/요약에 남길 상위 항목 수 (기본 30)
+
+.prof 파일은 python -m pstats, snakeviz 등으로 열 수 있음
+"""
+
+import cProfile
+import io
+import itertools
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional
+
+from utils.logger import get_logger
+
+logger = get_logger("Profiling")
+
+PROFILE_MODES = ("cpu", "mem")
+
+_local = threading.local()
+_records: List[Dict[str, Any]] = []
+_records_lock = threading.Lock()
+_seq = itertools.count(1)
+
+
+def profile_modes() -> FrozenSet[str]:
+    """BLOG_PROFILE에서 켜진 측정 종류"""
+    raw = os.getenv("BLOG_PROFILE", "")
+    return frozenset(mode.strip() for mode in raw.lower().split(",") if mode.strip() in PROFILE_MODES)
+
+
+def _top() -> int:
+    return int(os.getenv("BLOG_PROFILE_TOP", "30"))
+
+
+def _short_location(filename: str, lineno: int, func: Optional[str] = None) -> str:
+    location = f"{os.path.basename(filename)}:{lineno}"
+    return f"{location}({func})" if func else location
+
+
+def _save_cpu(profiler: cProfile.Profile, stem: str) -> Dict[str, Any]:
+    """cProfile 결과 저장, 자기 시간이 가장 긴 함수 반환"""
+    profiler.dump_stats(f"{stem}.prof")
+
+    stream = io.StringIO()
+    stats = pstats.Stats(profiler, stream=stream)
+    stats.sort_stats("cumulative").print_stats(_top())
+    with open(f"{stem}.txt", "w", encoding="utf-8") as f:
+        f.write(stream.getvalue())
+
+    hottest = max(stats.stats.items(), key=lambda item: item[1][2], default=None)
+    if hottest is None:
+        return {}
+    (filename, lineno, func), (_, _, tottime, _, _) = hottest
+    return {"top_function": _short_location(filename, lineno, func), "top_self_s": round(tottime, 4)}
+
+
+def _save_mem(before: tracemalloc.Snapshot, base_bytes: int, stem: str) -> Dict[str, Any]:
+    """스냅샷 차이(할당 위치별) 저장, 순증가량/피크 반환"""
+    _, peak = tracemalloc.get_traced_memory()
+    filters = [
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__),
+        tracemalloc.Filter(False, cProfile.__file__),
+        tracemalloc.Filter(False, pstats.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+    ]
+    after = tracemalloc.take_snapshot().filter_traces(filters)
+    diff = after.compare_to(before.filter_traces(filters), "lineno")
+    grown = sorted((stat for stat in diff if stat.size_diff > 0), key=lambda stat: stat.size_diff, reverse=True)
+
+    with open(f"{stem}.mem.txt", "w", encoding="utf-8") as f:
+        f.write(f"{'증가(KB)':>12}{'블록':>10}  위치\n")
+        for stat in grown[:_top()]:
+            frame = stat.traceback[0]
+            f.write(f"{stat.size_diff / 1024:>12.1f}{stat.count_diff:>10}  {frame.filename}:{frame.lineno}\n")
+
+    result = {
+        "net_kb": round(sum(stat.size_diff for stat in diff) / 1024, 1),
+        "peak_kb": round(max(peak - base_bytes, 0) / 1024, 1),
+    }
+    if grown:
+        frame = grown[0].traceback[0]
+        result["top_alloc"] = _short_location(frame.filename, frame.lineno)
+    return result
+
+
+@contextmanager
+def profile_node(node: str, run_id: str, day: Optional[int] = None) -> Iterator[None]:
+    """노드 1회 실행 측정 (BLOG_PROFILE이 비었거나 바깥 노드가 측정 중이면 통과)"""
+    modes = profile_modes()
+    if not modes or getattr(_local, "active", False):
+        yield
+        return
+
+    _local.active = True
+    profiler = cProfile.Profile() if "cpu" in modes else None
+    before: Optional[tracemalloc.Snapshot] = None
+    base_bytes = 0
+    if "mem" in modes:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        base_bytes = tracemalloc.get_traced_memory()[0]
+        before = tracemalloc.take_snapshot()
+
+    start = time.perf_counter()
+    cpu_start = time.thread_time()
+    if profiler:
+        profiler.enable()
+    try:
+        yield
+    finally:
+        if profiler:
+            profiler.disable()
+        record: Dict[str, Any] = {
+            "run_id": run_id,
+            "node": node,
+            "day": day,
+            "wall_s": round(time.perf_counter() - start, 4),
+            "cpu_s": round(time.thread_time() - cpu_start, 4),
+        }
+        _local.active = False
+
+        directory = os.path.join(os.getenv("BLOG_PROFILE_DIR", "outputs/profiles"), run_id)
+        stem = os.path.join(directory, f"{next(_seq):03d}-{node}" + (f"-day{day}" if day is not None else ""))
+        try:
+            os.makedirs(directory, exist_ok=True)
+            # 메모리 먼저: pstats 집계 자체의 할당이 섞이지 않도록
+            if before is not None:
+                record.update(_save_mem(before, base_bytes, stem))
+            if profiler:
+                record.update(_save_cpu(profiler, stem))
+        except OSError as e:
+            logger.warning(f"⚠️ 프로파일 저장 실패 ({node}): {e}")
+
+        with _records_lock:
+            _records.append(record)
+
+
+def profile_records(run_id: Optional[str] = None) -> List[Dict[str, Any]]:
+    with _records_lock:
+        return [dict(r) for r in _records if run_id is None or r["run_id"] == run_id]
+
+
+def format_profile_summary(run_id: str) -> str:
+    """
+    노드별 프로파일 요약표 (BLOG_PROFILE이 꺼져 있으면 빈 문자열)
+
+    같은 노드의 여러 실행(Day별 등)은 합산, 피크는 최댓값, 대표 함수/할당 위치는 가장 무거운 실행 기준
+    """
+    records = profile_records(run_id)
+    if not records:
+        return ""
+
+    by_node: Dict[str, Dict[str, Any]] = {}
+    for record in records:
+        row = by_node.setdefault(record["node"], {
+            "runs": 0, "wall_s": 0.0, "cpu_s": 0.0, "net_kb": 0.0, "peak_kb": 0.0,
+            "top_function": "-", "top_self_s": 0.0, "top_alloc": "-",
+        })
+        row["runs"] += 1
+        row["wall_s"] += record["wall_s"]
+        row["cpu_s"] += record["cpu_s"]
+        row["net_kb"] += record.get("net_kb", 0.0)
+        if record.get("top_self_s", 0.0) >= row["top_self_s"]:
+            row["top_function"] = record.get("top_function", "-")
+            row["top_self_s"] = record.get("top_self_s", 0.0)
+        if record.get("peak_kb", 0.0) >= row["peak_kb"]:
+            row["peak_kb"] = record.get("peak_kb", 0.0)
+            row["top_alloc"] = record.get("top_alloc", "-")
+
+    directory = os.path.join(os.getenv("BLOG_PROFILE_DIR", "outputs/profiles"), run_id)
+    lines = [
+        f"🔬 노드 프로파일 ({', '.join(sorted(profile_modes())) or '-'})",
+        f"   {'노드':<22}{'횟수':>5}{'벽시계(s)':>11}{'CPU(s)':>9}{'순증(KB)':>11}{'피크(KB)':>11}  최다 자기시간 함수 / 최대 할당 위치",
+    ]
+    for node, row in sorted(by_node.items(), key=lambda item: item[1]["cpu_s"], reverse=True):
+        lines.append(
+            f"   {node[:21]:<22}{row['runs']:>5}{row['wall_s']:>11.2f}{row['cpu_s']:>9.2f}"
+            f"{row['net_kb']:>11.1f}{row['peak_kb']:>11.1f}  {row['top_function']} / {row['top_alloc']}"
+        )
+    lines.append(f"   💾 {directory}/")
+    return "\n".join(lines)
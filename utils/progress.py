@@ -0,0 +1,91 @@
+# utils/progress.py
+"""
+실행(run_id)별 진행 상황 구독
+
+- 노드가 남기는 로그(get_logger)를 실행 단위로 모아 구독자(데몬/웹 API 스트림)에게 전달
+- 루트 로거에 핸들러 하나만 달고, 기록 시점 스레드의 run_context로 run_id를 찾음
+  (생성 코드에 진행 보고용 인자를 따로 넘기지 않아도 됨)
+- 구독자가 없는 실행의 로그는 그냥 버림
+"""
+
+import logging
+import queue
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from utils.run_context import current_context
+
+
+class ProgressHub:
+    """run_id → 구독 큐 목록"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._subscribers: Dict[str, List["queue.Queue[Dict[str, Any]]"]] = {}
+
+    def subscribe(self, run_id: str) -> "queue.Queue[Dict[str, Any]]":
+        events: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+        with self._lock:
+            self._subscribers.setdefault(run_id, []).append(events)
+        return events
+
+    def unsubscribe(self, run_id: str, events: "queue.Queue[Dict[str, Any]]") -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(run_id, [])
+            if events in subscribers:
+                subscribers.remove(events)
+            if not subscribers:
+                self._subscribers.pop(run_id, None)
+
+    def has_subscribers(self, run_id: str) -> bool:
+        with self._lock:
+            return bool(self._subscribers.get(run_id))
+
+    def publish(self, run_id: str, event: Dict[str, Any]) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers.get(run_id, []))
+        for events in subscribers:
+            events.put_nowait(event)
+
+
+class ProgressLogHandler(logging.Handler):
+    """로그 기록 → {"event": "log", ...} 진행 이벤트"""
+
+    def __init__(self, hub: ProgressHub, level: int = logging.INFO) -> None:
+        super().__init__(level)
+        self.hub = hub
+
+    def emit(self, record: logging.LogRecord) -> None:
+        context = current_context()
+        run_id = context["run_id"]
+        if not self.hub.has_subscribers(run_id):
+            return
+        try:
+            message = record.getMessage()
+        except Exception:
+            self.handleError(record)
+            return
+        self.hub.publish(run_id, {
+            "event": "log",
+            "ts": round(time.time(), 3),
+            "level": record.levelname,
+            "logger": record.name,
+            "node": context["node"],
+            "day": context["day"],
+            "message": message,
+        })
+
+
+_hub: Optional[ProgressHub] = None
+_hub_lock = threading.Lock()
+
+
+def get_progress_hub() -> ProgressHub:
+    """프로세스 공용 진행 허브 (처음 호출 시 루트 로거에 핸들러 연결)"""
+    global _hub
+    with _hub_lock:
+        if _hub is None:
+            _hub = ProgressHub()
+            logging.getLogger().addHandler(ProgressLogHandler(_hub))
+        return _hub
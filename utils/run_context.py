@@ -0,0 +1,112 @@
+# utils/run_context.py
+"""
+실행 컨텍스트 (contextvars)
+- run_id: 한 번의 CLI 실행/파이프라인 실행 단위
+- node / day / blog: 지금 어떤 노드가 어느 Day를 처리 중인지
+- task_type: 하이브리드 라우팅 작업 유형 (simple / creative / analytical)
+LLM 호출 지표 등 하위 계층이 인자 전달 없이 호출 주체를 알 수 있게 함
+run_scope / node_scope는 트레이스 구간(utils.tracing)도 함께 연다
+node_scope는 BLOG_PROFILE 설정 시 노드 프로파일링(utils.profiling)도 함께 한다
+"""
+
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Any, Dict, Iterator, Optional
+
+from utils.profiling import profile_node
+from utils.tracing import span
+
+_run_id: ContextVar[Optional[str]] = ContextVar("run_id", default=None)
+_node: ContextVar[Optional[str]] = ContextVar("node", default=None)
+_day: ContextVar[Optional[int]] = ContextVar("day", default=None)
+_blog: ContextVar[Optional[str]] = ContextVar("blog", default=None)
+_task_type: ContextVar[Optional[str]] = ContextVar("task_type", default=None)
+
+# run_scope 밖에서 호출될 때 쓰는 프로세스 기본 run_id
+_process_run_id: Optional[str] = None
+
+
+def new_run_id() -> str:
+    """시간순 정렬 가능한 run_id (예: 20250101-093000-ab12cd)"""
+    return f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+
+
+def get_run_id() -> str:
+    """현재 run_id (없으면 프로세스 기본값 생성)"""
+    global _process_run_id
+    run_id = _run_id.get()
+    if run_id:
+        return run_id
+    if _process_run_id is None:
+        _process_run_id = new_run_id()
+    return _process_run_id
+
+
+def current_context() -> Dict[str, Any]:
+    """지표/로그에 붙일 현재 컨텍스트"""
+    return {
+        "run_id": get_run_id(),
+        "node": _node.get(),
+        "day": _day.get(),
+        "blog": _blog.get(),
+        "task_type": _task_type.get(),
+    }
+
+
+@contextmanager
+def run_scope(run_id: Optional[str] = None, blog: Optional[str] = None) -> Iterator[str]:
+    """
+    실행 단위 지정
+
+    사용 예:
+        with run_scope(blog="travel") as run_id:
+            ...
+    """
+    run_token = _run_id.set(run_id or new_run_id())
+    blog_token = _blog.set(blog) if blog is not None else None
+    try:
+        with span("run", kind="run", run_id=_run_id.get(), blog=blog):
+            yield _run_id.get()
+    finally:
+        if blog_token is not None:
+            _blog.reset(blog_token)
+        _run_id.reset(run_token)
+
+
+@contextmanager
+def node_scope(node: str, day: Optional[int] = None) -> Iterator[None]:
+    """
+    노드(및 Day) 지정 - with 문과 데코레이터 모두 사용 가능
+
+    사용 예:
+        @node_scope("ContentPlanner")
+        def plan(...): ...
+
+        with node_scope("SEOContentWriter", day=3):
+            ...
+    """
+    node_token = _node.set(node)
+    day_token = _day.set(day) if day is not None else None
+    try:
+        with span(node, kind="node", run_id=get_run_id(), day=day), profile_node(node, get_run_id(), day):
+            yield
+    finally:
+        if day_token is not None:
+            _day.reset(day_token)
+        _node.reset(node_token)
+
+
+def current_node() -> Optional[str]:
+    return _node.get()
+
+
+@contextmanager
+def task_scope(task_type: str) -> Iterator[None]:
+    """하이브리드 라우팅 작업 유형 지정 (지표를 작업 유형별로 집계)"""
+    token = _task_type.set(task_type)
+    try:
+        yield
+    finally:
+        _task_type.reset(token)
@@ -0,0 +1,452 @@
+# utils/schedule_store.py
+"""
+예약 저장소 (SQLite WAL)
+
+- 예약 하나 = (이름, 블로그, 동작, cron, 지터) - 동작은 generate(글 생성) / publish(발행)처럼 따로 등록
+- 실행 시각마다 runs 테이블에 한 줄 (같은 예약의 같은 시각은 한 번만), 재시작해도 예약/실행 기록 유지
+- claim_due: 마지막으로 처리한 시각 이후 놓친 실행 시각을 모두 찾아 등록 (오래된 것은 최근 N개만 실행, 나머지는 skipped)
+- once 예약은 첫 실행 시각을 등록하면 비활성화
+- 예약기(scheduler.py)는 호스트당 하나만 실행 (실행 기록 등록은 트랜잭션이지만 실행 중복 방지는 프로세스 내 기준)
+- buffer 테이블: 미리 생성·검증·렌더링해 둔 Day별 산출물 (utils.pregen, 발행 시각에 release 동작이 꺼냄)
+
+환경 변수:
+- BLOG_SCHEDULE_DB: DB 경로 (기본 outputs/schedules.sqlite)
+
+CLI:
+    python -m utils.schedule_store add --name woncamp-gen --blog woncamp --action generate --cron "0 9 * * *" --jitter 600
+    python -m utils.schedule_store add --name woncamp-pub --blog woncamp --action publish --cron "30 18 * * 1-5" \\
+        --payload '{"platform": "tistory"}'
+    python -m utils.schedule_store list
+    python -m utils.schedule_store runs [--limit 20]
+    python -m utils.schedule_store disable|enable|remove --name woncamp-pub
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+
+from utils.cron import CronExpr
+from utils.logger import get_logger
+
+logger = get_logger("ScheduleStore")
+
+DEFAULT_SCHEDULE_DB = "outputs/schedules.sqlite"
+
+# 실행 시각 저장 형식 (분 단위, 로컬 시각)
+TIME_FORMAT = "%Y-%m-%d %H:%M"
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+ERROR = "error"
+SKIPPED = "skipped"
+
+# 미리 생성 버퍼 상태
+READY = "ready"
+INVALID = "invalid"
+RELEASED = "released"
+
+
+@dataclass
+class Schedule:
+    id: int
+    name: str
+    blog: str
+    action: str
+    cron: str
+    jitter_s: float
+    enabled: bool
+    once: bool
+    last_due_at: Optional[str]
+    payload: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class ScheduledRun:
+    """실행 시각 하나 (예약의 동작/지터/payload 포함)"""
+    id: int
+    schedule_id: int
+    schedule_name: str
+    blog: str
+    action: str
+    due_at: str
+    jitter_s: float
+    payload: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class BufferItem:
+    """미리 생성해 둔 Day 하나 (생성 결과 + 렌더링 HTML + 검증 결과)"""
+    blog: str
+    day: int
+    platform: str
+    status: str
+    trend_sensitive: bool
+    content_file: str
+    html_file: str
+    generated_at: float
+    released_at: Optional[float] = None
+    issues: List[str] = field(default_factory=list)
+
+
+def _schedule(row: sqlite3.Row) -> Schedule:
+    return Schedule(
+        id=row["id"], name=row["name"], blog=row["blog"], action=row["action"], cron=row["cron"],
+        jitter_s=row["jitter_s"], enabled=bool(row["enabled"]), once=bool(row["once"]),
+        last_due_at=row["last_due_at"], payload=json.loads(row["payload"]),
+    )
+
+
+class ScheduleStore:
+    """SQLite 예약 저장소 (프로세스마다 인스턴스 하나)"""
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        self.path = path or os.getenv("BLOG_SCHEDULE_DB", DEFAULT_SCHEDULE_DB)
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS schedules (
+                id           INTEGER PRIMARY KEY AUTOINCREMENT,
+                name         TEXT NOT NULL UNIQUE,
+                blog         TEXT NOT NULL,
+                action       TEXT NOT NULL,
+                cron         TEXT NOT NULL,
+                jitter_s     REAL NOT NULL DEFAULT 0,
+                payload      TEXT NOT NULL DEFAULT '{}',
+                enabled      INTEGER NOT NULL DEFAULT 1,
+                once         INTEGER NOT NULL DEFAULT 0,
+                last_due_at  TEXT,
+                created_at   REAL NOT NULL,
+                updated_at   REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS runs (
+                id           INTEGER PRIMARY KEY AUTOINCREMENT,
+                schedule_id  INTEGER NOT NULL,
+                blog         TEXT NOT NULL,
+                action       TEXT NOT NULL,
+                due_at       TEXT NOT NULL,
+                status       TEXT NOT NULL,
+                day          INTEGER,
+                result       TEXT,
+                error        TEXT,
+                started_at   REAL,
+                finished_at  REAL,
+                UNIQUE (schedule_id, due_at)
+            );
+            CREATE INDEX IF NOT EXISTS runs_status ON runs (status, due_at);
+            CREATE INDEX IF NOT EXISTS runs_blog_action ON runs (blog, action, status);
+            CREATE TABLE IF NOT EXISTS buffer (
+                blog             TEXT NOT NULL,
+                day              INTEGER NOT NULL,
+                platform         TEXT NOT NULL,
+                status           TEXT NOT NULL,
+                trend_sensitive  INTEGER NOT NULL DEFAULT 0,
+                content_file     TEXT NOT NULL,
+                html_file        TEXT NOT NULL,
+                issues           TEXT NOT NULL DEFAULT '[]',
+                generated_at     REAL NOT NULL,
+                released_at      REAL,
+                PRIMARY KEY (blog, day)
+            );
+            """
+        )
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            else:
+                self._conn.execute("COMMIT")
+
+    def add(
+        self,
+        name: str,
+        blog: str,
+        action: str,
+        cron: str,
+        jitter_s: float = 0.0,
+        payload: Optional[Dict[str, Any]] = None,
+        once: bool = False,
+        now: Optional[datetime] = None
+    ) -> int:
+        """
+        예약 등록 (같은 이름이 있으면 내용만 교체, 잘못된 cron은 CronError)
+
+        등록 시각 이전의 실행 시각은 놓친 실행으로 보지 않음
+        """
+        CronExpr(cron)
+        stamp = time.time()
+        start = (now or datetime.now()).strftime(TIME_FORMAT)
+        body = json.dumps(payload or {}, ensure_ascii=False)
+        with self._transaction() as conn:
+            row = conn.execute("SELECT id FROM schedules WHERE name = ?", (name,)).fetchone()
+            if row is not None:
+                # 꺼져 있던 예약을 다시 등록하면 꺼져 있던 동안의 실행 시각은 건너뜀
+                conn.execute(
+                    """
+                    UPDATE schedules SET blog = ?, action = ?, cron = ?, jitter_s = ?, payload = ?, once = ?,
+                        last_due_at = CASE WHEN enabled = 0 THEN ? ELSE last_due_at END, enabled = 1, updated_at = ?
+                    WHERE id = ?
+                    """,
+                    (blog, action, cron, jitter_s, body, int(once), start, stamp, row["id"]),
+                )
+                return int(row["id"])
+            cursor = conn.execute(
+                """
+                INSERT INTO schedules (name, blog, action, cron, jitter_s, payload, once, last_due_at, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (name, blog, action, cron, jitter_s, body, int(once), start, stamp, stamp),
+            )
+            return int(cursor.lastrowid)
+
+    def remove(self, name: str) -> bool:
+        with self._transaction() as conn:
+            return conn.execute("DELETE FROM schedules WHERE name = ?", (name,)).rowcount > 0
+
+    def set_enabled(self, name: str, enabled: bool, now: Optional[datetime] = None) -> bool:
+        """활성/비활성 (다시 켤 때는 꺼져 있던 동안의 실행 시각을 놓친 실행으로 보지 않음)"""
+        with self._transaction() as conn:
+            if enabled:
+                start = (now or datetime.now()).strftime(TIME_FORMAT)
+                query = "UPDATE schedules SET enabled = 1, last_due_at = ?, updated_at = ? WHERE name = ? AND enabled = 0"
+                params: tuple = (start, time.time(), name)
+            else:
+                query = "UPDATE schedules SET enabled = 0, updated_at = ? WHERE name = ?"
+                params = (time.time(), name)
+            return conn.execute(query, params).rowcount > 0
+
+    def schedules(self, enabled_only: bool = False) -> List[Schedule]:
+        query = "SELECT * FROM schedules" + (" WHERE enabled = 1" if enabled_only else "") + " ORDER BY blog, name"
+        with self._lock:
+            rows = self._conn.execute(query).fetchall()
+        return [_schedule(row) for row in rows]
+
+    def claim_due(self, now: datetime, max_catchup: int = 3) -> List[ScheduledRun]:
+        """
+        now까지 도래한 실행 시각을 runs에 등록하고, 아직 끝나지 않은 pending 실행 전체를 반환
+
+        Args:
+            max_catchup: 예약당 놓친 실행 중 실행할 최대 개수 (가장 최근 것부터, 나머지는 skipped)
+        """
+        with self._transaction() as conn:
+            for schedule in [_schedule(row) for row in conn.execute("SELECT * FROM schedules WHERE enabled = 1")]:
+                after = datetime.strptime(schedule.last_due_at, TIME_FORMAT) if schedule.last_due_at else now
+                due = CronExpr(schedule.cron).between(after, now)
+                if not due:
+                    continue
+                # once 예약은 놓친 실행이 여러 번이어도 한 번만
+                keep = due[-1:] if schedule.once else due[-max(1, max_catchup):]
+                for index, due_at in enumerate(due):
+                    status = PENDING if index >= len(due) - len(keep) else SKIPPED
+                    conn.execute(
+                        "INSERT OR IGNORE INTO runs (schedule_id, blog, action, due_at, status) VALUES (?, ?, ?, ?, ?)",
+                        (schedule.id, schedule.blog, schedule.action, due_at.strftime(TIME_FORMAT), status),
+                    )
+                if len(due) > len(keep):
+                    logger.warning(
+                        f"⚠️ 예약 {schedule.name}: 놓친 실행 {len(due)}회 중 최근 {len(keep)}회만 실행 (나머지 skipped)"
+                    )
+                conn.execute(
+                    "UPDATE schedules SET last_due_at = ?, enabled = ?, updated_at = ? WHERE id = ?",
+                    (due[-1].strftime(TIME_FORMAT), 0 if schedule.once else 1, time.time(), schedule.id),
+                )
+            rows = conn.execute(
+                """
+                SELECT runs.id, runs.schedule_id, schedules.name, runs.blog, runs.action, runs.due_at,
+                    schedules.jitter_s, schedules.payload
+                FROM runs JOIN schedules ON schedules.id = runs.schedule_id
+                WHERE runs.status = ? ORDER BY runs.due_at, runs.id
+                """,
+                (PENDING,),
+            ).fetchall()
+        return [
+            ScheduledRun(
+                id=row["id"], schedule_id=row["schedule_id"], schedule_name=row["name"], blog=row["blog"],
+                action=row["action"], due_at=row["due_at"], jitter_s=row["jitter_s"], payload=json.loads(row["payload"]),
+            )
+            for row in rows
+        ]
+
+    def next_due(self, now: datetime) -> Optional[datetime]:
+        """활성 예약 중 가장 이른 다음 실행 시각"""
+        times = [CronExpr(schedule.cron).next_after(now) for schedule in self.schedules(enabled_only=True)]
+        return min(times) if times else None
+
+    def recover(self) -> int:
+        """이전 예약기가 실행 도중 종료된 실행을 pending으로 되돌림 (기동 시 1회)"""
+        with self._transaction() as conn:
+            return conn.execute(
+                "UPDATE runs SET status = ?, started_at = NULL WHERE status = ?", (PENDING, RUNNING)
+            ).rowcount
+
+    def start_run(self, run_id: int) -> None:
+        with self._transaction() as conn:
+            conn.execute("UPDATE runs SET status = ?, started_at = ? WHERE id = ?", (RUNNING, time.time(), run_id))
+
+    def finish_run(self, run_id: int, result: Dict[str, Any]) -> None:
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE runs SET status = ?, day = ?, result = ?, error = NULL, finished_at = ? WHERE id = ?",
+                (DONE, result.get("day"), json.dumps(result, ensure_ascii=False), time.time(), run_id),
+            )
+
+    def fail_run(self, run_id: int, error: str, day: Optional[int] = None) -> None:
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE runs SET status = ?, day = ?, error = ?, finished_at = ? WHERE id = ?",
+                (ERROR, day, error, time.time(), run_id),
+            )
+
+    def completed(self, blog: str, action: str) -> Dict[int, Dict[str, Any]]:
+        """블로그/동작별 완료된 Day → 마지막 실행 결과"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT day, result FROM runs WHERE blog = ? AND action = ? AND status = ? AND day IS NOT NULL "
+                "ORDER BY finished_at",
+                (blog, action, DONE),
+            ).fetchall()
+        return {row["day"]: json.loads(row["result"] or "{}") for row in rows}
+
+    def buffer_put(
+        self,
+        blog: str,
+        day: int,
+        platform: str,
+        content_file: str,
+        html_file: str,
+        trend_sensitive: bool = False,
+        issues: Optional[List[str]] = None
+    ) -> str:
+        """미리 생성한 Day 등록/교체 (검증 문제가 있으면 invalid - 발행하지 않고 다음 생성 때 다시 만듦)"""
+        status = INVALID if issues else READY
+        with self._transaction() as conn:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO buffer (blog, day, platform, status, trend_sensitive, content_file, html_file,
+                    issues, generated_at, released_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, NULL)
+                """,
+                (blog, day, platform, status, int(trend_sensitive), content_file, html_file,
+                 json.dumps(issues or [], ensure_ascii=False), time.time()),
+            )
+        return status
+
+    def buffer_items(self, blog: Optional[str] = None, status: Optional[str] = None) -> List[BufferItem]:
+        """버퍼 항목 (블로그, Day 순)"""
+        query = "SELECT * FROM buffer WHERE 1 = 1"
+        params: List[Any] = []
+        if blog is not None:
+            query += " AND blog = ?"
+            params.append(blog)
+        if status is not None:
+            query += " AND status = ?"
+            params.append(status)
+        with self._lock:
+            rows = self._conn.execute(query + " ORDER BY blog, day", params).fetchall()
+        return [
+            BufferItem(
+                blog=row["blog"], day=row["day"], platform=row["platform"], status=row["status"],
+                trend_sensitive=bool(row["trend_sensitive"]), content_file=row["content_file"],
+                html_file=row["html_file"], generated_at=row["generated_at"], released_at=row["released_at"],
+                issues=json.loads(row["issues"]),
+            )
+            for row in rows
+        ]
+
+    def buffer_release(self, blog: str, day: int) -> bool:
+        """ready 항목을 발행 완료로 (이미 발행됐거나 없으면 False)"""
+        with self._transaction() as conn:
+            return conn.execute(
+                "UPDATE buffer SET status = ?, released_at = ? WHERE blog = ? AND day = ? AND status = ?",
+                (RELEASED, time.time(), blog, day, READY),
+            ).rowcount > 0
+
+    def runs(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """최근 실행 기록"""
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT runs.*, schedules.name FROM runs LEFT JOIN schedules ON schedules.id = runs.schedule_id
+                ORDER BY runs.due_at DESC, runs.id DESC LIMIT ?
+                """,
+                (limit,),
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="예약 관리")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    add = sub.add_parser("add", help="예약 등록 (같은 이름이면 교체)")
+    add.add_argument("--name", required=True)
+    add.add_argument("--blog", required=True)
+    add.add_argument("--action", required=True, help="generate / publish")
+    add.add_argument("--cron", required=True, help='예: "0 9 * * *" (분 시 일 월 요일), @daily')
+    add.add_argument("--jitter", type=float, default=0.0, help="실행 시각에 더할 최대 무작위 지연(초)")
+    add.add_argument("--payload", default="{}", help='동작에 넘길 JSON (예: {"platform": "tistory"})')
+    add.add_argument("--once", action="store_true", help="한 번 실행 후 비활성화")
+
+    sub.add_parser("list", help="예약 목록")
+    runs = sub.add_parser("runs", help="최근 실행 기록")
+    runs.add_argument("--limit", type=int, default=20)
+    for command in ("remove", "enable", "disable"):
+        sub.add_parser(command).add_argument("--name", required=True)
+
+    args = parser.parse_args(argv)
+    store = ScheduleStore()
+
+    if args.command == "add":
+        store.add(args.name, args.blog, args.action, args.cron, args.jitter, json.loads(args.payload), args.once)
+        next_at = CronExpr(args.cron).next_after(datetime.now()).strftime(TIME_FORMAT)
+        print(f"📅 예약 {args.name} 등록: {args.blog} {args.action} [{args.cron}] 다음 실행 {next_at} → {store.path}")
+    elif args.command == "list":
+        schedules = store.schedules()
+        if not schedules:
+            print("   (예약 없음)")
+        now = datetime.now()
+        for schedule in schedules:
+            next_at = CronExpr(schedule.cron).next_after(now).strftime(TIME_FORMAT) if schedule.enabled else "-"
+            print(
+                f"   {'✅' if schedule.enabled else '⏸️ '} {schedule.name:<20}{schedule.blog:<12}{schedule.action:<10}"
+                f"[{schedule.cron}] 지터 {schedule.jitter_s:.0f}초, 다음 {next_at}"
+            )
+    elif args.command == "runs":
+        for row in store.runs(args.limit):
+            day = f" Day {row['day']}" if row["day"] else ""
+            error = f": {row['error']}" if row["error"] else ""
+            print(f"   {row['due_at']} {row['name'] or row['schedule_id']:<20}{row['status']:<9}{row['action']}{day}{error}")
+    elif args.command == "remove":
+        print("🗑️  삭제" if store.remove(args.name) else f"⚠️ 예약 없음: {args.name}")
+    else:
+        changed = store.set_enabled(args.name, args.command == "enable")
+        print(f"{'✅' if args.command == 'enable' else '⏸️ '} {args.name} {args.command}" if changed else f"⚠️ 변경 없음: {args.name}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
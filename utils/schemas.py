@@ -0,0 +1,170 @@
+# utils/schemas.py
+"""
+노드별 LLM 출력 JSON Schema
+- 프롬프트에 출력 형식을 글로 적는 대신 provider 구조화 출력 모드로 전달
+- description에 기존 프롬프트의 형식 힌트(글자 수 등)를 옮겨 둠
+- OpenAI strict 모드 규칙을 따름: 모든 객체는 additionalProperties=false, 모든 속성이 required (_object로만 정의)
+"""
+
+from typing import Any, Dict
+
+
+def _string(description: str) -> Dict[str, Any]:
+    return {"type": "string", "description": description}
+
+
+def _string_list(description: str, min_items: int = 0) -> Dict[str, Any]:
+    schema: Dict[str, Any] = {
+        "type": "array",
+        "items": {"type": "string"},
+        "description": description,
+    }
+    if min_items:
+        schema["minItems"] = min_items
+    return schema
+
+
+def _object(properties: Dict[str, Any], description: str = "", title: str = "") -> Dict[str, Any]:
+    """strict 모드 객체 (모든 속성 필수, 추가 속성 불허)"""
+    schema: Dict[str, Any] = {
+        "type": "object",
+        "properties": properties,
+        "required": list(properties),
+        "additionalProperties": False,
+    }
+    if title:
+        schema["title"] = title
+    if description:
+        schema["description"] = description
+    return schema
+
+
+# ContentPlannerNode: 30일 글감 로테이션
+CONTENT_PLAN_SCHEMA: Dict[str, Any] = _object(
+    {
+        "topic": _string("입력 주제"),
+        "analysis": _object({
+            "primary_focus": _string("메인 주제 (60%)"),
+            "secondary_focus": _string("서브 주제 (40%)"),
+            "target_keywords": _string_list("핵심 타겟 키워드 3개 이상", 1),
+        }),
+        "30_days_plan": {
+            "type": "array",
+            "minItems": 1,
+            "description": "6개 카테고리 x 5개 = 30개 글감",
+            "items": _object({
+                "day": {"type": "integer", "minimum": 1},
+                "category": _string("카테고리 (예: 여행준비)"),
+                "title": _string("글감 제목 (40-60자)"),
+                "content_type": _string("콘텐츠 유형 (예: 체크리스트, 가이드, 후기)"),
+                "main_keywords": _string_list("메인 키워드 2개 이상", 1),
+            }),
+        },
+    },
+    title="content_plan",
+)
+
+
+# SEOContentWriterNode 1단계: 글 구조
+SEO_STRUCTURE_SCHEMA: Dict[str, Any] = _object(
+    {
+        "seo_title": _string("48~58자, 키워드 앞배치, 숫자 포함"),
+        "meta_description": _string("110~150자, 행동 유도 포함"),
+        "h1": _string("메인 제목"),
+        "sections": {
+            "type": "array",
+            "minItems": 1,
+            "items": _object({
+                "h2": _string("H2 제목 (질문형/숫자형)"),
+                "h3_list": _string_list("H3 소제목 목록", 1),
+                "content_outline": _string("이 섹션에서 다룰 내용 개요 1~2문장"),
+            }),
+        },
+        "table": _object(
+            {
+                "title": _string("표 제목"),
+                "headers": _string_list("열 제목 (3개 이상)", 1),
+                "rows": {"type": "array", "items": {"type": "array", "items": {"type": "string"}}},
+                "insert_after_section": {"type": "integer", "description": "이 번호의 섹션 뒤에 삽입 (1부터)"},
+            },
+            "비교/요약용 표 1개",
+        ),
+        "checklist": _object(
+            {
+                "title": _string("체크리스트/리스트 제목"),
+                "items": _string_list("항목 5개 이상", 1),
+                "insert_after_section": {"type": "integer", "description": "이 번호의 섹션 뒤에 삽입 (1부터)"},
+            },
+            "체크리스트/단계별 리스트 1개",
+        ),
+        "faq": {
+            "type": "array",
+            "description": "실제 검색 의도 기반 FAQ 3개",
+            "items": _object({
+                "question": _string("실제 검색될 만한 질문"),
+                "answer_outline": _string("답변 개요 1문장"),
+            }),
+        },
+        "internal_links": {
+            "type": "array",
+            "description": "관련 Day 글 내부 링크 (없으면 빈 배열)",
+            "items": _object({
+                "anchor_text": _string("관련 글 링크 텍스트"),
+                "target_day": {"type": "integer"},
+                "insert_after_section": {"type": "integer"},
+            }),
+        },
+        "image_prompts": {
+            "type": "array",
+            "items": _object({
+                "position": _string("thumbnail 또는 section_N"),
+                "prompt": _string("DSLR 스타일 이미지 프롬프트"),
+                "alt_text": _string("SEO 최적화 ALT 텍스트"),
+            }),
+        },
+    },
+    title="seo_structure",
+)
+
+
+# SEOContentWriterNode 2단계: 본문
+SEO_CONTENT_SCHEMA: Dict[str, Any] = _object(
+    {
+        "day": {"type": "integer"},
+        "title": _string("글 제목"),
+        "seo_title": _string("구조 단계의 seo_title 그대로"),
+        "meta_description": _string("구조 단계의 meta_description 그대로"),
+        "h1": _string("구조 단계의 h1 그대로"),
+        "opening": _string("오프닝 (80~120자, 한 줄)"),
+        "sections": {
+            "type": "array",
+            "minItems": 1,
+            "description": "구조의 모든 섹션을 순서대로 빠짐없이",
+            "items": _object({
+                "h2": _string("섹션 H2 제목"),
+                "h2_emoji": _string("H2 앞 이모지 1개"),
+                "h3_contents": {
+                    "type": "array",
+                    "minItems": 1,
+                    "items": _object({
+                        "h3": _string("H3 소제목"),
+                        "paragraphs": _string_list("단락 3개 (각 80~140자, 한 줄)", 1),
+                    }),
+                },
+            }),
+        },
+        "table_html": _string("<table> HTML (한 줄)"),
+        "checklist_html": _string("<ul> 체크리스트 HTML (한 줄)"),
+        "faq": {
+            "type": "array",
+            "items": _object({
+                "question": _string("실제 검색 질문"),
+                "answer": _string("간결한 답변 2~3문장"),
+            }),
+        },
+        "closing": _string("마무리 (60~100자, CTA 포함)"),
+        "word_count": {"type": "integer"},
+        "keywords_used": _string_list("본문에 사용한 키워드"),
+    },
+    title="seo_content",
+)
@@ -0,0 +1,147 @@
+# utils/shared_cache.py
+"""
+프로세스 공유 캐시 (여러 블로그 파이프라인이 같은 작업을 한 번만 수행)
+
+- 네이버 검색 / 데이터랩 검색량 / SERP 크롤링처럼 블로그와 무관한 외부 조회 결과를 메모리에 보관
+- 같은 키를 동시에 요청하면 먼저 온 쪽만 계산하고 나머지는 결과를 기다려 공유 (single-flight)
+- 반환값은 깊은 복사본 (호출자가 결과를 고쳐도 캐시/다른 블로그에 영향 없음)
+- 실패(예외)나 cacheable이 거부한 값(예: 데이터랩 fallback)은 저장하지 않음
+- utils.memo(실행 간 파일 재사용)와 달리 프로세스 안에서만, TTL 동안만 유지
+
+환경 변수:
+- BLOG_SHARED_CACHE: "0"이면 사용 안 함
+- BLOG_SHARED_CACHE_TTL: 보관 시간(초, 기본 3600)
+- BLOG_SHARED_CACHE_MAX: 캐시별 최대 항목 수 (기본 1024, 넘으면 오래된 것부터 제거)
+"""
+
+import copy
+import os
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from utils.hashing import canonical_hash
+from utils.logger import get_logger
+
+logger = get_logger("SharedCache")
+
+T = TypeVar("T")
+
+
+class SharedCache:
+    """TTL 메모리 캐시 + single-flight"""
+
+    def __init__(self, name: str, ttl_s: Optional[float] = None, max_entries: Optional[int] = None) -> None:
+        self.name = name
+        self.ttl_s = ttl_s if ttl_s is not None else float(os.getenv("BLOG_SHARED_CACHE_TTL", "3600"))
+        self.max_entries = max_entries or int(os.getenv("BLOG_SHARED_CACHE_MAX", "1024"))
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Tuple[float, Any]] = {}
+        self._inflight: Dict[str, Future] = {}
+        self.hits = 0
+        self.misses = 0
+        self.joined = 0
+
+    def get_or_compute(
+        self,
+        key: Any,
+        compute: Callable[[], T],
+        cacheable: Callable[[T], bool] = lambda value: True
+    ) -> T:
+        """
+        캐시 조회, 없으면 compute() 결과 저장 후 반환
+
+        Args:
+            key: 정규화 해시할 키 (dict/list/str 등)
+            compute: 실제 작업
+            cacheable: False를 돌려주면 결과를 저장하지 않음 (진행 중 합류자에게는 그대로 전달)
+        """
+        if os.getenv("BLOG_SHARED_CACHE", "1") == "0":
+            return compute()
+
+        digest = canonical_hash(key)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is not None and entry[0] > now:
+                self.hits += 1
+                return copy.deepcopy(entry[1])
+            future = self._inflight.get(digest)
+            if future is not None:
+                self.joined += 1
+                is_leader = False
+            else:
+                future = Future()
+                self._inflight[digest] = future
+                self.misses += 1
+                is_leader = True
+
+        if not is_leader:
+            logger.info(f"🔗 {self.name} 진행 중인 조회에 합류 ({digest[:12]})")
+            return copy.deepcopy(future.result())
+
+        try:
+            value = compute()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(digest, None)
+
+        if cacheable(value):
+            with self._lock:
+                self._entries[digest] = (time.monotonic() + self.ttl_s, copy.deepcopy(value))
+                while len(self._entries) > self.max_entries:
+                    self._entries.pop(next(iter(self._entries)))
+        future.set_result(value)
+        return copy.deepcopy(value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses, "joined": self.joined}
+
+
+_caches: Dict[str, SharedCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_shared_cache(name: str) -> SharedCache:
+    """이름별 프로세스 공용 캐시"""
+    with _caches_lock:
+        if name not in _caches:
+            _caches[name] = SharedCache(name)
+        return _caches[name]
+
+
+def clear_shared_caches() -> None:
+    with _caches_lock:
+        caches: List[SharedCache] = list(_caches.values())
+    for cache in caches:
+        cache.clear()
+
+
+def format_cache_stats() -> str:
+    """캐시별 적중/합류/계산 횟수 표 (사용 기록이 없으면 빈 문자열)"""
+    with _caches_lock:
+        caches = sorted(_caches.values(), key=lambda cache: cache.name)
+    if not caches:
+        return ""
+
+    lines = [
+        "🗃️  공유 캐시",
+        f"   {'캐시':<20}{'항목':>6}{'적중':>6}{'합류':>6}{'계산':>6}{'절약률':>9}",
+    ]
+    for cache in caches:
+        row = cache.stats()
+        requests = row["hits"] + row["joined"] + row["misses"]
+        saved = (row["hits"] + row["joined"]) / requests if requests else 0.0
+        lines.append(
+            f"   {cache.name:<20}{row['entries']:>6}{row['hits']:>6}{row['joined']:>6}{row['misses']:>6}{saved:>9.1%}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,82 @@
+# utils/structured_output.py
+"""
+구조화 출력(Structured Output) 지원
+- JSON Schema dict 또는 Pydantic 모델을 공통 JSON Schema로 변환
+- fastjsonschema로 컴파일한 검증기를 캐시하여 로컬 검증
+"""
+
+import json
+import threading
+from typing import Any, Callable, Dict
+
+try:
+    import fastjsonschema
+except ImportError:  # 미설치 시 로컬 검증 생략
+    fastjsonschema = None
+
+from utils.logger import get_logger
+
+logger = get_logger("StructuredOutput")
+
+_validators: Dict[str, Callable[[Any], Any]] = {}
+_validators_lock = threading.Lock()
+
+
+class StructuredOutputError(ValueError):
+    """스키마 검증 실패"""
+
+
+def to_json_schema(schema: Any) -> Dict[str, Any]:
+    """
+    JSON Schema dict 또는 Pydantic 모델 클래스를 JSON Schema dict로 변환
+    """
+    if isinstance(schema, dict):
+        return schema
+    if hasattr(schema, "model_json_schema"):  # Pydantic v2
+        return schema.model_json_schema()
+    if hasattr(schema, "schema"):  # Pydantic v1
+        return schema.schema()
+    raise TypeError(f"지원하지 않는 스키마 타입: {type(schema).__name__}")
+
+
+def schema_name(schema: Any) -> str:
+    """provider에 전달할 스키마 이름 (영문/숫자/_/- 만 허용)"""
+    if isinstance(schema, dict):
+        name = schema.get("title", "structured_output")
+    else:
+        name = getattr(schema, "__name__", "structured_output")
+    cleaned = "".join(ch if ch.isalnum() or ch in "_-" else "_" for ch in str(name))
+    return cleaned[:64] or "structured_output"
+
+
+def get_validator(schema: Any) -> Callable[[Any], Any] | None:
+    """컴파일된 검증기 반환 (스키마별 1회만 컴파일)"""
+    if fastjsonschema is None:
+        return None
+
+    schema_dict = to_json_schema(schema)
+    key = json.dumps(schema_dict, sort_keys=True, ensure_ascii=False)
+
+    with _validators_lock:
+        validator = _validators.get(key)
+        if validator is None:
+            validator = fastjsonschema.compile(schema_dict)
+            _validators[key] = validator
+    return validator
+
+
+def validate_structured(data: Any, schema: Any) -> Any:
+    """
+    스키마 검증 (기본값이 있으면 채워진 데이터 반환)
+
+    Raises:
+        StructuredOutputError: 검증 실패
+    """
+    validator = get_validator(schema)
+    if validator is None:
+        return data
+
+    try:
+        return validator(data)
+    except fastjsonschema.JsonSchemaException as e:
+        raise StructuredOutputError(f"스키마 검증 실패: {e.message}") from e
@@ -0,0 +1,283 @@
+# utils/tracing.py
+"""
+경량 트레이싱 (부모/자식 관계가 있는 구간 측정)
+
+- span(): with 문과 데코레이터 모두 사용 가능, contextvars로 부모 구간을 추적
+- 노드(run_context.node_scope), LLM 호출(utils.llm_client), HTTP 요청(utils.http_client)에 자동 적용
+- 내보내기: Chrome trace JSON (chrome://tracing, Perfetto), folded stack (flamegraph.pl, speedscope),
+  구간 이름별 벽시계 시간 요약표
+
+환경 변수:
+- BLOG_TRACE: "0"이면 수집 안 함
+- BLOG_TRACE_MAX_SPANS: 메모리에 보관할 최대 구간 수 (기본 200000, 초과분은 버림)
+"""
+
+import itertools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+
+from utils.logger import get_logger
+
+logger = get_logger("Tracing")
+
+DEFAULT_TRACE_DIR = "outputs/traces"
+
+
+@dataclass
+class Span:
+    name: str
+    kind: str
+    span_id: int
+    parent_id: Optional[int]
+    run_id: Optional[str]
+    start_ns: int
+    thread_id: int
+    thread_name: str
+    end_ns: Optional[int] = None
+    attrs: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def duration_s(self) -> float:
+        end = self.end_ns if self.end_ns is not None else time.perf_counter_ns()
+        return (end - self.start_ns) / 1e9
+
+    def set(self, **attrs: Any) -> None:
+        """구간 진행 중 속성 추가 (예: 응답 상태, 토큰 수)"""
+        self.attrs.update({key: value for key, value in attrs.items() if value is not None})
+
+
+class Tracer:
+    """완료된 구간 저장소 (스레드 안전)"""
+
+    def __init__(self) -> None:
+        self.enabled = os.getenv("BLOG_TRACE", "1") != "0"
+        self.max_spans = int(os.getenv("BLOG_TRACE_MAX_SPANS", "200000"))
+        self.dropped = 0
+        self._spans: List[Span] = []
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def next_id(self) -> int:
+        return next(self._ids)
+
+    def add(self, span: Span) -> None:
+        with self._lock:
+            if len(self._spans) >= self.max_spans:
+                self.dropped += 1
+                return
+            self._spans.append(span)
+
+    def spans(self, run_id: Optional[str] = None) -> List[Span]:
+        with self._lock:
+            if run_id is None:
+                return list(self._spans)
+            return [s for s in self._spans if s.run_id == run_id]
+
+    def clear(self, run_id: Optional[str] = None) -> None:
+        """보관 구간 삭제 (상주 프로세스에서 실행 단위로 비우기)"""
+        with self._lock:
+            if run_id is None:
+                self._spans.clear()
+            else:
+                self._spans = [s for s in self._spans if s.run_id != run_id]
+
+
+_current: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+_tracer: Optional[Tracer] = None
+_tracer_lock = threading.Lock()
+
+
+def get_tracer() -> Tracer:
+    """프로세스 공용 트레이서"""
+    global _tracer
+    with _tracer_lock:
+        if _tracer is None:
+            _tracer = Tracer()
+        return _tracer
+
+
+def current_span() -> Optional[Span]:
+    return _current.get()
+
+
+@contextmanager
+def span(name: str, kind: str = "internal", run_id: Optional[str] = None, **attrs: Any) -> Iterator[Optional[Span]]:
+    """
+    구간 측정 - with 문과 데코레이터 모두 사용 가능
+
+    run_id를 주지 않으면 부모 구간의 run_id를 물려받음
+
+    사용 예:
+        with span("render", kind="cpu", platform="naver") as s:
+            ...
+            if s: s.set(bytes=len(html))
+    """
+    tracer = get_tracer()
+    if not tracer.enabled:
+        yield None
+        return
+
+    parent = _current.get()
+    thread = threading.current_thread()
+    current = Span(
+        name=name,
+        kind=kind,
+        span_id=tracer.next_id(),
+        parent_id=parent.span_id if parent else None,
+        run_id=run_id or (parent.run_id if parent else None),
+        start_ns=time.perf_counter_ns(),
+        thread_id=thread.ident or 0,
+        thread_name=thread.name,
+        attrs={key: value for key, value in attrs.items() if value is not None},
+    )
+    token = _current.set(current)
+    try:
+        yield current
+    except BaseException as e:
+        current.attrs["error"] = type(e).__name__
+        raise
+    finally:
+        current.end_ns = time.perf_counter_ns()
+        _current.reset(token)
+        tracer.add(current)
+
+
+# ---------------------------------------------------------------------------
+# 내보내기
+# ---------------------------------------------------------------------------
+
+def chrome_trace(spans: List[Span]) -> Dict[str, Any]:
+    """Chrome trace event 형식 (완료 이벤트 "X", 마이크로초)"""
+    if not spans:
+        return {"traceEvents": [], "displayTimeUnit": "ms"}
+    origin = min(s.start_ns for s in spans)
+    pid = os.getpid()
+
+    events: List[Dict[str, Any]] = []
+    threads: Dict[int, str] = {}
+    for s in sorted(spans, key=lambda item: item.start_ns):
+        threads.setdefault(s.thread_id, s.thread_name)
+        events.append({
+            "name": s.name,
+            "cat": s.kind,
+            "ph": "X",
+            "ts": (s.start_ns - origin) / 1000,
+            "dur": ((s.end_ns or s.start_ns) - s.start_ns) / 1000,
+            "pid": pid,
+            "tid": s.thread_id,
+            "args": {"span_id": s.span_id, "parent_id": s.parent_id, "run_id": s.run_id, **s.attrs},
+        })
+    for thread_id, thread_name in threads.items():
+        events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": thread_id, "args": {"name": thread_name}})
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def _self_time_ns(spans: List[Span]) -> Dict[int, int]:
+    """구간별 자기 시간 (자식 구간 시간 제외, 병렬 자식으로 음수가 되면 0)"""
+    children: Dict[int, int] = {}
+    for s in spans:
+        if s.parent_id is not None and s.end_ns is not None:
+            children[s.parent_id] = children.get(s.parent_id, 0) + (s.end_ns - s.start_ns)
+    return {
+        s.span_id: max((s.end_ns or s.start_ns) - s.start_ns - children.get(s.span_id, 0), 0)
+        for s in spans
+    }
+
+
+def folded_stacks(spans: List[Span]) -> List[str]:
+    """folded stack 형식 ("부모;자식;손자 자기시간(us)") - flamegraph 입력"""
+    by_id = {s.span_id: s for s in spans}
+    self_ns = _self_time_ns(spans)
+    totals: Dict[str, int] = {}
+    for s in spans:
+        names = [s.name]
+        parent = by_id.get(s.parent_id) if s.parent_id is not None else None
+        while parent is not None:
+            names.append(parent.name)
+            parent = by_id.get(parent.parent_id) if parent.parent_id is not None else None
+        stack = ";".join(reversed(names))
+        totals[stack] = totals.get(stack, 0) + self_ns[s.span_id] // 1000
+    return [f"{stack} {micros}" for stack, micros in sorted(totals.items()) if micros > 0]
+
+
+def summarize_spans(spans: List[Span]) -> List[Dict[str, Any]]:
+    """구간 이름별 호출 수 / 전체 시간 / 자기 시간 (자기 시간 내림차순)"""
+    self_ns = _self_time_ns(spans)
+    rows: Dict[tuple, Dict[str, Any]] = {}
+    for s in spans:
+        row = rows.setdefault((s.kind, s.name), {"kind": s.kind, "name": s.name, "count": 0, "total_s": 0.0, "self_s": 0.0})
+        row["count"] += 1
+        row["total_s"] += s.duration_s
+        row["self_s"] += self_ns[s.span_id] / 1e9
+    return sorted(rows.values(), key=lambda r: r["self_s"], reverse=True)
+
+
+def wall_time_s(spans: List[Span]) -> float:
+    """첫 구간 시작 ~ 마지막 구간 종료"""
+    if not spans:
+        return 0.0
+    return (max(s.end_ns or s.start_ns for s in spans) - min(s.start_ns for s in spans)) / 1e9
+
+
+def format_trace_summary(run_id: Optional[str] = None, top: int = 15) -> str:
+    """CLI 출력용 '벽시계 시간이 어디로 갔나' 요약표"""
+    spans = get_tracer().spans(run_id)
+    if not spans:
+        return "🧭 트레이스: 기록된 구간 없음"
+
+    wall = wall_time_s(spans)
+    lines = [
+        f"🧭 트레이스 요약 (벽시계 {wall:.2f}초, 구간 {len(spans)}개)",
+        f"   {'종류':<8}{'구간':<36}{'횟수':>6}{'전체(s)':>10}{'자기(s)':>10}{'비중':>8}",
+    ]
+    for row in summarize_spans(spans)[:top]:
+        share = row["self_s"] / wall if wall else 0.0
+        lines.append(
+            f"   {row['kind']:<8}{row['name'][:35]:<36}{row['count']:>6}"
+            f"{row['total_s']:>10.2f}{row['self_s']:>10.2f}{share:>8.1%}"
+        )
+    return "\n".join(lines)
+
+
+def export_trace(run_id: Optional[str] = None, trace_dir: str = DEFAULT_TRACE_DIR) -> Optional[str]:
+    """
+    Chrome trace JSON + folded stack 파일 저장
+
+    Returns:
+        Chrome trace 파일 경로 (구간이 없으면 None)
+    """
+    spans = get_tracer().spans(run_id)
+    if not spans:
+        return None
+
+    os.makedirs(trace_dir, exist_ok=True)
+    stem = os.path.join(trace_dir, run_id or f"trace-{int(time.time())}")
+    trace_path = f"{stem}.trace.json"
+    with open(trace_path, "w", encoding="utf-8") as f:
+        json.dump(chrome_trace(spans), f, ensure_ascii=False, default=str)
+    with open(f"{stem}.folded", "w", encoding="utf-8") as f:
+        f.write("\n".join(folded_stacks(spans)) + "\n")
+
+    if get_tracer().dropped:
+        logger.warning(f"⚠️ 트레이스 구간 {get_tracer().dropped}개 버림 (BLOG_TRACE_MAX_SPANS 초과)")
+    return trace_path
+
+
+def format_trace_report(run_id: Optional[str] = None, trace_dir: str = DEFAULT_TRACE_DIR) -> str:
+    """요약표 + 트레이스 파일 저장 (CLI 실행 종료 시 출력용)"""
+    summary = format_trace_summary(run_id)
+    trace_path = export_trace(run_id, trace_dir)
+    if trace_path:
+        folded_path = trace_path[: -len(".trace.json")] + ".folded"
+        summary += (
+            f"\n   💾 {trace_path} (chrome://tracing / ui.perfetto.dev)"
+            f"\n   💾 {folded_path} (flamegraph.pl / speedscope)"
+        )
+    return summary
@@ -0,0 +1,248 @@
+"""
+글 생성 작업자 (utils.job_queue)
+- 큐에서 (블로그, Day, 단계) 작업을 임대해 실행하고 결과/실패를 기록
+- 처리 중에는 하트비트로 임대를 연장, 작업자가 죽으면 임대 만료 후 다른 작업자가 이어받음
+- 단계별 재시도 정책(지수 백오프), 재시도 불가 오류(PermanentJobError)는 바로 dead
+- --processes N: 같은 DB를 공유하는 작업자 프로세스 N개
+
+단계:
+- write: GPT 뼈대 + Claude 살붙이기 (HybridPostWriterNode) → outputs/batch_posts/<블로그>/dayXX.json
+- seo:   SEO 구조 + 본문 (SEOContentWriterNode) → outputs/content/<블로그>/dayXX_content.json
+- 계획 항목 / SERP / 톤 가이드는 작업 블로그 기준으로 계획 저장소(utils.plan_store)에서 조회
+
+사용 예:
+    python -m utils.job_queue enqueue --blog woncamp wonfinance --days 1-7 --stage write
+    python worker.py --processes 4
+    python worker.py --stages seo --drain      # 대기 작업이 없으면 종료
+
+환경 변수:
+- BLOG_QUEUE_DB: 큐 DB 경로 (utils.job_queue)
+- BLOG_WORKER_LEASE_S: 임대 시간(초, 기본 120, 하트비트는 1/3 간격)
+- BLOG_WORKER_POLL_S: 대기 작업이 없을 때 다시 확인하는 간격(초, 기본 2)
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import signal
+import socket
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from utils.job_queue import Job, JobQueue, PermanentJobError, RetryPolicy
+from utils.logger import get_logger
+from utils.plan_store import PlanStore, load_plan_store
+from utils.run_context import node_scope, run_scope
+
+logger = get_logger("Worker")
+
+StageFn = Callable[[Job], Dict[str, Any]]
+
+
+def plan_store_for(blog: str, payload: Optional[Dict[str, Any]] = None) -> PlanStore:
+    """
+    블로그 계획 저장소 (원본 JSON이 바뀌었으면 다시 가져옴)
+
+    원본은 payload의 plan_file / tone_guide_file, 없으면 블로그 설정의 경로 (run_multi_blog.plan_sources)
+    계획이 저장소에도 원본 JSON에도 없거나 설정에 경로가 빠졌으면 재시도 불가 (PermanentJobError)
+    """
+    from run_multi_blog import plan_sources
+
+    payload = payload or {}
+    try:
+        plan_file, tone_guide_file = plan_sources(blog)
+        return load_plan_store(
+            blog,
+            payload.get("plan_file", plan_file),
+            payload.get("tone_guide_file", tone_guide_file),
+        )
+    except (FileNotFoundError, ValueError) as e:
+        raise PermanentJobError(str(e)) from e
+
+
+def load_plan_item(job: Job) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """작업 Day의 계획 항목과 SERP 컨텍스트 (계획이 없거나 Day가 범위 밖이면 재시도 불가)"""
+    store = plan_store_for(job.blog, job.payload)
+    plan_item = store.plan_item(job.blog, job.day)
+    if plan_item is None:
+        raise PermanentJobError(f"{job.blog} Day {job.day}는 계획에 없습니다 (총 {store.day_count(job.blog)}일)")
+    return plan_item, store.serp_snapshot(job.blog)
+
+
+def load_tone_guide(job: Job) -> Dict[str, Any]:
+    """작업 블로그의 문체·톤 가이드 (없으면 재시도 불가)"""
+    store = plan_store_for(job.blog, job.payload)
+    tone_guide = store.tone_guide(job.blog)
+    if tone_guide is None:
+        raise PermanentJobError(f"{job.blog} 톤 가이드가 없습니다 (저장소 {store.path})")
+    return tone_guide
+
+
+def run_write(job: Job) -> Dict[str, Any]:
+    from nodes.hybrid_post_writer_node import HybridPostWriterNode
+
+    plan_item, serp_context = load_plan_item(job)
+    result = HybridPostWriterNode().write(plan_item, serp_context)
+
+    output_dir = os.path.join(job.payload.get("output_dir", "outputs/batch_posts"), job.blog)
+    os.makedirs(output_dir, exist_ok=True)
+    output_file = os.path.join(output_dir, f"day{job.day:02d}.json")
+    with open(output_file, "w", encoding="utf-8") as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+    return {"file": output_file, "title": result.get("title"), "char_count": len(result.get("final_content", ""))}
+
+
+def run_seo(job: Job) -> Dict[str, Any]:
+    from nodes.seo_content_writer_node import SEOContentWriterNode, save_contents
+
+    plan_item, serp_context = load_plan_item(job)
+    tone_guide = load_tone_guide(job)
+
+    with node_scope("SEOContentWriter", day=job.day):
+        content = SEOContentWriterNode().generate_single(job.day, plan_item, tone_guide, serp_context)
+    paths = save_contents([content], os.path.join(job.payload.get("output_dir", "outputs/content"), job.blog))
+    return {"file": paths[0], "title": content.get("title"), "char_count": content.get("full_text_length", 0)}
+
+
+# 단계 이름 → (실행 함수, 재시도 정책)
+STAGES: Dict[str, Tuple[StageFn, RetryPolicy]] = {
+    "write": (run_write, RetryPolicy(base_delay_s=30.0, max_delay_s=600.0)),
+    "seo": (run_seo, RetryPolicy(base_delay_s=30.0, max_delay_s=600.0)),
+}
+
+
+class Worker:
+    """작업자 1개 (프로세스당 하나, 작업은 한 번에 하나씩)"""
+
+    def __init__(
+        self,
+        queue: Optional[JobQueue] = None,
+        stages: Optional[List[str]] = None,
+        worker_id: Optional[str] = None,
+        lease_s: Optional[float] = None,
+        poll_s: Optional[float] = None
+    ) -> None:
+        self.queue = queue or JobQueue()
+        self.stages = stages or sorted(STAGES)
+        unknown = [stage for stage in self.stages if stage not in STAGES]
+        if unknown:
+            raise ValueError(f"알 수 없는 단계: {', '.join(unknown)} (가능: {', '.join(sorted(STAGES))})")
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.lease_s = lease_s or float(os.getenv("BLOG_WORKER_LEASE_S", "120"))
+        self.poll_s = poll_s or float(os.getenv("BLOG_WORKER_POLL_S", "2"))
+        self._stop = threading.Event()
+        self.processed = {"done": 0, "retry": 0, "dead": 0, "lost": 0}
+
+    def stop(self) -> None:
+        """지금 작업을 마친 뒤 종료"""
+        self._stop.set()
+
+    def run(self, drain: bool = False, max_jobs: Optional[int] = None) -> Dict[str, int]:
+        """
+        작업 처리 루프
+
+        Args:
+            drain: 대기 작업이 없으면 종료 (기본은 계속 대기)
+            max_jobs: 처리할 최대 작업 수
+        """
+        logger.info(f"👷 작업자 {self.worker_id} 시작 (단계: {', '.join(self.stages)})")
+        handled = 0
+        while not self._stop.is_set() and (max_jobs is None or handled < max_jobs):
+            job = self.queue.lease(self.worker_id, self.lease_s, self.stages)
+            if job is None:
+                if drain:
+                    break
+                self._stop.wait(self.poll_s)
+                continue
+            self.process(job)
+            handled += 1
+        logger.info(f"👷 작업자 {self.worker_id} 종료: {self.processed}")
+        return dict(self.processed)
+
+    def process(self, job: Job) -> None:
+        """작업 1건 실행 (하트비트 스레드가 임대 연장)"""
+        fn, policy = STAGES[job.stage]
+        label = f"{job.blog} Day {job.day} {job.stage} (#{job.id}, 시도 {job.attempts}/{job.max_attempts})"
+        print(f"▶️  {label}")
+
+        done = threading.Event()
+        beat = threading.Thread(target=self._heartbeat, args=(job, done), name=f"heartbeat-{job.id}", daemon=True)
+        beat.start()
+        start = time.perf_counter()
+        try:
+            with run_scope(blog=job.blog):
+                result = fn(job)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            retry_delay = None if isinstance(e, PermanentJobError) else policy.delay_s(job.attempts)
+            outcome = self.queue.fail(job, error, retry_delay)
+            logger.exception(f"❌ {label} 실패 → {outcome or '임대 상실'}")
+            if outcome == "retry":
+                print(f"🔁 {label} 실패, {retry_delay:.0f}초 후 재시도: {error}")
+            elif outcome == "dead":
+                print(f"⚰️  {label} 실패, dead 처리: {error}")
+            self.processed[outcome or "lost"] += 1
+        else:
+            if self.queue.complete(job, result):
+                print(f"✅ {label} 완료 ({time.perf_counter() - start:.1f}초)")
+                self.processed["done"] += 1
+            else:
+                logger.warning(f"⚠️ {label} 임대를 잃어 결과를 버림 (다른 작업자가 다시 실행)")
+                self.processed["lost"] += 1
+        finally:
+            done.set()
+            beat.join()
+
+    def _heartbeat(self, job: Job, done: threading.Event) -> None:
+        while not done.wait(self.lease_s / 3):
+            try:
+                if not self.queue.heartbeat(job, self.lease_s):
+                    logger.warning(f"⚠️ 작업 #{job.id} 임대 상실 (만료 후 다른 작업자에게 넘어감)")
+                    return
+            except Exception as e:
+                # 일시적 DB 잠금 등은 다음 주기에 다시 시도 (임대 시간 안에 성공하면 문제없음)
+                logger.warning(f"⚠️ 작업 #{job.id} 하트비트 실패: {e}")
+
+
+def _worker_process(stages: Optional[List[str]], drain: bool) -> None:
+    worker = Worker(stages=stages)
+    signal.signal(signal.SIGTERM, lambda signum, frame: worker.stop())
+    signal.signal(signal.SIGINT, lambda signum, frame: worker.stop())
+    worker.run(drain=drain)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="글 생성 작업자")
+    parser.add_argument("--processes", type=int, default=1, help="작업자 프로세스 수")
+    parser.add_argument("--stages", nargs="+", help=f"처리할 단계 (기본: 전체 {', '.join(sorted(STAGES))})")
+    parser.add_argument("--drain", action="store_true", help="대기 작업이 없으면 종료")
+    args = parser.parse_args(argv)
+
+    if args.processes <= 1:
+        _worker_process(args.stages, args.drain)
+        return 0
+
+    processes = [
+        multiprocessing.Process(target=_worker_process, args=(args.stages, args.drain), name=f"worker-{i}")
+        for i in range(1, args.processes + 1)
+    ]
+    for process in processes:
+        process.start()
+    print(f"👷 작업자 {len(processes)}개 시작 (PID {', '.join(str(p.pid) for p in processes)})")
+
+    def forward(signum: int, frame: Any) -> None:
+        for process in processes:
+            if process.is_alive():
+                os.kill(process.pid, signal.SIGTERM)
+
+    signal.signal(signal.SIGTERM, forward)
+    signal.signal(signal.SIGINT, forward)
+    for process in processes:
+        process.join()
+    return 0 if all(process.exitcode == 0 for process in processes) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())